@@ -1,46 +1,280 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, Float, text, String, ForeignKey
-from sqlalchemy.orm import sessionmaker, Session, relationship, declarative_base
+from sqlalchemy import (Column, Integer, BigInteger, SmallInteger, Float, text, String, ForeignKey, Index, select,
+                        tuple_, func, bindparam, case, event, inspect, any_)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import relationship, declarative_base, Session
 import os
-from typing import Optional
-from pydantic import BaseModel
+import io
+import csv
+import sys
+import math
+import array
+import random
+import json
+import time
+import heapq
+import bisect
+import base64
+import asyncio
+import logging
+import orjson
+import numpy as np
+from scipy.special import erfc
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from urllib.parse import urlencode
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, model_validator
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Comma-separated read replicas (streaming standbys of DATABASE_URL) that serve all queries; unset uses the primary
+DATABASE_READ_URLS = [url.strip() for url in os.getenv("DATABASE_READ_URL", "").split(",") if url.strip()]
+MAX_REGION_SIZE = 5_000_000  # bp; keeps /region/ queries within a LocusZoom-sized window
+EXPORT_BATCH_SIZE = 5000  # rows fetched per round trip by the server-side export cursor
+MAX_EFFECT_SIZE_BATCH = 100_000  # variant-gene pairs accepted by POST /effect_size/batch
+MAX_SEARCH_SUGGESTIONS = 50  # upper bound on the limit parameter of /search/
+MAX_SEARCH_RANKED = 5000  # prefixes matching more genes than this are listed alphabetically instead of ranked
+MAX_COMPARE_COLUMNS = 5000  # upper bound on the limit parameter of /compare/
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))  # 0 disables the timeout
+# Pool of every read replica; the primary's settings by default
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", str(DB_POOL_SIZE)))
+DB_READ_MAX_OVERFLOW = int(os.getenv("DB_READ_MAX_OVERFLOW", str(DB_MAX_OVERFLOW)))
+READ_POOL_SIZE = DB_READ_POOL_SIZE if DATABASE_READ_URLS else DB_POOL_SIZE  # of every engine that serves queries
+# Pooled connections opened, and hot statements prepared on, per read engine during the startup warm-up; 0 skips it
+DB_WARM_CONNECTIONS = min(int(os.getenv("DB_WARM_CONNECTIONS", str(READ_POOL_SIZE))), READ_POOL_SIZE)
+IMPORTED_AT = time.perf_counter()  # readiness is reported relative to this
+
+def async_database_url(url: str):
+    # DATABASE_URL is shared with the (synchronous) ingestion scripts, so swap in the asyncpg driver here
+    return make_url(url).set(drivername="postgresql+asyncpg")
+
+def create_pool(url: str, pool_size: int, max_overflow: int, read_only: bool = False):
+    server_settings = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+    if read_only:
+        # Standbys refuse writes anyway; this makes a "replica" that is really the primary refuse them too
+        server_settings["default_transaction_read_only"] = "on"
+    return create_async_engine(
+        async_database_url(url),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        connect_args={"server_settings": server_settings},
+    )
+
+# Created on startup by init_engine(), so importing this module needs neither DATABASE_URL nor a database
+engine = None  # the primary
+read_engines = []  # one per read replica, or just the primary
+
+class RoutingSession(Session):
+    """
+    Sends flushes and INSERT/UPDATE/DELETE statements to the primary and all
+    other statements to a read engine, picked once per session so that the
+    queries of a request all go to the same replica.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.read_engine = random.choice(read_engines)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or getattr(clause, "is_dml", False):
+            return engine.sync_engine
+        return self.read_engine.sync_engine
+
+SessionLocal = async_sessionmaker(sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False)
+
+def init_engine():
+    """Creates the connection pools on first call: the primary's and one per read replica."""
+    global engine
+    if engine is None:
+        if not DATABASE_URL:
+            raise RuntimeError("DATABASE_URL is not set.")
+        engine = create_pool(DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW)
+        read_engines[:] = [create_pool(url, DB_READ_POOL_SIZE, DB_READ_MAX_OVERFLOW, read_only=True)
+                           for url in DATABASE_READ_URLS] or [engine]
+    return engine
+
+def named_engines() -> dict:
+    """Every engine by the name it is reported under in /health and /metrics."""
+    engines = {"primary": engine}
+    if DATABASE_READ_URLS:
+        engines.update((f"replica{i}", read_engine) for i, read_engine in enumerate(read_engines, 1))
+    return engines
+
+# Queries slower than this are re-run with EXPLAIN ANALYZE after the request and their plan is logged; unset disables
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+
+logger = logging.getLogger(__name__)
+
+# Response cache settings
+CACHE_URL = os.getenv("CACHE_URL")  # e.g. redis://localhost:6379/0; unset keeps the cache in-process
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+DATA_VERSION_CHECK_SECONDS = float(os.getenv("DATA_VERSION_CHECK_SECONDS", "5"))
+
+# Parquet dataset written by ingest_data.py --parquet-dir; unset disables /scan/
+PARQUET_DIR = os.getenv("PARQUET_DIR")
+SCAN_BATCH_SIZE = 65536  # rows per Arrow record batch streamed by /scan/
+
+# Manhattan pyramid built by ingestion: bins of 100 bp at level 0, four times wider per level
+MANHATTAN_BASE_BIN = 100
+MANHATTAN_ZOOM = 4
+MANHATTAN_LEVELS = 10
 Base = declarative_base()
 
+# Chromosomes are stored as small integers, numbered as in PLINK
+CHROMOSOME_CODES = {**{str(n): n for n in range(1, 23)}, "X": 23, "Y": 24, "MT": 25, "M": 25}
+CHROMOSOME_NAMES = {code: name for name, code in CHROMOSOME_CODES.items() if name != "M"}
+
+def normalize_chromosome(chromosome: str) -> str:
+    """Accepts "18", "chr18", "chrx" or "M" alike and returns the name stored in the data ("18", "X", "MT")."""
+    code = CHROMOSOME_CODES.get(chromosome.removeprefix("chr").upper())
+    if code is None:
+        raise HTTPException(status_code=400, detail=f"Unknown chromosome: {chromosome}.")
+    return CHROMOSOME_NAMES[code]
+
+# GRCh38 chromosome lengths in bp, by chromosome code
+CHROMOSOME_LENGTHS = {
+    1: 248956422, 2: 242193529, 3: 198295559, 4: 190214555, 5: 181538259, 6: 170805979, 7: 159345973,
+    8: 145138636, 9: 138394717, 10: 133797422, 11: 135086622, 12: 133275309, 13: 114364328, 14: 107043718,
+    15: 101991189, 16: 90338345, 17: 83257441, 18: 80373285, 19: 58617616, 20: 64444167, 21: 46709983,
+    22: 50818468, 23: 156040895, 24: 57227415, 25: 16569,
+}
+
 class Gene(Base):
     __tablename__ = "gene"
-    gene_id = Column(String(30), primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
+    gene_id = Column(String(30), unique=True, index=True)
     median_tpm = Column(Float)
     gene_name = Column(String(30), index=True)
     associations = relationship("Association", back_populates="gene")
 
 class Variant(Base):
     __tablename__ = "variant"
-    variant_id = Column(String(200), primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
+    variant_id = Column(String(200), unique=True, index=True)
     rsid = Column(String, index=True)
-    chromosome = Column(String, index=True)
+    chromosome = Column(SmallInteger)  # see CHROMOSOME_CODES
     position = Column(Integer)
     ref = Column(String)
     alt = Column(String)
     associations = relationship("Association", back_populates="variant")
 
+    # Range scans for /region/ are served from (chromosome, position)
+    __table_args__ = (Index("ix_variant_chromosome_position", "chromosome", "position"),)
+
+# rsID prefix search (/search/) walks this index in byte order
+Index("ix_variant_rsid_prefix", Variant.rsid.collate("C"))
+
+class Study(Base):
+    __tablename__ = "study"
+    id = Column(SmallInteger, primary_key=True)
+    study_id = Column(String(30), unique=True)
+
 class Association(Base):
+    # Variants, genes and studies are referenced by integer key to keep this table small.
+    # Partitioned by study_key, one partition per study (created by ingestion).
     __tablename__ = "association"
-    id = Column(Integer, primary_key=True, index=True)
-    variant_id = Column(String(200), ForeignKey("variant.variant_id"))
-    gene_id = Column(String(30), ForeignKey("gene.gene_id"))
+    id = Column(BigInteger, primary_key=True, index=True)
+    variant_key = Column(Integer, ForeignKey("variant.id"), index=True)
+    gene_key = Column(Integer, ForeignKey("gene.id"), index=True)
     pvalue = Column(Float, index=True)
     beta = Column(Float)
     se = Column(Float)
+    r2 = Column(Float)
+    study_key = Column(SmallInteger, ForeignKey("study.id"), primary_key=True)
     gene = relationship("Gene", back_populates="associations")
     variant = relationship("Variant", back_populates="associations")
-    
-app = FastAPI()
+    study = relationship("Study")
+
+    # Keyset pagination on /associations/ walks (pvalue, id) within a gene
+    __table_args__ = (Index("ix_association_gene_key_pvalue_id", "gene_key", "pvalue", "id"),)
+
+class GeneSummary(Base):
+    # Lead association and hit counts of every gene in every study, rebuilt by
+    # ingestion for a study each time its partition is swapped in
+    __tablename__ = "gene_summary"
+    study_key = Column(SmallInteger, ForeignKey("study.id"), primary_key=True)
+    gene_key = Column(Integer, ForeignKey("gene.id"), primary_key=True, index=True)
+    lead_association_id = Column(BigInteger, nullable=False)
+    lead_variant_key = Column(Integer, ForeignKey("variant.id"))
+    min_pvalue = Column(Float)
+    lead_beta = Column(Float)
+    lead_se = Column(Float)
+    hits_genome_wide = Column(Integer, nullable=False)  # p < 5e-8
+    hits_suggestive = Column(Integer, nullable=False)  # p < 1e-5
+    credible_set_size = Column(Integer, nullable=False)  # variants in the 95% credible set
+
+    # /top_genes/ walks (min_pvalue, lead_association_id), within a study or across all of them
+    __table_args__ = (
+        Index("ix_gene_summary_study_key_min_pvalue", "study_key", "min_pvalue", "lead_association_id"),
+        Index("ix_gene_summary_min_pvalue", "min_pvalue", "lead_association_id"),
+    )
+
+class ManhattanBin(Base):
+    # Multi-resolution pyramid of every study's associations, built by ingestion:
+    # at each level, the strongest association of every bin and how many it covers
+    __tablename__ = "manhattan_bin"
+    study_key = Column(SmallInteger, ForeignKey("study.id"), primary_key=True)
+    level = Column(SmallInteger, primary_key=True)
+    chromosome = Column(SmallInteger, primary_key=True)
+    bin = Column(Integer, primary_key=True)  # position // (MANHATTAN_BASE_BIN * MANHATTAN_ZOOM ** level)
+    position = Column(Integer, nullable=False)
+    pvalue = Column(Float, nullable=False)
+    n = Column(Integer, nullable=False)
+
+class GeneOverview(Base):
+    # Materialized view over gene_summary: every gene's best lead p-value over all
+    # studies and the number of studies it is an eGene in. Refreshed by ingestion
+    # at the end of every run, so it can lag behind gene_summary during one.
+    __tablename__ = "gene_overview"
+    gene_key = Column(Integer, primary_key=True)
+    min_pvalue = Column(Float)
+    n_studies = Column(BigInteger)
+    n_egene_studies = Column(BigInteger)
+
+class StudyOverview(Base):
+    # Materialized view over gene_summary, refreshed like gene_overview: genes
+    # tested, eGenes and significant associations of every study
+    __tablename__ = "study_overview"
+    study_key = Column(SmallInteger, primary_key=True)
+    n_genes = Column(BigInteger)
+    n_egenes = Column(BigInteger)
+    hits_genome_wide = Column(BigInteger)
+    hits_suggestive = Column(BigInteger)
+    min_pvalue = Column(Float)
+
+# Chromosome as returned by the API ("18", "X")
+chromosome_name = case(CHROMOSOME_NAMES, value=Variant.chromosome).label("chromosome")
+
+class DataVersion(Base):
+    # Single row bumped by ingestion after every load; cached responses are keyed on it
+    __tablename__ = "data_version"
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_engine()
+    # The server takes requests while warming up; /ready reports when it is done
+    app.state.warmup = asyncio.create_task(warmup.run())
+    yield
+    app.state.warmup.cancel()
+    for pool_engine in named_engines().values():
+        await pool_engine.dispose()
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 origins = [
@@ -54,28 +288,317 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paging, plot and timing headers read by the frontend
+    expose_headers=["X-Next-Cursor", "X-Point-Count", "X-Bin-Width", "Server-Timing"],
 )
 
 # Dependency to get the DB session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
+
+class MemoryCacheBackend:
+    """In-process LRU cache with a per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def size(self) -> int:
+        return len(self._entries)
+
+class RedisCacheBackend:
+    """Cache shared by all workers, stored in Redis (or anything speaking its protocol)."""
+
+    def __init__(self, url: str, ttl_seconds: float, prefix: str = "eqtl:"):
+        import redis.asyncio  # only needed when CACHE_URL is set
+
+        self.client = redis.asyncio.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes):
+        await self.client.set(self.prefix + key, value, ex=max(1, int(self.ttl_seconds)))
+
+    async def size(self) -> int:
+        # Counts only this cache's keys: the Redis database may be shared. SCAN walks it in batches rather than
+        # blocking Redis, so the count is approximate while entries are being written or expire.
+        return sum([1 async for _ in self.client.scan_iter(match=self.prefix + "*", count=1000)])
+
+class ResponseCache:
+    """
+    Caches serialized endpoint responses. Keys are built from the endpoint name,
+    the normalized query parameters and the current data version, so entries
+    written before an ingestion run are never served after it.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.data_version = 0
+        self._version_checked_at = float("-inf")
+        self._version_lock = asyncio.Lock()
+
+    async def current_data_version(self) -> int:
+        if time.monotonic() - self._version_checked_at < DATA_VERSION_CHECK_SECONDS:
+            return self.data_version
+        async with self._version_lock:
+            if time.monotonic() - self._version_checked_at >= DATA_VERSION_CHECK_SECONDS:
+                try:
+                    # Read from a replica, like the responses it keys: a version the replica has not replayed yet
+                    # would get its old data cached under the new key
+                    async with SessionLocal() as db:
+                        version = await db.scalar(select(DataVersion.version).where(DataVersion.id == 1))
+                    self.data_version = version or 0
+                except Exception:
+                    # Keep serving with the last known version if the check fails
+                    pass
+                self._version_checked_at = time.monotonic()
+        return self.data_version
+
+    @staticmethod
+    def normalize_params(params: dict) -> str:
+        normalized = {}
+        for name, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = repr(float(value))
+            normalized[name] = value
+        return urlencode(sorted(normalized.items()))
+
+    async def get_or_build(self, endpoint: str, params: dict, build) -> Response:
+        """
+        Returns the cached response for these parameters, or awaits build() and
+        caches its result. Only 200 responses are cached; the content type and
+        X- headers (such as X-Next-Cursor) are kept alongside the body.
+        """
+        version = await self.current_data_version()
+        key = f"v{version}:{endpoint}?{self.normalize_params(params)}"
+
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            meta, body = cached.split(b"\n", 1)
+            headers = orjson.loads(meta)
+            media_type = headers.pop("content-type", "application/json")
+            headers["X-Cache"] = "HIT"
+            return Response(content=body, media_type=media_type, headers=headers)
+
+        self.misses += 1
+        response = await build()
+        if response.status_code == 200:
+            headers = {name: value for name, value in response.headers.items()
+                       if name.startswith("x-") or name == "content-type"}
+            await self.backend.set(key, orjson.dumps(headers) + b"\n" + response.body)
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    async def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": await self.backend.size(),
+            "data_version": self.data_version,
+        }
+
+response_cache = ResponseCache(
+    RedisCacheBackend(CACHE_URL, CACHE_TTL_SECONDS) if CACHE_URL
+    else MemoryCacheBackend(CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS)
+)
+
+class RequestStats:
+    """Database and serialization work done while handling one request."""
+
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.queries = 0
+        self.rows = 0
+        self.serialize_seconds = 0.0
+        self.slow_queries = []  # (statement, parameters, seconds, engine name)
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (f'db;dur={self.db_seconds * 1000:.1f};desc="{self.queries} queries, {self.rows} rows", '
+                f"serialize;dur={self.serialize_seconds * 1000:.1f}, total;dur={total_seconds * 1000:.1f}")
+
+# Set by the instrumentation middleware; the SQLAlchemy hooks below add to it
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+# Registered on the Engine class because the engine itself is only created on startup
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = request_stats.get()
+    if stats is None:
+        return
+    stats.db_seconds += elapsed
+    stats.queries += 1
+    # -1 for server-side cursors, whose rows are only fetched later
+    stats.rows += max(cursor.rowcount, 0)
+    if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS and not executemany:
+        name = next((name for name, query_engine in named_engines().items()
+                     if query_engine.sync_engine is conn.engine), "primary")
+        stats.slow_queries.append((statement, parameters, elapsed, name))
+
+@contextmanager
+def measure_serialization():
+    """Adds the time spent in the block to the current request's serialization time."""
+    start = time.perf_counter()
+    try:
+        yield
     finally:
-        db.close()
+        stats = request_stats.get()
+        if stats is not None:
+            stats.serialize_seconds += time.perf_counter() - start
+
+class RequestMetrics:
+    """
+    Per-process totals by route, exposed in the Prometheus text format at
+    /metrics. With several workers, every process reports its own totals.
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self.requests = defaultdict(int)  # (route, method, status) -> count
+        self.duration_buckets = defaultdict(lambda: [0] * len(self.BUCKETS))
+        self.duration_sum = defaultdict(float)
+        self.duration_count = defaultdict(int)
+        self.db_seconds = defaultdict(float)
+        self.queries = defaultdict(int)
+        self.rows = defaultdict(int)
+        self.serialize_seconds = defaultdict(float)
+        self.slow_queries = defaultdict(int)
+
+    def observe(self, route: str, method: str, status: int, seconds: float, stats: RequestStats):
+        self.requests[route, method, status] += 1
+        buckets = self.duration_buckets[route]
+        for i, bound in enumerate(self.BUCKETS):
+            if seconds <= bound:
+                buckets[i] += 1
+        self.duration_sum[route] += seconds
+        self.duration_count[route] += 1
+        self.db_seconds[route] += stats.db_seconds
+        self.queries[route] += stats.queries
+        self.rows[route] += stats.rows
+        self.serialize_seconds[route] += stats.serialize_seconds
+        self.slow_queries[route] += len(stats.slow_queries)
+
+    def render(self, cache: dict, pools: dict) -> str:
+        lines = ["# TYPE eqtl_http_requests_total counter"]
+        for (route, method, status), count in sorted(self.requests.items()):
+            lines.append(f'eqtl_http_requests_total{{route="{route}",method="{method}",status="{status}"}} {count}')
+        lines.append("# TYPE eqtl_http_request_duration_seconds histogram")
+        for route in sorted(self.duration_count):
+            for bound, count in zip(self.BUCKETS, self.duration_buckets[route]):
+                lines.append(f'eqtl_http_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {count}')
+            lines.append(f'eqtl_http_request_duration_seconds_bucket{{route="{route}",le="+Inf"}} '
+                         f"{self.duration_count[route]}")
+            lines.append(f'eqtl_http_request_duration_seconds_sum{{route="{route}"}} {self.duration_sum[route]}')
+            lines.append(f'eqtl_http_request_duration_seconds_count{{route="{route}"}} {self.duration_count[route]}')
+        for name, values in (("eqtl_db_seconds_total", self.db_seconds), ("eqtl_db_queries_total", self.queries),
+                             ("eqtl_db_rows_total", self.rows),
+                             ("eqtl_serialization_seconds_total", self.serialize_seconds),
+                             ("eqtl_slow_queries_total", self.slow_queries)):
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f'{name}{{route="{route}"}} {value}' for route, value in sorted(values.items()))
+        lines.append("# TYPE eqtl_cache_hits_total counter")
+        lines.append(f"eqtl_cache_hits_total {cache['hits']}")
+        lines.append("# TYPE eqtl_cache_misses_total counter")
+        lines.append(f"eqtl_cache_misses_total {cache['misses']}")
+        lines.append("# TYPE eqtl_data_version gauge")
+        lines.append(f"eqtl_data_version {cache['data_version']}")
+        lines.append("# TYPE eqtl_db_pool_connections gauge")
+        for name, pool in pools.items():
+            lines.append(f'eqtl_db_pool_connections{{pool="{name}",state="checked_out"}} {pool.checkedout()}')
+            lines.append(f'eqtl_db_pool_connections{{pool="{name}",state="idle"}} {pool.checkedin()}')
+        return "\n".join(lines) + "\n"
+
+request_metrics = RequestMetrics()
+# Keeps the background EXPLAIN tasks referenced until they finish
+explain_tasks = set()
+
+async def explain_slow_query(route: str, statement: str, parameters, seconds: float, engine_name: str):
+    """Re-runs a slow query with EXPLAIN ANALYZE on its own connection to the same database and logs the plan."""
+    try:
+        async with named_engines()[engine_name].connect() as conn:
+            result = await conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters)
+            plan = "\n".join(row[0] for row in result)
+    except Exception as e:
+        plan = f"EXPLAIN failed: {e}"
+    logger.warning("Slow query in %s on %s (%.0f ms):\n%s\nparameters: %r\n%s",
+                   route, engine_name, seconds * 1000, statement, parameters, plan)
+
+@app.middleware("http")
+async def instrument_requests(request: Request, call_next):
+    """
+    Records the database time, query count, rows and serialization time of
+    every request in /metrics and in its Server-Timing header. Work done while
+    a streaming response is being sent is not included.
+    """
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        request_stats.reset(token)
+    elapsed = time.perf_counter() - start
+
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    request_metrics.observe(route, request.method, response.status_code, elapsed, stats)
+    response.headers["Server-Timing"] = stats.server_timing(elapsed)
+    for statement, parameters, seconds, engine_name in stats.slow_queries:
+        if statement.lstrip()[:6].upper() in ("SELECT", "WITH"):
+            task = asyncio.create_task(explain_slow_query(route, statement, parameters, seconds, engine_name))
+            explain_tasks.add(task)
+            task.add_done_callback(explain_tasks.discard)
+    return response
 
 @app.get("/")
 async def read_root():
     return {"message": "Welcome to the eQTL Catalogue Backend!"}
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
-    try:
-        # Try to make a simple query to the database
-        db.execute(text("SELECT 1"))
-        return {"status": "ok", "database": "connected"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Database connection failed: {e}")
+async def health_check():
+    # Try to make a simple query to the primary and to every read replica
+    for name, pool_engine in named_engines().items():
+        try:
+            async with pool_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Database connection failed ({name}): {e}")
+    return {"status": "ok", "database": "connected", "read_replicas": len(DATABASE_READ_URLS)}
 
 class VariantBase(BaseModel):
     variant_id: str
@@ -107,6 +630,25 @@ class AssociationBase(BaseModel):
     class Config:
         from_attributes = True
 
+class GeneSummaryBase(BaseModel):
+    study_id: str
+    min_pvalue: float
+    beta: Optional[float] = None
+    se: Optional[float] = None
+    hits_genome_wide: int
+    hits_suggestive: int
+    credible_set_size: int
+    lead_variant: VariantBase
+    gene: GeneBase
+
+class StudyOverviewBase(BaseModel):
+    study_id: str
+    n_genes: Optional[int] = None
+    n_egenes: Optional[int] = None
+    hits_genome_wide: Optional[int] = None
+    hits_suggestive: Optional[int] = None
+    min_pvalue: Optional[float] = None
+
 class EffectSizeResponse(BaseModel):
     beta: float
     se: float
@@ -116,33 +658,927 @@ class EffectSizeResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class EffectSizeBatchRequest(BaseModel):
+    # Parallel arrays rather than a list of objects: cheaper to validate at 100k pairs
+    # and bound directly as the arrays unnested by the query
+    variant_ids: list[str] = Field(..., max_length=MAX_EFFECT_SIZE_BATCH)
+    gene_ids: list[str] = Field(..., max_length=MAX_EFFECT_SIZE_BATCH)
+
+    @model_validator(mode="after")
+    def check_lengths(self):
+        if len(self.variant_ids) != len(self.gene_ids):
+            raise ValueError("variant_ids and gene_ids must have the same length.")
+        return self
+
+def encode_cursor(pvalue: float, association_id: int) -> str:
+    """Encodes a keyset position: the sort value (a p-value, or a position on /region/) and the id."""
+    return base64.urlsafe_b64encode(json.dumps([pvalue, association_id]).encode()).decode()
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        pvalue, association_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(pvalue), int(association_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def filter_associations(statement, gene_name: Optional[str], p_value_threshold: float, study_id: Optional[str] = None):
+    if gene_name:
+        statement = statement.where(Gene.gene_name == gene_name)
+    if study_id:
+        # A scalar subquery rather than a join, so PostgreSQL prunes to the study's partition at run time
+        statement = statement.where(
+            Association.study_key == select(Study.id).where(Study.study_id == study_id).scalar_subquery())
+    return statement.where(Association.pvalue <= p_value_threshold)
+
+# Columns behind an AssociationBase, selected as plain rows on the list endpoints
+ASSOCIATION_ROW_COLUMNS = (
+    Association.id, Association.pvalue, Association.beta, Association.se,
+    Variant.variant_id, Variant.rsid, chromosome_name, Variant.position, Variant.ref, Variant.alt,
+    Gene.gene_id, Gene.median_tpm, Gene.gene_name,
+)
+
+def select_association_rows():
+    return select(*ASSOCIATION_ROW_COLUMNS).select_from(Association).join(Association.gene).join(Association.variant)
+
+def association_row_dict(r) -> dict:
+    return {
+        "id": r[0], "pvalue": r[1], "beta": r[2], "se": r[3],
+        "variant": {"variant_id": r[4], "rsid": r[5], "chromosome": r[6], "position": r[7], "ref": r[8], "alt": r[9]},
+        "gene": {"gene_id": r[10], "median_tpm": r[11], "gene_name": r[12]},
+    }
+
+def association_rows_response(rows, headers: Optional[dict] = None) -> Response:
+    """
+    Serializes rows from select_association_rows() in the AssociationBase shape
+    straight to JSON, skipping ORM objects and Pydantic validation.
+    """
+    with measure_serialization():
+        body = orjson.dumps([association_row_dict(r) for r in rows])
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def associations_statement(gene_name: Optional[str], p_value_threshold: float, study_id: Optional[str], limit: int,
+                           cursor: Optional[str] = None):
+    statement = filter_associations(select_association_rows(), gene_name, p_value_threshold, study_id)
+    if cursor:
+        statement = statement.where(tuple_(Association.pvalue, Association.id) > decode_cursor(cursor))
+    return statement.order_by(Association.pvalue, Association.id).limit(limit)
+
 @app.get("/associations/", response_model=list[AssociationBase])
 async def get_associations(
     gene_name: Optional[str] = None,
     p_value_threshold: float = 0.05,
-    db: Session = Depends(get_db)
+    study_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Association).join(Gene).join(Variant)
+    """
+    Returns associations ordered by (pvalue, id). When more rows are available,
+    the X-Next-Cursor response header holds the cursor for the next page.
+    """
+    async def build():
+        result = await db.execute(associations_statement(gene_name, p_value_threshold, study_id, limit, cursor))
+        rows = result.all()
 
-    if gene_name:
-        query = query.filter(Gene.gene_name == gene_name)
-    
-    query = query.filter(Association.pvalue <= p_value_threshold)
-    
-    return query.limit(100).all() # Limit to 100 for now to avoid large responses
+        headers = {}
+        if len(rows) == limit:
+            last = rows[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.pvalue, last.id)
+        return association_rows_response(rows, headers)
+
+    params = {"gene_name": gene_name, "p_value_threshold": p_value_threshold, "study_id": study_id,
+              "limit": limit, "cursor": cursor}
+    return await response_cache.get_or_build("associations", params, build)
+
+EXPORT_COLUMNS = [
+    Association.id, Study.study_id, Variant.variant_id, Variant.rsid, chromosome_name,
+    Variant.position, Variant.ref, Variant.alt, Gene.gene_id, Gene.gene_name,
+    Association.pvalue, Association.beta, Association.se,
+]
+
+async def export_rows(gene_name: Optional[str], p_value_threshold: float, study_id: Optional[str], fmt: str):
+    """
+    Yields the export body in batches, reading from a server-side cursor so the
+    full result set is never held in memory.
+    """
+    statement = filter_associations(
+        select(*EXPORT_COLUMNS).select_from(Association).join(Gene).join(Variant).outerjoin(Study),
+        gene_name, p_value_threshold, study_id
+    ).order_by(Association.pvalue, Association.id)
+    names = [column.key for column in EXPORT_COLUMNS]
+
+    # The request-scoped session is closed once the endpoint returns, so the
+    # stream uses its own session for as long as the client keeps reading.
+    async with SessionLocal() as db:
+        result = await db.stream(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(names)
+            async for rows in result.partitions():
+                writer.writerows(rows)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            async for rows in result.partitions():
+                yield b"".join(orjson.dumps(dict(zip(names, row))) + b"\n" for row in rows)
+
+GENE_SUMMARY_COLUMNS = (
+    Study.study_id, GeneSummary.min_pvalue, GeneSummary.lead_beta, GeneSummary.lead_se,
+    GeneSummary.hits_genome_wide, GeneSummary.hits_suggestive, GeneSummary.credible_set_size,
+    Variant.variant_id, Variant.rsid, chromosome_name, Variant.position, Variant.ref, Variant.alt,
+    Gene.gene_id, Gene.median_tpm, Gene.gene_name, GeneSummary.lead_association_id,
+)
+
+def select_gene_summary_rows():
+    return (select(*GENE_SUMMARY_COLUMNS).select_from(GeneSummary)
+            .join(Study, Study.id == GeneSummary.study_key)
+            .join(Gene, Gene.id == GeneSummary.gene_key)
+            .outerjoin(Variant, Variant.id == GeneSummary.lead_variant_key))
+
+def gene_summary_rows_response(rows, headers: Optional[dict] = None) -> Response:
+    with measure_serialization():
+        body = orjson.dumps([{
+            "study_id": r[0], "min_pvalue": r[1], "beta": r[2], "se": r[3],
+            "hits_genome_wide": r[4], "hits_suggestive": r[5], "credible_set_size": r[6],
+            "lead_variant": {"variant_id": r[7], "rsid": r[8], "chromosome": r[9], "position": r[10],
+                             "ref": r[11], "alt": r[12]},
+            "gene": {"gene_id": r[13], "median_tpm": r[14], "gene_name": r[15]},
+        } for r in rows])
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/gene_summary/", response_model=list[GeneSummaryBase])
+async def get_gene_summary(
+    gene_name: Optional[str] = None,
+    gene_id: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Returns the lead eQTL of a gene in every study it was tested in, strongest first."""
+    if not gene_name and not gene_id:
+        raise HTTPException(status_code=400, detail="Either gene_name or gene_id is required.")
+
+    async def build():
+        statement = select_gene_summary_rows()
+        if gene_id:
+            statement = statement.where(
+                GeneSummary.gene_key == select(Gene.id).where(Gene.gene_id == gene_id).scalar_subquery())
+        if gene_name:
+            statement = statement.where(Gene.gene_name == gene_name)
+        result = await db.execute(statement.order_by(GeneSummary.min_pvalue, GeneSummary.lead_association_id))
+        return gene_summary_rows_response(result.all())
+
+    return await response_cache.get_or_build("gene_summary", {"gene_name": gene_name, "gene_id": gene_id}, build)
+
+@app.get("/top_genes/", response_model=list[GeneSummaryBase])
+async def get_top_genes(
+    study_id: Optional[str] = None,
+    p_value_threshold: float = 5e-8,
+    limit: int = Query(100, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Returns the genes whose lead eQTL reaches p_value_threshold, in a study or
+    across all studies (one row per gene and study), ordered by lead p-value.
+    Pages like /associations/, through the X-Next-Cursor response header.
+    """
+    async def build():
+        statement = select_gene_summary_rows().where(GeneSummary.min_pvalue <= p_value_threshold)
+        if study_id:
+            statement = statement.where(
+                GeneSummary.study_key == select(Study.id).where(Study.study_id == study_id).scalar_subquery())
+        if cursor:
+            statement = statement.where(
+                tuple_(GeneSummary.min_pvalue, GeneSummary.lead_association_id) > decode_cursor(cursor))
+
+        result = await db.execute(
+            statement.order_by(GeneSummary.min_pvalue, GeneSummary.lead_association_id).limit(limit))
+        rows = result.all()
+
+        headers = {}
+        if len(rows) == limit:
+            last = rows[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.min_pvalue, last.lead_association_id)
+        return gene_summary_rows_response(rows, headers)
+
+    params = {"study_id": study_id, "p_value_threshold": p_value_threshold, "limit": limit, "cursor": cursor}
+    return await response_cache.get_or_build("top_genes", params, build)
+
+@app.get("/studies/", response_model=list[StudyOverviewBase])
+async def get_studies(db: AsyncSession = Depends(get_db)):
+    """
+    Lists the loaded studies with their number of genes tested, eGenes (genes
+    with a genome-wide significant lead eQTL) and associations below 5e-8 and
+    1e-5, from the study_overview materialized view. The counts of a study
+    loaded since its last refresh are null until ingestion finishes.
+    """
+    async def build():
+        result = await db.execute(
+            select(Study.study_id, StudyOverview.n_genes, StudyOverview.n_egenes, StudyOverview.hits_genome_wide,
+                   StudyOverview.hits_suggestive, StudyOverview.min_pvalue)
+            .outerjoin(StudyOverview, StudyOverview.study_key == Study.id)
+            .order_by(Study.study_id)
+        )
+        with measure_serialization():
+            body = orjson.dumps([dict(row._mapping) for row in result])
+        return Response(content=body, media_type="application/json")
+
+    return await response_cache.get_or_build("studies", {}, build)
+
+@app.get("/associations/export")
+async def export_associations(
+    gene_name: Optional[str] = None,
+    p_value_threshold: float = 0.05,
+    study_id: Optional[str] = None,
+    format: Literal["ndjson", "csv"] = "ndjson"
+):
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_rows(gene_name, p_value_threshold, study_id, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="associations.{format}"'},
+    )
+
+def effect_size_statement(variant_id: str, gene_id: str):
+    return select_association_rows().where(
+        # Resolve the IDs to keys first so the association indexes are searched for constants
+        Association.variant_key == select(Variant.id).where(Variant.variant_id == variant_id).scalar_subquery(),
+        Association.gene_key == select(Gene.id).where(Gene.gene_id == gene_id).scalar_subquery()
+    ).limit(1)
 
 @app.get("/effect_size/", response_model=EffectSizeResponse)
 async def get_effect_size(
     variant_id: str,
     gene_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
+):
+    async def build():
+        row = (await db.execute(effect_size_statement(variant_id, gene_id))).first()
+
+        if not row:
+            raise HTTPException(status_code=404, detail="Effect size not found for the given variant and gene.")
+
+        with measure_serialization():
+            association = association_row_dict(row)
+            body = orjson.dumps({name: association[name] for name in ("beta", "se", "variant", "gene")})
+        return Response(content=body, media_type="application/json")
+
+    return await response_cache.get_or_build("effect_size", {"variant_id": variant_id, "gene_id": gene_id}, build)
+
+@app.get("/region/", response_model=list[AssociationBase])
+async def get_region(
+    chromosome: str,
+    start: int = Query(..., ge=0),
+    end: int = Query(..., ge=0),
+    p_value_threshold: float = 0.05,
+    limit: int = Query(1000, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Returns the associations of variants in a window, ordered by (position, id).
+    Pages like /associations/: when more rows are available, the X-Next-Cursor
+    response header holds the cursor for the next page.
+    """
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be smaller than start.")
+    if end - start > MAX_REGION_SIZE:
+        raise HTTPException(status_code=400, detail=f"Regions are limited to {MAX_REGION_SIZE} bp.")
+
+    chromosome = normalize_chromosome(chromosome)
+
+    async def build():
+        statement = select_association_rows().where(
+            Variant.chromosome == CHROMOSOME_CODES[chromosome],
+            Variant.position.between(start, end),
+            Association.pvalue <= p_value_threshold
+        )
+        if cursor:
+            position, association_id = decode_cursor(cursor)
+            statement = statement.where(tuple_(Variant.position, Association.id) > (int(position), association_id))
+
+        result = await db.execute(statement.order_by(Variant.position, Association.id).limit(limit))
+        rows = result.all()
+
+        headers = {}
+        if len(rows) == limit:
+            last = rows[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last.position, last.id)
+        return association_rows_response(rows, headers)
+
+    params = {"chromosome": chromosome, "start": start, "end": end,
+              "p_value_threshold": p_value_threshold, "limit": limit, "cursor": cursor}
+    return await response_cache.get_or_build("region", params, build)
+
+EFFECT_SIZE_BATCH_COLUMNS = [
+    Variant.variant_id, Gene.gene_id, Study.study_id,
+    Association.beta, Association.se, Association.pvalue,
+]
+
+async def effect_size_batch_rows(variant_ids: list[str], gene_ids: list[str]):
+    """
+    Yields NDJSON for every association matching one of the requested pairs, in
+    request order. The pairs are sent as two arrays and joined against
+    association in a single query.
+    """
+    pairs = func.unnest(
+        bindparam("variant_ids", variant_ids, type_=ARRAY(String)),
+        bindparam("gene_ids", gene_ids, type_=ARRAY(String)),
+    ).table_valued("variant_id", "gene_id", with_ordinality="ordinality").render_derived(name="pairs")
+    statement = (
+        select(*EFFECT_SIZE_BATCH_COLUMNS).select_from(pairs)
+        .join(Variant, Variant.variant_id == pairs.c.variant_id)
+        .join(Gene, Gene.gene_id == pairs.c.gene_id)
+        .join(Association, (Association.variant_key == Variant.id) & (Association.gene_key == Gene.id))
+        .outerjoin(Study)
+        .order_by(pairs.c.ordinality, Study.study_id)
+    )
+    names = [column.key for column in EFFECT_SIZE_BATCH_COLUMNS]
+
+    async with SessionLocal() as db:
+        result = await db.stream(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            yield b"".join(orjson.dumps(dict(zip(names, row))) + b"\n" for row in rows)
+
+
+@app.post("/effect_size/batch")
+async def get_effect_size_batch(request: EffectSizeBatchRequest):
+    """
+    Looks up the effect sizes of up to MAX_EFFECT_SIZE_BATCH variant-gene pairs.
+    Streams one JSON object per matching association (one per study); pairs
+    without an association are left out.
+    """
+    return StreamingResponse(
+        effect_size_batch_rows(request.variant_ids, request.gene_ids),
+        media_type="application/x-ndjson",
+    )
+
+def compare_matrices(study_keys, column_keys, values: dict, limit: int):
+    """
+    Scatters association rows into study x column matrices, one per entry of
+    values (NaN where a study did not test a column), keeping the `limit`
+    columns with the lowest p-value in any study, strongest first.
+
+    Returns:
+        tuple: (study keys of the rows, keys of the kept columns, {name: matrix}).
+    """
+    studies, row = np.unique(study_keys, return_inverse=True)
+    columns, column = np.unique(column_keys, return_inverse=True)
+    best = np.full(len(columns), np.inf)
+    np.fmin.at(best, column, np.nan_to_num(values["pvalue"], nan=np.inf))
+    kept = np.argsort(best, kind="stable")[:limit]
+    position = np.full(len(columns), -1)
+    position[kept] = np.arange(len(kept))
+    selected = position[column] >= 0
+    matrices = {}
+    for name, value in values.items():
+        matrix = np.full((len(studies), len(kept)), np.nan)
+        matrix[row[selected], position[column[selected]]] = value[selected]
+        matrices[name] = matrix
+    return studies, columns[kept], matrices
+
+def cross_study_summary(beta, se, pvalue, p_value_threshold: float) -> dict:
+    """
+    Per-column statistics over the studies (rows) of the matrices:
+
+    - n_studies, n_significant and sharing: studies that tested the column, those
+      with p <= p_value_threshold, and their ratio
+    - meta_beta, meta_se, meta_pvalue: inverse-variance weighted fixed-effect
+      meta-analysis
+    - cochran_q and i2: heterogeneity of the effects around meta_beta (i2 is
+      null with fewer than two studies)
+    - concordance: fraction of studies whose effect has the sign of meta_beta
+    """
+    tested = np.isfinite(beta) & np.isfinite(se) & (np.nan_to_num(se) > 0)
+    n_studies = tested.sum(axis=0)
+    n_significant = (np.nan_to_num(pvalue, nan=np.inf) <= p_value_threshold).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(tested, 1 / np.where(tested, se, 1.0) ** 2, 0.0)
+        effect = np.where(tested, beta, 0.0)
+        total_weight = weight.sum(axis=0)
+        meta_beta = (weight * effect).sum(axis=0) / total_weight
+        meta_se = 1 / np.sqrt(total_weight)
+        q = (weight * (effect - meta_beta) ** 2).sum(axis=0)
+        df = n_studies - 1
+        i2 = np.where(n_studies >= 2, np.where(q > df, (q - df) / q, 0.0), np.nan)
+        concordance = (tested & (np.sign(effect) == np.sign(meta_beta))).sum(axis=0) / n_studies
+        sharing = n_significant / n_studies
+        meta_pvalue = erfc(np.abs(meta_beta / meta_se) / math.sqrt(2))
+    return {
+        "n_studies": n_studies, "n_significant": n_significant, "sharing": sharing,
+        "meta_beta": meta_beta, "meta_se": meta_se, "meta_pvalue": meta_pvalue,
+        "cochran_q": np.where(n_studies > 0, q, np.nan), "i2": i2, "concordance": concordance,
+    }
+
+@app.get("/compare/")
+async def compare_studies(
+    gene_name: Optional[str] = None,
+    gene_id: Optional[str] = None,
+    variant_id: Optional[str] = None,
+    p_value_threshold: float = 5e-8,
+    limit: int = Query(200, ge=1, le=MAX_COMPARE_COLUMNS),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Compares the eQTLs of a gene (or of a variant) across every loaded study.
+
+    For a gene, returns study x variant matrices of beta, se and pvalue over its
+    `limit` variants with the lowest p-value in any study; for a variant, study x
+    gene matrices over the genes it was tested against. Untested cells are null.
+    A gene_name shared by several genes is rejected with their gene_ids.
+    `summary` holds per-column sharing and heterogeneity statistics (see
+    cross_study_summary()), all as arrays parallel to the columns.
+    """
+    if sum(bool(value) for value in (gene_name or gene_id, variant_id)) != 1:
+        raise HTTPException(status_code=400, detail="Give either gene_name/gene_id or variant_id.")
+
+    async def build():
+        if variant_id:
+            column_key = Association.gene_key
+            condition = Association.variant_key == (
+                select(Variant.id).where(Variant.variant_id == variant_id).scalar_subquery())
+        else:
+            column_key = Association.variant_key
+            gene = Gene.gene_id == gene_id if gene_id else Gene.gene_name == gene_name
+            genes = (await db.execute(select(Gene.id, Gene.gene_id).where(gene).order_by(Gene.gene_id))).all()
+            if len(genes) > 1:
+                raise HTTPException(status_code=400, detail=f"{gene_name} names several genes; give one of their "
+                                                            f"gene_ids: {', '.join(r[1] for r in genes)}.")
+            condition = Association.gene_key == (genes[0][0] if genes else None)
+        # One round trip returning column arrays, which NumPy takes without building a row object per association
+        arrays = (await db.execute(
+            select(func.array_agg(Association.study_key), func.array_agg(column_key),
+                   func.array_agg(Association.beta), func.array_agg(Association.se),
+                   func.array_agg(Association.pvalue)).where(condition)
+        )).one()
+        if arrays[0] is None:
+            raise HTTPException(status_code=404, detail="No associations found.")
+        study_keys, column_keys = np.array(arrays[0]), np.array(arrays[1])
+        values = {name: np.array(array, dtype=float) for name, array in zip(("beta", "se", "pvalue"), arrays[2:])}
+        study_keys, column_keys, matrices = compare_matrices(study_keys, column_keys, values, limit)
+        summary = cross_study_summary(matrices["beta"], matrices["se"], matrices["pvalue"], p_value_threshold)
+
+        keys = bindparam("keys", column_keys.tolist(), type_=ARRAY(Integer))
+        if variant_id:
+            result = await db.execute(select(Gene.id, Gene.gene_id, Gene.gene_name).where(Gene.id == any_(keys)))
+            by_key = {r[0]: {"gene_id": r[1], "gene_name": r[2]} for r in result}
+        else:
+            result = await db.execute(
+                select(Variant.id, Variant.variant_id, Variant.rsid, chromosome_name, Variant.position, Variant.ref,
+                       Variant.alt).where(Variant.id == any_(keys)))
+            by_key = {r[0]: {"variant_id": r[1], "rsid": r[2], "chromosome": r[3], "position": r[4],
+                             "ref": r[5], "alt": r[6]} for r in result}
+        study_names = dict((await db.execute(select(Study.id, Study.study_id).where(
+            Study.id == any_(bindparam("studies", study_keys.tolist(), type_=ARRAY(Integer)))))).all())
+        studies = [study_names.get(key) for key in study_keys.tolist()]
+        # Rows in study ID order
+        order = sorted(range(len(studies)), key=lambda row: studies[row] or "")
+        studies = [studies[row] for row in order]
+        matrices = {name: matrix[order] for name, matrix in matrices.items()}
+
+        with measure_serialization():
+            body = orjson.dumps({
+                "studies": studies,
+                "genes" if variant_id else "variants": [by_key.get(key) for key in column_keys.tolist()],
+                "p_value_threshold": p_value_threshold,
+                **matrices,
+                "summary": summary,
+            }, option=orjson.OPT_SERIALIZE_NUMPY)
+        return Response(content=body, media_type="application/json")
+
+    params = {"gene_name": gene_name, "gene_id": gene_id, "variant_id": variant_id,
+              "p_value_threshold": p_value_threshold, "limit": limit}
+    return await response_cache.get_or_build("compare", params, build)
+
+def manhattan_level(bp_per_pixel: float) -> Optional[int]:
+    """Coarsest pyramid level whose bins are no wider than a pixel, or None if even level 0 is too coarse."""
+    level = None
+    for candidate in range(MANHATTAN_LEVELS):
+        if MANHATTAN_BASE_BIN * MANHATTAN_ZOOM ** candidate <= bp_per_pixel:
+            level = candidate
+    return level
+
+def neg_log10(pvalue: float) -> float:
+    return -math.log10(max(pvalue, 1e-300))
+
+def manhattan_binary(chromosomes, positions, scores, counts) -> bytes:
+    """
+    Packs the points as consecutive little-endian arrays: position (uint32),
+    -log10 p-value (float32), associations per point (uint32) and chromosome
+    code (uint8). The order keeps every array aligned for typed-array views.
+    """
+    columns = [array.array("I", positions), array.array("f", scores), array.array("I", counts)]
+    if sys.byteorder == "big":
+        for column in columns:
+            column.byteswap()
+    return b"".join(column.tobytes() for column in columns) + bytes(chromosomes)
+
+@app.get("/manhattan/")
+async def get_manhattan(
+    study_id: str,
+    chromosome: Optional[str] = None,
+    start: Optional[int] = Query(None, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    width: int = Query(1000, ge=100, le=10000),
+    p_value_threshold: float = 5e-8,
+    format: Literal["json", "binary"] = "json",
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Returns the points of a Manhattan plot of a study, genome-wide or for a
+    chromosome or region, at a resolution of `width` pixels. Every association
+    with p <= p_value_threshold is returned; weaker ones are reduced to the
+    strongest association per bin of the finest pyramid level that is still no
+    finer than a pixel (or per pixel, thinned on the fly, when zoomed in further).
+    n is the number of associations a point stands for. In a bin whose strongest
+    association is significant, the strongest point also counts the bin's weaker
+    associations, so n adds up to every association in the plot.
+
+    With format=json the points come as parallel arrays; with format=binary as
+    the packed arrays described in manhattan_binary(), with the number of points
+    in the X-Point-Count header.
+    """
+    if chromosome is None:
+        if start is not None or end is not None:
+            raise HTTPException(status_code=400, detail="start and end require a chromosome.")
+        chromosome_code = None
+        span = sum(CHROMOSOME_LENGTHS.values())
+    else:
+        chromosome = normalize_chromosome(chromosome)
+        chromosome_code = CHROMOSOME_CODES[chromosome]
+        start = start or 0
+        end = CHROMOSOME_LENGTHS[chromosome_code] if end is None else end
+        if end <= start:
+            raise HTTPException(status_code=400, detail="end must be larger than start.")
+        span = end - start
+    bp_per_pixel = span / width
+    level = manhattan_level(bp_per_pixel)
+
+    async def build():
+        study_key = select(Study.id).where(Study.study_id == study_id).scalar_subquery()
+        significant = (
+            select(Variant.chromosome, Variant.position, Association.pvalue)
+            .select_from(Association).join(Variant, Variant.id == Association.variant_key)
+            .where(Association.study_key == study_key, Association.pvalue <= p_value_threshold)
+        )
+        if chromosome_code is not None:
+            significant = significant.where(Variant.chromosome == chromosome_code,
+                                            Variant.position.between(start, end))
+        else:
+            significant = significant.where(Variant.chromosome.isnot(None), Variant.position.isnot(None))
+
+        if level is not None:
+            bin_width = MANHATTAN_BASE_BIN * MANHATTAN_ZOOM ** level
+            # Bins led by a significant association too, for the number of weaker associations they hold
+            thinned = select(ManhattanBin.chromosome, ManhattanBin.position, ManhattanBin.pvalue,
+                             ManhattanBin.n).where(ManhattanBin.study_key == study_key,
+                                                   ManhattanBin.level == level)
+            if chromosome_code is not None:
+                thinned = thinned.where(ManhattanBin.chromosome == chromosome_code,
+                                        ManhattanBin.bin.between(start // bin_width, end // bin_width),
+                                        ManhattanBin.position.between(start, end))
+        else:
+            # Zoomed in below the finest level: thin the region's rows per pixel instead
+            bin_width = max(1, int(bp_per_pixel))
+            pixel = Variant.position // bin_width
+            thinned = (
+                select(Variant.chromosome, Variant.position, Association.pvalue,
+                       func.count().over(partition_by=pixel))
+                .select_from(Association).join(Variant, Variant.id == Association.variant_key)
+                .where(Association.study_key == study_key, Association.pvalue > p_value_threshold,
+                       Variant.chromosome == chromosome_code, Variant.position.between(start, end))
+                .distinct(pixel).order_by(pixel, Association.pvalue, Association.id)
+            )
+
+        points = [[c, p, pvalue, 1] for c, p, pvalue in (await db.execute(significant)).all()]
+        significant_bins = {}
+        if level is not None:
+            for point in points:
+                significant_bins.setdefault((point[0], point[1] // bin_width), []).append(point)
+        for c, p, pvalue, n in (await db.execute(thinned)).all():
+            covered = significant_bins.get((c, p // bin_width)) if pvalue <= p_value_threshold else None
+            if covered is None:
+                points.append([c, p, pvalue, n])
+            else:
+                min(covered, key=lambda point: point[2])[3] += max(n - len(covered), 0)
+        points.sort(key=lambda point: (point[0], point[1]))
+        chromosomes = [point[0] for point in points]
+        positions = [point[1] for point in points]
+        scores = [neg_log10(point[2]) for point in points]
+        counts = [point[3] for point in points]
+
+        headers = {"X-Point-Count": str(len(points)), "X-Bin-Width": str(bin_width)}
+        if format == "binary":
+            with measure_serialization():
+                body = manhattan_binary(chromosomes, positions, scores, counts)
+            return Response(content=body, media_type="application/octet-stream", headers=headers)
+        with measure_serialization():
+            body = orjson.dumps({
+                "study_id": study_id, "level": level, "bin_width": bin_width, "p_value_threshold": p_value_threshold,
+                "chromosome": [CHROMOSOME_NAMES.get(code) for code in chromosomes], "position": positions,
+                "neg_log10_pvalue": scores, "n": counts,
+            })
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    params = {"study_id": study_id, "chromosome": chromosome, "start": start, "end": end, "width": width,
+              "p_value_threshold": p_value_threshold, "format": format}
+    return await response_cache.get_or_build("manhattan", params, build)
+
+class GeneSearchIndex:
+    """
+    Gene symbols and Ensembl IDs held as one sorted in-memory array, so prefix
+    lookups are two binary searches. It is loaded in the background at startup
+    and reloaded whenever the data version changes.
+    """
+
+    def __init__(self):
+        self._keys = []  # upper-cased symbols and IDs, sorted
+        self._entries = []  # (gene position in self._genes) for every key
+        self._genes = []  # (gene_id, gene_name, best p-value over all studies)
+        self._version = None
+        self._lock = asyncio.Lock()
+
+    async def load(self, version: int):
+        # From the gene_overview materialized view rather than grouping every row of gene_summary
+        statement = (
+            select(Gene.gene_id, Gene.gene_name, GeneOverview.min_pvalue)
+            .outerjoin(GeneOverview, GeneOverview.gene_key == Gene.id)
+        )
+        async with SessionLocal() as db:
+            genes = (await db.execute(statement)).all()
+        keyed = sorted(
+            (key.upper(), position)
+            for position, (gene_id, gene_name, _) in enumerate(genes)
+            for key in {gene_id, gene_name} if key
+        )
+        self._keys = [key for key, _ in keyed]
+        self._entries = [position for _, position in keyed]
+        self._genes = [tuple(gene) for gene in genes]
+        self._version = version
+
+    async def ensure_loaded(self):
+        version = await response_cache.current_data_version()
+        if self._version != version:
+            async with self._lock:
+                if self._version != version:
+                    await self.load(version)
+
+    def search(self, prefix: str, limit: int) -> list[dict]:
+        """
+        Genes whose symbol or ID starts with prefix (case-insensitive). Exact
+        matches come first, then shorter names, then genes with stronger eQTLs.
+        Very short prefixes (such as "ENSG") keep alphabetical order, which
+        bounds the work per keystroke.
+        """
+        prefix = prefix.upper()
+        low = bisect.bisect_left(self._keys, prefix)
+        high = bisect.bisect_left(self._keys, prefix + "\U0010ffff", lo=low)
+        if high - low > MAX_SEARCH_RANKED:
+            top = list(dict.fromkeys(self._entries[low:low + MAX_SEARCH_RANKED]))[:limit]
+        else:
+            ranked = {}
+            for index in range(low, high):
+                key, position = self._keys[index], self._entries[index]
+                best_pvalue = self._genes[position][2]
+                rank = (key != prefix, len(key), best_pvalue is None, best_pvalue or 0.0, key)
+                if position not in ranked or rank < ranked[position]:
+                    ranked[position] = rank
+            top = heapq.nsmallest(limit, ranked, key=ranked.get)
+        return [{"type": "gene", "gene_id": self._genes[position][0], "gene_name": self._genes[position][1],
+                 "min_pvalue": self._genes[position][2]} for position in top]
+
+gene_search_index = GeneSearchIndex()
+
+class Warmup:
+    """
+    Startup work that would otherwise land on the first requests: checks that
+    the tables and materialized views exist on every read engine, opens
+    DB_WARM_CONNECTIONS pooled connections to each and prepares the hot
+    statements on them (asyncpg keeps prepared statements per connection), and
+    loads the data version and the gene search index. Failed attempts, such as
+    while a database is still starting, are retried.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.error = None
+        self.timings = {}
+
+    @staticmethod
+    def hot_statements():
+        # Parameter values do not matter: statements are cached by their SQL, and these match nothing
+        return [
+            select(DataVersion.version).where(DataVersion.id == 1),
+            associations_statement(" ", 0.05, None, 100),
+            effect_size_statement(" ", " "),
+        ]
+
+    async def prepare(self, conn):
+        for statement in self.hot_statements():
+            await conn.execute(statement)
+
+    @staticmethod
+    def relation_names(sync_conn) -> set:
+        inspector = inspect(sync_conn)
+        return set(inspector.get_table_names()) | set(inspector.get_materialized_view_names())
+
+    async def warm(self):
+        start = time.perf_counter()
+        for read_engine in read_engines:
+            async with read_engine.connect() as conn:
+                relations = await conn.run_sync(self.relation_names)
+            missing = sorted(set(Base.metadata.tables) - relations)
+            if missing:
+                raise RuntimeError(f"Missing tables: {', '.join(missing)}")
+        self.timings["schema_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        connections = await asyncio.gather(*(read_engine.connect() for read_engine in read_engines
+                                             for _ in range(DB_WARM_CONNECTIONS)), return_exceptions=True)
+        try:
+            for conn in connections:
+                if isinstance(conn, BaseException):
+                    raise conn
+            await asyncio.gather(*(self.prepare(conn) for conn in connections))
+        finally:
+            # Back to the pool, still holding their prepared statements
+            await asyncio.gather(*(conn.close() for conn in connections if not isinstance(conn, BaseException)))
+        self.timings["connections"] = len(connections)
+        self.timings["connections_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await gene_search_index.ensure_loaded()
+        self.timings["reference_data_seconds"] = time.perf_counter() - start
+
+    async def run(self):
+        delay = 1.0
+        while True:
+            try:
+                await self.warm()
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                logger.warning("Warm-up failed, retrying in %.0fs: %s", delay, self.error)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                continue
+            self.ready = True
+            self.error = None
+            self.timings["ready_after_seconds"] = time.perf_counter() - IMPORTED_AT
+            return
+
+warmup = Warmup()
+
+@app.get("/ready")
+async def readiness():
+    """
+    Readiness probe: 503 until the startup warm-up has finished, then 200 with
+    its timings. /health only checks that the database answers.
+    """
+    if not warmup.ready:
+        raise HTTPException(status_code=503, detail=warmup.error or "Warming up.")
+    return {"status": "ready", **warmup.timings}
+
+async def search_rsids(db: AsyncSession, prefix: str, limit: int) -> list[dict]:
+    """rsIDs starting with prefix, in byte order, read from ix_variant_rsid_prefix."""
+    # Bounding the range instead of using LIKE keeps the index usable with bound parameters
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    rsid = Variant.rsid.collate("C")
+    result = await db.execute(
+        select(Variant.rsid, Variant.variant_id, chromosome_name, Variant.position)
+        .where(rsid >= prefix, rsid < upper).order_by(rsid).limit(limit)
+    )
+    return [{"type": "variant", "rsid": r[0], "variant_id": r[1], "chromosome": r[2], "position": r[3]}
+            for r in result.all()]
+
+@app.get("/search/")
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=MAX_SEARCH_SUGGESTIONS),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Type-ahead suggestions: genes whose symbol or Ensembl ID starts with q and,
+    when q looks like an rsID ("rs" optionally followed by digits), variants
+    whose rsID does.
+    """
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="q must not be blank.")
+    await gene_search_index.ensure_loaded()
+    suggestions = gene_search_index.search(q, limit)
+    # Gene symbols such as RS1 look like rsIDs too, so genes are listed first
+    if q[:2].lower() == "rs" and (q[2:] == "" or q[2:].isdigit()) and len(suggestions) < limit:
+        suggestions += await search_rsids(db, "rs" + q[2:], limit - len(suggestions))
+    with measure_serialization():
+        body = orjson.dumps(suggestions)
+    return Response(content=body, media_type="application/json")
+
+class ParquetStore:
+    """
+    Columnar copy of the associations, partitioned by study and chromosome.
+    The file listing is re-discovered whenever the data version changes, so
+    files written by a new ingestion run are picked up without a restart.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._dataset = None
+        self._version = None
+
+    def dataset(self, version: int):
+        if self._dataset is None or self._version != version:
+            import pyarrow as pa  # only needed when PARQUET_DIR is set
+            import pyarrow.dataset as ds
+            import pyarrow.fs
+
+            partitioning = ds.partitioning(
+                pa.schema([("study_id", pa.string()), ("chromosome", pa.string())]), flavor="hive")
+            self._dataset = ds.dataset(self.root, format="parquet", partitioning=partitioning,
+                                       filesystem=pyarrow.fs.LocalFileSystem(use_mmap=True))
+            self._version = version
+        return self._dataset
+
+parquet_store = ParquetStore(PARQUET_DIR) if PARQUET_DIR else None
+
+def scan_rows(scanner, fmt: str, limit: Optional[int]):
+    """
+    Yields the scan result batch by batch, as NDJSON or as an Arrow IPC stream.
+    Runs in the threadpool: reading and decoding Parquet is blocking work.
+    """
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, scanner.projected_schema) if fmt == "arrow" else None
+    remaining = limit
+    for batch in scanner.to_batches():
+        if remaining is not None:
+            if remaining <= 0:
+                break
+            batch = batch.slice(0, remaining)
+            remaining -= batch.num_rows
+        if not batch.num_rows:
+            continue
+        if writer is None:
+            yield b"".join(orjson.dumps(row) + b"\n" for row in batch.to_pylist())
+            continue
+        writer.write_batch(batch)
+        yield sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+    if writer is not None:
+        writer.close()
+        yield sink.getvalue()
+
+@app.get("/scan/")
+async def scan_associations(
+    study_id: Optional[str] = None,
+    chromosome: Optional[str] = None,
+    start: Optional[int] = Query(None, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    gene_id: Optional[str] = None,
+    p_value_threshold: float = 5e-8,
+    limit: Optional[int] = Query(None, ge=1),
+    format: Literal["ndjson", "arrow"] = "ndjson"
 ):
-    association = db.query(Association).join(Gene).join(Variant).filter(
-        Association.variant_id == variant_id,
-        Association.gene_id == gene_id
-    ).first()
+    """
+    Scans the Parquet copy of the associations instead of PostgreSQL. Meant for
+    bulk queries such as every genome-wide significant hit of a study: study and
+    chromosome filters prune whole partitions, and the p-value and position
+    filters skip row groups by their statistics. Rows are streamed unordered.
+    """
+    if parquet_store is None:
+        raise HTTPException(status_code=503, detail="No Parquet dataset is configured (set PARQUET_DIR).")
+    import pyarrow.compute as pc
+
+    try:
+        dataset = parquet_store.dataset(await response_cache.current_data_version())
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="The Parquet dataset has not been written yet.")
+
+    condition = pc.field("pvalue") <= p_value_threshold
+    if study_id is not None:
+        condition &= pc.field("study_id") == study_id
+    if chromosome is not None:
+        condition &= pc.field("chromosome") == normalize_chromosome(chromosome)
+    if start is not None:
+        condition &= pc.field("position") >= start
+    if end is not None:
+        condition &= pc.field("position") <= end
+    if gene_id is not None:
+        condition &= pc.field("gene_id") == gene_id
+
+    scanner = dataset.scanner(filter=condition, batch_size=SCAN_BATCH_SIZE)
+    media_type = "application/vnd.apache.arrow.stream" if format == "arrow" else "application/x-ndjson"
+    return StreamingResponse(scan_rows(scanner, format, limit), media_type=media_type)
 
-    if not association:
-        raise HTTPException(status_code=404, detail="Effect size not found for the given variant and gene.")
+@app.get("/cache/stats")
+async def cache_stats():
+    return await response_cache.stats()
 
-    return association
\ No newline at end of file
+@app.get("/metrics")
+async def metrics():
+    pools = {name: pool_engine.pool for name, pool_engine in named_engines().items()}
+    return Response(content=request_metrics.render(await response_cache.stats(), pools),
+                    media_type="text/plain; version=0.0.4")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The backend is run from its directory rather than installed, so make main importable.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import fakeredis
+from fastapi import Response
+
+from main import RedisCacheBackend, ResponseCache
+
+
+def make_backend(ttl_seconds=60):
+    """A RedisCacheBackend talking to an in-process fake Redis instead of a server."""
+    backend = RedisCacheBackend("redis://localhost:6379/0", ttl_seconds)
+    backend.client = fakeredis.FakeAsyncRedis()
+    return backend
+
+
+def make_cache(backend, data_version):
+    """A ResponseCache that takes data_version as current without asking the database."""
+    cache = ResponseCache(backend)
+    cache.data_version = data_version
+    cache._version_checked_at = time.monotonic()
+    return cache
+
+
+def test_redis_backend_get_and_set():
+    """
+    Test that values set through the Redis backend are read back, under its key prefix.
+    """
+    async def run():
+        backend = make_backend()
+        assert await backend.get("missing") is None
+        await backend.set("key", b"value")
+        assert await backend.get("key") == b"value"
+        assert await backend.client.get("eqtl:key") == b"value"
+        assert await backend.size() == 1
+
+    asyncio.run(run())
+
+
+def test_redis_backend_size_counts_only_its_own_keys():
+    """
+    Test that the entry count reported by /cache/stats ignores other keys in a shared Redis database.
+    """
+    async def run():
+        backend = make_backend()
+        await backend.client.set("sessions:1", b"other application")
+        await backend.client.set("eqtlx", b"not under the prefix")
+        for i in range(2500):
+            await backend.set(f"key{i}", b"value")
+        assert await backend.size() == 2500
+
+    asyncio.run(run())
+
+
+def test_redis_backend_expires_entries():
+    """
+    Test that entries are written with the configured TTL and are gone once it has passed.
+    """
+    async def run():
+        backend = make_backend(ttl_seconds=1)
+        await backend.set("key", b"value")
+        assert await backend.client.ttl("eqtl:key") == 1
+        await asyncio.sleep(1.1)
+        assert await backend.get("key") is None
+
+        backend = make_backend(ttl_seconds=300)
+        await backend.set("key", b"value")
+        assert 0 < await backend.client.ttl("eqtl:key") <= 300
+
+    asyncio.run(run())
+
+
+def test_response_cache_in_redis_is_invalidated_by_data_version():
+    """
+    Test that responses cached in Redis are served with their headers until the data version
+    changes, after which they are built again.
+    """
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return Response(content=b'[{"id": 1}]', media_type="application/json", headers={"X-Next-Cursor": "abc"})
+
+    async def run():
+        backend = make_backend()
+        cache = make_cache(backend, data_version=1)
+        first = await cache.get_or_build("associations", {"gene_name": "RBFA", "limit": 10}, build)
+        second = await cache.get_or_build("associations", {"limit": 10.0, "gene_name": " RBFA "}, build)
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.body == b'[{"id": 1}]'
+        assert second.headers["X-Next-Cursor"] == "abc"
+        assert second.media_type == "application/json"
+        assert len(builds) == 1
+
+        # A second worker sharing the Redis sees the same entry
+        other_worker = make_cache(backend, data_version=1)
+        shared = await other_worker.get_or_build("associations", {"gene_name": "RBFA", "limit": 10}, build)
+        assert shared.headers["X-Cache"] == "HIT"
+        assert len(builds) == 1
+
+        cache.data_version = 2
+        third = await cache.get_or_build("associations", {"gene_name": "RBFA", "limit": 10}, build)
+        assert third.headers["X-Cache"] == "MISS"
+        assert len(builds) == 2
+
+    asyncio.run(run())
@@ -1,4 +1,8 @@
 import httpx
+import json
+import math
+import struct
+import time
 import pytest
 
 # Assuming your FastAPI app runs on http://localhost:8001
@@ -106,3 +110,381 @@ def test_get_effect_size_not_found(client):
     data = response.json()
     assert "detail" in data
     assert data["detail"] == "Effect size not found for the given variant and gene."
+
+def test_get_region_valid(client):
+    """
+    Test the /region/ endpoint returns only associations inside the requested window.
+    """
+    start, end = 79900000, 80300000
+    response = client.get(f"/region/?chromosome=chr18&start={start}&end={end}&p_value_threshold=0.05")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    assert len(data) > 0
+
+    positions = [association["variant"]["position"] for association in data]
+    assert positions == sorted(positions)
+    for association in data:
+        assert association["variant"]["chromosome"] == "18"
+        assert start <= association["variant"]["position"] <= end
+        assert association["pvalue"] <= 0.05
+
+def test_get_region_pagination(client):
+    """
+    Test that following X-Next-Cursor walks through a dense window in (position, id) order, returning the
+    same rows as a single unpaged request.
+    """
+    url = "/region/?chromosome=chr18&start=79900000&end=80300000&p_value_threshold=0.05"
+    everything = client.get(url + "&limit=10000").json()
+    assert len(everything) > 60
+
+    rows, cursor = [], None
+    while True:
+        page = client.get(url + "&limit=25" + (f"&cursor={cursor}" if cursor else ""))
+        assert page.status_code == 200
+        rows += page.json()
+        cursor = page.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+        assert len(page.json()) == 25
+
+    keys = [(row["variant"]["position"], row["id"]) for row in rows]
+    assert keys == sorted(keys)
+    assert [row["id"] for row in rows] == [row["id"] for row in everything]
+
+    assert client.get(url + "&cursor=not-a-cursor").status_code == 400
+
+def test_get_region_too_large(client):
+    """
+    Test the /region/ endpoint rejects windows larger than the configured maximum.
+    """
+    response = client.get("/region/?chromosome=18&start=0&end=100000000")
+
+    assert response.status_code == 400
+    assert "detail" in response.json()
+
+def test_get_region_unknown_chromosome(client):
+    """
+    Test the /region/ endpoint rejects chromosome names it cannot map to a chromosome code.
+    """
+    response = client.get("/region/?chromosome=chr99&start=0&end=1000")
+
+    assert response.status_code == 400
+    assert "detail" in response.json()
+
+def test_read_associations_by_study(client):
+    """
+    Test that filtering /associations/ by study returns that study's rows and nothing for an unknown study.
+    """
+    response = client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05&study_id=QTD000021")
+    assert response.status_code == 200
+    assert len(response.json()) > 0
+
+    response = client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05&study_id=QTD999999")
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_read_associations_pagination(client):
+    """
+    Test that following X-Next-Cursor walks through all associations in (pvalue, id) order
+    without repeating any row.
+    """
+    url = "/associations/?gene_name=RBFA&p_value_threshold=0.05&limit=25"
+    first_page = client.get(url)
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 25
+    assert "x-next-cursor" in first_page.headers
+
+    second_page = client.get(url + f"&cursor={first_page.headers['x-next-cursor']}")
+    assert second_page.status_code == 200
+
+    rows = first_page.json() + second_page.json()
+    keys = [(row["pvalue"], row["id"]) for row in rows]
+    assert keys == sorted(keys)
+    assert len({row["id"] for row in rows}) == len(rows)
+
+def test_read_associations_invalid_cursor(client):
+    """
+    Test the /associations/ endpoint with a malformed cursor.
+    """
+    response = client.get("/associations/?gene_name=RBFA&cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+def test_export_associations_ndjson(client):
+    """
+    Test that the NDJSON export streams every matching association, one object per line.
+    """
+    response = client.get("/associations/export?gene_name=RBFA&p_value_threshold=0.05&format=ndjson")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) > 0
+
+    rows = [json.loads(line) for line in lines]
+    assert all(row["pvalue"] <= 0.05 and row["gene_name"] == "RBFA" for row in rows)
+
+    paged = client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05&limit=10000").json()
+    assert len(rows) == len(paged)
+
+def test_export_associations_csv(client):
+    """
+    Test the CSV export starts with a header row.
+    """
+    response = client.get("/associations/export?gene_name=RBFA&p_value_threshold=0.05&format=csv")
+
+    assert response.status_code == 200
+    header = response.text.splitlines()[0].split(",")
+    assert header[:3] == ["id", "study_id", "variant_id"]
+
+def test_cache_hit_on_repeated_query(client):
+    """
+    Test that repeating an identical query is served from the response cache and counted as a hit.
+    """
+    url = "/associations/?gene_name=RBFA&p_value_threshold=0.01"
+    first = client.get(url)
+    assert first.status_code == 200
+    hits_before = client.get("/cache/stats").json()["hits"]
+
+    second = client.get(url)
+
+    assert second.status_code == 200
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] == hits_before + 1
+    assert "misses" in stats
+
+def test_get_effect_size_batch(client):
+    """
+    Test the batch endpoint returns the same effect sizes as single lookups and skips unknown pairs.
+    """
+    associations = client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05&limit=5").json()
+    variant_ids = [association["variant"]["variant_id"] for association in associations]
+    gene_ids = [association["gene"]["gene_id"] for association in associations]
+
+    response = client.post("/effect_size/batch", json={
+        "variant_ids": variant_ids + ["NONEXISTENT_VARIANT"],
+        "gene_ids": gene_ids + ["NONEXISTENT_GENE"],
+    })
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    pairs = list(zip(variant_ids, gene_ids))
+    returned = [(row["variant_id"], row["gene_id"]) for row in rows]
+    # Every known pair comes back (once per study), in request order
+    assert set(returned) == set(pairs)
+    assert returned == sorted(returned, key=pairs.index)
+    for variant_id, gene_id in pairs:
+        single = client.get(f"/effect_size/?variant_id={variant_id}&gene_id={gene_id}").json()
+        assert (single["beta"], single["se"]) in {
+            (row["beta"], row["se"]) for row in rows if (row["variant_id"], row["gene_id"]) == (variant_id, gene_id)
+        }
+
+def test_get_effect_size_batch_mismatched_lengths(client):
+    """
+    Test the batch endpoint rejects variant and gene lists of different lengths.
+    """
+    response = client.post("/effect_size/batch", json={"variant_ids": ["a", "b"], "gene_ids": ["c"]})
+
+    assert response.status_code == 422
+
+def test_get_gene_summary(client):
+    """
+    Test that /gene_summary/ reports the gene's strongest association as its lead eQTL.
+    """
+    response = client.get("/gene_summary/?gene_name=RBFA")
+    assert response.status_code == 200
+    data = response.json()
+    assert [summary["study_id"] for summary in data] == ["QTD000021"]
+
+    summary = data[0]
+    lead = client.get("/associations/?gene_name=RBFA&study_id=QTD000021&limit=1").json()[0]
+    assert summary["min_pvalue"] == lead["pvalue"]
+    assert summary["lead_variant"]["variant_id"] == lead["variant"]["variant_id"]
+    assert summary["gene"]["gene_name"] == "RBFA"
+    assert 1 <= summary["hits_genome_wide"] <= summary["hits_suggestive"]
+    assert summary["credible_set_size"] >= 1
+
+def test_get_top_genes(client):
+    """
+    Test that /top_genes/ lists genes whose lead eQTL passes the threshold, and none below it.
+    """
+    response = client.get("/top_genes/?study_id=QTD000021&p_value_threshold=5e-8")
+    assert response.status_code == 200
+    assert "RBFA" in [summary["gene"]["gene_name"] for summary in response.json()]
+
+    response = client.get("/top_genes/?study_id=QTD000021&p_value_threshold=1e-300")
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_get_studies(client):
+    """
+    Test that /studies/ lists every study with the gene and eQTL counts of its gene summaries.
+    """
+    response = client.get("/studies/")
+    assert response.status_code == 200
+    data = response.json()
+    assert [study["study_id"] for study in data] == ["QTD000021"]
+
+    study = data[0]
+    summary = client.get("/gene_summary/?gene_name=RBFA").json()[0]
+    assert study["n_genes"] >= study["n_egenes"] >= 1
+    assert study["hits_suggestive"] >= study["hits_genome_wide"] >= summary["hits_genome_wide"]
+    assert study["min_pvalue"] <= summary["min_pvalue"]
+
+def test_get_manhattan_keeps_significant_points(client):
+    """
+    Test that /manhattan/ returns parallel point arrays including every genome-wide significant association.
+    """
+    response = client.get("/manhattan/?study_id=QTD000021&chromosome=18&width=1000")
+    assert response.status_code == 200
+    data = response.json()
+    count = int(response.headers["x-point-count"])
+    for column in ("chromosome", "position", "neg_log10_pvalue", "n"):
+        assert len(data[column]) == count
+    assert data["position"] == sorted(data["position"])
+
+    significant = client.get("/associations/?gene_name=RBFA&p_value_threshold=5e-8&limit=10000").json()
+    assert sum(score >= -math.log10(5e-8) for score in data["neg_log10_pvalue"]) == len(significant)
+
+def test_get_manhattan_counts_every_association(client):
+    """
+    Test that the n of the points adds up to every association, also in bins whose strongest
+    association is significant, at a pyramid level and when zoomed in below it.
+    """
+    for url in ("/manhattan/?study_id=QTD000021&width=1000",
+                "/manhattan/?study_id=QTD000021&chromosome=18&width=1000",
+                "/manhattan/?study_id=QTD000021&chromosome=18&start=79900000&end=80300000&width=10000"):
+        # With a threshold of 1 every association is returned as a point of its own
+        every = client.get(url + "&p_value_threshold=1").json()
+        assert set(every["n"]) == {1}
+        for threshold in ("5e-8", "1e-5"):
+            data = client.get(url + "&p_value_threshold=" + threshold).json()
+            assert len(data["n"]) < len(every["n"])
+            assert sum(data["n"]) == len(every["n"])
+
+def test_get_manhattan_binary(client):
+    """
+    Test that the binary /manhattan/ payload holds the same points as the JSON one.
+    """
+    url = "/manhattan/?study_id=QTD000021&chromosome=18&start=79900000&end=80300000"
+    data = client.get(url).json()
+    response = client.get(url + "&format=binary")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+
+    count = int(response.headers["x-point-count"])
+    assert len(response.content) == 13 * count
+    positions = struct.unpack_from(f"<{count}I", response.content, 0)
+    assert list(positions) == data["position"]
+
+def test_search_gene_prefix(client):
+    """
+    Test that /search/ suggests genes by case-insensitive symbol or Ensembl ID prefix.
+    """
+    for query in ("rbf", "RBFA", "ENSG0000010154"):
+        response = client.get(f"/search/?q={query}")
+        assert response.status_code == 200
+        assert response.json()[0]["gene_name"] == "RBFA"
+
+    response = client.get("/search/?q=NONEXISTENT_GENE")
+    assert response.status_code == 200
+    assert response.json() == []
+
+def test_search_rsid_prefix(client):
+    """
+    Test that /search/ suggests variants in rsID order for rsID-shaped queries, up to the limit.
+    """
+    response = client.get("/search/?q=rs1&limit=5")
+    assert response.status_code == 200
+    data = response.json()
+    assert 0 < len(data) <= 5
+    rsids = [suggestion["rsid"] for suggestion in data if suggestion["type"] == "variant"]
+    assert rsids == sorted(rsids)
+    assert all(rsid.startswith("rs1") for rsid in rsids)
+
+def test_compare_gene_across_studies(client):
+    """
+    Test that /compare/ returns study x variant matrices with per-variant summary arrays, strongest variant first.
+    """
+    response = client.get("/compare/?gene_name=RBFA&limit=5")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert 0 < len(data["variants"]) <= 5
+    assert len(data["studies"]) > 0
+    for name in ("beta", "se", "pvalue"):
+        assert len(data[name]) == len(data["studies"])
+        assert all(len(row) == len(data["variants"]) for row in data[name])
+    best = [min(p for p in column if p is not None) for column in zip(*data["pvalue"])]
+    assert best == sorted(best)
+    summary = data["summary"]
+    assert all(len(values) == len(data["variants"]) for values in summary.values())
+    assert all(0 <= sharing <= 1 for sharing in summary["sharing"])
+    for beta, se, pvalue in zip(summary["meta_beta"], summary["meta_se"], summary["meta_pvalue"]):
+        assert pvalue == pytest.approx(math.erfc(abs(beta / se) / math.sqrt(2)), rel=1e-9, abs=1e-300)
+
+def test_compare_requires_one_target(client):
+    """
+    Test that /compare/ rejects requests naming neither or both of a gene and a variant.
+    """
+    assert client.get("/compare/").status_code == 400
+    assert client.get("/compare/?gene_name=RBFA&variant_id=chr18_80032946_T_A").status_code == 400
+
+def test_server_timing_header(client):
+    """
+    Test that responses carry a Server-Timing header with database, serialization and total time.
+    """
+    response = client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05&limit=10")
+
+    assert response.status_code == 200
+    metrics = {part.strip().split(";")[0] for part in response.headers["server-timing"].split(",")}
+    assert {"db", "serialize", "total"} <= metrics
+
+def test_cors_exposes_response_headers(client):
+    """
+    Test that cross-origin responses let the frontend read the paging, plot and timing headers.
+    """
+    response = client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05&limit=1",
+                          headers={"Origin": "http://localhost:5173"})
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    exposed = {name.strip().lower() for name in response.headers["access-control-expose-headers"].split(",")}
+    assert {"x-next-cursor", "x-point-count", "x-bin-width", "server-timing"} <= exposed
+
+def test_metrics_counts_requests(client):
+    """
+    Test that /metrics reports request counts per route template in the Prometheus text format.
+    """
+    client.get("/associations/?gene_name=RBFA&p_value_threshold=0.05")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    requests = [line for line in lines
+                if line.startswith('eqtl_http_requests_total{route="/associations/",method="GET",status="200"}')]
+    assert len(requests) == 1
+    assert int(requests[0].rsplit(" ", 1)[1]) >= 1
+    assert any(line.startswith("eqtl_db_queries_total") for line in lines)
+    assert any(line.startswith('eqtl_db_pool_connections{pool="primary",state="idle"}') for line in lines)
+
+def test_ready_after_warmup(client):
+    """
+    Test that /ready reports ready, with the warm-up timings, once the startup warm-up has finished.
+    """
+    for _ in range(100):
+        response = client.get("/ready")
+        if response.status_code != 503:
+            break
+        time.sleep(0.1)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["connections"] >= 0
+    assert data["ready_after_seconds"] > 0
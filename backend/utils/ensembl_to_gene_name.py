@@ -1,15 +1,20 @@
 import pandas as pd
 import mygene
 import sys
-from functools import lru_cache
+import os
 import re
+import gzip
 import time
+import sqlite3
 import argparse
 
 # --- Configuration ---
 # File paths are now handled by command-line arguments (argparse) with defaults.
 ENSEMBL_ID_COLUMN = "gene_id"
 NEW_COLUMN_NAME = "gene_symbol"
+BATCH_SIZE = 1000  # IDs per MyGene.info querymany request
+CACHE_TTL_DAYS = 30
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "eqtl_catalogue", "gene_symbols.sqlite")
 # ---------------------
 
 
@@ -24,53 +29,166 @@ def get_ensembl_stable_id(ensembl_id_with_version):
     return ensembl_id_with_version
 
 
-@lru_cache(maxsize=None)
-def lookup_gene_symbol(ensembl_id, mg_client, max_retries=3):
+class SymbolCache:
     """
-    Looks up the gene symbol using the MyGene.info API with caching.
+    On-disk cache of Ensembl ID -> gene symbol lookups, kept in SQLite so it
+    survives across runs. Entries older than the TTL are treated as missing.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=CACHE_TTL_DAYS):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS gene_symbol "
+            "(ensembl_id TEXT PRIMARY KEY, symbol TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+
+    def get_many(self, ensembl_ids):
+        """Returns {ensembl_id: symbol} for the IDs with a fresh cache entry."""
+        cutoff = time.time() - self.ttl_seconds
+        found = {}
+        ids = list(ensembl_ids)
+        # Stay below SQLite's limit on bound parameters.
+        for start in range(0, len(ids), 900):
+            batch = ids[start:start + 900]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.conn.execute(
+                f"SELECT ensembl_id, symbol FROM gene_symbol WHERE ensembl_id IN ({placeholders}) AND fetched_at >= ?",
+                (*batch, cutoff),
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, symbols):
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO gene_symbol (ensembl_id, symbol, fetched_at) VALUES (?, ?, ?)",
+                [(ensembl_id, symbol, now) for ensembl_id, symbol in symbols.items()],
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+def load_offline_mapping(path):
+    """
+    Reads an Ensembl ID -> gene symbol mapping for offline resolution.
+
+    Accepts an Ensembl GTF (optionally gzipped), from whose "gene" records the
+    gene_id and gene_name attributes are taken, or a two-column TSV of
+    Ensembl ID and symbol (a header row is allowed).
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    mapping = {}
+    with opener(path, "rt") as fh:
+        if ".gtf" in os.path.basename(path):
+            for line in fh:
+                if line.startswith("#"):
+                    continue
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 9 or fields[2] != "gene":
+                    continue
+                gene_id = re.search(r'gene_id "([^"]+)"', fields[8])
+                gene_name = re.search(r'gene_name "([^"]+)"', fields[8])
+                if gene_id and gene_name:
+                    mapping[get_ensembl_stable_id(gene_id.group(1))] = gene_name.group(1)
+        else:
+            for line in fh:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) >= 2 and fields[0].startswith("ENS"):
+                    mapping[get_ensembl_stable_id(fields[0])] = fields[1]
+    return mapping
+
+
+def query_symbols(ensembl_ids, mg_client, batch_size=BATCH_SIZE, max_retries=3):
+    """
+    Looks up gene symbols with MyGene.info querymany, batch_size IDs per request.
     Uses exponential backoff for API call retries.
+
+    Returns:
+        dict: {ensembl_id: symbol} with "N/A" for IDs MyGene.info does not know.
+        IDs from batches that failed every retry are left out.
     """
-    # 1. Clean the Ensembl ID (remove version if present, although the sample data looks clean)
-    clean_id = get_ensembl_stable_id(str(ensembl_id).strip())
+    symbols = {}
+    for start in range(0, len(ensembl_ids), batch_size):
+        batch = ensembl_ids[start:start + batch_size]
+        for attempt in range(max_retries):
+            try:
+                hits = mg_client.querymany(batch, scopes="ensembl.gene", fields="symbol",
+                                           species="human", verbose=False)
+                break
+            except Exception as e:
+                # Handle potential connection or API rate limit errors
+                if attempt < max_retries - 1:
+                    wait_time = 2**attempt
+                    print(f"[batch of {len(batch)}] API error: {e}. Retrying in {wait_time}s...", file=sys.stderr)
+                    time.sleep(wait_time)
+                else:
+                    print(f"[batch of {len(batch)}] Failed after {max_retries} attempts. Error: {e}", file=sys.stderr)
+                    hits = None
+        if hits is None:
+            continue
 
-    if not clean_id or not clean_id.startswith("ENS"):
-        return "N/A"  # Return not available for non-Ensembl-like IDs
+        batch_symbols = dict.fromkeys(batch, "N/A")
+        for hit in hits:
+            # querymany returns one entry per hit; keep the first symbol per ID
+            if not hit.get("notfound") and hit.get("symbol") and batch_symbols.get(hit["query"]) == "N/A":
+                batch_symbols[hit["query"]] = hit["symbol"]
+        symbols.update(batch_symbols)
+    return symbols
 
-    # 2. Query MyGene.info with retries
-    for attempt in range(max_retries):
-        try:
-            # Query for the symbol field based on the Ensembl ID
-            res = mg_client.query(clean_id, fields="symbol", species="human", verbose=False)
-
-            if res.get("hits") and len(res["hits"]) > 0:
-                # The first hit should contain the gene symbol
-                symbol = res["hits"][0].get("symbol")
-                return symbol if symbol else "N/A"
-            else:
-                return "N/A"
-
-        except Exception as e:
-            # Handle potential connection or API rate limit errors
-            if attempt < max_retries - 1:
-                wait_time = 2**attempt
-                print(f"[{clean_id}] API error: {e}. Retrying in {wait_time}s...", file=sys.stderr)
-                time.sleep(wait_time)
-            else:
-                print(f"[{clean_id}] Failed after {max_retries} attempts. Error: {e}", file=sys.stderr)
-                return "API_ERROR"
-    return "N/A"  # Should be caught by the loop, but as a safeguard
-
-
-def main(input_file, output_file):
+
+def resolve_gene_symbols(ensembl_ids, mg_client=None, cache=None, offline_mapping=None):
+    """
+    Resolves Ensembl IDs (with or without version suffix) to gene symbols.
+
+    With an offline mapping no network access happens at all. Otherwise IDs are
+    served from the on-disk cache where possible and the rest are fetched from
+    MyGene.info in batches and written back to the cache.
+
+    Returns:
+        dict: {stable ensembl_id: symbol}. Non-Ensembl IDs map to "N/A"; IDs whose
+        lookup failed map to "API_ERROR".
+    """
+    clean_ids = {get_ensembl_stable_id(str(ensembl_id).strip()) for ensembl_id in ensembl_ids}
+    symbols = {clean_id: "N/A" for clean_id in clean_ids if not clean_id.startswith("ENS")}
+    pending = sorted(clean_ids - symbols.keys())
+
+    if offline_mapping is not None:
+        symbols.update({clean_id: offline_mapping.get(clean_id, "N/A") for clean_id in pending})
+        return symbols
+
+    if cache is not None:
+        symbols.update(cache.get_many(pending))
+        pending = [clean_id for clean_id in pending if clean_id not in symbols]
+    print(f"{len(clean_ids) - len(pending)} of {len(clean_ids)} IDs resolved locally; "
+          f"querying MyGene.info for {len(pending)}.")
+
+    if pending:
+        fetched = query_symbols(pending, mg_client or mygene.MyGeneInfo())
+        if cache is not None:
+            cache.put_many(fetched)
+        symbols.update(fetched)
+        symbols.update({clean_id: "API_ERROR" for clean_id in pending if clean_id not in fetched})
+    return symbols
+
+
+def export_mapping(mapping, output_file):
+    """Writes a mapping as a two-column TSV that ingest_data.py --gene-names can read."""
+    pd.DataFrame(sorted(mapping.items()), columns=["gene_id", "gene_name"]).to_csv(
+        output_file, sep="\t", index=False)
+    print(f"Wrote {len(mapping)} gene names to: {output_file}")
+
+
+def main(input_file, output_file, cache_path=DEFAULT_CACHE_PATH, offline=None):
     """
     Reads the input TSV, performs gene name lookups, and writes the output TSV.
     """
     print(f"Starting gene symbol lookup for file: {input_file}")
 
-    # 1. Initialize MyGene.info client
-    mg = mygene.MyGeneInfo()
-
-    # 2. Read the TSV file using tab as the separator
+    # 1. Read the TSV file using tab as the separator
     try:
         df = pd.read_csv(input_file, sep="\t", skipinitialspace=True)
     except FileNotFoundError:
@@ -88,16 +206,24 @@ def main(input_file, output_file):
 
     print(f"Successfully read {len(df)} rows.")
 
-    # 3. Apply the lookup function to the Ensembl ID column
-    print("Performing gene symbol lookups using MyGene.info API...")
+    # 2. Resolve every unique ID in one pass
+    if offline:
+        print(f"Resolving gene symbols offline from {offline}...")
+        symbols = resolve_gene_symbols(df[ENSEMBL_ID_COLUMN].unique(), offline_mapping=load_offline_mapping(offline))
+    else:
+        print("Performing gene symbol lookups using MyGene.info API...")
+        cache = SymbolCache(cache_path)
+        try:
+            symbols = resolve_gene_symbols(df[ENSEMBL_ID_COLUMN].unique(), cache=cache)
+        finally:
+            cache.close()
 
-    # Use a lambda to pass the initialized MyGeneInfo client instance
-    # The lru_cache decorator on the function handles caching unique queries automatically.
-    df[NEW_COLUMN_NAME] = df[ENSEMBL_ID_COLUMN].apply(lambda x: lookup_gene_symbol(x, mg))
+    df[NEW_COLUMN_NAME] = df[ENSEMBL_ID_COLUMN].map(
+        lambda x: symbols[get_ensembl_stable_id(str(x).strip())])
 
     print(f"Lookup complete. New column '{NEW_COLUMN_NAME}' added.")
 
-    # 4. Write the updated DataFrame to a new TSV file
+    # 3. Write the updated DataFrame to a new TSV file
     try:
         df.to_csv(output_file, sep="\t", index=False)
         print(f"Success! Results saved to: {output_file}")
@@ -129,7 +255,32 @@ if __name__ == "__main__":
         help="Path for the output TSV file with added gene symbols.",
     )
 
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=DEFAULT_CACHE_PATH,
+        help="Path of the SQLite cache of previous MyGene.info lookups.",
+    )
+
+    parser.add_argument(
+        "--offline",
+        type=str,
+        help="Resolve without network access from an Ensembl GTF (.gtf/.gtf.gz) or a two-column TSV mapping.",
+    )
+
+    parser.add_argument(
+        "--export-map",
+        type=str,
+        help="Instead of annotating --input, write the --offline mapping as a gene_id/gene_name TSV "
+             "for ingest_data.py --gene-names.",
+    )
+
     args = parser.parse_args()
 
-    # Call main with the parsed arguments
-    main(args.input, args.output)
+    if args.export_map:
+        if not args.offline:
+            parser.error("--export-map requires --offline")
+        export_mapping(load_offline_mapping(args.offline), args.export_map)
+    else:
+        # Call main with the parsed arguments
+        main(args.input, args.output, args.cache, args.offline)
@@ -0,0 +1,91 @@
+"""
+Compares POST /effect_size/batch with one GET /effect_size/ request per pair.
+
+Variant-gene pairs are taken from /associations/export of a running backend, so
+the benchmark works against whatever data is loaded. Single lookups go through
+the response cache, so they are timed twice: the first pass (all misses) is the
+fair comparison, the second shows what repeat lookups cost once cached.
+
+    python benchmarks/bench_effect_size_batch.py --pairs 1000 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+
+async def fetch_pairs(client, count, p_value_threshold):
+    """Returns up to `count` distinct (variant_id, gene_id) pairs from the export endpoint."""
+    pairs = {}
+    async with client.stream("GET", "/associations/export",
+                             params={"p_value_threshold": p_value_threshold}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            row = json.loads(line)
+            pairs[(row["variant_id"], row["gene_id"])] = None
+            if len(pairs) >= count:
+                break
+    return list(pairs)
+
+
+async def time_single(client, pairs, concurrency):
+    """Looks every pair up with its own GET request, `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def lookup(variant_id, gene_id):
+        async with semaphore:
+            response = await client.get("/effect_size/", params={"variant_id": variant_id, "gene_id": gene_id})
+            return response.status_code == 200
+
+    start = time.perf_counter()
+    found = await asyncio.gather(*(lookup(*pair) for pair in pairs))
+    return time.perf_counter() - start, sum(found)
+
+
+async def time_batch(client, pairs):
+    """Looks every pair up with a single POST request and reads the whole stream."""
+    body = {"variant_ids": [pair[0] for pair in pairs], "gene_ids": [pair[1] for pair in pairs]}
+    start = time.perf_counter()
+    rows = 0
+    async with client.stream("POST", "/effect_size/batch", json=body) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            rows += bool(line)
+    return time.perf_counter() - start, rows
+
+
+async def main(base_url, count, concurrency, p_value_threshold):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=600) as client:
+        pairs = await fetch_pairs(client, count, p_value_threshold)
+        if not pairs:
+            print("No associations found; load some data first.")
+            return
+        print(f"Looking up {len(pairs)} variant-gene pairs")
+
+        batch_elapsed, batch_rows = await time_batch(client, pairs)
+        single_elapsed, single_found = await time_single(client, pairs, concurrency)
+        cached_elapsed, _ = await time_single(client, pairs, concurrency)
+
+    print(f"{'method':<34} {'seconds':>9} {'pairs/s':>10} {'rows':>8}")
+    print(f"{'POST /effect_size/batch':<34} {batch_elapsed:>9.3f} {len(pairs) / batch_elapsed:>10.0f} {batch_rows:>8}")
+    print(f"{'GET /effect_size/ (cache misses)':<34} {single_elapsed:>9.3f} "
+          f"{len(pairs) / single_elapsed:>10.0f} {single_found:>8}")
+    print(f"{'GET /effect_size/ (cache hits)':<34} {cached_elapsed:>9.3f} {len(pairs) / cached_elapsed:>10.0f}")
+    print(f"Batch speed-up over cold single lookups: {single_elapsed / batch_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched against single effect-size lookups.")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--pairs", type=int, default=1000, help="Number of variant-gene pairs to look up.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Parallel requests for the single lookups.")
+    parser.add_argument("--p-value-threshold", type=float, default=1.0,
+                        help="Threshold passed to /associations/export when collecting pairs.")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.base_url, args.pairs, args.concurrency, args.p_value_threshold))
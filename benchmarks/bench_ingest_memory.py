@@ -0,0 +1,125 @@
+"""
+Memory profile of the parsing stage of ingestion.
+
+Reads a sumstats file chunk by chunk and splits every chunk into variant, gene
+and association rows, as ingest_data.py does before its COPYs, but without a
+database. Two readers are compared, each in a fresh process so their peaks do
+not mix:
+
+    inferred  pandas read_csv with type inference on every column, the reader
+              ingest_data.py used before typed parsing
+    typed     ingest_data.read_chunks: pyarrow CSV parsing of the needed
+              columns with fixed types
+
+For each it reports the peak resident memory above the interpreter's baseline,
+the largest in-memory size of a parsed chunk, and rows/sec. Key maps are reset
+for every chunk so the numbers reflect the per-chunk working set rather than
+the growth of the variant ID map, which is the same for both readers.
+
+    python benchmarks/bench_ingest_memory.py bench_data/QTD000001.all.tsv.gz
+"""
+import argparse
+import gzip
+import io
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data_ingestion"))
+import ingest_data  # noqa: E402
+
+READERS = ("inferred", "typed")
+
+
+def read_chunks_inferred(file_path, chunk_size=100000):
+    """Yields DataFrames of chunk_size lines parsed with pandas type inference, as before typed parsing."""
+    with gzip.open(file_path, "rb") as fh:
+        header = fh.readline().decode().rstrip("\n").split("\t")
+        while True:
+            lines = list(itertools.islice(fh, chunk_size))
+            if not lines:
+                break
+            yield pd.read_csv(io.BytesIO(b"".join(lines)), sep="\t", header=None, names=header,
+                              low_memory=True, na_values=["NA"])
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def profile(file_path, reader):
+    """
+    Parses and splits every chunk of a file with one reader.
+
+    Args:
+        file_path (str): Path to a .tsv.gz sumstats file.
+        reader (str): "inferred" or "typed".
+
+    Returns:
+        dict: Rows, seconds, rows/sec, baseline and peak RSS and the largest chunk, in MB.
+    """
+    baseline = peak_rss_mb()
+    chunks = (read_chunks_inferred(file_path) if reader == "inferred"
+              else (chunk_df for chunk_df, _ in ingest_data.read_chunks(file_path)))
+    rows = 0
+    largest_chunk = 0
+    start = time.perf_counter()
+    for chunk_df in chunks:
+        largest_chunk = max(largest_chunk, chunk_df.memory_usage(deep=True).sum())
+        ingest_data.split_chunk(chunk_df, 1, ingest_data.KeyMap(), ingest_data.KeyMap())
+        rows += len(chunk_df)
+    seconds = time.perf_counter() - start
+    return {
+        "reader": reader,
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds else 0.0,
+        "baseline_mb": baseline,
+        "peak_mb": peak_rss_mb() - baseline,
+        "largest_chunk_mb": largest_chunk / 2**20,
+    }
+
+
+def run(file_path, readers=READERS):
+    """Profiles each reader in its own Python process and returns their results."""
+    results = []
+    for reader in readers:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), file_path, "--reader", reader, "--child"],
+                             capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(out.splitlines()[-1]))
+    return results
+
+
+def print_results(file_path, results):
+    print(f"{file_path}: {os.path.getsize(file_path) / 2**20:.1f} MB compressed, {results[0]['rows']:,} rows")
+    print(f"{'reader':<10} {'peak MB':>9} {'chunk MB':>9} {'rows/s':>10} {'seconds':>8}")
+    for r in results:
+        print(f"{r['reader']:<10} {r['peak_mb']:>9.1f} {r['largest_chunk_mb']:>9.1f} {r['rows_per_sec']:>10,.0f} "
+              f"{r['seconds']:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the peak memory of the ingestion readers on one file.")
+    parser.add_argument("file", help="A .tsv.gz sumstats file.")
+    parser.add_argument("--reader", choices=READERS, action="append",
+                        help="Reader to profile (repeatable); both by default.")
+    parser.add_argument("--output", help="Append the results as a JSON line to this file.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(profile(args.file, args.reader[0])))
+        sys.exit(0)
+
+    results = run(args.file, args.reader or READERS)
+    print_results(args.file, results)
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps({"file": args.file, "results": results}) + "\n")
@@ -0,0 +1,157 @@
+"""
+Interactive latency of the backend while ingestion loads into the primary.
+
+Starts the backend twice against an already loaded database: once reading
+from the primary only, and once with --read-url (a streaming replica of it) as
+DATABASE_READ_URL. In each mode it sends a steady stream of interactive
+requests (/associations/, /effect_size/, /gene_summary/, /search/) from
+--concurrency clients, first while the database is idle and then while
+ingest_data.py loads the files matching --pattern into the primary. Those
+studies are removed first, so every run loads the same rows. With a replica,
+it also reports how far the replica's replay lagged behind at the end of the
+load window.
+
+The response cache is disabled so every request reaches the database. The
+files to load should be studies that are not in the database yet, such as
+generate_sumstats.py output with --first-study above the loaded ones, and big
+enough that their load outlasts --duration.
+
+    python benchmarks/bench_replica.py --database-url postgresql://.../eqtl_bench \\
+        --read-url postgresql://...replica.../eqtl_bench --pattern "extra_data/*.all.tsv.gz"
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+from sqlalchemy.engine import make_url
+
+import load_test
+from run_benchmarks import REPO_ROOT, connect, endpoint_paths
+
+INTERACTIVE_ENDPOINTS = ("associations", "effect_size", "gene_summary", "search")
+
+
+def start_backend(database_url, read_url, port):
+    """Starts the backend without response cache and waits until /ready answers."""
+    env = {**os.environ, "DATABASE_URL": database_url, "CACHE_MAX_ENTRIES": "0"}
+    env.pop("DATABASE_READ_URL", None)
+    if read_url:
+        env["DATABASE_READ_URL"] = read_url
+    process = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+                               cwd=os.path.join(REPO_ROOT, "backend"), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(600):
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/ready").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("The backend did not become ready within 60 seconds.")
+
+
+def start_ingestion(database_url, pattern, workers):
+    """Starts ingest_data.py on the files matching pattern, after removing their studies."""
+    command = [sys.executable, os.path.join(REPO_ROOT, "data_ingestion", "ingest_data.py"),
+               "--pattern", pattern, "--workers", str(workers)]
+    for path in sorted(glob.glob(pattern)):
+        command += ["--remove-study", os.path.basename(path).split(".")[0]]
+    env = {**os.environ, "DATABASE_URL": make_url(database_url).set(drivername="postgresql+psycopg2")
+           .render_as_string(hide_password=False)}
+    return subprocess.Popen(command, cwd=os.path.join(REPO_ROOT, "data_ingestion"), env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def replay_lag_seconds(read_url):
+    """Seconds between now and the last transaction the replica has replayed; 0 when it has nothing to replay."""
+    conn = connect(read_url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                        "ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp()) END")
+            return float(cur.fetchone()[0] or 0)
+    finally:
+        conn.close()
+
+
+def measure_mode(database_url, read_url, port, paths, pattern, workers, concurrency, duration):
+    """
+    Runs the idle and the loading phase against one backend configuration.
+
+    Returns:
+        dict: Load test summaries of both phases, the ingestion time, whether the
+        ingestion outlasted the loading phase, and the replica's replay lag.
+    """
+    backend = start_backend(database_url, read_url, port)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        idle = asyncio.run(load_test.run_load(base_url, paths, concurrency, duration))["all"]
+        ingestion_start = time.perf_counter()
+        ingestion = start_ingestion(database_url, pattern, workers)
+        # run_load's warm-up is not counted, which also lets the ingestion get past its start-up
+        loading = asyncio.run(load_test.run_load(base_url, paths, concurrency, duration))["all"]
+        covered = ingestion.poll() is None
+        lag = replay_lag_seconds(read_url) if read_url else None
+        if ingestion.wait() != 0:
+            raise RuntimeError("ingest_data.py failed.")
+        ingestion_seconds = time.perf_counter() - ingestion_start
+    finally:
+        backend.terminate()
+        backend.wait()
+    return {"idle": idle, "loading": loading, "ingestion_seconds": ingestion_seconds,
+            "ingestion_covered_window": covered, "replay_lag_s": lag}
+
+
+def print_results(results):
+    print(f"{'mode':<8} {'phase':<8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for mode, result in results.items():
+        for phase in ("idle", "loading"):
+            summary = result[phase]
+            print(f"{mode:<8} {phase:<8} {summary['throughput_rps']:>8.1f} {summary['p50_ms']:>8.1f} "
+                  f"{summary['p95_ms']:>8.1f} {summary['p99_ms']:>8.1f} {summary['errors']:>7}")
+        lag = "" if result["replay_lag_s"] is None else f", replica replay lag {result['replay_lag_s']:.2f}s"
+        print(f"{mode:<8} ingestion took {result['ingestion_seconds']:.1f}s{lag}"
+              + ("" if result["ingestion_covered_window"] else " (finished before the load window ended)"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare interactive latency during ingestion with and without "
+                                                 "a read replica.")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"),
+                        help="An already loaded primary; the --pattern studies are reloaded into it.")
+    parser.add_argument("--read-url", help="A streaming replica of --database-url; without it only the primary "
+                                           "mode is run.")
+    parser.add_argument("--pattern", required=True, help="Glob of the sumstats files loaded during the test.")
+    parser.add_argument("--workers", type=int, default=4, help="Ingestion workers.")
+    parser.add_argument("--port", type=int, default=8013, help="Port the backend is started on.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent interactive clients.")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds per phase.")
+    parser.add_argument("--samples", type=int, default=50, help="Distinct parameter sets per endpoint.")
+    parser.add_argument("--label", default="", help="Name recorded with the results.")
+    parser.add_argument("--output", help="Append the results as a JSON line to this file.")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required.")
+    if not glob.glob(args.pattern):
+        parser.error(f"No files match {args.pattern}.")
+
+    sampled = endpoint_paths(args.database_url, args.samples)
+    # Interleaved so every client cycles through all the interactive endpoints
+    paths = [path for group in zip(*(sampled[endpoint] for endpoint in INTERACTIVE_ENDPOINTS)) for path in group]
+    modes = {"primary": None, **({"replica": args.read_url} if args.read_url else {})}
+    results = {mode: measure_mode(args.database_url, read_url, args.port, paths, args.pattern, args.workers,
+                                  args.concurrency, args.duration)
+               for mode, read_url in modes.items()}
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps({"label": args.label, "concurrency": args.concurrency, "duration": args.duration,
+                                 "pattern": args.pattern, "results": results}) + "\n")
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of the per-row cost of building an /associations/ response.
+
+Compares, for the same synthetic rows:
+
+  orm:     Association/Gene/Variant ORM objects validated into AssociationBase with
+           from_attributes and serialized the way FastAPI does for response_model
+  columns: plain column tuples serialized straight to JSON with orjson, as the
+           endpoint now does
+
+No database is needed; only the in-process response-building cost is measured.
+
+    python benchmarks/bench_serialization.py --rows 10000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+# Importing the app creates (but does not connect) its engine
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/unused")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from main import Association, AssociationBase, Gene, Variant, association_rows_response  # noqa: E402
+
+
+def make_rows(n, seed=0):
+    rng = random.Random(seed)
+    gene = ("ENSG00000101546", 4.15, "RBFA")
+    rows = []
+    for i in range(n):
+        position = 79000000 + i * 50
+        variant = (f"chr18_{position}_C_G", f"rs{position}", "18", position, "C", "G")
+        rows.append((i, rng.random() * 0.05, rng.gauss(0, 1), rng.random()) + variant + gene)
+    return rows
+
+
+def make_orm_objects(rows):
+    gene = Gene(gene_id=rows[0][10], median_tpm=rows[0][11], gene_name=rows[0][12])
+    return [
+        Association(
+            id=r[0], pvalue=r[1], beta=r[2], se=r[3], gene=gene,
+            variant=Variant(variant_id=r[4], rsid=r[5], chromosome=r[6], position=r[7], ref=r[8], alt=r[9]),
+        )
+        for r in rows
+    ]
+
+
+def time_it(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-row cost of serializing /associations/ responses.")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5, help="Best of this many runs is reported.")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    adapter = TypeAdapter(list[AssociationBase])
+
+    def orm_path():
+        # Object materialization is part of the old path's cost
+        objects = make_orm_objects(rows)
+        return adapter.dump_json(adapter.validate_python(objects, from_attributes=True))
+
+    def columns_path():
+        return association_rows_response(rows).body
+
+    assert len(orm_path()) > 0 and len(columns_path()) > 0
+    for name, fn in [("orm", orm_path), ("columns", columns_path)]:
+        elapsed = time_it(fn, args.repeat)
+        print(f"{name:<8} {elapsed * 1000:8.1f} ms total  {elapsed / args.rows * 1e6:6.2f} us/row")
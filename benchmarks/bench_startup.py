@@ -0,0 +1,139 @@
+"""
+Time from launching a backend process to its first fast responses.
+
+Starts the backend several times against an already loaded database, once
+with the startup warm-up (DB_WARM_CONNECTIONS, see /ready) and once without it,
+and for each start records:
+
+    listening   the first answer from / (no database access)
+    ready       the first 200 from /ready
+    first burst latency of the first burst of --concurrency requests to the hot
+                endpoints (/associations/ and /effect_size/), sent once ready,
+                as when a load balancer adds the new worker
+    fast        time from launch until a whole burst completes within
+                --fast-factor times the steady-state burst latency, taken as
+                the median over the last half of --bursts bursts
+
+The response cache is disabled so every request reaches the database.
+
+    python benchmarks/bench_startup.py --database-url postgresql://.../eqtl_bench --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from run_benchmarks import REPO_ROOT, endpoint_paths
+
+MODES = {"cold": "0", "warm": None}  # DB_WARM_CONNECTIONS; None keeps the backend's default
+
+
+def wait_for(client, path, deadline, ok=(200,)):
+    """Polls path every 10 ms until it answers with one of the ok statuses; returns the time it did."""
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(path).status_code in ok:
+                return time.perf_counter()
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.01)
+    raise RuntimeError(f"{path} did not answer in time.")
+
+
+async def burst(base_url, paths):
+    """Sends all paths at once on fresh connections; returns their latencies in ms."""
+    async def one(client, path):
+        start = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        return (time.perf_counter() - start) * 1000
+
+    async with httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_connections=len(paths))) as client:
+        return await asyncio.gather(*(one(client, path) for path in paths))
+
+
+def measure_start(database_url, port, warm_connections, paths, concurrency, bursts, fast_factor):
+    """Launches the backend once and returns its startup timings in seconds and burst latencies in ms."""
+    env = {**os.environ, "DATABASE_URL": database_url, "CACHE_MAX_ENTRIES": "0"}
+    if warm_connections is not None:
+        env["DB_WARM_CONNECTIONS"] = warm_connections
+    base_url = f"http://127.0.0.1:{port}"
+    launched = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+                               cwd=os.path.join(REPO_ROOT, "backend"), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        with httpx.Client(base_url=base_url) as client:
+            listening = wait_for(client, "/", launched + 60)
+            ready = wait_for(client, "/ready", launched + 60)
+        latencies, finished = [], []
+        for i in range(bursts):
+            batch = [paths[(i * concurrency + j) % len(paths)] for j in range(concurrency)]
+            latencies.append(asyncio.run(burst(base_url, batch)))
+            finished.append(time.perf_counter())
+    finally:
+        process.terminate()
+        process.wait()
+    steady = statistics.median(max(burst_ms) for burst_ms in latencies[bursts // 2:])
+    fast = next(i for i, burst_ms in enumerate(latencies) if max(burst_ms) <= fast_factor * steady)
+    return {
+        "listening_s": listening - launched,
+        "ready_s": ready - launched,
+        "first_burst_p50_ms": statistics.median(latencies[0]),
+        "first_burst_max_ms": max(latencies[0]),
+        "steady_burst_max_ms": steady,
+        "fast_s": finished[fast] - launched,
+        "bursts_to_fast": fast + 1,
+    }
+
+
+def summarize(runs):
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def print_results(results):
+    print(f"{'mode':<6} {'listen s':>9} {'ready s':>8} {'1st p50 ms':>11} {'1st max ms':>11} {'steady ms':>10} "
+          f"{'fast s':>7} {'bursts':>7}")
+    for mode, summary in results.items():
+        print(f"{mode:<6} {summary['listening_s']:>9.2f} {summary['ready_s']:>8.2f} "
+              f"{summary['first_burst_p50_ms']:>11.1f} {summary['first_burst_max_ms']:>11.1f} "
+              f"{summary['steady_burst_max_ms']:>10.1f} {summary['fast_s']:>7.2f} {summary['bursts_to_fast']:>7.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure backend time-to-first-fast-response with and without "
+                                                 "the startup warm-up.")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="An already loaded database.")
+    parser.add_argument("--port", type=int, default=8012, help="Port the backend is started on.")
+    parser.add_argument("--runs", type=int, default=3, help="Starts per mode; medians are reported.")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests per burst.")
+    parser.add_argument("--bursts", type=int, default=20, help="Bursts sent after each start.")
+    parser.add_argument("--fast-factor", type=float, default=1.5,
+                        help="A burst is fast when it finishes within this multiple of the steady-state latency.")
+    parser.add_argument("--samples", type=int, default=50, help="Distinct parameter sets per endpoint.")
+    parser.add_argument("--label", default="", help="Name recorded with the results.")
+    parser.add_argument("--output", help="Append the results as a JSON line to this file.")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required.")
+
+    sampled = endpoint_paths(args.database_url, args.samples)
+    # Interleaved so every burst exercises both hot statements
+    paths = [path for pair in zip(sampled["associations"], sampled["effect_size"]) for path in pair]
+    results = {}
+    for mode, warm_connections in MODES.items():
+        runs = [measure_start(args.database_url, args.port, warm_connections, paths, args.concurrency, args.bursts,
+                              args.fast_factor) for _ in range(args.runs)]
+        results[mode] = summarize(runs)
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps({"label": args.label, "concurrency": args.concurrency,
+                                 "fast_factor": args.fast_factor, "results": results}) + "\n")
@@ -0,0 +1,164 @@
+"""
+On-disk size and lookup cost of the association schema.
+
+Reports the heap and index size of every table, the bytes each association
+row costs, and the latency and shared buffers touched by the effect-size and
+per-gene lookups the backend runs. Works on both the string-keyed schema and
+the integer-keyed one created by data/migrations/001_compact_keys.sql, so it
+can be run before and after the migration:
+
+    python benchmarks/bench_storage.py --label before --output storage.jsonl
+    psql "$DATABASE_URL" -f data/migrations/001_compact_keys.sql && psql "$DATABASE_URL" -c "VACUUM ANALYZE"
+    python benchmarks/bench_storage.py --label after --output storage.jsonl
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+import psycopg2
+from sqlalchemy.engine import make_url
+
+TABLES = ["association", "variant", "gene", "study"]
+
+QUERIES = {
+    # (effect size of one variant-gene pair, best associations of one gene)
+    "string_keys": (
+        "SELECT beta, se FROM association WHERE variant_id = %s AND gene_id = %s",
+        "SELECT id, pvalue, beta FROM association WHERE gene_id = %s ORDER BY pvalue, id LIMIT 1000",
+    ),
+    # Natural IDs are resolved to keys in scalar subqueries, as the backend does,
+    # so the planner can use the association indexes on the resulting constants
+    "integer_keys": (
+        "SELECT beta, se FROM association WHERE variant_key = (SELECT id FROM variant WHERE variant_id = %s) "
+        "AND gene_key = (SELECT id FROM gene WHERE gene_id = %s)",
+        "SELECT id, pvalue, beta FROM association WHERE gene_key = (SELECT id FROM gene WHERE gene_id = %s) "
+        "ORDER BY pvalue, id LIMIT 1000",
+    ),
+}
+
+SAMPLE_PAIRS = {
+    "string_keys": "SELECT variant_id, gene_id FROM association TABLESAMPLE SYSTEM (10) LIMIT %s",
+    "integer_keys": "SELECT v.variant_id, g.gene_id FROM association a TABLESAMPLE SYSTEM (10) "
+                    "JOIN variant v ON v.id = a.variant_key JOIN gene g ON g.id = a.gene_key LIMIT %s",
+}
+
+
+def detect_schema(cur):
+    cur.execute("SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'association' AND column_name = 'variant_key'")
+    return "integer_keys" if cur.fetchone() else "string_keys"
+
+
+def table_sizes(cur):
+    """Returns {table: {"heap": bytes, "indexes": bytes, "total": bytes}} for the tables that exist."""
+    sizes = {}
+    for table in TABLES:
+        cur.execute("SELECT to_regclass(%s)", (table,))
+        if cur.fetchone()[0] is None:
+            continue
+        # Summed over the partitions of a partitioned table
+        cur.execute("SELECT sum(pg_relation_size(relid)), sum(pg_indexes_size(relid)), "
+                    "sum(pg_total_relation_size(relid)) FROM "
+                    "(SELECT relid FROM pg_partition_tree(%s::regclass) UNION SELECT %s::regclass) tree",
+                    (table, table))
+        heap, indexes, total = cur.fetchone()
+        sizes[table] = {"heap": heap, "indexes": indexes, "total": total}
+    return sizes
+
+
+def buffers_touched(cur, query, params):
+    """Shared buffers (8 kB pages) hit or read by one execution of a query."""
+    cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query, params)
+    plan = cur.fetchone()[0][0]["Plan"]
+    return plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0)
+
+
+def time_queries(cur, query, params_list):
+    """Returns per-execution latencies in microseconds; the first pass warms the cache."""
+    for params in params_list:
+        cur.execute(query, params)
+        cur.fetchall()
+    latencies = []
+    for params in params_list:
+        start = time.perf_counter()
+        cur.execute(query, params)
+        cur.fetchall()
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies, buffers):
+    latencies = sorted(latencies)
+    return {
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": percentile(latencies, 0.50),
+        "p95_us": percentile(latencies, 0.95),
+        "buffers_per_query": statistics.fmean(buffers),
+    }
+
+
+def run(database_url, lookups):
+    url = make_url(database_url).set(drivername="postgresql")
+    conn = psycopg2.connect(url.render_as_string(hide_password=False))
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            schema = detect_schema(cur)
+            pair_query, gene_query = QUERIES[schema]
+            sizes = table_sizes(cur)
+            cur.execute("SELECT count(*) FROM association")
+            association_rows = cur.fetchone()[0]
+
+            cur.execute(SAMPLE_PAIRS[schema], (lookups,))
+            pairs = cur.fetchall()
+            genes = sorted({(gene_id,) for _, gene_id in pairs})
+            results = {
+                "effect_size_lookup": summarize(time_queries(cur, pair_query, pairs),
+                                                [buffers_touched(cur, pair_query, p) for p in pairs[:50]]),
+                "gene_top_1000": summarize(time_queries(cur, gene_query, genes),
+                                           [buffers_touched(cur, gene_query, g) for g in genes[:50]]),
+            }
+    finally:
+        conn.close()
+
+    return {
+        "schema": schema,
+        "association_rows": association_rows,
+        "bytes_per_association": sizes["association"]["total"] / max(association_rows, 1),
+        "sizes": sizes,
+        "lookups": results,
+    }
+
+
+def print_results(results):
+    print(f"schema: {results['schema']}, {results['association_rows']:,} associations, "
+          f"{results['bytes_per_association']:.1f} bytes per association (heap + indexes)")
+    print(f"{'table':<12} {'heap MB':>10} {'index MB':>10} {'total MB':>10}")
+    for table, size in results["sizes"].items():
+        print(f"{table:<12} {size['heap'] / 2**20:>10.2f} {size['indexes'] / 2**20:>10.2f} {size['total'] / 2**20:>10.2f}")
+    print(f"{'lookup':<20} {'mean us':>9} {'p50 us':>9} {'p95 us':>9} {'buffers':>8}")
+    for name, summary in results["lookups"].items():
+        print(f"{name:<20} {summary['mean_us']:>9.0f} {summary['p50_us']:>9.0f} {summary['p95_us']:>9.0f} "
+              f"{summary['buffers_per_query']:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure table sizes and lookup cost of the association schema.")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--lookups", type=int, default=500, help="Number of variant-gene pairs to look up.")
+    parser.add_argument("--label", default="", help="Name recorded with the results, e.g. before/after.")
+    parser.add_argument("--output", help="Append the results as a JSON line to this file.")
+    args = parser.parse_args()
+
+    results = run(args.database_url, args.lookups)
+    print_results(results)
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps({"label": args.label, **results}) + "\n")
@@ -0,0 +1,214 @@
+"""
+Synthetic eQTL Catalogue sumstats for benchmarking.
+
+Writes one <study>.all.tsv.gz (every cis variant-gene test) and/or
+<study>.cc.tsv.gz (only the variants close to each eGene's lead, as in the
+credible-set files) per study, in the column layout of the real files, plus a
+gene_id/gene_name TSV for ingest_data.py --gene-names. Genes and variants are
+shared between studies and placed along GRCh38-sized chromosomes, so
+ingestion de-duplicates them the way it does for real releases, and eGenes get
+a signal that decays with distance from a lead variant.
+
+    python benchmarks/generate_sumstats.py --output-dir bench_data --studies 4 --genes 2000 --variants 200000
+
+The number of rows per study in the .all files is roughly
+genes * variants * 2 * cis_window / 3.1e9.
+"""
+import argparse
+import gzip
+import math
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.special import erfc
+
+COLUMNS = ["molecular_trait_id", "chromosome", "position", "ref", "alt", "variant", "ma_samples", "maf",
+           "pvalue", "beta", "se", "type", "ac", "an", "r2", "molecular_trait_object_id", "gene_id",
+           "median_tpm", "rsid"]
+
+# GRCh38 autosome lengths; variants and genes are spread over them in proportion
+CHROMOSOME_LENGTHS = [248956422, 242193529, 198295559, 190214555, 181538259, 170805979, 159345973, 145138636,
+                      138394717, 133797422, 135086622, 133275309, 114364328, 107043718, 101991189, 90338345,
+                      83257441, 80373285, 58617616, 64444167, 46709983, 50818468]
+BASES = np.array(list("ACGT"))
+LD_DISTANCE = 20000  # bp over which the signal of a lead variant decays by 1/e
+CREDIBLE_SET_Z_DROP = 2.0  # .cc files keep variants within this many z units of the gene's lead
+
+
+def place(rng, count, lengths):
+    """Returns (chromosome index, position) arrays for count points, sorted, spread by chromosome length."""
+    chromosome = rng.choice(len(lengths), size=count, p=np.asarray(lengths) / sum(lengths))
+    position = (rng.random(count) * np.asarray(lengths)[chromosome]).astype(np.int64) + 1
+    order = np.lexsort((position, chromosome))
+    return chromosome[order], position[order]
+
+
+def make_variants(rng, count, lengths):
+    chromosome, position = place(rng, count, lengths)
+    ref_code = rng.integers(0, 4, count)
+    ref, alt = BASES[ref_code], BASES[(ref_code + rng.integers(1, 4, count)) % 4]
+    chromosome = (chromosome + 1).astype(str)
+    return pd.DataFrame({
+        "chromosome": chromosome,
+        "position": position,
+        "ref": ref,
+        "alt": alt,
+        "variant": [f"chr{c}_{p}_{r}_{a}" for c, p, r, a in zip(chromosome, position, ref, alt)],
+        "maf": rng.uniform(0.01, 0.5, count),
+        "rsid": [f"rs{n}" for n in rng.permutation(count) + 1],
+    })
+
+
+def make_genes(rng, count, lengths, egene_fraction):
+    chromosome, tss = place(rng, count, lengths)
+    return pd.DataFrame({
+        "gene_id": [f"ENSG{n:011d}" for n in range(1, count + 1)],
+        "gene_name": [f"SYN{n}" for n in range(1, count + 1)],
+        "chromosome": chromosome + 1,
+        "tss": tss,
+        "median_tpm": rng.lognormal(1.5, 1.5, count),
+        "is_egene": rng.random(count) < egene_fraction,
+        # Lead z-score of eGenes; the lead variant is drawn from the gene's cis window in generate()
+        "lead_z": rng.uniform(4, 25, count) * rng.choice([-1, 1], count),
+    })
+
+
+def cis_ranges(genes, variants, window):
+    """Returns (first, last) variant row of every gene's cis window."""
+    keys = variants["chromosome"].astype(int).to_numpy() * 10**10 + variants["position"].to_numpy()
+    gene_keys = genes["chromosome"].to_numpy() * 10**10 + genes["tss"].to_numpy()
+    return np.searchsorted(keys, gene_keys - window), np.searchsorted(keys, gene_keys + window, side="right")
+
+
+def study_rows(rng, genes, variants, first, last, samples, kind, batch_rows=500000):
+    """Yields the sumstats rows of one study as DataFrames of about batch_rows rows, gene by gene."""
+    counts = last - first
+    lead_position = genes["lead_position"].to_numpy()
+    # The causal variant of an eGene is shared by all studies; its strength varies a little between them
+    strength = np.where(genes["is_egene"].to_numpy(),
+                        genes["lead_z"].to_numpy() * rng.uniform(0.7, 1.3, len(genes)), 0.0)
+    batch_start = 0
+    while batch_start < len(genes):
+        # Genes of this batch, with their cis variants laid out one row per test
+        batch_stop = batch_start + max(1, np.searchsorted(np.cumsum(counts[batch_start:]), batch_rows))
+        batch_counts = counts[batch_start:batch_stop]
+        gene_index = np.repeat(np.arange(batch_start, batch_stop), batch_counts)
+        row_in_gene = np.arange(len(gene_index)) - np.repeat(np.cumsum(batch_counts) - batch_counts, batch_counts)
+        variant_index = first[gene_index] + row_in_gene
+        batch_start = batch_stop
+        if not len(gene_index):
+            continue
+
+        position = variants["position"].to_numpy()[variant_index]
+        z = rng.standard_normal(len(gene_index))
+        z += strength[gene_index] * np.exp(-np.abs(position - lead_position[gene_index]) / LD_DISTANCE)
+        if kind == "cc":
+            # Credible-set files only list variants close to the lead of each eGene
+            best = pd.Series(np.abs(z)).groupby(gene_index).transform("max").to_numpy()
+            keep = (strength[gene_index] != 0) & (np.abs(z) >= best - CREDIBLE_SET_Z_DROP)
+            gene_index, variant_index, z = gene_index[keep], variant_index[keep], z[keep]
+
+        cis = variants.iloc[variant_index]
+        gene = genes.iloc[gene_index]
+        maf = cis["maf"].to_numpy()
+        se = 1 / np.sqrt(2 * maf * (1 - maf) * samples)
+        an = np.full(len(z), 2 * samples)
+        ac = np.rint(maf * an).astype(np.int64)
+        yield pd.DataFrame({
+            "molecular_trait_id": gene["gene_id"].to_numpy(),
+            "chromosome": cis["chromosome"].to_numpy(),
+            "position": cis["position"].to_numpy(),
+            "ref": cis["ref"].to_numpy(),
+            "alt": cis["alt"].to_numpy(),
+            "variant": cis["variant"].to_numpy(),
+            "ma_samples": np.minimum(ac, samples),
+            "maf": maf,
+            "pvalue": erfc(np.abs(z) / math.sqrt(2)),
+            "beta": z * se,
+            "se": se,
+            "type": "SNP",
+            "ac": ac,
+            "an": an,
+            "r2": np.where(rng.random(len(z)) < 0.1, np.nan, rng.uniform(0.5, 1, len(z))),
+            "molecular_trait_object_id": gene["gene_id"].to_numpy(),
+            "gene_id": gene["gene_id"].to_numpy(),
+            "median_tpm": gene["median_tpm"].to_numpy(),
+            "rsid": cis["rsid"].to_numpy(),
+        }, columns=COLUMNS)
+
+
+def write_study(path, frames):
+    """Writes sumstats frames to a gzipped TSV with the eQTL Catalogue header; returns the row count."""
+    rows = 0
+    with gzip.open(path, "wt", compresslevel=1) as fh:
+        fh.write("\t".join(COLUMNS) + "\n")
+        for frame in frames:
+            # Six significant digits, about what the released files carry, and quicker to format
+            frame.to_csv(fh, sep="\t", header=False, index=False, na_rep="NA", float_format="%.6g")
+            rows += len(frame)
+    return rows
+
+
+def generate(output_dir, studies=4, genes=2000, variants=200000, kinds=("all",), cis_window=1000000,
+             egene_fraction=0.3, first_study=1, seed=0):
+    """
+    Writes the synthetic files of every study into output_dir.
+
+    Args:
+        output_dir (str): Directory for the .tsv.gz files and gene_names.tsv.
+        studies (int): Number of studies (files per kind).
+        genes (int): Number of genes, shared by all studies.
+        variants (int): Number of variants, shared by all studies.
+        kinds (tuple): "all" and/or "cc".
+        cis_window (int): Variants within this many bp of a gene's TSS are tested against it.
+        egene_fraction (float): Fraction of genes with an eQTL signal.
+        first_study (int): Number of the first study ID (QTD<number>).
+        seed (int): Random seed; the same arguments always produce the same files.
+
+    Returns:
+        dict: {file path: rows written}.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    lengths = CHROMOSOME_LENGTHS
+    variant_table = make_variants(rng, variants, lengths)
+    gene_table = make_genes(rng, genes, lengths, egene_fraction)
+    first, last = cis_ranges(gene_table, variant_table, cis_window)
+    lead = first + rng.integers(0, 2**31, genes) % np.maximum(last - first, 1)
+    gene_table["lead_position"] = variant_table["position"].to_numpy()[np.minimum(lead, variants - 1)]
+    gene_table[["gene_id", "gene_name"]].to_csv(os.path.join(output_dir, "gene_names.tsv"), sep="\t", index=False)
+
+    written = {}
+    for study in range(first_study, first_study + studies):
+        samples = int(rng.integers(80, 700))
+        for kind in kinds:
+            path = os.path.join(output_dir, f"QTD{study:06d}.{kind}.tsv.gz")
+            study_rng = np.random.default_rng([seed, study])
+            written[path] = write_study(path, study_rows(study_rng, gene_table, variant_table, first, last,
+                                                         samples, kind))
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic eQTL Catalogue sumstats files.")
+    parser.add_argument("--output-dir", default="bench_data")
+    parser.add_argument("--studies", type=int, default=4)
+    parser.add_argument("--genes", type=int, default=2000)
+    parser.add_argument("--variants", type=int, default=200000)
+    parser.add_argument("--kind", choices=["all", "cc", "both"], default="all",
+                        help="Full summary statistics, credible-set variants only, or both.")
+    parser.add_argument("--cis-window", type=int, default=1000000)
+    parser.add_argument("--egene-fraction", type=float, default=0.3)
+    parser.add_argument("--first-study", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    kinds = ("all", "cc") if args.kind == "both" else (args.kind,)
+    written = generate(args.output_dir, args.studies, args.genes, args.variants, kinds, args.cis_window,
+                       args.egene_fraction, args.first_study, args.seed)
+    for path, rows in written.items():
+        print(f"{path}: {rows:,} rows, {os.path.getsize(path) / 2**20:.1f} MB")
+    print(f"Wrote {sum(written.values()):,} rows in {time.perf_counter() - start_time:.1f}s")
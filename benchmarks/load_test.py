@@ -0,0 +1,113 @@
+"""
+Concurrent load test for the FastAPI backend.
+
+Fires requests at a running backend from a number of concurrent clients for a
+fixed duration and reports throughput and latency percentiles per endpoint.
+Run it against the backend before and after a change to compare the two, e.g.
+
+    python benchmarks/load_test.py --concurrency 50 --duration 30 --label sync
+    python benchmarks/load_test.py --concurrency 50 --duration 30 --label async
+
+With --output, each run is appended as one JSON line so runs can be diffed later.
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/associations/?gene_name=RBFA&p_value_threshold=0.05",
+    "/effect_size/?variant_id=chr18_80089655_C_G&gene_id=ENSG00000101546",
+    "/region/?chromosome=18&start=79900000&end=80300000&p_value_threshold=0.05",
+]
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """Returns throughput and p50/p95/p99 latency (ms) for one endpoint."""
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "throughput_rps": len(values) / elapsed,
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+    }
+
+
+async def run_load(base_url, paths, concurrency, duration, warmup=2.0):
+    """
+    Runs `concurrency` client loops that cycle through `paths` until `duration`
+    seconds have passed. Requests issued during the warm-up period are not counted.
+
+    Returns:
+        dict: Per-path summaries plus an "all" entry covering every request.
+    """
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        start = time.perf_counter()
+        measure_from = start + warmup
+        stop_at = measure_from + duration
+
+        async def worker(offset):
+            i = offset
+            while time.perf_counter() < stop_at:
+                path = paths[i % len(paths)]
+                i += 1
+                sent = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    failed = response.status_code >= 500
+                except httpx.HTTPError:
+                    failed = True
+                if sent < measure_from:
+                    continue
+                if failed:
+                    errors[path] += 1
+                else:
+                    latencies[path].append(time.perf_counter() - sent)
+
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+
+    results = {path: summarize(latencies[path], errors[path], duration) for path in paths}
+    results["all"] = summarize([v for path in paths for v in latencies[path]], sum(errors.values()), duration)
+    return results
+
+
+def print_results(results):
+    print(f"{'endpoint':<80} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for path, summary in results.items():
+        print(f"{path[:80]:<80} {summary['throughput_rps']:>9.1f} {summary['p50_ms']:>8.1f} "
+              f"{summary['p95_ms']:>8.1f} {summary['p99_ms']:>8.1f} {summary['errors']:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure concurrent request throughput of the backend.")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--path", action="append", dest="paths",
+                        help="Endpoint path (with query string) to request; repeatable. Defaults to the README examples.")
+    parser.add_argument("--concurrency", type=int, default=50, help="Number of concurrent clients.")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measured seconds (after a 2s warm-up).")
+    parser.add_argument("--label", default="", help="Name recorded with the results, e.g. the git revision.")
+    parser.add_argument("--output", help="Append the results as a JSON line to this file.")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_load(args.base_url, args.paths or DEFAULT_PATHS, args.concurrency, args.duration))
+    print_results(results)
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps({"label": args.label, "concurrency": args.concurrency,
+                                 "duration": args.duration, "results": results}) + "\n")
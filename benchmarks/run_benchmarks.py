@@ -0,0 +1,270 @@
+"""
+End-to-end benchmark of ingestion throughput and endpoint latency.
+
+Loads a directory of sumstats files (such as those written by
+generate_sumstats.py) into a scratch PostgreSQL database with ingest_data.py,
+starts the backend against it, and runs a concurrent load test (load_test.py)
+on every endpoint in turn with parameters sampled from the loaded data. The
+database is rebuilt from scratch, so it must be named explicitly with
+--database-url, and its name must end in _bench unless --yes-destroy is given.
+
+    python benchmarks/run_benchmarks.py --database-url postgresql://.../eqtl_bench \\
+        --generate --data-dir bench_data --label main --save-baseline
+    # after a change, on the same machine and data:
+    python benchmarks/run_benchmarks.py --database-url postgresql://.../eqtl_bench \\
+        --data-dir bench_data --label my-change
+
+Each run is compared with the baseline (benchmarks/baseline.json by default):
+ingestion rows/sec or endpoint throughput more than --tolerance below it, or
+p95 latency more than --tolerance above it, is reported as a regression and
+makes the script exit with status 1. Baselines are only comparable between
+runs on the same machine and data set.
+"""
+import argparse
+import asyncio
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+import psycopg2
+from sqlalchemy.engine import make_url
+
+import generate_sumstats
+import load_test
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+CHROMOSOME_NAMES = {**{n: str(n) for n in range(1, 23)}, 23: "X", 24: "Y", 25: "MT"}
+SCRATCH_SUFFIX = "_bench"
+
+
+def connect(database_url):
+    url = make_url(database_url).set(drivername="postgresql")
+    conn = psycopg2.connect(url.render_as_string(hide_password=False))
+    conn.autocommit = True
+    return conn
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_ingestion(database_url, pattern, workers, gene_names=None):
+    """
+    Rebuilds the database from the files matching pattern with ingest_data.py,
+    then reruns it on the unchanged files to time the no-op incremental check.
+    """
+    command = [sys.executable, os.path.join(REPO_ROOT, "data_ingestion", "ingest_data.py"),
+               "--pattern", pattern, "--workers", str(workers)]
+    if gene_names:
+        command += ["--gene-names", gene_names]
+    env = {**os.environ, "DATABASE_URL": make_url(database_url).set(drivername="postgresql+psycopg2")
+           .render_as_string(hide_password=False)}
+    cwd = os.path.join(REPO_ROOT, "data_ingestion")
+
+    start = time.perf_counter()
+    subprocess.run(command + ["--rebuild"], cwd=cwd, env=env, check=True, stdout=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    subprocess.run(command, cwd=cwd, env=env, check=True, stdout=subprocess.DEVNULL)
+    rerun_elapsed = time.perf_counter() - start
+
+    conn = connect(database_url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("VACUUM ANALYZE")
+            cur.execute("SELECT count(*) FROM association")
+            rows = cur.fetchone()[0]
+    finally:
+        conn.close()
+    return {"files": len(glob.glob(pattern)), "rows": rows, "seconds": elapsed,
+            "rows_per_sec": rows / elapsed, "unchanged_rerun_seconds": rerun_elapsed}
+
+
+def start_backend(database_url, port, cache):
+    """Starts uvicorn on the backend and waits until /ready answers, so its warm-up is not measured."""
+    env = {**os.environ, "DATABASE_URL": database_url}
+    if not cache:
+        # Measure the database path rather than the response cache
+        env["CACHE_MAX_ENTRIES"] = "0"
+    process = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+                               cwd=os.path.join(REPO_ROOT, "backend"), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(600):
+        try:
+            if httpx.get(f"http://localhost:{port}/ready").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("The backend did not become ready within 60 seconds.")
+
+
+def endpoint_paths(database_url, samples):
+    """Returns {endpoint: [request paths]} with parameters sampled from the loaded data."""
+    conn = connect(database_url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT setseed(0.5)")
+            cur.execute("SELECT gene_name, gene_id FROM gene WHERE gene_name IS NOT NULL ORDER BY random() LIMIT %s",
+                        (samples,))
+            genes = cur.fetchall()
+            cur.execute("SELECT v.variant_id, g.gene_id, v.rsid, v.chromosome, v.position "
+                        "FROM association a TABLESAMPLE SYSTEM (1) REPEATABLE (0) "
+                        "JOIN variant v ON v.id = a.variant_key JOIN gene g ON g.id = a.gene_key LIMIT %s",
+                        (samples,))
+            pairs = cur.fetchall()
+            cur.execute("SELECT study_id FROM study ORDER BY study_id")
+            studies = [study_id for (study_id,) in cur.fetchall()]
+    finally:
+        conn.close()
+    if not pairs or not studies:
+        raise RuntimeError("The database has no associations to sample request parameters from.")
+
+    regions = [(CHROMOSOME_NAMES[chromosome], max(0, position - 250000), position + 250000)
+               for _, _, _, chromosome, position in pairs if chromosome]
+    paths = {
+        "associations": [f"/associations/?gene_name={name}&p_value_threshold=0.05" for name, _ in genes],
+        "effect_size": [f"/effect_size/?variant_id={variant_id}&gene_id={gene_id}"
+                        for variant_id, gene_id, _, _, _ in pairs],
+        "region": [f"/region/?chromosome={chromosome}&start={start}&end={end}&p_value_threshold=0.05"
+                   for chromosome, start, end in regions],
+        "gene_summary": [f"/gene_summary/?gene_name={name}" for name, _ in genes],
+        "top_genes": [f"/top_genes/?study_id={study_id}&p_value_threshold=5e-8" for study_id in studies],
+        "manhattan": [f"/manhattan/?study_id={study_id}&width=1500" for study_id in studies]
+                     + [f"/manhattan/?study_id={studies[i % len(studies)]}&chromosome={chromosome}"
+                        f"&start={start}&end={end}&width=1000" for i, (chromosome, start, end) in enumerate(regions)],
+        "compare": [f"/compare/?gene_name={name}" for name, _ in genes]
+                   + [f"/compare/?variant_id={variant_id}" for variant_id, _, _, _, _ in pairs],
+        # Gene names minus their last letter, as while typing
+        "search": [f"/search/?q={name[:-1] or name}" for name, _ in genes]
+                  + [f"/search/?q={rsid[:5]}" for _, _, rsid, _, _ in pairs if rsid],
+    }
+    return {endpoint: endpoint_paths for endpoint, endpoint_paths in paths.items() if endpoint_paths}
+
+
+def run_endpoints(base_url, paths, concurrency, duration):
+    """Load-tests one endpoint at a time; returns {endpoint: summary over all of its paths}."""
+    return {endpoint: asyncio.run(load_test.run_load(base_url, endpoint_paths, concurrency, duration))["all"]
+            for endpoint, endpoint_paths in paths.items()}
+
+
+def compare(results, baseline, tolerance):
+    """Returns a list of regression messages (empty if none) against a baseline run."""
+    regressions = []
+
+    def check(name, value, reference, higher_is_better):
+        if value is None or not reference:
+            return
+        change = value / reference - 1
+        if (change < -tolerance) if higher_is_better else (change > tolerance):
+            regressions.append(f"{name}: {value:,.1f} vs {reference:,.1f} in the baseline ({change:+.0%})")
+
+    if results.get("ingestion") and baseline.get("ingestion"):
+        check("ingestion rows/sec", results["ingestion"]["rows_per_sec"], baseline["ingestion"]["rows_per_sec"],
+              True)
+    for endpoint, summary in results.get("endpoints", {}).items():
+        reference = baseline.get("endpoints", {}).get(endpoint)
+        if reference is None:
+            continue
+        check(f"{endpoint} p95 ms", summary["p95_ms"], reference["p95_ms"], False)
+        check(f"{endpoint} req/s", summary["throughput_rps"], reference["throughput_rps"], True)
+        if summary["errors"] and not reference["errors"]:
+            regressions.append(f"{endpoint}: {summary['errors']} errors, none in the baseline")
+    return regressions
+
+
+def print_results(results):
+    ingestion = results.get("ingestion")
+    if ingestion:
+        print(f"ingestion: {ingestion['rows']:,} rows from {ingestion['files']} files in {ingestion['seconds']:.1f}s "
+              f"({ingestion['rows_per_sec']:,.0f} rows/sec); "
+              f"unchanged rerun {ingestion['unchanged_rerun_seconds']:.1f}s")
+    print(f"{'endpoint':<14} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for endpoint, summary in results["endpoints"].items():
+        print(f"{endpoint:<14} {summary['throughput_rps']:>9.1f} {summary['p50_ms']:>8.1f} "
+              f"{summary['p95_ms']:>8.1f} {summary['p99_ms']:>8.1f} {summary['errors']:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ingestion and endpoint latency on a scratch database.")
+    parser.add_argument("--database-url", required=True,
+                        help=f"Scratch database, named *{SCRATCH_SUFFIX}; all of its tables are dropped and rebuilt "
+                             "by the ingestion step. DATABASE_URL is deliberately not used.")
+    parser.add_argument("--yes-destroy", action="store_true",
+                        help=f"Allow ingesting into a --database-url whose name does not end in {SCRATCH_SUFFIX}.")
+    parser.add_argument("--data-dir", default="bench_data", help="Directory of the sumstats files to load.")
+    parser.add_argument("--kind", choices=["all", "cc"], default="all", help="Which of the files to load.")
+    parser.add_argument("--generate", action="store_true",
+                        help="Write synthetic files into --data-dir first (see generate_sumstats.py).")
+    parser.add_argument("--studies", type=int, default=4, help="Studies to generate.")
+    parser.add_argument("--genes", type=int, default=2000, help="Genes to generate.")
+    parser.add_argument("--variants", type=int, default=200000, help="Variants to generate.")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="Ingestion workers.")
+    parser.add_argument("--skip-ingest", action="store_true", help="Benchmark the endpoints on the loaded data only.")
+    parser.add_argument("--port", type=int, default=8011, help="Port the backend is started on.")
+    parser.add_argument("--cache", action="store_true", help="Keep the backend's response cache enabled.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients per endpoint.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per endpoint.")
+    parser.add_argument("--samples", type=int, default=50, help="Distinct parameter sets per endpoint.")
+    parser.add_argument("--label", default="", help="Name recorded with the results, e.g. the branch.")
+    parser.add_argument("--output", help="Append the results as a JSON line to this file.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare with.")
+    parser.add_argument("--save-baseline", action="store_true", help="Record this run as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative change counted as a regression (0.2 = 20%%).")
+    args = parser.parse_args()
+    database_name = make_url(args.database_url).database or ""
+    if not args.skip_ingest and not database_name.endswith(SCRATCH_SUFFIX) and not args.yes_destroy:
+        parser.error(f"Refusing to rebuild {database_name or 'the default database'}: the ingestion step drops every "
+                     f"table, so --database-url must name a scratch database ending in {SCRATCH_SUFFIX} "
+                     "(or pass --yes-destroy).")
+
+    pattern = os.path.join(args.data_dir, f"*.{args.kind}.tsv.gz")
+    results = {"label": args.label, "revision": git_revision(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "concurrency": args.concurrency, "duration": args.duration, "cache": args.cache}
+    if args.generate:
+        written = generate_sumstats.generate(args.data_dir, args.studies, args.genes, args.variants, (args.kind,))
+        results["generated"] = {"studies": args.studies, "genes": args.genes, "variants": args.variants,
+                                "rows": sum(written.values())}
+    if not args.skip_ingest:
+        gene_names = os.path.join(args.data_dir, "gene_names.tsv")
+        results["ingestion"] = run_ingestion(args.database_url, pattern, args.workers,
+                                             gene_names if os.path.exists(gene_names) else None)
+
+    backend = start_backend(args.database_url, args.port, args.cache)
+    try:
+        paths = endpoint_paths(args.database_url, args.samples)
+        results["endpoints"] = run_endpoints(f"http://localhost:{args.port}", paths, args.concurrency, args.duration)
+    finally:
+        backend.terminate()
+        backend.wait()
+
+    print_results(results)
+    if args.output:
+        with open(args.output, "a") as fh:
+            fh.write(json.dumps(results) + "\n")
+
+    regressions = []
+    if args.save_baseline:
+        with open(args.baseline, "w") as fh:
+            json.dump(results, fh, indent=2)
+        print(f"Saved as the baseline in {args.baseline}.")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline, args.tolerance)
+        print(f"Compared with the baseline {baseline.get('label') or ''} ({baseline.get('revision')}, "
+              f"{baseline.get('time')}): {len(regressions) or 'no'} regressions")
+        for regression in regressions:
+            print(f"  {regression}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,119 @@
+-- Moves a database from string keys to compact integer keys:
+--
+--   * variant and gene get integer primary keys (id); variant_id and gene_id
+--     stay as unique natural keys used by the API.
+--   * studies move into their own table, referenced by a smallint.
+--   * association references variants, genes and studies by those keys
+--     (variant_key, gene_key, study_key) instead of repeating the strings.
+--   * variant.chromosome becomes a smallint (1-22, X=23, Y=24, MT=25).
+--
+-- The three tables are rebuilt with INSERT ... SELECT rather than updated in
+-- place, so each is written once and comes out without dead tuples. Variant
+-- keys are numbered in genomic order. Constraint and index names follow
+-- data_ingestion/ingest_data.py, which drops and re-creates them by name
+-- around bulk loads.
+--
+-- Run it once, in a maintenance window, with
+--     psql "$DATABASE_URL" -f data/migrations/001_compact_keys.sql
+-- and VACUUM ANALYZE afterwards.
+
+BEGIN;
+
+CREATE TABLE study (
+    id smallserial NOT NULL,
+    study_id character varying(30) NOT NULL,
+    CONSTRAINT pk_study PRIMARY KEY (id),
+    CONSTRAINT study_study_id_key UNIQUE (study_id)
+);
+INSERT INTO study (study_id)
+SELECT DISTINCT study_id FROM association WHERE study_id IS NOT NULL ORDER BY study_id;
+
+CREATE TABLE variant_compact (
+    id integer NOT NULL,
+    variant_id character varying(200) NOT NULL,
+    rsid character varying(200),
+    chromosome smallint,
+    "position" integer,
+    ref character varying(200),
+    alt character varying(200),
+    ma_samples integer,
+    maf double precision,
+    type character varying(20),
+    ac integer,
+    an integer
+);
+INSERT INTO variant_compact
+SELECT row_number() OVER (ORDER BY c.chromosome, v."position", v.variant_id),
+       v.variant_id, v.rsid, c.chromosome, v."position", v.ref, v.alt, v.ma_samples, v.maf, v.type, v.ac, v.an
+FROM variant v
+CROSS JOIN LATERAL (
+    SELECT CASE upper(regexp_replace(v.chromosome, '^chr', ''))
+        WHEN 'X' THEN 23
+        WHEN 'Y' THEN 24
+        WHEN 'MT' THEN 25
+        WHEN 'M' THEN 25
+        ELSE CASE WHEN v.chromosome ~ '^(chr)?[0-9]+$' THEN regexp_replace(v.chromosome, '^chr', '')::smallint END
+    END::smallint AS chromosome
+) c;
+
+CREATE TABLE gene_compact (
+    id integer NOT NULL,
+    gene_id character varying(30) NOT NULL,
+    median_tpm double precision,
+    gene_name character varying(30)
+);
+INSERT INTO gene_compact
+SELECT row_number() OVER (ORDER BY gene_id), gene_id, median_tpm, gene_name FROM gene;
+
+CREATE TABLE association_compact (
+    id bigint NOT NULL,
+    variant_key integer,
+    gene_key integer,
+    pvalue double precision,
+    beta double precision,
+    se double precision,
+    r2 double precision,
+    study_key smallint
+);
+INSERT INTO association_compact (id, variant_key, gene_key, pvalue, beta, se, r2, study_key)
+SELECT a.id, v.id, g.id, a.pvalue, a.beta, a.se, a.r2, s.id
+FROM association a
+LEFT JOIN variant_compact v ON v.variant_id = a.variant_id
+LEFT JOIN gene_compact g ON g.gene_id = a.gene_id
+LEFT JOIN study s ON s.study_id = a.study_id;
+
+DROP TABLE association, variant, gene;
+ALTER TABLE variant_compact RENAME TO variant;
+ALTER TABLE gene_compact RENAME TO gene;
+ALTER TABLE association_compact RENAME TO association;
+
+CREATE SEQUENCE association_id_seq OWNED BY association.id;
+SELECT setval('association_id_seq', coalesce(max(id), 0) + 1, false) FROM association;
+ALTER TABLE association ALTER COLUMN id SET DEFAULT nextval('association_id_seq');
+
+ALTER TABLE variant ADD CONSTRAINT pk_variant PRIMARY KEY (id);
+CREATE UNIQUE INDEX ix_variant_variant_id ON variant (variant_id);
+CREATE INDEX ix_variant_rsid ON variant (rsid);
+CREATE INDEX ix_variant_chromosome_position ON variant (chromosome, "position");
+
+ALTER TABLE gene ADD CONSTRAINT pk_gene PRIMARY KEY (id);
+CREATE UNIQUE INDEX ix_gene_gene_id ON gene (gene_id);
+CREATE INDEX ix_gene_gene_name ON gene (gene_name);
+
+ALTER TABLE association ADD CONSTRAINT pk_association PRIMARY KEY (id);
+CREATE INDEX ix_association_variant_key ON association (variant_key);
+CREATE INDEX ix_association_gene_key ON association (gene_key);
+CREATE INDEX ix_association_pvalue ON association (pvalue);
+CREATE INDEX ix_association_study_key ON association (study_key);
+CREATE INDEX ix_association_gene_key_pvalue_id ON association (gene_key, pvalue, id);
+ALTER TABLE association ADD CONSTRAINT fk_association_variant_key_variant
+    FOREIGN KEY (variant_key) REFERENCES variant (id);
+ALTER TABLE association ADD CONSTRAINT fk_association_gene_key_gene
+    FOREIGN KEY (gene_key) REFERENCES gene (id);
+ALTER TABLE association ADD CONSTRAINT fk_association_study_key_study
+    FOREIGN KEY (study_key) REFERENCES study (id);
+
+-- Cached API responses refer to the old layout
+UPDATE data_version SET version = version + 1, updated_at = now();
+
+COMMIT;
@@ -0,0 +1,69 @@
+-- Turns association into a table partitioned by study (LIST on study_key),
+-- with one partition per study named association_p<study key>. Requires
+-- 001_compact_keys.sql.
+--
+-- The rows are copied into the new partitions with a single INSERT ... SELECT
+-- before any index exists, and the indexes and foreign keys are then added on
+-- the parent, which builds them on every partition in bulk. Names follow
+-- data_ingestion/ingest_data.py, which from now on loads each study into a
+-- staging table and swaps it in as that study's partition.
+--
+-- Run it once, in a maintenance window, with
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f data/migrations/002_partition_association.sql
+-- and VACUUM ANALYZE afterwards.
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM association WHERE study_key IS NULL) THEN
+        RAISE EXCEPTION 'association has rows without a study; assign them to a study before partitioning';
+    END IF;
+END
+$$;
+
+ALTER TABLE association RENAME TO association_unpartitioned;
+ALTER SEQUENCE association_id_seq OWNED BY NONE;
+
+CREATE TABLE association (
+    id bigint NOT NULL DEFAULT nextval('association_id_seq'),
+    variant_key integer,
+    gene_key integer,
+    pvalue double precision,
+    beta double precision,
+    se double precision,
+    r2 double precision,
+    study_key smallint NOT NULL
+) PARTITION BY LIST (study_key);
+ALTER SEQUENCE association_id_seq OWNED BY association.id;
+
+DO $$
+DECLARE
+    study_key smallint;
+BEGIN
+    FOR study_key IN SELECT id FROM study ORDER BY id LOOP
+        EXECUTE format('CREATE TABLE %I PARTITION OF association FOR VALUES IN (%s)',
+                       'association_p' || study_key, study_key);
+    END LOOP;
+END
+$$;
+
+INSERT INTO association (id, variant_key, gene_key, pvalue, beta, se, r2, study_key)
+SELECT id, variant_key, gene_key, pvalue, beta, se, r2, study_key FROM association_unpartitioned;
+DROP TABLE association_unpartitioned;
+
+ALTER TABLE association ADD CONSTRAINT pk_association PRIMARY KEY (id, study_key);
+CREATE INDEX ix_association_variant_key ON association (variant_key);
+CREATE INDEX ix_association_gene_key ON association (gene_key);
+CREATE INDEX ix_association_pvalue ON association (pvalue);
+CREATE INDEX ix_association_gene_key_pvalue_id ON association (gene_key, pvalue, id);
+ALTER TABLE association ADD CONSTRAINT fk_association_variant_key_variant
+    FOREIGN KEY (variant_key) REFERENCES variant (id);
+ALTER TABLE association ADD CONSTRAINT fk_association_gene_key_gene
+    FOREIGN KEY (gene_key) REFERENCES gene (id);
+ALTER TABLE association ADD CONSTRAINT fk_association_study_key_study
+    FOREIGN KEY (study_key) REFERENCES study (id);
+
+UPDATE data_version SET version = version + 1, updated_at = now();
+
+COMMIT;
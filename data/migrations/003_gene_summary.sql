@@ -0,0 +1,73 @@
+-- Adds gene_summary, the per-gene, per-study overview served by /gene_summary/
+-- and /top_genes/, and fills it from the existing associations. Requires
+-- 002_partition_association.sql.
+--
+-- Each row holds the lead (lowest p-value) association of a gene in a study,
+-- the number of associations below 5e-8 and 1e-5, and the size of the 95%
+-- credible set computed from Wakefield approximate Bayes factors (prior
+-- standard deviation 0.15 on beta). The query is the one
+-- data_ingestion/ingest_data.py runs for a single study after swapping in its
+-- partition, partitioned by study here so all studies are summarized at once.
+--
+-- Run it once with
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f data/migrations/003_gene_summary.sql
+
+BEGIN;
+
+CREATE TABLE gene_summary (
+    study_key smallint NOT NULL,
+    gene_key integer NOT NULL,
+    lead_association_id bigint NOT NULL,
+    lead_variant_key integer,
+    min_pvalue double precision,
+    lead_beta double precision,
+    lead_se double precision,
+    hits_genome_wide integer NOT NULL,
+    hits_suggestive integer NOT NULL,
+    credible_set_size integer NOT NULL,
+    CONSTRAINT pk_gene_summary PRIMARY KEY (study_key, gene_key),
+    CONSTRAINT fk_gene_summary_study_key_study FOREIGN KEY (study_key) REFERENCES study (id),
+    CONSTRAINT fk_gene_summary_gene_key_gene FOREIGN KEY (gene_key) REFERENCES gene (id),
+    CONSTRAINT fk_gene_summary_lead_variant_key_variant FOREIGN KEY (lead_variant_key) REFERENCES variant (id)
+);
+
+INSERT INTO gene_summary (study_key, gene_key, lead_association_id, lead_variant_key, min_pvalue, lead_beta,
+                          lead_se, hits_genome_wide, hits_suggestive, credible_set_size)
+WITH scored AS (
+    SELECT id, study_key, gene_key, variant_key, pvalue, beta, se,
+           CASE WHEN se > 0 THEN 0.5 * ln(se * se / (se * se + 0.0225))
+                                 + beta * beta / (se * se) * 0.0225 / (2 * (se * se + 0.0225)) END AS log_abf
+    FROM association
+), weighted AS (
+    SELECT *, exp(greatest(log_abf - max(log_abf) OVER (PARTITION BY study_key, gene_key), -700)) AS weight
+    FROM scored
+), posterior AS (
+    SELECT *, weight / sum(weight) OVER (PARTITION BY study_key, gene_key) AS probability
+    FROM weighted
+), ranked AS (
+    SELECT *,
+           sum(probability) OVER (PARTITION BY study_key, gene_key ORDER BY probability DESC NULLS LAST, id
+                                  ROWS UNBOUNDED PRECEDING) - probability AS probability_before,
+           row_number() OVER (PARTITION BY study_key, gene_key ORDER BY pvalue NULLS LAST, id) AS pvalue_rank
+    FROM posterior
+)
+SELECT study_key, gene_key,
+       max(id) FILTER (WHERE pvalue_rank = 1),
+       max(variant_key) FILTER (WHERE pvalue_rank = 1),
+       min(pvalue),
+       max(beta) FILTER (WHERE pvalue_rank = 1),
+       max(se) FILTER (WHERE pvalue_rank = 1),
+       count(*) FILTER (WHERE pvalue < 5e-8),
+       count(*) FILTER (WHERE pvalue < 1e-5),
+       count(*) FILTER (WHERE probability_before < 0.95)
+FROM ranked
+WHERE gene_key IS NOT NULL
+GROUP BY study_key, gene_key;
+
+CREATE INDEX ix_gene_summary_gene_key ON gene_summary (gene_key);
+CREATE INDEX ix_gene_summary_study_key_min_pvalue ON gene_summary (study_key, min_pvalue, lead_association_id);
+CREATE INDEX ix_gene_summary_min_pvalue ON gene_summary (min_pvalue, lead_association_id);
+
+UPDATE data_version SET version = version + 1, updated_at = now();
+
+COMMIT;
@@ -0,0 +1,50 @@
+-- Adds manhattan_bin, the multi-resolution pyramid behind /manhattan/, and
+-- builds it for every study already loaded. Requires 002_partition_association.sql.
+--
+-- At level L the genome is cut into bins of 100 * 4^L bp (levels 0 to 9), and
+-- each bin keeps its strongest association and the number of associations it
+-- covers. Level 0 is binned from association, every further level from the
+-- level below, as data_ingestion/ingest_data.py does after loading a study.
+--
+-- Run it once with
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f data/migrations/004_manhattan_bins.sql
+
+BEGIN;
+
+CREATE TABLE manhattan_bin (
+    study_key smallint NOT NULL,
+    level smallint NOT NULL,
+    chromosome smallint NOT NULL,
+    bin integer NOT NULL,
+    "position" integer NOT NULL,
+    pvalue double precision NOT NULL,
+    n integer NOT NULL,
+    CONSTRAINT pk_manhattan_bin PRIMARY KEY (study_key, level, chromosome, bin),
+    CONSTRAINT fk_manhattan_bin_study_key_study FOREIGN KEY (study_key) REFERENCES study (id)
+);
+
+INSERT INTO manhattan_bin (study_key, level, chromosome, bin, "position", pvalue, n)
+SELECT DISTINCT ON (a.study_key, v.chromosome, v."position" / 100)
+       a.study_key, 0, v.chromosome, v."position" / 100, v."position", a.pvalue,
+       count(*) OVER (PARTITION BY a.study_key, v.chromosome, v."position" / 100)
+FROM association a JOIN variant v ON v.id = a.variant_key
+WHERE a.pvalue IS NOT NULL AND v.chromosome IS NOT NULL AND v."position" IS NOT NULL
+ORDER BY a.study_key, v.chromosome, v."position" / 100, a.pvalue, a.id;
+
+DO $$
+BEGIN
+    FOR zoom_level IN 1..9 LOOP
+        INSERT INTO manhattan_bin (study_key, level, chromosome, bin, "position", pvalue, n)
+        SELECT DISTINCT ON (b.study_key, b.chromosome, b.bin / 4)
+               b.study_key, zoom_level, b.chromosome, b.bin / 4, b."position", b.pvalue,
+               sum(b.n) OVER (PARTITION BY b.study_key, b.chromosome, b.bin / 4)
+        FROM manhattan_bin b
+        WHERE b.level = zoom_level - 1
+        ORDER BY b.study_key, b.chromosome, b.bin / 4, b.pvalue, b."position";
+    END LOOP;
+END
+$$;
+
+UPDATE data_version SET version = version + 1, updated_at = now();
+
+COMMIT;
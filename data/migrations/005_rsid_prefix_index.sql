@@ -0,0 +1,8 @@
+-- Adds the byte-order rsID index used by /search/ for rsID prefix suggestions.
+-- Requires 001_compact_keys.sql.
+--
+-- Built CONCURRENTLY so ingestion can keep writing to variant meanwhile, which
+-- is why this file has no transaction block. Run it with
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f data/migrations/005_rsid_prefix_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_variant_rsid_prefix ON variant (rsid COLLATE "C");
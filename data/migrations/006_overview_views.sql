@@ -0,0 +1,34 @@
+-- Adds the gene_overview and study_overview materialized views: aggregates of
+-- gene_summary over every study, read by the backend's gene search index and
+-- by /studies/. Requires 003_gene_summary.sql.
+--
+-- The queries are the MATERIALIZED_VIEWS of data_ingestion/ingest_data.py,
+-- which creates them along with its tables on a fresh database and refreshes
+-- them with REFRESH MATERIALIZED VIEW CONCURRENTLY at the end of every run.
+-- That refresh needs the unique indexes created here.
+--
+-- Run it once with
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f data/migrations/006_overview_views.sql
+
+BEGIN;
+
+CREATE MATERIALIZED VIEW gene_overview AS
+SELECT gene_key, min(min_pvalue) AS min_pvalue, count(*) AS n_studies,
+       count(*) FILTER (WHERE hits_genome_wide > 0) AS n_egene_studies
+FROM gene_summary
+GROUP BY gene_key;
+
+CREATE UNIQUE INDEX ix_gene_overview_gene_key ON gene_overview (gene_key);
+
+CREATE MATERIALIZED VIEW study_overview AS
+SELECT study_key, count(*) AS n_genes, count(*) FILTER (WHERE hits_genome_wide > 0) AS n_egenes,
+       sum(hits_genome_wide) AS hits_genome_wide, sum(hits_suggestive) AS hits_suggestive,
+       min(min_pvalue) AS min_pvalue
+FROM gene_summary
+GROUP BY study_key;
+
+CREATE UNIQUE INDEX ix_study_overview_study_key ON study_overview (study_key);
+
+UPDATE data_version SET version = version + 1, updated_at = now();
+
+COMMIT;
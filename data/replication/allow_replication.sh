@@ -0,0 +1,4 @@
+#!/bin/bash
+# Run by the db service when it initializes a new data directory: lets db-replica
+# (docker-compose --profile replica) stream the WAL with the superuser's password
+echo "host replication all all md5" >> "$PGDATA/pg_hba.conf"
@@ -1,1588 +1,1588 @@
-88269117	chr18_80089655_C_G	ENSG00000101546	0.005060859955847263	0.7998219728469849	0.27619698643684387	0.9690999984741211
-165263272	chr18_80006298_C_T	ENSG00000101546	0.006537919864058495	0.6408849954605103	0.22850899398326874	0.8438900113105774
-189974970	chr18_80006322_T_G	ENSG00000101546	0.011794700287282467	-0.5716080069541931	0.22096000611782074	0.843529999256134
-189969216	chr18_79178881_T_G	ENSG00000101546	0.02522590011358261	0.635079026222229	0.2776080071926117	0.9558600187301636
-165263198	chr18_79985640_A_G	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528
-189976676	chr18_80214310_C_A	ENSG00000101546	0.04717560112476349	0.544579029083252	0.2694779932498932	0.6489700078964233
-165263686	chr18_80096776_T_C	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.9875199794769287
-165263890	chr18_80149200_G_C	ENSG00000101546	4.389380137581611e-06	0.7606329917907715	0.15253299474716187	0.9581500291824341
-165263199	chr18_79986042_CT_C	ENSG00000101546	6.413459777832031e-05	0.7103880047798157	0.16687899827957153	0.8760600090026855
-88268227	chr18_79988659_G_A	ENSG00000101546	0.006915390025824308	0.5245959758758545	0.18840600550174713	0.9341999888420105
-165263207	chr18_79988525_A_C	ENSG00000101546	0.0031936299055814743	0.6835629940032959	0.22371900081634521	0.8479499816894531
-189970452	chr18_79381096_T_C	ENSG00000101546	0.005841409787535667	-0.5551300048828125	0.1951259970664978	0.7927500009536743
-189974568	chr18_79948532_T_A	ENSG00000101546	0.02531309984624386	-0.626285970211029	0.273934006690979	0.8651599884033203
-189974572	chr18_79948781_G_A	ENSG00000101546	0.0036047999747097492	-0.5253739953041077	0.1743129938840866	0.9980499744415283
-189974574	chr18_79948992_A_G	ENSG00000101546	0.03834199905395508	-0.5101780295372009	0.2416040003299713	0.8685399889945984
-88268435	chr18_80015173_T_C	ENSG00000101546	0.0003370509948581457	0.5943009853363037	0.1574999988079071	0.9223799705505371
-88268441	chr18_80015318_T_C	ENSG00000101546	0.0003370520134922117	0.5942829847335815	0.15749500691890717	0.9225199818611145
-165263473	chr18_80048712_T_A	ENSG00000101546	0.001699079992249608	0.6150810122489929	0.18831400573253632	0.9347699880599976
-165263474	chr18_80048745_A_G	ENSG00000101546	0.0017098799580708146	0.6147590279579163	0.18833500146865845	0.9346699714660645
-189969758	chr18_79267258_A_G	ENSG00000101546	0.030641300603747368	-0.3394399881362915	0.15379899740219116	0.9347699880599976
-189974336	chr18_79897319_C_A	ENSG00000101546	0.02697809971868992	-0.7050880193710327	0.3119800090789795	0.8267999887466431
-189974520	chr18_79939893_C_T	ENSG00000101546	0.002230909885838628	0.6795340180397034	0.2139360010623932	0.8003100156784058
-189974562	chr18_79947427_C_T	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203
-165263183	chr18_79977397_C_T	ENSG00000101546	0.004117169883102179	0.6725360155105591	0.22659200429916382	0.8432499766349792
-189974850	chr18_79989181_C_T	ENSG00000101546	0.016787299886345863	-0.6368229985237122	0.2598299980163574	0.807129979133606
-165263286	chr18_80007935_A_G	ENSG00000101546	0.00274211005307734	0.6948300004005432	0.22362199425697327	0.7960799932479858
-165263290	chr18_80009368_T_C	ENSG00000101546	0.005383189767599106	0.6336519718170166	0.22047600150108337	0.8845999836921692
-165263382	chr18_80032826_A_C	ENSG00000101546	0.002464570105075836	0.6766359806060791	0.2152789980173111	0.9028099775314331
-88268647	chr18_80038033_C_T	ENSG00000101546	0.002321799984201789	0.6017940044403076	0.19025899469852448	0.7152799963951111
-165263432	chr18_80041700_G_A	ENSG00000101546	0.001348600024357438	0.7056990265846252	0.21119900047779083	0.911329984664917
-165263480	chr18_80049381_T_C	ENSG00000101546	0.0016119900392368436	0.6201500296592712	0.18887099623680115	0.9311699867248535
-88269453	chr18_80130127_G_A	ENSG00000101546	0.024224499240517616	0.6989679932594299	0.30333900451660156	0.9883300065994263
-165264086	chr18_80200981_G_A	ENSG00000101546	5.232629973761505e-07	0.9415439963340759	0.17010100185871124	0.8468199968338013
-165264113	chr18_80211420_G_T	ENSG00000101546	4.844760042033158e-07	0.9379090070724487	0.16884900629520416	0.856909990310669
-165263979	chr18_80168455_T_G	ENSG00000101546	0.008551299571990967	-0.6225879788398743	0.229994997382164	0.9817900061607361
-189974648	chr18_79957256_T_C	ENSG00000101546	0.026315899565815926	-0.6152210235595703	0.27098700404167175	0.8858199715614319
-165264015	chr18_80177025_G_GCACA	ENSG00000101546	1.5764900496151313e-08	1.0693299770355225	0.16700099408626556	0.7436299920082092
-189970536	chr18_79386003_T_C	ENSG00000101546	0.029892899096012115	-1.0388000011444092	0.46848100423812866	0.5593400001525879
-165263100	chr18_79954740_T_TTTTA	ENSG00000101546	0.015940500423312187	-0.4315820038318634	0.1746480017900467	0.9331099987030029
-165264074	chr18_80195609_G_C	ENSG00000101546	5.187960141483927e-07	0.9366790056228638	0.1691560000181198	0.8519600033760071
-189976530	chr18_80186371_C_CCT	ENSG00000101546	0.04832129925489426	0.5391690135002136	0.268216997385025	0.6838600039482117
-165263593	chr18_80076295_T_A	ENSG00000101546	7.731499884755522e-09	0.986873984336853	0.150068998336792	0.9564999938011169
-165264073	chr18_80195568_TATATAC_T	ENSG00000101546	0.00558339012786746	-0.7545740008354187	0.2637389898300171	0.8303099870681763
-189969054	chr18_79161566_G_A	ENSG00000101546	0.033481400460004807	0.561834990978241	0.2589539885520935	0.9670199751853943
-189974326	chr18_79895807_C_A	ENSG00000101546	0.026583099737763405	-0.7069860100746155	0.3119789958000183	0.8252599835395813
-189968432	chr18_79082227_T_C	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-88264593	chr18_79476259_G_A	ENSG00000101546	0.031721800565719604	-0.5312759876251221	0.2423200011253357	0.9400200247764587
-165264067	chr18_80192432_C_T	ENSG00000101546	4.886369993073458e-07	0.9410269856452942	0.16947700083255768	0.853190004825592
-165263391	chr18_80033734_T_C	ENSG00000101546	2.1368899705276334e-10	1.0814100503921509	0.14541399478912354	0.9551200270652771
-189974924	chr18_79999306_C_T	ENSG00000101546	0.016028599813580513	-0.6412019729614258	0.2597000002861023	0.7981100082397461
-189974274	chr18_79884045_G_A	ENSG00000101546	0.03408399969339371	-0.620281994342804	0.2868939936161041	0.9244400262832642
-88269193	chr18_80097610_CA_C	ENSG00000101546	0.010821700096130371	0.6994050145149231	0.2670089900493622	0.98853999376297
-165263190	chr18_79981409_C_T	ENSG00000101546	2.8930999818044256e-08	0.993582010269165	0.15884700417518616	0.8503199815750122
-165263802	chr18_80126255_CTGT_C	ENSG00000101546	0.0013861899496987462	-0.7513729929924011	0.2254679948091507	0.9777500033378601
-165261080	chr18_79397432_CCAGCTCT_C	ENSG00000101546	0.027723999693989754	-0.41871899366378784	0.18619999289512634	0.7035599946975708
-165263884	chr18_80147460_G_GCTGTGGTGC	ENSG00000101546	0.00011425300181144848	-0.6719560027122498	0.16421100497245789	0.9685099720954895
-165263885	chr18_80147460_G_GCTGTGGTGC	ENSG00000101546	0.00011425300181144848	-0.6719560027122498	0.16421100497245789	0.9685099720954895
-189976542	chr18_80190271_CA_C	ENSG00000101546	0.0494145005941391	0.540340006351471	0.27014100551605225	0.6949599981307983
-189969626	chr18_79245424_CA_C	ENSG00000101546	0.03679890185594559	0.5042889714241028	0.23683199286460876	0.8968600034713745
-189974566	chr18_79947827_TG_T	ENSG00000101546	0.02533089928328991	-0.6261579990386963	0.2739120125770569	0.8652700185775757
-165263469	chr18_80047699_GA_G	ENSG00000101546	0.0013542500091716647	0.7053020000457764	0.21116599440574646	0.9127600193023682
-165263725	chr18_80109435_G_T	ENSG00000101546	1.2129700621699158e-07	0.892195999622345	0.15117600560188293	0.9795399904251099
-189970000	chr18_79327597_C_T	ENSG00000101546	0.024081099778413773	-0.9562659859657288	0.41456499695777893	0.7628700137138367
-189969056	chr18_79161589_T_C	ENSG00000101546	0.033481400460004807	0.561834990978241	0.2589539885520935	0.9670199751853943
-165263261	chr18_80004129_TA_T	ENSG00000101546	0.00520892022177577	0.6606469750404358	0.22894099354743958	0.8338599801063538
-189969526	chr18_79221928_TA_T	ENSG00000101546	0.004411329980939627	0.5199660062789917	0.17661799490451813	0.94691002368927
-165263301	chr18_80011878_C_T	ENSG00000101546	2.8614999258991247e-10	1.0858500003814697	0.1473889946937561	0.9119499921798706
-88268453	chr18_80015887_T_C	ENSG00000101546	0.0005235049757175148	0.6151949763298035	0.16903799772262573	0.8602700233459473
-189974594	chr18_79951357_T_G	ENSG00000101546	0.038259100168943405	-0.5104730129241943	0.24163700640201569	0.8684399724006653
-165263937	chr18_80157500_C_T	ENSG00000101546	0.005877189803868532	-0.633247971534729	0.22275499999523163	0.9998800158500671
-165263487	chr18_80052545_C_T	ENSG00000101546	7.230669840652126e-09	0.9848809838294983	0.14939799904823303	0.9470199942588806
-165263179	chr18_79976966_AT_A	ENSG00000101546	0.0034992999862879515	0.6780070066452026	0.22419500350952148	0.8539800047874451
-165264000	chr18_80173623_TA_T	ENSG00000101546	0.006267809774726629	-0.6556059718132019	0.23250199854373932	0.9845700263977051
-189968988	chr18_79154049_C_T	ENSG00000101546	0.026356900110840797	0.6221839785575867	0.27413201332092285	0.987559974193573
-165263103	chr18_79955231_TA_T	ENSG00000101546	0.01798349991440773	-0.413085013628006	0.17042699456214905	0.9349200129508972
-88268149	chr18_79970807_C_A	ENSG00000101546	0.00901023019105196	0.4909360110759735	0.1826609969139099	0.9951300024986267
-165263836	chr18_80131623_G_T	ENSG00000101546	1.1903100016752433e-07	0.891057014465332	0.15086300671100616	0.9770200252532959
-189974634	chr18_79955687_T_C	ENSG00000101546	0.026685500517487526	-0.6141179800033569	0.27118799090385437	0.8807200193405151
-189968338	chr18_79071888_TG_T	ENSG00000101546	0.027317199856042862	0.6245059967041016	0.27695798873901367	0.8624100089073181
-189973980	chr18_79854682_C_G	ENSG00000101546	0.023015199229121208	0.4193579852581024	0.18036200106143951	0.8848699927330017
-165263252	chr18_79999802_G_C	ENSG00000101546	1.4111000368188797e-08	1.0174100399017334	0.15822599828243256	0.8517900109291077
-189970340	chr18_79371392_A_C	ENSG00000101546	0.03572259843349457	0.4821909964084625	0.22510899603366852	0.8771399855613708
-165263488	chr18_80052571_C_T	ENSG00000101546	7.160169790410009e-09	0.98505699634552	0.14937099814414978	0.9501199722290039
-189973910	chr18_79829199_T_G	ENSG00000101546	0.004635340068489313	0.6134790182113647	0.20961399376392365	0.7643700242042542
-165263651	chr18_80089468_C_T	ENSG00000101546	8.101719828346177e-08	0.9278609752655029	0.15459899604320526	0.9344099760055542
-189968455	chr18_79084159_G_GT	ENSG00000101546	0.026145299896597862	0.6233959794044495	0.27426400780677795	0.990559995174408
-189976140	chr18_80138816_C_CA	ENSG00000101546	0.04852209985256195	0.5525559782981873	0.2751289904117584	0.6626099944114685
-165263197	chr18_79984401_C_CT	ENSG00000101546	0.003161210101097822	0.6846809983253479	0.22382999956607819	0.8464900255203247
-88268465	chr18_80016428_G_A	ENSG00000101546	0.0003410860081203282	0.5949400067329407	0.157819002866745	0.9217699766159058
-88268463	chr18_80016386_T_A	ENSG00000101546	0.00033757698838599026	0.5943300127983093	0.15752699971199036	0.9221699833869934
-189974008	chr18_79860620_C_T	ENSG00000101546	0.021427400410175323	-0.4055219888687134	0.1722709983587265	0.942330002784729
-189974530	chr18_79941917_C_T	ENSG00000101546	0.018415000289678574	-0.7021380066871643	0.29080599546432495	0.8183500170707703
-189968360	chr18_79072683_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165263904	chr18_80152678_CTTTT_C	ENSG00000101546	1.8839300253148394e-07	0.8988940119743347	0.1551939994096756	0.9596899747848511
-165263594	chr18_80077162_A_AAT	ENSG00000101546	0.00010088000271935016	-0.6831870079040527	0.1655060052871704	0.972540020942688
-165263282	chr18_80007204_A_G	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8471400141716003
-88264535	chr18_79466973_C_T	ENSG00000101546	0.030743399634957314	-0.5306249856948853	0.24057699739933014	0.9541299939155579
-165262655	chr18_79782225_A_G	ENSG00000101546	0.04506170004606247	-0.39171698689460754	0.19190900027751923	0.5810999870300293
-165264154	chr18_80230333_G_C	ENSG00000101546	7.558409720331838e-07	1.3686699867248535	0.25151100754737854	0.4362500011920929
-88264545	chr18_79467950_G_T	ENSG00000101546	0.030585499480366707	-0.5315729975700378	0.24077099561691284	0.955489993095398
-165264026	chr18_80178331_G_A	ENSG00000101546	5.078319986751012e-07	0.9027500152587891	0.16286900639533997	0.8690699934959412
-165263478	chr18_80049003_A_G	ENSG00000101546	0.00093129399465397	0.6501619815826416	0.18792100250720978	0.9037500023841858
-165261302	chr18_79455999_G_A	ENSG00000101546	0.03341389819979668	-0.9631909728050232	0.4437670111656189	0.6566900014877319
-165264124	chr18_80214056_T_C	ENSG00000101546	4.836339826397307e-07	0.9379900097846985	0.16885100305080414	0.8568400144577026
-165263196	chr18_79983996_A_G	ENSG00000101546	0.0031252100598067045	0.6856480240821838	0.2238609939813614	0.8450300097465515
-189975318	chr18_80042683_A_G	ENSG00000101546	0.00030811000033281744	-0.5959500074386597	0.15681500732898712	0.9711300134658813
-189974158	chr18_79870600_G_C	ENSG00000101546	0.016574300825595856	0.42703700065612793	0.17387999594211578	0.9479399919509888
-165264001	chr18_80173715_C_T	ENSG00000101546	6.341139737742196e-07	0.8533120155334473	0.15553000569343567	0.9968100190162659
-189974394	chr18_79912473_A_C	ENSG00000101546	0.0037128899712115526	0.545753002166748	0.18168799579143524	0.8391000032424927
-189974396	chr18_79912533_A_G	ENSG00000101546	0.009505489841103554	0.4873799979686737	0.1826860010623932	0.810949981212616
-165263336	chr18_80019532_T_C	ENSG00000101546	9.29609011990351e-09	0.9903740286827087	0.15163099765777588	0.9100900292396545
-165263308	chr18_80013284_A_G	ENSG00000101546	0.0024590399116277695	0.6799489855766296	0.21628199517726898	0.8852300047874451
-165263450	chr18_80043716_A_G	ENSG00000101546	0.001348600024357438	0.7056990265846252	0.21119900047779083	0.911329984664917
-165263188	chr18_79979098_T_C	ENSG00000101546	0.0031906599178910255	0.6855279803276062	0.22433899343013763	0.8428199887275696
-165263254	chr18_80001717_C_T	ENSG00000101546	2.8912999994190614e-08	0.9936370253562927	0.1588519960641861	0.8511199951171875
-165263294	chr18_80010278_A_C	ENSG00000101546	4.501179873273031e-09	1.0125700235366821	0.15097500383853912	0.9097700119018555
-88269647	chr18_80153280_A_T	ENSG00000101546	0.026515599340200424	0.43570300936698914	0.19217799603939056	0.8357800245285034
-189973992	chr18_79858869_C_T	ENSG00000101546	0.034122198820114136	0.3691610097885132	0.17078299820423126	0.9214199781417847
-189973994	chr18_79859009_C_T	ENSG00000101546	0.010832199826836586	0.4584600031375885	0.17504900693893433	0.934469997882843
-189974256	chr18_79881902_C_G	ENSG00000101546	0.028648799285292625	0.3878380060195923	0.17351900041103363	0.9393600225448608
-189975328	chr18_80043839_A_C	ENSG00000101546	0.00030836599762551486	-0.595770001411438	0.1567779928445816	0.9712799787521362
-165263727	chr18_80110152_A_G	ENSG00000101546	5.758960105595179e-05	-0.6803119778633118	0.15868200361728668	0.9999499917030334
-165263853	chr18_80134846_A_G	ENSG00000101546	1.1987299330940004e-07	0.8911299705505371	0.15092000365257263	0.9764900207519531
-165263258	chr18_80003701_T_C	ENSG00000101546	2.8912999994190614e-08	0.9936370253562927	0.1588519960641861	0.8511199951171875
-165263929	chr18_80155950_G_A	ENSG00000101546	1.484340009483276e-05	0.7235910296440125	0.15522600710391998	0.9126399755477905
-165263259	chr18_80003721_T_C	ENSG00000101546	2.8912999994190614e-08	0.9936370253562927	0.1588519960641861	0.8511199951171875
-165263097	chr18_79953591_G_A	ENSG00000101546	0.018157700076699257	-0.4125800132751465	0.17048600316047668	0.9350399971008301
-165263096	chr18_79953494_C_T	ENSG00000101546	0.018177499994635582	-0.4124450087547302	0.1704609990119934	0.9351199865341187
-165264125	chr18_80214183_C_T	ENSG00000101546	3.407639894703607e-07	1.5600299835205078	0.2764289975166321	0.4388200044631958
-165263963	chr18_80164499_T_C	ENSG00000101546	2.1902700098053174e-07	0.8857880234718323	0.15393200516700745	0.9749500155448914
-165263533	chr18_80060910_C_T	ENSG00000101546	7.034130167227204e-09	0.9838669896125793	0.14909300208091736	0.9586499929428101
-165263454	chr18_80044678_T_G	ENSG00000101546	0.001348600024357438	0.7056990265846252	0.21119900047779083	0.911329984664917
-165263200	chr18_79986403_T_A	ENSG00000101546	1.6620999758742983e-06	0.8167529702186584	0.15587599575519562	0.849049985408783
-88264265	chr18_79437571_T_C	ENSG00000101546	0.043609898537397385	-0.44555801153182983	0.21675600111484528	0.8732500076293945
-88268703	chr18_80042638_G_A	ENSG00000101546	0.003612630069255829	0.5335400104522705	0.17706599831581116	0.9787099957466125
-165263479	chr18_80049229_C_T	ENSG00000101546	2.2965099560678937e-05	0.7533029913902283	0.16582900285720825	0.9481800198554993
-165263320	chr18_80015810_T_C	ENSG00000101546	0.0023489799350500107	0.6838210225105286	0.21645799279212952	0.883109986782074
-165263383	chr18_80032946_T_A	ENSG00000101546	4.7634500510707056e-11	1.145259976387024	0.1469459980726242	0.9411900043487549
-189975326	chr18_80043750_G_A	ENSG00000101546	0.00030836599762551486	-0.595770001411438	0.1567779928445816	0.9712799787521362
-165263548	chr18_80064423_A_C	ENSG00000101546	0.0011940599652007222	0.7402759790420532	0.21897999942302704	0.9021700024604797
-88264217	chr18_79432116_A_G	ENSG00000101546	0.02420409955084324	-0.49648699164390564	0.2154339998960495	0.9023799896240234
-189975102	chr18_80020683_C_T	ENSG00000101546	0.0003653719904832542	-0.6127560138702393	0.16344499588012695	0.9256200194358826
-165263293	chr18_80009836_G_A	ENSG00000101546	4.4834198575927076e-09	1.0126399993896484	0.15096400678157806	0.9098799824714661
-165263295	chr18_80010322_G_A	ENSG00000101546	4.485749993676791e-09	1.012619972229004	0.15096400678157806	0.9099199771881104
-165263170	chr18_79970825_A_G	ENSG00000101546	0.003493859898298979	0.6786320209503174	0.22436299920082092	0.8561000227928162
-189974034	chr18_79862996_T_C	ENSG00000101546	0.0238575991243124	-0.3865709900856018	0.16731199622154236	0.9996100068092346
-88269645	chr18_80153273_C_G	ENSG00000101546	0.02143239974975586	0.44191399216651917	0.18773899972438812	0.8216400146484375
-165263919	chr18_80153302_C_T	ENSG00000101546	0.0337240993976593	-0.5685020089149475	0.26239800453186035	0.748989999294281
-189975310	chr18_80041795_T_C	ENSG00000101546	0.00030811000033281744	-0.5959500074386597	0.15681500732898712	0.9711300134658813
-165263622	chr18_80083867_C_G	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934
-165263623	chr18_80083957_C_T	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445
-165263455	chr18_80044809_G_A	ENSG00000101546	7.453770045628971e-09	0.9854879975318909	0.1496569961309433	0.9538000226020813
-165264037	chr18_80179378_T_C	ENSG00000101546	0.0015318799996748567	0.5973799824714661	0.18102000653743744	0.9066900014877319
-165263483	chr18_80051495_C_A	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252
-189968632	chr18_79108000_T_A	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967
-165263227	chr18_79992876_T_TAAA	ENSG00000101546	4.858270131080644e-06	0.8729450106620789	0.17599999904632568	0.7013300061225891
-189968640	chr18_79110162_T_C	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967
-189969888	chr18_79296049_T_C	ENSG00000101546	0.02867319993674755	-0.8735740184783936	0.39090099930763245	0.9350699782371521
-189969898	chr18_79303255_G_A	ENSG00000101546	0.03531689941883087	-0.8263319730758667	0.384893000125885	0.9322500228881836
-189968628	chr18_79107637_G_A	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967
-189969428	chr18_79204525_C_A	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646
-189969128	chr18_79169242_T_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189970456	chr18_79381111_T_C	ENSG00000101546	0.026278700679540634	-0.9570159912109375	0.42142999172210693	0.8164399862289429
-189968698	chr18_79118330_C_G	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967
-189970060	chr18_79339743_G_A	ENSG00000101546	0.024308599531650543	-0.9125999808311462	0.3962939977645874	0.8648800253868103
-88267149	chr18_79783475_C_CAAAAAAAAAA	ENSG00000101546	0.007150080054998398	-1.1952500343322754	0.4311380088329315	0.4055199921131134
-189968204	chr18_79058217_T_C	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9401000142097473
-189968590	chr18_79103691_G_A	ENSG00000101546	0.04781489819288254	-0.7181119918823242	0.3564029932022095	0.9768800139427185
-189969598	chr18_79237692_G_T	ENSG00000101546	0.04433250054717064	0.4997889995574951	0.24399599432945251	0.8938999772071838
-189968726	chr18_79122298_G_A	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967
-189969296	chr18_79186660_A_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189969098	chr18_79167154_C_A	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189969812	chr18_79281913_G_C	ENSG00000101546	0.029738599434494972	-0.8309569954872131	0.37438100576400757	0.9692699909210205
-88264153	chr18_79425179_C_CTCTGTCTCTGTCTCTCTGTCTGTCTCTGTGTCTG	ENSG00000101546	0.03348499909043312	-0.5042049884796143	0.23239700496196747	0.6798400282859802
-189968828	chr18_79134116_T_C	ENSG00000101546	0.030845800414681435	-0.8117179870605469	0.3682529926300049	0.9889600276947021
-189970538	chr18_79386295_C_G	ENSG00000101546	0.0355570986866951	-0.9875860214233398	0.46062400937080383	0.8064200282096863
-189968428	chr18_79080425_A_C	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-189970446	chr18_79379494_C_A	ENSG00000101546	0.006771930027753115	0.8088930249214172	0.2897219955921173	0.546970009803772
-88261925	chr18_79097672_G_C	ENSG00000101546	0.029620099812746048	-0.540611982345581	0.24338500201702118	0.9357600212097168
-88269135	chr18_80091891_C_T	ENSG00000101546	0.010521300137043	0.8432310223579407	0.3206230103969574	0.9692599773406982
-165263044	chr18_79937110_T_C	ENSG00000101546	0.004301569890230894	-0.7993729710578918	0.27071601152420044	0.8554199934005737
-165264135	chr18_80217899_A_G	ENSG00000101546	0.005211949814110994	-0.6893119812011719	0.23889200389385223	0.805109977722168
-88269507	chr18_80134386_A_AGT	ENSG00000101546	0.047348301857709885	0.6571260094642639	0.3254309892654419	0.7366799712181091
-88262155	chr18_79128052_C_CT	ENSG00000101546	0.013145900331437588	-0.7608969807624817	0.2989029884338379	0.7035099864006042
-165263146	chr18_79966121_T_C	ENSG00000101546	0.002355509903281927	-0.5645080208778381	0.17874300479888916	0.8751500248908997
-189974242	chr18_79880316_C_CA	ENSG00000101546	0.01609550043940544	-0.7063339948654175	0.2862679958343506	0.7907099723815918
-165263427	chr18_80040239_AT_A	ENSG00000101546	0.0006344889989122748	-1.2856199741363525	0.3591110110282898	0.569130003452301
-189970338	chr18_79371370_TAA_T	ENSG00000101546	0.026458900421857834	-1.0992599725723267	0.4846689999103546	0.6761000156402588
-189969996	chr18_79327536_AGC_A	ENSG00000101546	0.034864600747823715	-0.9216139912605286	0.42817699909210205	0.7690600156784058
-189969660	chr18_79249079_TA_T	ENSG00000101546	0.02948799915611744	-0.8166509866714478	0.3673500120639801	0.9844300150871277
-189975024	chr18_80011677_G_C	ENSG00000101546	0.015259799547493458	-0.6196200251579285	0.2490289956331253	0.8984299898147583
-189975134	chr18_80025983_A_G	ENSG00000101546	0.016570299863815308	-0.5826950073242188	0.23725199699401855	0.9036200046539307
-165264151	chr18_80226462_C_T	ENSG00000101546	5.715129987038381e-07	1.369979977607727	0.24850699305534363	0.43606001138687134
-165263604	chr18_80080362_C_T	ENSG00000101546	0.0007970309816300869	-0.7052819728851318	0.20100200176239014	0.9670400023460388
-189975844	chr18_80103247_A_G	ENSG00000101546	0.003959029912948608	0.5524510145187378	0.18528500199317932	0.9293599724769592
-189975842	chr18_80103219_T_C	ENSG00000101546	0.003961219917982817	0.5524060130119324	0.18528200685977936	0.9293599724769592
-88265749	chr18_79628431_T_C	ENSG00000101546	0.04770689830183983	0.3341499865055084	0.16575799882411957	0.9682999849319458
-189976466	chr18_80177445_C_T	ENSG00000101546	0.04747119918465614	0.5311939716339111	0.26321500539779663	0.7918800115585327
-189974410	chr18_79914634_C_T	ENSG00000101546	0.004485940095037222	0.5156059861183167	0.17548500001430511	0.8685500025749207
-88268923	chr18_80065981_A_G	ENSG00000101546	0.001693099969998002	0.6461420059204102	0.19775299727916718	0.9551100134849548
-165263283	chr18_80007566_T_C	ENSG00000101546	0.003112219972535968	0.6858699917793274	0.22382999956607819	0.8428599834442139
-88268963	chr18_80070388_G_C	ENSG00000101546	0.02360139973461628	0.8853600025177002	0.38246700167655945	0.9613699913024902
-165263002	chr18_79918327_A_G	ENSG00000101546	0.04121759906411171	0.37589898705482483	0.18069800734519958	0.830269992351532
-189974288	chr18_79887234_G_C	ENSG00000101546	0.0339869000017643	-0.6203529834747314	0.286765992641449	0.9263399839401245
-88268535	chr18_80028215_G_C	ENSG00000101546	0.007812350057065487	0.5490819811820984	0.20038799941539764	0.8706700205802917
-88268537	chr18_80028302_C_G	ENSG00000101546	0.003849250031635165	0.5351849794387817	0.1789100021123886	0.9419999718666077
-189975286	chr18_80041227_G_A	ENSG00000101546	0.0003089960082434118	-0.5979019999504089	0.15736399590969086	0.9656100273132324
-189974310	chr18_79891511_A_G	ENSG00000101546	0.033448200672864914	-0.6237900257110596	0.2874540090560913	0.9214500188827515
-88268163	chr18_79976111_C_T	ENSG00000101546	0.008952969685196877	0.49998798966407776	0.18586699664592743	0.9432399868965149
-189969808	chr18_79281852_T_G	ENSG00000101546	0.03782210126519203	0.48354700207710266	0.2283560037612915	0.9390599727630615
-189974472	chr18_79928830_G_C	ENSG00000101546	0.008587850257754326	0.4717639982700348	0.17437900602817535	0.9334400296211243
-88265751	chr18_79628519_G_A	ENSG00000101546	0.047676701098680496	0.3341909945011139	0.1657550036907196	0.9682899713516235
-88269187	chr18_80097461_G_T	ENSG00000101546	0.025620199739933014	0.6260730028152466	0.27443501353263855	0.9892699718475342
-88269191	chr18_80097554_G_A	ENSG00000101546	0.010862300172448158	0.6994370222091675	0.2671639919281006	0.9884799718856812
-88269733	chr18_80164071_A_C	ENSG00000101546	0.03801070153713226	0.6622840166091919	0.3130820095539093	0.870930016040802
-189975172	chr18_80030689_G_T	ENSG00000101546	0.00036481101415120065	-0.6129689812660217	0.16348199546337128	0.9254599809646606
-189974628	chr18_79955231_T_C	ENSG00000101546	0.0031202901154756546	0.5538470149040222	0.18079699575901031	0.9220600128173828
-189974420	chr18_79917315_C_G	ENSG00000101546	0.0030392499174922705	0.5548359751701355	0.18059200048446655	0.8702099919319153
-189969456	chr18_79208210_A_G	ENSG00000101546	0.003539720084518194	0.5443410277366638	0.1802310049533844	0.9538499712944031
-165263246	chr18_79997882_T_A	ENSG00000101546	0.00667465990409255	0.6408960223197937	0.22912199795246124	0.8406500220298767
-88269457	chr18_80130552_A_G	ENSG00000101546	0.02465049922466278	0.6977249979972839	0.303737998008728	0.9815000295639038
-88268929	chr18_80067192_G_A	ENSG00000101546	0.010367799550294876	0.8489490151405334	0.3221229910850525	0.9592400193214417
-88268939	chr18_80067404_G_T	ENSG00000101546	0.010668500326573849	0.8413940072059631	0.3205600082874298	0.9634799957275391
-88269301	chr18_80115526_C_G	ENSG00000101546	0.024279000237584114	0.6988750100135803	0.30341899394989014	0.988860011100769
-189970012	chr18_79330730_G_A	ENSG00000101546	0.04692310094833374	0.45115798711776733	0.22298599779605865	0.9156000018119812
-88263091	chr18_79260146_G_A	ENSG00000101546	0.03113340027630329	0.668129026889801	0.3036479949951172	0.7333499789237976
-189974534	chr18_79942976_C_T	ENSG00000101546	0.00617578998208046	0.5417900085449219	0.1917780041694641	0.6976400017738342
-88269189	chr18_80097486_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342
-88266771	chr18_79742141_TGAGGTGGAGGCCTGGGGGCAGCAGAG_T	ENSG00000101546	0.03260349854826927	-0.9425650238990784	0.43219301104545593	0.42250001430511475
-189975476	chr18_80059643_T_C	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189975484	chr18_80060018_A_T	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189974788	chr18_79977240_T_G	ENSG00000101546	0.01845810003578663	-0.6320319771766663	0.26187101006507874	0.8072999715805054
-165263529	chr18_80060000_T_C	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853
-189975516	chr18_80062951_G_A	ENSG00000101546	0.012708200141787529	-0.5767030119895935	0.22540099918842316	0.9361000061035156
-189974956	chr18_80005220_C_T	ENSG00000101546	0.015002500265836716	-0.6167280077934265	0.24721099436283112	0.8146399855613708
-189974866	chr18_79991380_A_G	ENSG00000101546	0.016766300424933434	-0.6369699835777283	0.2598380148410797	0.807200014591217
-165263304	chr18_80012151_T_C	ENSG00000101546	0.0024645200464874506	0.6798909902572632	0.21631500124931335	0.8861700296401978
-189975426	chr18_80055138_T_C	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189975480	chr18_80059915_G_A	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571
-189975486	chr18_80060172_G_A	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189975234	chr18_80035323_C_G	ENSG00000101546	0.017634199932217598	-0.5941640138626099	0.2443539947271347	0.9664999842643738
-189974258	chr18_79881916_C_T	ENSG00000101546	0.035509899258613586	-0.6130660176277161	0.28586700558662415	0.9263100028038025
-165263491	chr18_80053395_G_T	ENSG00000101546	0.0014024500269442797	0.6116849780082703	0.18375900387763977	0.9997699856758118
-189975560	chr18_80067838_T_C	ENSG00000101546	0.027172299101948738	-0.5348979830741882	0.23698699474334717	0.9732599854469299
-189975404	chr18_80052890_C_T	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571
-189974338	chr18_79897865_A_C	ENSG00000101546	0.027356300503015518	-0.6986830234527588	0.309935986995697	0.8177499771118164
-88264183	chr18_79428406_C_T	ENSG00000101546	0.0035831599961966276	0.5916919708251953	0.1961819976568222	0.5903199911117554
-165264179	chr18_80256437_C_T	ENSG00000101546	1.0022899914474692e-06	1.3872699737548828	0.2583479881286621	0.4155200123786926
-189974874	chr18_79992459_A_G	ENSG00000101546	0.01678840070962906	-0.6368399858474731	0.2598400115966797	0.8073300123214722
-189974378	chr18_79908190_C_T	ENSG00000101546	0.02625890076160431	-0.7442160248756409	0.32767701148986816	0.865369975566864
-165263545	chr18_80062556_T_C	ENSG00000101546	0.0013587300200015306	0.6284509897232056	0.18821699917316437	0.9168499708175659
-189974944	chr18_80004073_T_C	ENSG00000101546	0.01681469939649105	-0.6360729932785034	0.2595919966697693	0.8078600168228149
-189975592	chr18_80074222_A_G	ENSG00000101546	0.021228300407528877	0.5256810188293457	0.22296099364757538	0.8827199935913086
-189975030	chr18_80012053_C_T	ENSG00000101546	0.015259799547493458	-0.6196200251579285	0.2490289956331253	0.8984299898147583
-189974798	chr18_79978994_G_A	ENSG00000101546	0.016826199367642403	-0.6356809735298157	0.259460985660553	0.8081899881362915
-189975558	chr18_80067644_G_A	ENSG00000101546	0.018936200067400932	-0.5249940156936646	0.2184389978647232	0.9997000098228455
-189974750	chr18_79969568_T_G	ENSG00000101546	0.024881400167942047	-0.6028140187263489	0.26285699009895325	0.8036199808120728
-165262766	chr18_79845212_A_G	ENSG00000101546	0.03241319954395294	-0.5894320011138916	0.2699649930000305	0.823419988155365
-189975422	chr18_80054855_C_T	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189974768	chr18_79972180_C_T	ENSG00000101546	0.019525699317455292	-0.6385509967803955	0.26704299449920654	0.7862200140953064
-189974958	chr18_80005310_T_C	ENSG00000101546	0.0203901007771492	-0.6135429739952087	0.2584550082683563	0.8163400292396545
-88264299	chr18_79439638_T_C	ENSG00000101546	0.04078270122408867	-0.3897930085659027	0.18696199357509613	0.855459988117218
-189968676	chr18_79116940_T_TA	ENSG00000101546	0.027863100171089172	0.6207360029220581	0.27628999948501587	0.9672899842262268
-165264163	chr18_80242558_C_G	ENSG00000101546	0.032818298786878586	-0.831233024597168	0.3816309869289398	0.40481001138687134
-189974744	chr18_79969306_GA_G	ENSG00000101546	0.00014140500570647418	1.3737800121307373	0.3408629894256592	0.40935999155044556
-165263669	chr18_80092346_TATAGAGAGAGAGAGAGAGAG_T	ENSG00000101546	0.00607470003888011	-0.8651469945907593	0.3055979907512665	0.6850600242614746
-189975887	chr18_80111566_AT_A	ENSG00000101546	0.005242549814283848	0.5107319951057434	0.17712900042533875	0.9149500131607056
-165263595	chr18_80077316_C_CAA	ENSG00000101546	0.0005801990046165884	-0.917589008808136	0.2543419897556305	0.8556399941444397
-165263834	chr18_80131569_CTT_C	ENSG00000101546	1.2384700198708742e-07	0.8924009799957275	0.15134300291538239	0.9730899930000305
-189968852	chr18_79138774_T_TA	ENSG00000101546	0.034833598881959915	0.5915639996528625	0.2747890055179596	0.9073699712753296
-88269041	chr18_80083194_CA_C	ENSG00000101546	0.0026245699264109135	-0.7046819925308228	0.22572000324726105	0.7047299742698669
-189974358	chr18_79903863_A_G	ENSG00000101546	0.027788599953055382	0.43759599328041077	0.19467799365520477	0.7608399987220764
-165264041	chr18_80180322_C_T	ENSG00000101546	0.008212540298700333	-0.6301609873771667	0.23152300715446472	0.9437400102615356
-165263619	chr18_80083687_G_A	ENSG00000101546	0.000790458987466991	-0.7059760093688965	0.2010509967803955	0.9594500064849854
-165263109	chr18_79956624_G_A	ENSG00000101546	0.016277799382805824	-0.4408339858055115	0.17898400127887726	0.9308300018310547
-189974122	chr18_79867877_A_G	ENSG00000101546	0.024202600121498108	-0.4021959900856018	0.17451700568199158	0.9387999773025513
-165264149	chr18_80223381_T_A	ENSG00000101546	0.027060700580477715	-0.8133559823036194	0.36008700728416443	0.41071999073028564
-165263779	chr18_80120574_C_T	ENSG00000101546	5.779879938927479e-05	-0.6903769969940186	0.16106800734996796	0.972790002822876
-88268473	chr18_80017636_T_G	ENSG00000101546	0.00033769800211302936	0.5948230028152466	0.15766200423240662	0.9208700060844421
-189974450	chr18_79923131_G_T	ENSG00000101546	0.0018138400046154857	-0.7967979907989502	0.24556100368499756	0.7055799961090088
-88268097	chr18_79965655_A_G	ENSG00000101546	0.020526399835944176	0.5358060002326965	0.22596199810504913	0.8470799922943115
-165263407	chr18_80036239_G_T	ENSG00000101546	0.0012013299856334925	0.7136030197143555	0.21121099591255188	0.9030900001525879
-189974644	chr18_79956889_G_A	ENSG00000101546	0.0014028799487277865	-0.611066997051239	0.1835789978504181	0.9300900101661682
-165263886	chr18_80147638_A_G	ENSG00000101546	0.03544029965996742	-0.43302100896835327	0.2018350064754486	0.8271600008010864
-189975242	chr18_80036574_C_T	ENSG00000101546	0.0003092499973718077	-0.5977219939231873	0.15732699632644653	0.9657700061798096
-165263108	chr18_79956540_T_C	ENSG00000101546	0.029979800805449486	-0.389710009098053	0.17584800720214844	0.9292200207710266
-189974136	chr18_79868996_A_G	ENSG00000101546	0.024199599400162697	-0.40219399333000183	0.17451299726963043	0.9389399886131287
-165261322	chr18_79459475_C_T	ENSG00000101546	0.031688299030065536	-0.5803430080413818	0.2646459937095642	0.8968300223350525
-165263874	chr18_80144824_A_G	ENSG00000101546	0.00041173299541696906	-0.9514430165290833	0.2562609910964966	0.8420799970626831
-88270173	chr18_80257297_C_T	ENSG00000101546	0.047908999025821686	0.46539101004600525	0.23107700049877167	0.9243299961090088
-88265709	chr18_79621649_C_T	ENSG00000101546	0.04461599886417389	-0.49900299310684204	0.24394699931144714	0.9291499853134155
-189975098	chr18_80019652_C_A	ENSG00000101546	0.013960200361907482	-0.6017209887504578	0.23853500187397003	0.8804900050163269
-165264166	chr18_80245424_G_A	ENSG00000101546	0.030152199789881706	-0.8601790070533752	0.38855698704719543	0.40099000930786133
-189974132	chr18_79868832_T_C	ENSG00000101546	0.024199599400162697	-0.40219399333000183	0.17451299726963043	0.9389399886131287
-165264045	chr18_80182722_G_T	ENSG00000101546	0.00996697973459959	-0.6216570138931274	0.2345689982175827	0.9793599843978882
-165263111	chr18_79957182_T_C	ENSG00000101546	0.00988140981644392	-0.4686099886894226	0.17660599946975708	0.9330800175666809
-189975228	chr18_80034810_G_A	ENSG00000101546	0.00044641000567935407	-0.5888959765434265	0.15967200696468353	0.999779999256134
-165264169	chr18_80248901_T_G	ENSG00000101546	0.03456300124526024	0.5418429970741272	0.2513050138950348	0.46849000453948975
-189975044	chr18_80013596_G_A	ENSG00000101546	0.00036805300624109805	-0.6124699711799622	0.1634649932384491	0.9235000014305115
-165263481	chr18_80050485_C_T	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193
-165262767	chr18_79846001_G_A	ENSG00000101546	0.020738299936056137	0.3971950113773346	0.1677979975938797	0.9456400275230408
-88265721	chr18_79624103_C_G	ENSG00000101546	0.043914999812841415	-0.4948810040950775	0.24110999703407288	0.9356099963188171
-165263464	chr18_80047043_G_C	ENSG00000101546	0.003139219945296645	0.6661379933357239	0.21759900450706482	0.9107499718666077
-88264251	chr18_79436509_G_A	ENSG00000101546	0.003377229906618595	0.6379070281982422	0.21008999645709991	0.558210015296936
-165263977	chr18_80167710_G_A	ENSG00000101546	0.0016949500422924757	-0.9104419946670532	0.27867400646209717	0.8137000203132629
-189974458	chr18_79925520_A_G	ENSG00000101546	0.008464010432362556	0.4737200140953064	0.1747570037841797	0.9314900040626526
-88268475	chr18_80017757_C_T	ENSG00000101546	0.00033673999132588506	0.594323992729187	0.15749399363994598	0.9223799705505371
-165264171	chr18_80249901_T_C	ENSG00000101546	0.01624150015413761	0.6362590193748474	0.25823700428009033	0.45124000310897827
-165263621	chr18_80083748_G_C	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934
-165263780	chr18_80120603_G_C	ENSG00000101546	5.779879938927479e-05	-0.6903769969940186	0.16106800734996796	0.972790002822876
-165263463	chr18_80046509_A_G	ENSG00000101546	0.0015298300422728062	0.7141900062561035	0.21638800203800201	0.9067999720573425
-165263718	chr18_80106536_C_CGTG	ENSG00000101546	0.0009647249826230109	-0.9014440178871155	0.26139500737190247	0.693589985370636
-165263677	chr18_80094116_TAC_T	ENSG00000101546	0.001179030048660934	-0.7517610192298889	0.22211000323295593	0.838670015335083
-189975886	chr18_80111566_AT_A	ENSG00000101546	0.005242549814283848	0.5107319951057434	0.17712900042533875	0.9149500131607056
-189970168	chr18_79354568_CAAA_C	ENSG00000101546	0.008687240071594715	0.9145209789276123	0.33856698870658875	0.6008700132369995
-165263659	chr18_80091490_CTT_C	ENSG00000101546	0.00044414299190975726	-0.8210899829864502	0.22253400087356567	0.976170003414154
-165263676	chr18_80094116_TAC_T	ENSG00000101546	0.001179030048660934	-0.7517610192298889	0.22211000323295593	0.838670015335083
-165262968	chr18_79903896_A_G	ENSG00000101546	0.007458209991455078	0.7488849759101868	0.27163100242614746	0.7172300219535828
-165263645	chr18_80088881_G_GTT	ENSG00000101546	0.0008126859902404249	-0.7047669887542725	0.2012059986591339	0.9644399881362915
-165261301	chr18_79455760_TCCCACGGCCGCCCCATCCCAC_T	ENSG00000101546	0.026114100590348244	0.5667369961738586	0.24928300082683563	0.43731001019477844
-189969028	chr18_79158230_CT_C	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-165263541	chr18_80062261_G_GT	ENSG00000101546	6.983349898348479e-09	0.9865990281105042	0.14946800470352173	0.9559500217437744
-165262966	chr18_79903409_C_G	ENSG00000101546	0.010445400141179562	-0.7067210078239441	0.26844099164009094	0.8590099811553955
-189968684	chr18_79117040_A_ACT	ENSG00000101546	0.0408950001001358	0.527961015701294	0.2533789873123169	0.9663900136947632
-189969452	chr18_79208081_T_G	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646
-189968300	chr18_79069127_C_CT	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165263968	chr18_80165736_G_GA	ENSG00000101546	2.1741000466590776e-07	0.8853939771652222	0.15381400287151337	0.9742799997329712
-189968716	chr18_79120359_TAAAA_T	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967
-88264019	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267
-88264191	chr18_79429220_CAA_C	ENSG00000101546	0.04382459819316864	-0.45905399322509766	0.22355599701404572	0.846310019493103
-189975578	chr18_80070469_A_G	ENSG00000101546	0.01796709932386875	-0.5397830009460449	0.2226649969816208	0.9735100269317627
-189974276	chr18_79884547_TCTGGGC_T	ENSG00000101546	0.03304240107536316	-0.6261109709739685	0.2878369987010956	0.9235900044441223
-165263351	chr18_80024474_TTGTG_T	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414
-189969584	chr18_79236473_CT_C	ENSG00000101546	0.030060099437832832	-0.8153769969940186	0.36810699105262756	0.9937400221824646
-165261386	chr18_79474048_G_A	ENSG00000101546	0.02458750084042549	-0.7795990109443665	0.33922499418258667	0.6962199807167053
-189969062	chr18_79162674_CAG_C	ENSG00000101546	0.033481400460004807	0.561834990978241	0.2589539885520935	0.9670199751853943
-189968278	chr18_79064966_C_T	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9400799870491028
-165261351	chr18_79464648_T_TTCTGTGTGTG	ENSG00000101546	0.025898899883031845	-0.7204480171203613	0.3164199888706207	0.7374500036239624
-189969168	chr18_79173346_A_AT	ENSG00000101546	0.03304319828748703	0.5645449757575989	0.259535014629364	0.9645799994468689
-165263596	chr18_80077316_CA_C	ENSG00000101546	2.383680026696311e-07	0.8571000099182129	0.14949700236320496	0.9176099896430969
-165263005	chr18_79918420_C_CGGG	ENSG00000101546	0.010068999603390694	0.6765609979629517	0.2556520104408264	0.5720400214195251
-189968654	chr18_79112039_TAGAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189969156	chr18_79172036_A_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-88264507	chr18_79464494_T_TA	ENSG00000101546	0.03658439964056015	-0.5196570158004761	0.24376200139522552	0.9464499950408936
-189974454	chr18_79924036_C_CA	ENSG00000101546	0.013886700384318829	-0.7454249858856201	0.29526498913764954	0.7831699848175049
-189975218	chr18_80034088_CG_C	ENSG00000101546	0.017705900594592094	-0.5938979983329773	0.24440599977970123	0.9673900008201599
-189970442	chr18_79379096_CCTGAGTTTCCGGACGGGCCCGGCCCTGCGAGGGCGCG_C	ENSG00000101546	0.028271500021219254	-0.9858899712562561	0.44000399112701416	0.8375300168991089
-189969116	chr18_79168362_T_TTTTG	ENSG00000101546	0.0321056991815567	0.5739529728889465	0.2623920142650604	0.9609699845314026
-165263646	chr18_80089156_CTTTTTT_C	ENSG00000101546	0.0007952200248837471	-0.7048580050468445	0.20083999633789062	0.9687299728393555
-189969324	chr18_79189288_A_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189969080	chr18_79164533_G_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-165263755	chr18_80116545_C_CT	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844
-189968902	chr18_79145066_A_G	ENSG00000101546	0.021456299349665642	0.8250390291213989	0.3505690097808838	0.8266100287437439
-189968411	chr18_79078663_GT_G	ENSG00000101546	0.03195120021700859	-0.8200979828834534	0.3745729923248291	0.9371100068092346
-88269042	chr18_80083194_CAA_C	ENSG00000101546	0.03877180069684982	0.6794390082359314	0.3224959969520569	0.7369199991226196
-165263133	chr18_79963052_AGCGTGCGTCAGC_A	ENSG00000101546	0.0020915500354021788	-0.8126299977302551	0.2541239857673645	0.8120999932289124
-189968298	chr18_79069113_G_GCC	ENSG00000101546	0.026198700070381165	0.6238790154457092	0.2745780050754547	0.991349995136261
-165263719	chr18_80106536_C_CGTG	ENSG00000101546	0.0009647249826230109	-0.9014440178871155	0.26139500737190247	0.693589985370636
-88267659	chr18_79882883_C_T	ENSG00000101546	0.009121229872107506	1.5579899549484253	0.5806570053100586	0.5323799848556519
-165263145	chr18_79965699_A_G	ENSG00000101546	0.0012596900342032313	-0.7240279912948608	0.21526800096035004	0.9650300145149231
-165263142	chr18_79965625_G_C	ENSG00000101546	0.0013199399691075087	-0.7183049917221069	0.2145259976387024	0.9714699983596802
-165263618	chr18_80083488_C_CTT	ENSG00000101546	0.0014832599554210901	-0.6493579745292664	0.19614699482917786	0.9565899968147278
-189968938	chr18_79149476_GAA_G	ENSG00000101546	0.030845800414681435	-0.8117179870605469	0.3682529926300049	0.9889600276947021
-165263065	chr18_79946239_CAAAGAA_C	ENSG00000101546	0.018309399485588074	-0.41694799065589905	0.17252600193023682	0.8902300000190735
-88269145	chr18_80092342_TATATATAGAGAGAGAGAGAGAG_T	ENSG00000101546	0.021002300083637238	1.3039599657058716	0.552049994468689	0.5843200087547302
-189976456	chr18_80177170_C_CACACAT	ENSG00000101546	0.04319680109620094	0.540369987487793	0.262347012758255	0.7683699727058411
-189968986	chr18_79153989_C_T	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-189968090	chr18_79044595_TA_T	ENSG00000101546	0.03289920091629028	-0.8263850212097168	0.37958601117134094	0.8961600065231323
-165263901	chr18_80152678_CTT_C	ENSG00000101546	0.006232670042663813	-0.5736100077629089	0.20327800512313843	0.9239500164985657
-189968096	chr18_79045092_GCTTT_G	ENSG00000101546	0.03276880085468292	-0.8266410231590271	0.3794110119342804	0.9081100225448608
-165263193	chr18_79982214_AAGC_A	ENSG00000101546	0.001902349991723895	-0.7687190175056458	0.23805800080299377	0.9539700150489807
-165264134	chr18_80217851_G_GA	ENSG00000101546	4.7355800347759214e-07	0.9590169787406921	0.17247000336647034	0.8252400159835815
-189969160	chr18_79172256_T_TG	ENSG00000101546	0.02102700062096119	1.0501899719238281	0.4447050094604492	0.49046000838279724
-189969146	chr18_79171878_G_GTT	ENSG00000101546	0.028650900349020958	-0.8239669799804688	0.36864998936653137	0.926010012626648
-189969560	chr18_79229978_TA_T	ENSG00000101546	0.03398840129375458	-0.7986850142478943	0.3692060112953186	0.9703500270843506
-88268429	chr18_80013393_T_C	ENSG00000101546	0.006624099798500538	0.9265140295028687	0.3309069871902466	0.9486500024795532
-189968397	chr18_79076904_G_GT	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165263704	chr18_80099359_C_T	ENSG00000101546	0.0010180700337514281	-1.4965399503707886	0.4361189901828766	0.4753200113773346
-88264587	chr18_79474712_G_A	ENSG00000101546	0.02989250048995018	-0.5387089848518372	0.24294699728488922	0.8973900079727173
-165263242	chr18_79997395_C_CA	ENSG00000101546	2.8814399755106024e-08	0.9946050047874451	0.15898500382900238	0.8493000268936157
-88264589	chr18_79475415_CGTT_C	ENSG00000101546	0.030645400285720825	-0.5480639934539795	0.24833300709724426	0.8634999990463257
-189968469	chr18_79085883_G_GT	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.9910200238227844
-165263647	chr18_80089161_TTTTTTC_T	ENSG00000101546	0.0002696430019568652	0.6738640069961548	0.17547400295734406	0.9258900284767151
-189968518	chr18_79092640_C_CTTT	ENSG00000101546	0.026963699609041214	0.6564019918441772	0.29041001200675964	0.8723999857902527
-165263395	chr18_80034081_G_GC	ENSG00000101546	2.1349699785844223e-10	1.0824600458145142	0.14554999768733978	0.9538999795913696
-189976320	chr18_80158991_AT_A	ENSG00000101546	0.0029946300201117992	0.5591099858283997	0.18168599903583527	0.8935700058937073
-165264173	chr18_80250995_ATTGT_A	ENSG00000101546	8.147729886331945e-07	1.3974100351333618	0.2576969861984253	0.417959988117218
-165261384	chr18_79473733_A_G	ENSG00000101546	0.01849539950489998	-0.7254490256309509	0.30067598819732666	0.8794199824333191
-189969194	chr18_79175282_C_CTG	ENSG00000101546	0.03348590061068535	0.5636100172996521	0.2597790062427521	0.9584500193595886
-189970171	chr18_79354568_CAAAAAAA_C	ENSG00000101546	0.02525389939546585	-0.9186720252037048	0.401652991771698	0.8540899753570557
-189969231	chr18_79181600_C_CT	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-88268179	chr18_79977810_TTTTTG_T	ENSG00000101546	0.0090065598487854	0.5001299977302551	0.18607200682163239	0.9585400223731995
-88269551	chr18_80144307_TACA_T	ENSG00000101546	0.025891300290822983	0.6965559720993042	0.30591100454330444	0.9466000199317932
-189968310	chr18_79069549_C_CG	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654
-189974442	chr18_79922282_GA_G	ENSG00000101546	0.0020336799789220095	0.563323974609375	0.17565099895000458	0.8583499789237976
-189969450	chr18_79207979_C_T	ENSG00000101546	0.03009819984436035	-0.8121849894523621	0.3667539954185486	0.9940800070762634
-189969326	chr18_79189296_G_A	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189969432	chr18_79206623_C_CATAA	ENSG00000101546	0.02459779940545559	0.5034890174865723	0.21909800171852112	0.6862199902534485
-165263607	chr18_80081300_A_ATTTTG	ENSG00000101546	0.0003881960001308471	-0.735040009021759	0.19702699780464172	0.9323999881744385
-189968366	chr18_79072965_C_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968134	chr18_79050340_T_TAATAAATAAATA	ENSG00000101546	0.03670889884233475	0.6114330291748047	0.28700900077819824	0.9308199882507324
-189969998	chr18_79327540_TGCTCTCCGTGGTTAGC_T	ENSG00000101546	0.034864600747823715	-0.9216139912605286	0.42817699909210205	0.7690600156784058
-189969590	chr18_79237248_G_A	ENSG00000101546	0.037329401820898056	0.507407009601593	0.23898600041866302	0.8235099911689758
-189974608	chr18_79952896_GGCCCCCT_G	ENSG00000101546	0.014420700259506702	-0.675724983215332	0.2692070007324219	0.8406599760055542
-88264503	chr18_79464361_CT_C	ENSG00000101546	0.0354854017496109	-0.5205100178718567	0.24267500638961792	0.9361699819564819
-189968434	chr18_79082248_T_A	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9400799870491028
-189975248	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798
-189968364	chr18_79072845_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165263218	chr18_79991107_CAA_C	ENSG00000101546	4.226340024615638e-05	0.8044869899749756	0.18392400443553925	0.7601000070571899
-88268469	chr18_80017227_T_C	ENSG00000101546	0.0003371330094523728	0.5942819714546204	0.15749800205230713	0.9224299788475037
-165261352	chr18_79464677_T_TATATACACAC	ENSG00000101546	0.026624400168657303	-0.8889089822769165	0.39236900210380554	0.497189998626709
-165263307	chr18_80013122_A_AT	ENSG00000101546	7.343759733657862e-08	0.9926689863204956	0.1647309958934784	0.8404200077056885
-189969435	chr18_79206623_CATAA_C	ENSG00000101546	0.036491598933935165	-0.7889209985733032	0.36987999081611633	0.737820029258728
-189969756	chr18_79266758_T_C	ENSG00000101546	0.029738599434494972	-0.8309569954872131	0.37438100576400757	0.9692699909210205
-189969058	chr18_79161735_A_G	ENSG00000101546	0.026211999356746674	0.6285030245780945	0.27663901448249817	0.970990002155304
-88269433	chr18_80129095_CTTTTTTTTTGT_C	ENSG00000101546	0.024507999420166016	0.7027459740638733	0.30560898780822754	0.9831100106239319
-189969926	chr18_79309669_A_G	ENSG00000101546	0.027699900791049004	-0.9351099729537964	0.41576799750328064	0.7708799839019775
-165261435	chr18_79488298_TTGTGTGTGTGTGTG_T	ENSG00000101546	0.0348701998591423	-0.39046499133110046	0.18141299486160278	0.7831100225448608
-165263243	chr18_79997448_A_AAAT	ENSG00000101546	0.006668020039796829	0.6410819888114929	0.22915899753570557	0.8404399752616882
-88264017	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267
-165264089	chr18_80202126_AAAC_A	ENSG00000101546	0.012753100134432316	-0.6267529726028442	0.2450910061597824	0.9089199900627136
-189969072	chr18_79163645_A_G	ENSG00000101546	0.031346000730991364	-0.8081910014152527	0.36778199672698975	0.9937400221824646
-165264142	chr18_80219205_T_TTTGC	ENSG00000101546	0.04346669837832451	-0.43810200691223145	0.2129790037870407	0.8742899894714355
-165263333	chr18_80018583_T_C	ENSG00000101546	9.473540174553818e-09	0.98955899477005	0.1516129970550537	0.9089099764823914
-189976380	chr18_80168314_C_A	ENSG00000101546	0.046848900616168976	0.5284479856491089	0.2610970139503479	0.8314899802207947
-88264185	chr18_79428486_A_C	ENSG00000101546	0.04352179914712906	-0.3734950125217438	0.18162000179290771	0.8747100234031677
-88264575	chr18_79472709_A_G	ENSG00000101546	0.0498369000852108	-0.3575980067253113	0.1791210025548935	0.9945300221443176
-165263643	chr18_80088353_A_G	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445
-189968592	chr18_79103710_A_G	ENSG00000101546	0.028219299390912056	0.6170700192451477	0.27530500292778015	0.9819499850273132
-189968648	chr18_79110876_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968276	chr18_79064762_C_T	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165263247	chr18_79997949_T_G	ENSG00000101546	0.00667465990409255	0.6408960223197937	0.22912199795246124	0.8406500220298767
-165261459	chr18_79491848_A_G	ENSG00000101546	0.02016489952802658	-0.41565200686454773	0.17476600408554077	0.8600299954414368
-165261457	chr18_79491559_C_G	ENSG00000101546	0.01997949928045273	-0.4160810112953186	0.17467600107192993	0.8610299825668335
-165261456	chr18_79491254_C_G	ENSG00000101546	0.020042700693011284	-0.4207099974155426	0.1767120063304901	0.8355699777603149
-165261430	chr18_79488213_G_A	ENSG00000101546	0.022015299648046494	-0.40702399611473083	0.1737149953842163	0.8542100191116333
-165261455	chr18_79491061_T_C	ENSG00000101546	0.01999030075967312	-0.416032999753952	0.1746709942817688	0.8610799908638
-88264727	chr18_79491622_G_A	ENSG00000101546	0.04307619854807854	0.3810189962387085	0.18487299978733063	0.8528599739074707
-165261460	chr18_79491941_T_C	ENSG00000101546	0.020231500267982483	-0.4155910015106201	0.17483699321746826	0.8591399788856506
-165261461	chr18_79492044_G_C	ENSG00000101546	0.02181529998779297	-0.41130200028419495	0.17526499927043915	0.859499990940094
-165263654	chr18_80090098_C_T	ENSG00000101546	0.00042329999268986285	-0.8076810240745544	0.2180349975824356	0.9999200105667114
-189968150	chr18_79051231_T_G	ENSG00000101546	0.02619119919836521	0.6239150166511536	0.2745800018310547	0.9768900275230408
-189968516	chr18_79092507_A_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968246	chr18_79061076_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968418	chr18_79079688_G_T	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654
-189968690	chr18_79117126_T_C	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189968324	chr18_79070812_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-189968610	chr18_79106106_A_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165263655	chr18_80090300_T_C	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-189968420	chr18_79079728_G_A	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654
-189968694	chr18_79117339_T_A	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183
-189968558	chr18_79099291_A_G	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183
-189975156	chr18_80028551_T_C	ENSG00000101546	0.0003614209999796003	-0.61388099193573	0.16360199451446533	0.9251300096511841
-165263356	chr18_80026210_G_A	ENSG00000101546	0.0024157098960131407	0.6816679835319519	0.21641899645328522	0.8848900198936462
-165263269	chr18_80005618_G_A	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8476799726486206
-165263270	chr18_80005839_C_G	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8476799726486206
-165263054	chr18_79942025_T_C	ENSG00000101546	0.00342423003166914	0.8067060112953186	0.2660979926586151	0.7327200174331665
-165262356	chr18_79710683_G_A	ENSG00000101546	0.027877699583768845	1.0290100574493408	0.45805901288986206	0.5303099751472473
-189974294	chr18_79888218_C_T	ENSG00000101546	0.03377470001578331	-0.6218339800834656	0.2870970070362091	0.921500027179718
-165263212	chr18_79988975_G_A	ENSG00000101546	0.007797140162438154	0.677515983581543	0.2471960037946701	0.8099700212478638
-165263210	chr18_79988859_G_C	ENSG00000101546	1.6504300219821744e-06	0.8164809942245483	0.15577000379562378	0.8511199951171875
-189976396	chr18_80169145_A_G	ENSG00000101546	0.04821709915995598	0.527944028377533	0.26250699162483215	0.8372700214385986
-165264157	chr18_80237823_T_C	ENSG00000101546	0.03238749876618385	-0.8387230038642883	0.38408398628234863	0.4003700017929077
-165263737	chr18_80112081_G_A	ENSG00000101546	0.001039269962348044	-0.7610329985618591	0.22220300137996674	0.9879800081253052
-165263738	chr18_80112093_G_C	ENSG00000101546	0.001042929943650961	-0.7607399821281433	0.2221899926662445	0.9881700277328491
-189969332	chr18_79189668_T_A	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189968208	chr18_79058307_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.9712700247764587
-189968756	chr18_79126701_C_T	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183
-88269197	chr18_80097897_C_T	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342
-88269195	chr18_80097877_G_A	ENSG00000101546	0.024271700531244278	0.6988790035247803	0.3034049868583679	0.9890199899673462
-189974966	chr18_80005859_G_A	ENSG00000101546	0.014974099583923817	-0.6198790073394775	0.2484000027179718	0.8089500069618225
-88268259	chr18_79992430_A_G	ENSG00000101546	0.011227499693632126	0.9215899705886841	0.35370200872421265	0.9165700078010559
-165263352	chr18_80024474_TTGTG_T	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414
-189968422	chr18_79079751_GT_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165262318	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449
-88268541	chr18_80028464_T_C	ENSG00000101546	0.003772800089791417	0.5350610017776489	0.17845599353313446	0.9571999907493591
-189975420	chr18_80054701_GGAC_G	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-88268455	chr18_80015967_C_T	ENSG00000101546	0.00567656010389328	1.0066499710083008	0.3525719940662384	0.8747400045394897
-189974544	chr18_79944951_GC_G	ENSG00000101546	0.022499799728393555	-0.6802849769592285	0.29143500328063965	0.8177800178527832
-189975058	chr18_80015355_A_AATTATTATTATT	ENSG00000101546	0.01359890028834343	-0.6569129824638367	0.25937798619270325	0.8670600056648254
-189968946	chr18_79150079_C_CA	ENSG00000101546	0.026356900110840797	0.6221839785575867	0.27413201332092285	0.987559974193573
-88269207	chr18_80098620_CTT_C	ENSG00000101546	0.02666180022060871	0.6308789849281311	0.27854400873184204	0.979200005531311
-189974588	chr18_79950980_G_A	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203
-189974590	chr18_79951127_G_T	ENSG00000101546	0.00324757001362741	0.5525670051574707	0.18118500709533691	0.9183400273323059
-189974592	chr18_79951157_A_C	ENSG00000101546	0.025229500606656075	-0.6268119812011719	0.27400100231170654	0.8650100231170654
-165263364	chr18_80028456_T_C	ENSG00000101546	0.0024493299424648285	0.6803510189056396	0.2163189947605133	0.8861200213432312
-165261385	chr18_79473902_G_A	ENSG00000101546	0.026818400248885155	-0.6829119920730591	0.30184000730514526	0.8665099740028381
-189969230	chr18_79181600_C_CT	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-88268421	chr18_80013111_GA_G	ENSG00000101546	0.00623522000387311	0.94343101978302	0.3343529999256134	0.9108899831771851
-189974490	chr18_79934128_TAA_T	ENSG00000101546	0.018797900527715683	-0.7050750255584717	0.2930130064487457	0.8239700198173523
-88267299	chr18_79829229_G_A	ENSG00000101546	0.006904010195285082	1.3521699905395508	0.48552000522613525	0.5361999869346619
-189976484	chr18_80178889_A_G	ENSG00000101546	0.04774029925465584	0.5347390174865723	0.26530200242996216	0.7473999857902527
-189968142	chr18_79050764_C_T	ENSG00000101546	0.02619119919836521	0.6239150166511536	0.2745800018310547	0.9768900275230408
-88264319	chr18_79442949_A_G	ENSG00000101546	0.024087799713015556	-0.4948180019855499	0.21452699601650238	0.9288899898529053
-165263222	chr18_79991786_C_A	ENSG00000101546	2.8773799343184692e-08	0.994189977645874	0.15891000628471375	0.8507500290870667
-165263966	chr18_80165030_A_G	ENSG00000101546	1.0223699973721523e-05	0.7187389731407166	0.1509310007095337	0.9588299989700317
-189975184	chr18_80032450_C_G	ENSG00000101546	0.00041126098949462175	-0.6060730218887329	0.163223996758461	0.9515500068664551
-165263381	chr18_80032676_T_C	ENSG00000101546	0.002472139894962311	0.6762980222702026	0.21524199843406677	0.9030900001525879
-165263050	chr18_79941007_C_G	ENSG00000101546	0.004313630051910877	-0.7956420183181763	0.26954200863838196	0.8611299991607666
-189974252	chr18_79880942_G_T	ENSG00000101546	0.02927199937403202	-0.6120150089263916	0.2749199867248535	0.9426599740982056
-165264109	chr18_80210089_T_C	ENSG00000101546	0.01109089981764555	-0.6423850059509277	0.2461089938879013	0.9005600214004517
-165263681	chr18_80095624_C_T	ENSG00000101546	8.493950008414686e-05	-0.8327509760856628	0.19936099648475647	0.9533500075340271
-88269223	chr18_80101627_G_A	ENSG00000101546	0.010835600085556507	0.6991339921951294	0.2669549882411957	0.989139974117279
-165263746	chr18_80115768_G_C	ENSG00000101546	0.0003516149881761521	-0.8289920091629028	0.220441997051239	0.9840099811553955
-88269225	chr18_80101974_C_T	ENSG00000101546	0.01050500012934208	0.6951419711112976	0.26425701379776	0.9999899864196777
-189974538	chr18_79943476_A_G	ENSG00000101546	0.0024323000106960535	-0.633467972278595	0.20126299560070038	0.8774700164794922
-189974500	chr18_79934294_C_A	ENSG00000101546	0.008568979799747467	0.4717499911785126	0.1743219941854477	0.934499979019165
-189974498	chr18_79934168_T_G	ENSG00000101546	0.00886933971196413	0.4530409872531891	0.16819800436496735	0.9988300204277039
-88267735	chr18_79901170_A_G	ENSG00000101546	0.043753400444984436	0.626662015914917	0.305074006319046	0.638979971408844
-88264359	chr18_79449015_A_G	ENSG00000101546	0.020402999594807625	-0.44371500611305237	0.1869339942932129	0.8567000031471252
-88269721	chr18_80160338_C_T	ENSG00000101546	0.04165950044989586	0.9882199764251709	0.4761109948158264	0.6051499843597412
-88264375	chr18_79451175_T_C	ENSG00000101546	0.010953900404274464	-0.4541740119457245	0.1736910045146942	0.9836699962615967
-165263154	chr18_79968045_C_T	ENSG00000101546	0.0033152198884636164	0.5490509867668152	0.1804489940404892	0.8358500003814697
-165263155	chr18_79968135_G_T	ENSG00000101546	0.0025249600876122713	0.6742879748344421	0.21508799493312836	0.9993699789047241
-88265723	chr18_79624561_C_T	ENSG00000101546	0.04361329972743988	0.3741999864578247	0.18204499781131744	0.9674999713897705
-88265771	chr18_79630343_G_A	ENSG00000101546	0.04653380066156387	0.3270370066165924	0.1613450050354004	0.9975500106811523
-88268371	chr18_80006801_T_C	ENSG00000101546	0.01107420027256012	0.9228410124778748	0.3534800112247467	0.9176999926567078
-165263281	chr18_80006936_G_A	ENSG00000101546	0.0031031400430947542	0.6861979961395264	0.22386400401592255	0.8466399908065796
-189975124	chr18_80024198_A_C	ENSG00000101546	0.00036481101415120065	-0.6129689812660217	0.16348199546337128	0.9254599809646606
-189976680	chr18_80214570_C_T	ENSG00000101546	0.04749640077352524	0.5439770221710205	0.26958099007606506	0.6470199823379517
-165264132	chr18_80215819_G_T	ENSG00000101546	0.010726099833846092	-0.6411049962043762	0.2444400042295456	0.9078199863433838
-165261463	chr18_79492234_A_G	ENSG00000101546	0.020214799791574478	-0.4156700074672699	0.17484599351882935	0.8594800233840942
-88264735	chr18_79492158_A_G	ENSG00000101546	0.044126201421022415	0.37968501448631287	0.18517599999904633	0.8499900102615356
-165263408	chr18_80036386_A_C	ENSG00000101546	0.0012144800275564194	0.7148810029029846	0.2118079960346222	0.9005299806594849
-189974232	chr18_79878968_G_A	ENSG00000101546	0.02235650084912777	-0.6372110247612	0.27268001437187195	0.9195500016212463
-88269185	chr18_80097175_T_C	ENSG00000101546	0.010834700427949429	0.6996859908103943	0.2671619951725006	0.9884700179100037
-88269215	chr18_80099154_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342
-165263287	chr18_80008141_T_A	ENSG00000101546	5.821710146847181e-05	0.7035840153694153	0.16422699391841888	0.8942199945449829
-88264267	chr18_79437795_A_G	ENSG00000101546	0.019953899085521698	-0.5127109885215759	0.21519500017166138	0.9152200222015381
-88269213	chr18_80099142_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342
-189968536	chr18_79097489_T_A	ENSG00000101546	0.026249200105667114	0.6333479881286621	0.2788429856300354	0.9636600017547607
-189969944	chr18_79312902_A_T	ENSG00000101546	0.04649680107831955	0.46311700344085693	0.2284409999847412	0.8740900158882141
-189974560	chr18_79946425_T_C	ENSG00000101546	0.026411300525069237	-0.6212390065193176	0.2738179862499237	0.8618000149726868
-165264108	chr18_80209970_C_T	ENSG00000101546	5.121460162627045e-07	0.9372400045394897	0.1691569983959198	0.8549500107765198
-165263926	chr18_80153654_A_G	ENSG00000101546	0.004891959950327873	-0.6616219878196716	0.2275339961051941	0.9807999730110168
-165263661	chr18_80091874_G_T	ENSG00000101546	8.101719828346177e-08	0.9278609752655029	0.15459899604320526	0.9344099760055542
-189970126	chr18_79350161_C_T	ENSG00000101546	0.04271410033106804	0.45565399527549744	0.22068999707698822	0.9141299724578857
-189970194	chr18_79356116_C_T	ENSG00000101546	0.03198229894042015	0.4816110134124756	0.22001299262046814	0.9361000061035156
-189969588	chr18_79236894_C_T	ENSG00000101546	0.010057100094854832	1.083940029144287	0.4095189869403839	0.6497600078582764
-165262777	chr18_79852254_C_T	ENSG00000101546	0.029356699436903	-0.5751489996910095	0.25849899649620056	0.9031199812889099
-189968894	chr18_79144511_C_T	ENSG00000101546	0.028131699189543724	0.6180059909820557	0.2755639851093292	0.9607999920845032
-189969586	chr18_79236752_G_T	ENSG00000101546	0.04136829823255539	0.49744999408721924	0.23931199312210083	0.8937900066375732
-88264323	chr18_79444231_G_T	ENSG00000101546	0.021645499393343925	-0.5013729929924011	0.213359996676445	0.8994799852371216
-189974032	chr18_79862879_A_G	ENSG00000101546	0.010590399615466595	0.45870301127433777	0.174576997756958	0.9356399774551392
-165263296	chr18_80011050_C_T	ENSG00000101546	4.485749993676791e-09	1.012619972229004	0.15096400678157806	0.9098799824714661
-189976588	chr18_80197495_C_T	ENSG00000101546	0.009564920328557491	0.49497199058532715	0.18569299578666687	0.8510500192642212
-88268461	chr18_80016061_G_T	ENSG00000101546	0.0032865500543266535	0.5493680238723755	0.18037700653076172	0.9368000030517578
-189976626	chr18_80208181_A_G	ENSG00000101546	0.047510500997304916	0.5501949787139893	0.27268001437187195	0.6280400156974792
-189974016	chr18_79860911_A_G	ENSG00000101546	0.010555099695920944	0.4590950012207031	0.17464199662208557	0.934499979019165
-165263253	chr18_80001335_T_C	ENSG00000101546	1.4020399952130447e-08	1.0173399448394775	0.15817700326442719	0.8520799875259399
-189968532	chr18_79097112_C_T	ENSG00000101546	0.026814399287104607	0.622094988822937	0.2749519944190979	0.9851300120353699
-189968482	chr18_79086261_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165264022	chr18_80177972_T_TACACAC	ENSG00000101546	0.0028105799574404955	-0.8103110194206238	0.26148900389671326	0.6188700199127197
-189970552	chr18_79387642_G_C	ENSG00000101546	0.022433200851082802	-0.49226298928260803	0.21077799797058105	0.7585099935531616
-88264041	chr18_79412078_A_G	ENSG00000101546	0.04878789931535721	-0.411734014749527	0.2052599936723709	0.4424299895763397
-88269773	chr18_80168573_T_TTGTG	ENSG00000101546	0.01679369993507862	0.7516739964485168	0.30671000480651855	0.6649600267410278
-88264321	chr18_79443592_A_G	ENSG00000101546	0.0010349299991503358	-0.7124919891357422	0.20794999599456787	0.6106699705123901
-88265039	chr18_79530109_T_C	ENSG00000101546	0.008827930316329002	-0.7055609822273254	0.2617810070514679	0.41578999161720276
-165263958	chr18_80163448_CAG_C	ENSG00000101546	0.00013008899986743927	-0.6530699729919434	0.1610729992389679	0.951449990272522
-189968880	chr18_79141527_A_T	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806
-165263386	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023
-189968354	chr18_79072485_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968848	chr18_79137391_T_C	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806
-88269475	chr18_80131569_CT_C	ENSG00000101546	0.026396099478006363	0.6945620179176331	0.30610400438308716	0.9568700194358826
-189968766	chr18_79128050_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165261387	chr18_79474655_G_A	ENSG00000101546	0.023498600348830223	-0.6998289823532104	0.3020879924297333	0.8451499938964844
-165263878	chr18_80146131_C_G	ENSG00000101546	0.0026378000620752573	-0.7031970024108887	0.2253659963607788	0.9875400066375732
-189974406	chr18_79914567_A_ACAC	ENSG00000101546	0.005766630172729492	0.5081620216369629	0.1783290058374405	0.8534200191497803
-189974474	chr18_79932475_A_AAAAG	ENSG00000101546	0.015355500392615795	-0.7255340218544006	0.2918809950351715	0.8104000091552734
-165264065	chr18_80191353_C_A	ENSG00000101546	0.005423389840871096	-0.7459239959716797	0.2597790062427521	0.8539900183677673
-165264116	chr18_80211946_CA_C	ENSG00000101546	0.010767700150609016	-0.6441410183906555	0.24573400616645813	0.901229977607727
-189974318	chr18_79892129_A_AC	ENSG00000101546	0.013907000422477722	-0.6947519779205322	0.2752549946308136	0.871399998664856
-189975888	chr18_80111566_AT_A	ENSG00000101546	0.005242549814283848	0.5107319951057434	0.17712900042533875	0.9149500131607056
-165263962	chr18_80164361_C_T	ENSG00000101546	0.004420159850269556	-0.6688129901885986	0.2272299975156784	0.9820899963378906
-165263475	chr18_80048941_C_CGTCT	ENSG00000101546	3.2930998713709414e-05	0.7449690103530884	0.1676589995622635	0.9231600165367126
-165263589	chr18_80074960_G_A	ENSG00000101546	0.0004214690125081688	-0.854718029499054	0.23064999282360077	0.9711199998855591
-189968396	chr18_79076904_G_GT	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968940	chr18_79149725_A_AT	ENSG00000101546	0.032887399196624756	0.5622609853744507	0.2582469880580902	0.9640300273895264
-88268244	chr18_79991107_CA_C	ENSG00000101546	0.020448200404644012	0.46891599893569946	0.19762499630451202	0.8222200274467468
-189970542	chr18_79387207_CA_C	ENSG00000101546	0.008634510450065136	0.6610770225524902	0.24453599750995636	0.6520299911499023
-165263930	chr18_80156079_C_T	ENSG00000101546	0.005804670043289661	-0.6445559859275818	0.22638000547885895	0.9838200211524963
-165263471	chr18_80047702_A_G	ENSG00000101546	0.0013542500091716647	0.7053020000457764	0.21116599440574646	0.9127600193023682
-165263274	chr18_80006383_CA_C	ENSG00000101546	0.0021724801044911146	0.6917529702186584	0.21717999875545502	0.8327900171279907
-165263349	chr18_80024187_T_TA	ENSG00000101546	9.365420439166883e-09	0.9901210069656372	0.15163399279117584	0.9103400111198425
-189968730	chr18_79124164_CAG_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165263549	chr18_80064603_G_A	ENSG00000101546	2.311870048288256e-05	0.7587190270423889	0.16708900034427643	0.9409099817276001
-189974528	chr18_79941908_T_A	ENSG00000101546	0.016617100685834885	-0.653846025466919	0.26634201407432556	0.8183199763298035
-165263803	chr18_80126255_CTGT_C	ENSG00000101546	0.0013861899496987462	-0.7513729929924011	0.2254679948091507	0.9777500033378601
-189974456	chr18_79924117_C_T	ENSG00000101546	0.018136899918317795	-0.7141460180282593	0.2950440049171448	0.8180800080299377
-189968808	chr18_79132112_C_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165263244	chr18_79997448_A_AAAT	ENSG00000101546	0.006668020039796829	0.6410819888114929	0.22915899753570557	0.8404399752616882
-189968864	chr18_79139469_T_G	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806
-189968796	chr18_79130596_C_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189968454	chr18_79084159_G_GT	ENSG00000101546	0.026145299896597862	0.6233959794044495	0.27426400780677795	0.990559995174408
-165262768	chr18_79846478_CAT_C	ENSG00000101546	0.02139969915151596	0.3941349983215332	0.16739700734615326	0.9439200162887573
-189968468	chr18_79085883_G_GT	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.9910200238227844
-189969652	chr18_79248225_TG_T	ENSG00000101546	0.03012160025537014	-0.8133220076560974	0.3673210144042969	0.9957000017166138
-88268567	chr18_80031647_T_C	ENSG00000101546	0.0037468199152499437	0.5355499982833862	0.17847700417041779	0.9565500020980835
-88265791	chr18_79631418_CGT_C	ENSG00000101546	0.04891889914870262	0.33583900332450867	0.16752399504184723	0.9341700077056885
-165263047	chr18_79939763_AC_A	ENSG00000101546	0.01909800060093403	-0.4082370102405548	0.17009800672531128	0.8504300117492676
-189968410	chr18_79078663_G_GT	ENSG00000101546	0.02647639997303486	0.6239200234413147	0.2751219868659973	0.9853699803352356
-165264052	chr18_80186148_G_A	ENSG00000101546	0.011839100159704685	-0.6416829824447632	0.24818499386310577	0.9166600108146667
-189968876	chr18_79140729_G_A	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806
-165263506	chr18_80056237_G_GT	ENSG00000101546	0.00015261500084307045	0.6454190015792847	0.16102899610996246	0.9305899739265442
-165264046	chr18_80184151_G_A	ENSG00000101546	0.01181969977915287	-0.6072559952735901	0.23481300473213196	0.9821400046348572
-165263157	chr18_79968594_A_G	ENSG00000101546	0.003704539965838194	0.7053970098495483	0.23477399349212646	0.8464400172233582
-165263167	chr18_79970585_CT_C	ENSG00000101546	0.009232349693775177	0.5941150188446045	0.221794992685318	0.8132200241088867
-189968638	chr18_79109564_CT_C	ENSG00000101546	0.02801240049302578	0.6179019808769226	0.2753010094165802	0.9795299768447876
-165263995	chr18_80172670_C_T	ENSG00000101546	0.006621839944273233	-0.6514000296592712	0.23263899981975555	0.9870399832725525
-165264076	chr18_80195893_C_CT	ENSG00000101546	9.202360160998069e-06	0.7922729849815369	0.16539299488067627	0.86558997631073
-165263458	chr18_80045228_C_CT	ENSG00000101546	0.0012360200053080916	0.7123919725418091	0.21142500638961792	0.905239999294281
-165263457	chr18_80045228_C_CT	ENSG00000101546	0.0012360200053080916	0.7123919725418091	0.21142500638961792	0.905239999294281
-189968996	chr18_79155086_G_A	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847699999809265
-189968786	chr18_79130419_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189974128	chr18_79868719_T_C	ENSG00000101546	0.024199599400162697	-0.40219399333000183	0.17451299726963043	0.9389399886131287
-189968994	chr18_79155083_A_G	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-189968706	chr18_79119108_CTG_C	ENSG00000101546	0.027767999097704887	0.6189860105514526	0.27533799409866333	0.9764800071716309
-189968192	chr18_79057721_T_TA	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293
-165263192	chr18_79981952_CG_C	ENSG00000101546	2.677890006452799e-05	0.7691310048103333	0.17090100049972534	0.8939599990844727
-165263255	chr18_80002141_C_T	ENSG00000101546	0.006564840208739042	0.6404359936714172	0.22846999764442444	0.8449299931526184
-165264033	chr18_80179223_A_AT	ENSG00000101546	5.437000254460145e-07	0.8975480198860168	0.16243700683116913	0.9192799925804138
-165263202	chr18_79986442_C_CA	ENSG00000101546	0.00017432900494895875	0.6640830039978027	0.1673090010881424	0.8925899863243103
-165263869	chr18_80144063_AT_A	ENSG00000101546	0.0011340300552546978	-0.7654100060462952	0.2253129929304123	0.9729599952697754
-189968874	chr18_79140712_G_A	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806
-189968140	chr18_79050620_A_G	ENSG00000101546	0.02619119919836521	0.6239150166511536	0.2745800018310547	0.9768900275230408
-189968566	chr18_79101639_TAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189976036	chr18_80127339_G_GT	ENSG00000101546	4.4629800868278835e-06	0.8070570230484009	0.16198499500751495	0.9078199863433838
-189968384	chr18_79075081_G_GTT	ENSG00000101546	0.03524570167064667	0.6415330171585083	0.29869601130485535	0.9439799785614014
-165264056	chr18_80186948_A_T	ENSG00000101546	0.004830219782888889	-0.7145410180091858	0.24535700678825378	0.9209499955177307
-165264071	chr18_80194850_A_C	ENSG00000101546	0.01119260024279356	-0.6294440031051636	0.24146899580955505	0.9396399855613708
-189974106	chr18_79867490_TG_T	ENSG00000101546	0.026217199862003326	-0.4064269959926605	0.17889800667762756	0.9064000248908997
-189975142	chr18_80026740_CAT_C	ENSG00000101546	0.0003653719904832542	-0.6127560138702393	0.16344499588012695	0.9256200194358826
-165264158	chr18_80237893_T_C	ENSG00000101546	0.029706399887800217	-0.849481999874115	0.3826490044593811	0.40230000019073486
-165264072	chr18_80195252_G_A	ENSG00000101546	0.013934800401329994	-0.6261630058288574	0.24815599620342255	0.9025999903678894
-189968670	chr18_79114946_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165263367	chr18_80028595_A_AG	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231
-189968910	chr18_79146549_A_G	ENSG00000101546	0.03590390086174011	0.559315025806427	0.2613779902458191	0.9762099981307983
-189975232	chr18_80035261_TAA_T	ENSG00000101546	0.0003092499973718077	-0.5977219939231873	0.15732699632644653	0.9657700061798096
-88264135	chr18_79424489_ATC_A	ENSG00000101546	0.035638801753520966	-0.40778300166130066	0.19028300046920776	0.7771000266075134
-165263517	chr18_80057775_G_A	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252
-189968386	chr18_79076578_AT_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165263492	chr18_80053957_ACT_A	ENSG00000101546	2.131220026058145e-05	0.7576010227203369	0.1660279929637909	0.9484999775886536
-165262745	chr18_79829596_C_G	ENSG00000101546	0.039578501135110855	-0.5699710249900818	0.27168700098991394	0.8153600096702576
-165262657	chr18_79782606_AC_A	ENSG00000101546	0.044745299965143204	-0.3916890025138855	0.19160400331020355	0.5842300057411194
-189968707	chr18_79119108_CTG_C	ENSG00000101546	0.027767999097704887	0.6189860105514526	0.27533799409866333	0.9764800071716309
-189968908	chr18_79146328_T_C	ENSG00000101546	0.028304100036621094	0.8882920145988464	0.39653098583221436	0.5303099751472473
-189968655	chr18_79112039_TAGAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165261442	chr18_79489705_A_G	ENSG00000101546	0.020162399858236313	-0.4175409972667694	0.1755570024251938	0.8545600175857544
-189968423	chr18_79079751_GT_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-88269552	chr18_80144307_TACA_T	ENSG00000101546	0.025891300290822983	0.6965559720993042	0.30591100454330444	0.9466000199317932
-165264090	chr18_80202126_AAAC_A	ENSG00000101546	0.012753100134432316	-0.6267529726028442	0.2450910061597824	0.9089199900627136
-88262207	chr18_79133508_AAC_A	ENSG00000101546	0.01566080003976822	0.7371839880943298	0.29748401045799255	0.8217899799346924
-165261429	chr18_79487686_C_G	ENSG00000101546	0.04398379847407341	-0.3603760004043579	0.17563700675964355	0.8575000166893005
-189968062	chr18_79039214_G_A	ENSG00000101546	0.020527100190520287	-1.050920009613037	0.44319799542427063	0.7403299808502197
-189969018	chr18_79157419_A_C	ENSG00000101546	0.03309350088238716	0.560634970664978	0.2578139901161194	0.972029983997345
-189970444	chr18_79379138_C_G	ENSG00000101546	0.028271500021219254	-0.9858899712562561	0.44000399112701416	0.8375300168991089
-189969434	chr18_79206623_CATAA_C	ENSG00000101546	0.036491598933935165	-0.7889209985733032	0.36987999081611633	0.737820029258728
-165263437	chr18_80041720_CTTT_C	ENSG00000101546	0.0012789099710062146	0.713791012763977	0.21253199875354767	0.9042900204658508
-189968731	chr18_79124164_CAG_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189970076	chr18_79342612_T_A	ENSG00000101546	0.025955799967050552	-0.9063199758529663	0.3982129991054535	0.7273899912834167
-88262208	chr18_79133508_AAC_A	ENSG00000101546	0.01566080003976822	0.7371839880943298	0.29748401045799255	0.8217899799346924
-189974546	chr18_79944954_G_A	ENSG00000101546	0.022499799728393555	-0.6802849769592285	0.29143500328063965	0.8177800178527832
-189974650	chr18_79957497_C_CT	ENSG00000101546	0.0225272998213768	-0.6381809711456299	0.2734549939632416	0.876259982585907
-165261437	chr18_79489040_G_A	ENSG00000101546	0.019716599956154823	-0.4143350124359131	0.17355699837207794	0.8567299842834473
-189970164	chr18_79354288_C_A	ENSG00000101546	0.04056549817323685	0.46553799510002136	0.2230439931154251	0.902209997177124
-189975266	chr18_80038461_C_A	ENSG00000101546	0.0003188450064044446	-0.5966470241546631	0.15742400288581848	0.9603400230407715
-189975342	chr18_80045715_G_A	ENSG00000101546	0.01263049989938736	-0.5753780007362366	0.22467699646949768	0.9758899807929993
-88268731	chr18_80045856_A_C	ENSG00000101546	0.0035814300645142794	0.5257490277290344	0.17430800199508667	0.9998300075531006
-165263461	chr18_80045949_A_C	ENSG00000101546	2.2688599610187765e-10	1.0516300201416016	0.1416810005903244	0.9998499751091003
-165263462	chr18_80046478_C_T	ENSG00000101546	7.452690020670616e-09	0.9856410026550293	0.1496790051460266	0.9543899893760681
-189976134	chr18_80136961_G_A	ENSG00000101546	2.643429979798384e-05	0.6996489763259888	0.15533900260925293	0.9907500147819519
-189974438	chr18_79919006_G_C	ENSG00000101546	0.0066312397830188274	0.48878198862075806	0.1745939999818802	0.9206200242042542
-165262960	chr18_79899561_G_T	ENSG00000101546	0.03711000084877014	-0.6233670115470886	0.29325300455093384	0.8791999816894531
-189968387	chr18_79076578_AT_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968818	chr18_79133508_A_AAC	ENSG00000101546	0.04565830156207085	0.559283971786499	0.27478501200675964	0.7888799905776978
-88263055	chr18_79252797_C_CT	ENSG00000101546	0.021775100380182266	0.6891270279884338	0.2935599982738495	0.6720799803733826
-189968362	chr18_79072701_G_GC	ENSG00000101546	0.03247750177979469	0.5609250068664551	0.25700798630714417	0.9900100231170654
-88268579	chr18_80032972_GTTTTTCCTCTGCCCGTTTGTTTGTGAAAACTCTGCTTCTCAATACTCCGCCC_G	ENSG00000101546	0.0012752000475302339	0.6026189923286438	0.17938099801540375	0.9282699823379517
-189968567	chr18_79101639_TAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-88268180	chr18_79977810_TTTTTG_T	ENSG00000101546	0.0090065598487854	0.5001299977302551	0.18607200682163239	0.9585400223731995
-189968678	chr18_79116940_TAA_T	ENSG00000101546	0.04045280069112778	-0.7494009733200073	0.3588379919528961	0.88441002368927
-88264235	chr18_79434097_A_G	ENSG00000101546	0.024301599711179733	-0.49390000104904175	0.2144639939069748	0.9359099864959717
-88264249	chr18_79435885_A_C	ENSG00000101546	0.023322200402617455	-0.48093900084495544	0.20732800662517548	0.9973800182342529
-88264289	chr18_79439023_A_G	ENSG00000101546	0.02402999997138977	-0.49540600180625916	0.21468999981880188	0.9272099733352661
-88264303	chr18_79441610_G_C	ENSG00000101546	0.04085079953074455	-0.38913899660110474	0.18671299517154694	0.8569999933242798
-88264307	chr18_79441837_T_C	ENSG00000101546	0.022944100201129913	-0.5003949999809265	0.2151000052690506	0.8924000263214111
-88264309	chr18_79442052_C_T	ENSG00000101546	0.022940700873732567	-0.500465989112854	0.21512499451637268	0.8923299908638
-88264311	chr18_79442394_T_C	ENSG00000101546	0.02406729944050312	-0.4954099953174591	0.2147510051727295	0.8962200284004211
-165261333	chr18_79462613_C_T	ENSG00000101546	0.0271208006888628	-0.5959150195121765	0.26392900943756104	0.9055899977684021
-88264571	chr18_79472204_A_G	ENSG00000101546	0.042507100850343704	-0.4067719876766205	0.1968120038509369	0.921779990196228
-165261406	chr18_79479253_G_A	ENSG00000101546	0.02256079949438572	-0.4961729943752289	0.2126609981060028	0.6370400190353394
-165261409	chr18_79481207_C_G	ENSG00000101546	0.008506080135703087	-0.497734010219574	0.18374000489711761	0.8274000287055969
-165261410	chr18_79481357_G_A	ENSG00000101546	0.009778819978237152	-0.5023890137672424	0.18905900418758392	0.7541499733924866
-165261411	chr18_79481374_A_G	ENSG00000101546	0.012608599849045277	-0.47899800539016724	0.18699400126934052	0.8098099827766418
-165263862	chr18_80139595_C_G	ENSG00000101546	1.559189968247665e-07	0.8953660130500793	0.15333600342273712	0.9739500284194946
-189974192	chr18_79874234_C_G	ENSG00000101546	0.03234120085835457	-0.5900099873542786	0.270114004611969	0.964709997177124
-189974196	chr18_79874361_C_T	ENSG00000101546	0.04905340075492859	0.4443570077419281	0.22179199755191803	0.9974499940872192
-189974540	chr18_79944512_C_G	ENSG00000101546	0.025339100509881973	-0.6260780096054077	0.27389299869537354	0.866159975528717
-189974542	chr18_79944919_C_T	ENSG00000101546	0.023991400375962257	-0.6715369820594788	0.2909359931945801	0.7998999953269958
-189974548	chr18_79945362_A_G	ENSG00000101546	0.038335900753736496	-0.5102840065956116	0.24164600670337677	0.8674499988555908
-165261412	chr18_79481665_A_G	ENSG00000101546	0.015734700486063957	-0.4688830077648163	0.18935400247573853	0.7924399971961975
-165263722	chr18_80108244_C_A	ENSG00000101546	0.00029792700661346316	-0.8340280055999756	0.21888099610805511	0.9868599772453308
-189974190	chr18_79873976_G_A	ENSG00000101546	0.036646001040935516	0.3692980110645294	0.17328999936580658	0.9490000009536743
-88269525	chr18_80138359_C_T	ENSG00000101546	0.024976499378681183	0.6974279880523682	0.3043209910392761	0.9661700129508972
-189975263	chr18_80038449_TTGTC_T	ENSG00000101546	0.01789800077676773	-0.5947930216789246	0.24520400166511536	0.9567499756813049
-189974486	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834
-88268415	chr18_80011983_C_A	ENSG00000101546	0.006631609983742237	0.9260450005531311	0.3307879865169525	0.9488700032234192
-165263235	chr18_79995179_T_C	ENSG00000101546	0.0034303099382668734	0.7194989919662476	0.23737899959087372	0.8192200064659119
-88264687	chr18_79489122_C_T	ENSG00000101546	0.044888198375701904	0.3766619861125946	0.18437999486923218	0.8487499952316284
-165261446	chr18_79490107_C_G	ENSG00000101546	0.02172970026731491	-0.4120570123195648	0.17546799778938293	0.8585799932479858
-165263138	chr18_79963843_G_A	ENSG00000101546	0.0026279999874532223	-0.7095100283622742	0.22729800641536713	0.9226999878883362
-165263137	chr18_79963832_G_A	ENSG00000101546	0.0026249599177390337	-0.7097190022468567	0.22733700275421143	0.9225900173187256
-189969540	chr18_79224569_C_T	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940299987792969
-165261448	chr18_79490638_G_A	ENSG00000101546	0.01955379918217659	-0.3910149931907654	0.16356199979782104	0.996720016002655
-165263507	chr18_80056237_G_GT	ENSG00000101546	0.00015261500084307045	0.6454190015792847	0.16102899610996246	0.9305899739265442
-189976141	chr18_80138816_C_CA	ENSG00000101546	0.04852209985256195	0.5525559782981873	0.2751289904117584	0.6626099944114685
-189976544	chr18_80190271_CA_C	ENSG00000101546	0.0494145005941391	0.540340006351471	0.27014100551605225	0.6949599981307983
-165263314	chr18_80015201_T_TG	ENSG00000101546	4.449080215351842e-09	1.0125999450683594	0.1509159952402115	0.9107800126075745
-165262740	chr18_79827927_C_CTT	ENSG00000101546	0.011989600025117397	0.513247013092041	0.19887800514698029	0.6629599928855896
-165263368	chr18_80028595_A_AG	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231
-88268243	chr18_79991107_CA_C	ENSG00000101546	0.020448200404644012	0.46891599893569946	0.19762499630451202	0.8222200274467468
-165263245	chr18_79997448_A_AAAT	ENSG00000101546	0.006668020039796829	0.6410819888114929	0.22915899753570557	0.8404399752616882
-165263939	chr18_80157550_A_AACTT	ENSG00000101546	9.776449587661773e-06	0.7181739807128906	0.1504340022802353	0.9609799981117249
-165263020	chr18_79926660_C_CT	ENSG00000101546	0.019240999594330788	-0.4084230065345764	0.17038699984550476	0.8445600271224976
-88268408	chr18_80011523_A_AAG	ENSG00000101546	0.0003354639920871705	0.5944780111312866	0.15748700499534607	0.9214900135993958
-165263433	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238
-165263389	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023
-165264117	chr18_80211946_CA_C	ENSG00000101546	0.010767700150609016	-0.6441410183906555	0.24573400616645813	0.901229977607727
-165263275	chr18_80006383_CA_C	ENSG00000101546	0.0021724801044911146	0.6917529702186584	0.21717999875545502	0.8327900171279907
-165263769	chr18_80119413_CA_C	ENSG00000101546	2.673410108400276e-06	0.7768129706382751	0.15182499587535858	0.9588199853897095
-165263434	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238
-189974407	chr18_79914567_A_ACAC	ENSG00000101546	0.005766630172729492	0.5081620216369629	0.1783290058374405	0.8534200191497803
-88269601	chr18_80151832_T_TA	ENSG00000101546	0.011504399590194225	1.0405399799346924	0.4007680118083954	0.5421500205993652
-189975251	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798
-189976684	chr18_80215026_TA_T	ENSG00000101546	0.049762699753046036	0.541579008102417	0.2711859941482544	0.6305999755859375
-88268640	chr18_80037888_CAAAAAA_C	ENSG00000101546	0.04219590127468109	0.4156379997730255	0.20078900456428528	0.7036399841308594
-189969627	chr18_79245424_CA_C	ENSG00000101546	0.03679890185594559	0.5042889714241028	0.23683199286460876	0.8968600034713745
-165263180	chr18_79976966_AT_A	ENSG00000101546	0.0034992999862879515	0.6780070066452026	0.22419500350952148	0.8539800047874451
-189976543	chr18_80190271_CA_C	ENSG00000101546	0.0494145005941391	0.540340006351471	0.27014100551605225	0.6949599981307983
-165263276	chr18_80006383_CA_C	ENSG00000101546	0.0021724801044911146	0.6917529702186584	0.21717999875545502	0.8327900171279907
-189968685	chr18_79117040_A_ACT	ENSG00000101546	0.0408950001001358	0.527961015701294	0.2533789873123169	0.9663900136947632
-189969169	chr18_79173346_A_AT	ENSG00000101546	0.03304319828748703	0.5645449757575989	0.259535014629364	0.9645799994468689
-165263203	chr18_79986442_C_CA	ENSG00000101546	0.00017432900494895875	0.6640830039978027	0.1673090010881424	0.8925899863243103
-165263756	chr18_80116545_C_CT	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844
-88268307	chr18_79998683_C_G	ENSG00000101546	0.014356800355017185	0.4843209981918335	0.19282099604606628	0.8916100263595581
-165263249	chr18_79998837_T_C	ENSG00000101546	0.0031788500491529703	0.6856939792633057	0.22430099546909332	0.8440399765968323
-189974674	chr18_79961149_C_T	ENSG00000101546	0.022092100232839584	-0.6302440166473389	0.26914501190185547	0.8257899880409241
-165263124	chr18_79961125_A_G	ENSG00000101546	0.009977339766919613	-0.4703580141067505	0.1775050014257431	0.9077799916267395
-88264717	chr18_79490878_C_T	ENSG00000101546	0.04308350011706352	0.38102400302886963	0.1848820000886917	0.8528000116348267
-165261439	chr18_79489212_A_G	ENSG00000101546	0.023302199319005013	-0.4020810127258301	0.17330700159072876	0.8553400039672852
-165261444	chr18_79489902_C_T	ENSG00000101546	0.023647800087928772	-0.4086270034313202	0.17658400535583496	0.8522899746894836
-165261443	chr18_79489831_T_C	ENSG00000101546	0.02305220067501068	-0.40998101234436035	0.17637899518013	0.8530799746513367
-165263938	chr18_80157550_A_AACTT	ENSG00000101546	9.776449587661773e-06	0.7181739807128906	0.1504340022802353	0.9609799981117249
-165261440	chr18_79489311_A_G	ENSG00000101546	0.019971000030636787	-0.413908988237381	0.17375099658966064	0.8541899919509888
-189974254	chr18_79881226_A_G	ENSG00000101546	0.04038320109248161	-0.3620240092277527	0.17328700423240662	0.9162499904632568
-88269203	chr18_80098513_T_C	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9887599945068359
-189976398	chr18_80169229_G_A	ENSG00000101546	0.04581720009446144	0.5306689739227295	0.26092299818992615	0.8379899859428406
-165263251	chr18_79999582_A_G	ENSG00000101546	0.003123970003798604	0.6857290267944336	0.22387699782848358	0.8470399975776672
-189968312	chr18_79069599_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968316	chr18_79069952_T_C	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654
-189975782	chr18_80094527_T_G	ENSG00000101546	0.04555770009756088	-0.42556801438331604	0.2089879959821701	0.9381099939346313
-189968330	chr18_79071142_T_C	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654
-189968304	chr18_79069232_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189975442	chr18_80056645_G_T	ENSG00000101546	0.017709199339151382	-0.5895990133285522	0.24264399707317352	0.965149998664856
-189975444	chr18_80056991_G_A	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571
-165263220	chr18_79991151_A_G	ENSG00000101546	0.006708129774779081	0.6383129954338074	0.22834600508213043	0.8453400135040283
-189975432	chr18_80055505_A_G	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571
-165262780	chr18_79855988_C_T	ENSG00000101546	0.03361830115318298	-0.5539600253105164	0.2555280029773712	0.9125800132751465
-165263558	chr18_80066399_C_G	ENSG00000101546	0.0005949999904260039	0.8107140064239502	0.2252040058374405	0.8926600217819214
-165261441	chr18_79489693_C_T	ENSG00000101546	0.02021780051290989	-0.41695699095726013	0.1753920018672943	0.8563799858093262
-189975834	chr18_80099463_C_A	ENSG00000101546	0.00355039001442492	0.5585179924964905	0.18498900532722473	0.923829972743988
-165263493	chr18_80053972_T_C	ENSG00000101546	2.131220026058145e-05	0.7576010227203369	0.1660279929637909	0.9484999775886536
-165263694	chr18_80097984_G_C	ENSG00000101546	3.9682898744786144e-08	0.9398599863052368	0.1521420031785965	0.9430299997329712
-88268591	chr18_80033710_A_G	ENSG00000101546	0.0025717299431562424	0.5703060030937195	0.18227800726890564	0.9211300015449524
-189968306	chr18_79069377_A_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-88269421	chr18_80127256_T_C	ENSG00000101546	0.024045800790190697	0.6929889917373657	0.30035001039505005	0.9993500113487244
-88269661	chr18_80153647_T_C	ENSG00000101546	0.026196099817752838	0.7009819746017456	0.3085069954395294	0.8868100047111511
-189969164	chr18_79172718_A_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-165263519	chr18_80058414_A_G	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193
-189968332	chr18_79071213_A_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-88264627	chr18_79479863_G_A	ENSG00000101546	0.024715399369597435	0.5066459774971008	0.220660001039505	0.6346499919891357
-165263495	chr18_80054070_C_T	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193
-165263680	chr18_80094597_C_T	ENSG00000101546	0.00017910900351125747	0.6984239816665649	0.17631299793720245	0.8826500177383423
-189975840	chr18_80103152_A_G	ENSG00000101546	0.003961219917982817	0.5524060130119324	0.18528200685977936	0.9293599724769592
-189975230	chr18_80035232_A_T	ENSG00000101546	0.0003092499973718077	-0.5977219939231873	0.15732699632644653	0.9657700061798096
-189968624	chr18_79107353_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165263660	chr18_80091557_G_T	ENSG00000101546	0.00044414299190975726	-0.8210899829864502	0.22253400087356567	0.976170003414154
-189968190	chr18_79057565_C_G	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293
-189968186	chr18_79057485_T_C	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293
-189968622	chr18_79107095_A_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968130	chr18_79050030_A_G	ENSG00000101546	0.03523319959640503	0.597881019115448	0.2783519923686981	0.9544699788093567
-189968720	chr18_79120803_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189974134	chr18_79868953_G_C	ENSG00000101546	0.016444800421595573	0.42762601375579834	0.17390300333499908	0.9478399753570557
-189974146	chr18_79869373_G_A	ENSG00000101546	0.016442500054836273	0.427619993686676	0.17389599978923798	0.9478999972343445
-88268159	chr18_79973273_C_T	ENSG00000101546	0.009821070358157158	0.4935680031776428	0.18585200607776642	0.9221799969673157
-165263685	chr18_80096657_A_G	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.987529993057251
-88269209	chr18_80098907_T_G	ENSG00000101546	0.010833400301635265	0.6991909742355347	0.2669680118560791	0.9890099763870239
-88269211	chr18_80098936_T_C	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342
-165263765	chr18_80118775_G_A	ENSG00000101546	5.522430001292378e-05	-0.6893159747123718	0.16033999621868134	0.9832900166511536
-165263815	chr18_80129276_G_A	ENSG00000101546	0.00037060098838992417	-0.8321589827537537	0.22222299873828888	0.9770799875259399
-88269445	chr18_80129301_A_G	ENSG00000101546	0.024224499240517616	0.6989679932594299	0.30333900451660156	0.9883300065994263
-189976592	chr18_80198202_T_C	ENSG00000101546	0.009564920328557491	0.49497199058532715	0.18569299578666687	0.8510500192642212
-165264099	chr18_80206083_G_C	ENSG00000101546	0.010746500454843044	-0.640330970287323	0.24421200156211853	0.9113199710845947
-189976648	chr18_80211402_G_C	ENSG00000101546	0.04830950126051903	0.5429670214653015	0.2700920104980469	0.6302700042724609
-165261082	chr18_79398019_A_G	ENSG00000101546	0.042753901332616806	-0.5647420287132263	0.2735790014266968	0.5271099805831909
-88264121	chr18_79422003_T_G	ENSG00000101546	0.019655099138617516	0.5088779926300049	0.21304799616336823	0.46035999059677124
-88264453	chr18_79459389_G_C	ENSG00000101546	0.006419629789888859	0.6041060090065002	0.21489299833774567	0.5322099924087524
-165262653	chr18_79782065_G_A	ENSG00000101546	0.045755401253700256	-0.39195701479911804	0.1926639974117279	0.577750027179718
-165262771	chr18_79848203_C_G	ENSG00000101546	0.02034120075404644	0.396014004945755	0.16675299406051636	0.9521999955177307
-189974248	chr18_79880340_C_T	ENSG00000101546	0.021694200113415718	-0.6418460011482239	0.2732439935207367	0.911109983921051
-189974388	chr18_79911112_G_A	ENSG00000101546	0.004530809819698334	0.5153930187225342	0.17562100291252136	0.8685700297355652
-189974392	chr18_79911830_A_C	ENSG00000101546	0.002845499897375703	0.5605630278587341	0.1811390072107315	0.8322299718856812
-165262995	chr18_79915188_A_T	ENSG00000101546	0.00795970018953085	-0.7358710169792175	0.2692280113697052	0.8645700216293335
-189974418	chr18_79917155_A_G	ENSG00000101546	0.0026061199605464935	-0.8074439764022827	0.25843900442123413	0.7077400088310242
-165263149	chr18_79967126_T_C	ENSG00000101546	0.003251390065997839	0.5506470203399658	0.1805800050497055	0.835070013999939
-165263166	chr18_79970197_A_G	ENSG00000101546	0.0034312200732529163	0.6782429814338684	0.2237749993801117	0.8579000234603882
-165263177	chr18_79976365_T_A	ENSG00000101546	0.002789250109344721	0.7504439949989319	0.2419690042734146	0.8117499947547913
-165263178	chr18_79976735_T_C	ENSG00000101546	0.0034454900305718184	0.6796560287475586	0.22434599697589874	0.853659987449646
-165263240	chr18_79996604_G_A	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528
-165263241	chr18_79996664_A_C	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528
-88268339	chr18_80004232_C_G	ENSG00000101546	0.006844629999250174	0.5252249836921692	0.18838000297546387	0.9337999820709229
-165263265	chr18_80004353_T_C	ENSG00000101546	0.0031801799777895212	0.6846820116043091	0.22397999465465546	0.8461099863052368
-189975046	chr18_80014886_A_C	ENSG00000101546	0.0003680720110423863	-0.6124129891395569	0.16345100104808807	0.9237099885940552
-165263334	chr18_80018816_T_C	ENSG00000101546	0.002536430023610592	0.6788970232009888	0.21666400134563446	0.8821399807929993
-88268481	chr18_80019156_C_T	ENSG00000101546	0.0004446200036909431	0.5852479934692383	0.15862999856472015	0.8768100142478943
-165263422	chr18_80039495_T_C	ENSG00000101546	0.0011908699525520205	0.7143269777297974	0.21125000715255737	0.9028900265693665
-88268657	chr18_80039707_C_T	ENSG00000101546	0.003636860055848956	0.5357609987258911	0.17793899774551392	0.9728599786758423
-88269073	chr18_80086171_T_C	ENSG00000101546	0.013327600434422493	0.7274990081787109	0.2863749861717224	0.9688100218772888
-165263684	chr18_80096499_G_T	ENSG00000101546	0.0007837309967726469	-0.6893439888954163	0.19616499543190002	0.9999600052833557
-165263695	chr18_80098501_T_C	ENSG00000101546	0.000130853004520759	-0.8881670236587524	0.21914899349212646	0.989300012588501
-88269205	chr18_80098597_T_C	ENSG00000101546	0.010849700309336185	0.6992549896240234	0.26705101132392883	0.9889299869537354
-165263766	chr18_80118818_C_T	ENSG00000101546	1.83099000423681e-05	-0.7252659797668457	0.15751099586486816	0.9831600189208984
-165263797	chr18_80124685_G_A	ENSG00000101546	0.0010703200241550803	-0.7656580209732056	0.22416700422763824	0.9782299995422363
-165263816	chr18_80129292_T_C	ENSG00000101546	5.776300167781301e-05	-0.6904259920120239	0.1610720008611679	0.9726399779319763
-88269711	chr18_80159189_C_A	ENSG00000101546	0.04252230003476143	0.6393460035324097	0.30936399102211	0.9185400009155273
-189976540	chr18_80187442_T_C	ENSG00000101546	0.009092560037970543	0.4767880141735077	0.17761999368667603	0.9968900084495544
-189968494	chr18_79088401_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968102	chr18_79046843_A_G	ENSG00000101546	0.04790379852056503	0.5542430281639099	0.2751869857311249	0.9925900101661682
-165263635	chr18_80086851_G_A	ENSG00000101546	0.0007837309967726469	-0.6893439888954163	0.19616499543190002	0.9999600052833557
-189968748	chr18_79125187_C_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968644	chr18_79110397_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968750	chr18_79125298_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189968752	chr18_79125300_C_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189968126	chr18_79049535_C_T	ENSG00000101546	0.03523319959640503	0.597881019115448	0.2783519923686981	0.9544699788093567
-189968576	chr18_79102423_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189968158	chr18_79052962_C_T	ENSG00000101546	0.032968200743198395	0.5597910284996033	0.25723499059677124	0.9755499958992004
-165262746	chr18_79829655_G_A	ENSG00000101546	0.02116600051522255	0.3977780044078827	0.1686280071735382	0.9473000168800354
-165262747	chr18_79829689_G_A	ENSG00000101546	0.02116600051522255	0.3977780044078827	0.1686280071735382	0.947350025177002
-165262748	chr18_79829759_C_T	ENSG00000101546	0.021174399182200432	0.3977130055427551	0.16861200332641602	0.9474999904632568
-189968182	chr18_79057189_G_A	ENSG00000101546	0.020477300509810448	0.6620489954948425	0.2790890038013458	0.9433299899101257
-189975428	chr18_80055299_T_A	ENSG00000101546	0.017705900594592094	-0.5901219844818115	0.24285200238227844	0.9646999835968018
-189968616	chr18_79106549_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826099872589111
-189968160	chr18_79053245_G_A	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293
-189968724	chr18_79121798_C_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968120	chr18_79048210_G_A	ENSG00000101546	0.0428554005920887	0.538437008857727	0.26096799969673157	0.9537400007247925
-189968652	chr18_79111939_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968520	chr18_79093118_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968508	chr18_79091094_A_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968474	chr18_79086014_A_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165264120	chr18_80212884_C_CA	ENSG00000101546	8.715030048733752e-07	0.9057700037956238	0.1675650030374527	0.8506500124931335
-189968058	chr18_79038700_C_G	ENSG00000101546	0.03980499878525734	-0.885125994682312	0.4224100112915039	0.8608800172805786
-165262321	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449
-189974488	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834
-165262735	chr18_79826290_A_G	ENSG00000101546	0.00378870009444654	0.627170979976654	0.20927800238132477	0.5979099869728088
-165262733	chr18_79826223_C_T	ENSG00000101546	0.00366286002099514	0.6300830245018005	0.20943599939346313	0.5947099924087524
-165264159	chr18_80238491_C_CA	ENSG00000101546	9.123349968831462e-07	1.388550043106079	0.25743499398231506	0.4219000041484833
-165262754	chr18_79832660_C_G	ENSG00000101546	0.022002199664711952	0.3916130065917969	0.16711999475955963	0.9518700242042542
-88265792	chr18_79631418_CGT_C	ENSG00000101546	0.04891889914870262	0.33583900332450867	0.16752399504184723	0.9341700077056885
-189973888	chr18_79825900_C_T	ENSG00000101546	0.02994289994239807	0.520455002784729	0.23478899896144867	0.5083400011062622
-189968226	chr18_79059225_T_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.9712700247764587
-88269600	chr18_80151832_T_TA	ENSG00000101546	0.011504399590194225	1.0405399799346924	0.4007680118083954	0.5421500205993652
-189968380	chr18_79074681_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165261445	chr18_79490090_C_CCCCCCG	ENSG00000101546	0.0011022200342267752	1.1362600326538086	0.3335860073566437	0.5041300058364868
-189968382	chr18_79074733_C_T	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-88264020	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267
-189968178	chr18_79055173_C_T	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293
-189976683	chr18_80215026_TA_T	ENSG00000101546	0.049762699753046036	0.541579008102417	0.2711859941482544	0.6305999755859375
-189968146	chr18_79051037_C_CAA	ENSG00000101546	0.026054900139570236	0.6269279718399048	0.275644987821579	0.969980001449585
-165263439	chr18_80041720_CTTT_C	ENSG00000101546	0.0012789099710062146	0.713791012763977	0.21253199875354767	0.9042900204658508
-189968258	chr18_79063088_C_T	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165263671	chr18_80093639_C_T	ENSG00000101546	0.0007727540214546025	-0.6972600221633911	0.19816799461841583	0.9859099984169006
-165263426	chr18_80040239_A_ATTTTTT	ENSG00000101546	2.4490100614116272e-08	1.058609962463379	0.1681469976902008	0.7731599807739258
-189968604	chr18_79105141_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165263605	chr18_80081068_G_C	ENSG00000101546	0.00044452500878833234	-0.8213809728622437	0.22262899577617645	0.9748499989509583
-165263606	chr18_80081190_T_C	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934
-189973946	chr18_79835748_G_A	ENSG00000101546	0.02287450060248375	0.41680800914764404	0.1790740042924881	0.9065899848937988
-189968128	chr18_79050002_A_G	ENSG00000101546	0.03523319959640503	0.597881019115448	0.2783519923686981	0.9544699788093567
-165263641	chr18_80088041_C_T	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445
-189969145	chr18_79171878_G_GTT	ENSG00000101546	0.028650900349020958	-0.8239669799804688	0.36864998936653137	0.926010012626648
-189974468	chr18_79928124_C_T	ENSG00000101546	0.004080949816852808	0.5253480076789856	0.17681799829006195	0.9315299987792969
-189969192	chr18_79175062_A_G	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304
-165264023	chr18_80177972_T_TACACAC	ENSG00000101546	0.0028105799574404955	-0.8103110194206238	0.26148900389671326	0.6188700199127197
-88264485	chr18_79463270_T_C	ENSG00000101546	0.026027800515294075	-0.42829498648643494	0.1882759928703308	0.914359986782074
-165263476	chr18_80048941_C_CGTCT	ENSG00000101546	3.2930998713709414e-05	0.7449690103530884	0.1676589995622635	0.9231600165367126
-165263161	chr18_79969449_C_T	ENSG00000101546	0.0007966730045154691	0.6422420144081116	0.18302899599075317	0.8087000250816345
-88268599	chr18_80034026_C_T	ENSG00000101546	0.0036171600222587585	0.5427029728889465	0.18013300001621246	0.9630100131034851
-88268596	chr18_80033957_ACCTCGCGCCAGTCTTCGCCCCGCCCATTCACCGCCCG_A	ENSG00000101546	0.003214519936591387	0.5541219711303711	0.18148699402809143	0.9526399970054626
-189969190	chr18_79174976_G_T	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304
-189968086	chr18_79044372_C_T	ENSG00000101546	0.029401499778032303	0.6184489727020264	0.27803999185562134	0.953249990940094
-88264487	chr18_79463302_T_C	ENSG00000101546	0.02601430006325245	-0.42830199003219604	0.1882610023021698	0.9144099950790405
-165263658	chr18_80091064_A_G	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-88264521	chr18_79464840_G_A	ENSG00000101546	0.04578449949622154	-0.37894299626350403	0.18629199266433716	0.92535001039505
-165261285	chr18_79451956_C_T	ENSG00000101546	0.011720200069248676	1.1646599769592285	0.4497910141944885	0.5813500285148621
-165262738	chr18_79827758_C_G	ENSG00000101546	0.008222740143537521	0.9172099828720093	0.3370420038700104	0.4500100016593933
-165263429	chr18_80040888_G_A	ENSG00000101546	2.1306000019816196e-10	1.0814900398254395	0.14541099965572357	0.9556499719619751
-88261539	chr18_79051830_A_G	ENSG00000101546	0.03224790096282959	-0.4322510063648224	0.19777999818325043	0.9691200256347656
-88268277	chr18_79993320_TA_T	ENSG00000101546	0.0006915549747645855	0.5959029793739319	0.16770799458026886	0.8548300266265869
-189969376	chr18_79194643_G_A	ENSG00000101546	0.03558110073208809	0.6024720072746277	0.2810389995574951	0.976140022277832
-165262758	chr18_79834109_G_C	ENSG00000101546	0.03796989843249321	-0.5710309743881226	0.26988500356674194	0.8181999921798706
-189974322	chr18_79893508_C_T	ENSG00000101546	0.031037800014019012	0.38543900847435	0.17507000267505646	0.9323999881744385
-165263135	chr18_79963434_C_T	ENSG00000101546	0.002108830027282238	-0.7193319797515869	0.22514000535011292	0.9371700286865234
-189969006	chr18_79156593_T_C	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-165263284	chr18_80007575_T_G	ENSG00000101546	1.3900599782346035e-08	1.017490029335022	0.15814900398254395	0.8522599935531616
-165263354	chr18_80025761_G_A	ENSG00000101546	2.903239870732932e-10	1.0852899551391602	0.1473820060491562	0.9137799739837646
-165261284	chr18_79451908_G_A	ENSG00000101546	0.012045400217175484	1.185439944267273	0.4596579968929291	0.6571699976921082
-189972258	chr18_79614110_G_A	ENSG00000101546	0.04099920019507408	-0.49995800852775574	0.2400670051574707	0.7966200113296509
-88264519	chr18_79464810_G_A	ENSG00000101546	0.04581430181860924	-0.3789820075035095	0.18633800745010376	0.9251099824905396
-189973975	chr18_79851617_AGTGT_A	ENSG00000101546	0.025087300688028336	0.3987250030040741	0.1741199940443039	0.9344800114631653
-165263960	chr18_80164008_G_C	ENSG00000101546	1.6429399352091423e-07	0.906453013420105	0.155581995844841	0.9467300176620483
-189974290	chr18_79887406_G_A	ENSG00000101546	0.028696300461888313	0.38781601190567017	0.17356300354003906	0.9388300180435181
-88264239	chr18_79435347_T_TTTG	ENSG00000101546	0.01670759916305542	-0.531885027885437	0.21684999763965607	0.8868200182914734
-88268527	chr18_80026225_G_T	ENSG00000101546	0.0037550099659711123	0.5361679792404175	0.17872799932956696	0.9558600187301636
-165262756	chr18_79833034_CT_C	ENSG00000101546	0.022035999223589897	0.3914470076560974	0.16709299385547638	0.952210009098053
-165263262	chr18_80004129_TA_T	ENSG00000101546	0.00520892022177577	0.6606469750404358	0.22894099354743958	0.8338599801063538
-165263201	chr18_79986442_C_CA	ENSG00000101546	0.00017432900494895875	0.6640830039978027	0.1673090010881424	0.8925899863243103
-165263943	chr18_80158499_T_C	ENSG00000101546	2.1639000635786942e-07	0.8859949707984924	0.15388700366020203	0.9753900170326233
-165263346	chr18_80022390_C_T	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414
-189974186	chr18_79873629_G_A	ENSG00000101546	0.03373640030622482	0.3741300106048584	0.17269599437713623	0.9526299834251404
-189974204	chr18_79876077_C_T	ENSG00000101546	0.033759698271751404	0.3732829988002777	0.17232799530029297	0.9575600028038025
-88269315	chr18_80116512_TC_T	ENSG00000101546	0.024279000237584114	0.6988750100135803	0.30341899394989014	0.9890599846839905
-165263535	chr18_80061354_GT_G	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768
-165261216	chr18_79435381_C_T	ENSG00000101546	0.028486300259828568	-0.5824120044708252	0.2602970004081726	0.8003100156784058
-189975249	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798
-165263444	chr18_80042008_G_A	ENSG00000101546	2.1362399349467154e-10	1.0832899808883667	0.1456650048494339	0.9544500112533569
-189974206	chr18_79876101_C_T	ENSG00000101546	0.033759698271751404	0.3732829988002777	0.17232799530029297	0.9575600028038025
-88268525	chr18_80026224_G_T	ENSG00000101546	0.0037550099659711123	0.5361679792404175	0.17872799932956696	0.9558600187301636
-165263430	chr18_80040980_G_C	ENSG00000101546	7.270180013563277e-09	0.9866189956665039	0.14969100058078766	0.951770007610321
-165264009	chr18_80175614_G_A	ENSG00000101546	5.855069957760861e-07	0.8658900260925293	0.15724200010299683	0.9783099889755249
-165263277	chr18_80006426_G_C	ENSG00000101546	2.907809992791499e-08	0.9940099716186523	0.15894700586795807	0.8502799868583679
-189969002	chr18_79156413_C_T	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-165263328	chr18_80017135_G_C	ENSG00000101546	0.0015251500299200416	-0.8334389925003052	0.25244200229644775	0.8865100145339966
-165262773	chr18_79849462_C_T	ENSG00000101546	0.02033980004489422	0.39604198932647705	0.16676299273967743	0.9520099759101868
-189974444	chr18_79922662_T_C	ENSG00000101546	0.008993959985673428	0.6875429749488831	0.255748987197876	0.6315299868583679
-88268407	chr18_80011523_A_AAG	ENSG00000101546	0.0003354639920871705	0.5944780111312866	0.15748700499534607	0.9214900135993958
-165263754	chr18_80116545_C_CT	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844
-189968280	chr18_79065411_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165263313	chr18_80015201_T_TG	ENSG00000101546	4.449080215351842e-09	1.0125999450683594	0.1509159952402115	0.9107800126075745
-189968250	chr18_79061767_T_C	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189975222	chr18_80034310_CTCGCCCCGCCCTGCATCA_C	ENSG00000101546	0.01939390040934086	-0.5574700236320496	0.23287199437618256	0.9631800055503845
-165263396	chr18_80034081_G_GC	ENSG00000101546	2.1349699785844223e-10	1.0824600458145142	0.14554999768733978	0.9538999795913696
-88268639	chr18_80037888_CAAAAAA_C	ENSG00000101546	0.04219590127468109	0.4156379997730255	0.20078900456428528	0.7036399841308594
-165264155	chr18_80230443_G_T	ENSG00000101546	0.009560249745845795	-1.0725799798965454	0.4023590087890625	0.4146899878978729
-165263582	chr18_80073792_G_A	ENSG00000101546	7.0585102207587624e-09	0.9839000105857849	0.14911699295043945	0.9587699770927429
-189974491	chr18_79934128_TAA_T	ENSG00000101546	0.018797900527715683	-0.7050750255584717	0.2930130064487457	0.8239700198173523
-189975223	chr18_80034310_CTCGCCCCGCCCTGCATCA_C	ENSG00000101546	0.01939390040934086	-0.5574700236320496	0.23287199437618256	0.9631800055503845
-189970402	chr18_79376186_C_T	ENSG00000101546	0.0025194899644702673	1.4823399782180786	0.4727360010147095	0.40827998518943787
-189968236	chr18_79060196_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-165263514	chr18_80057487_A_ATTTCT	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853
-165263579	chr18_80070707_C_T	ENSG00000101546	5.149839853402227e-05	0.6767920255661011	0.15671099722385406	0.9416499733924866
-189974260	chr18_79882394_GA_G	ENSG00000101546	0.028648799285292625	0.3878380060195923	0.17351900041103363	0.9393600225448608
-189976478	chr18_80178830_AC_A	ENSG00000101546	2.380720070505049e-05	0.7269030213356018	0.1603659987449646	0.9226999878883362
-189968734	chr18_79124185_C_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165264077	chr18_80196890_TAA_T	ENSG00000101546	0.03214230015873909	-0.4360960125923157	0.199412003159523	0.7321599721908569
-189968738	chr18_79124310_A_T	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183
-189975250	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798
-189969661	chr18_79249079_TA_T	ENSG00000101546	0.02948799915611744	-0.8166509866714478	0.3673500120639801	0.9844300150871277
-88266772	chr18_79742141_TGAGGTGGAGGCCTGGGGGCAGCAGAG_T	ENSG00000101546	0.03260349854826927	-0.9425650238990784	0.43219301104545593	0.42250001430511475
-165264075	chr18_80195893_C_CT	ENSG00000101546	9.202360160998069e-06	0.7922729849815369	0.16539299488067627	0.86558997631073
-88266775	chr18_79742176_AAGCAT_A	ENSG00000101546	0.026386499404907227	-1.1123900413513184	0.490215003490448	0.4789699912071228
-189968742	chr18_79124480_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165263634	chr18_80086614_A_G	ENSG00000101546	0.0007937669870443642	-0.7054010033607483	0.20096200704574585	0.9684799909591675
-189968570	chr18_79101946_AT_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189976682	chr18_80215026_TA_T	ENSG00000101546	0.049762699753046036	0.541579008102417	0.2711859941482544	0.6305999755859375
-189975170	chr18_80030402_C_T	ENSG00000101546	0.016570299863815308	-0.5826950073242188	0.23725199699401855	0.9036200046539307
-189968272	chr18_79064045_A_G	ENSG00000101546	0.026272600516676903	0.6248220205307007	0.27513399720191956	0.9890199899673462
-88264129	chr18_79424016_G_A	ENSG00000101546	0.03583399951457977	-0.40857699513435364	0.19086100161075592	0.7759900093078613
-189968630	chr18_79107717_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165264051	chr18_80185774_CCT_C	ENSG00000101546	4.3216800804657396e-07	0.9511610269546509	0.17034900188446045	0.8398699760437012
-189968214	chr18_79058693_CAA_C	ENSG00000101546	0.026237700134515762	0.6261829733848572	0.2756670117378235	0.9628499746322632
-189968583	chr18_79103285_T_TTTA	ENSG00000101546	0.026482699438929558	0.6243190169334412	0.2753100097179413	0.9829199910163879
-165263019	chr18_79926660_C_CT	ENSG00000101546	0.019240999594330788	-0.4084230065345764	0.17038699984550476	0.8445600271224976
-165263150	chr18_79967147_CA_C	ENSG00000101546	0.004885829985141754	0.6611229777336121	0.22732800245285034	0.7614399790763855
-165263164	chr18_79969751_CCTTG_C	ENSG00000101546	0.0033433600328862667	0.5450299978256226	0.17929799854755402	0.8363900184631348
-165263165	chr18_79969751_CCTTG_C	ENSG00000101546	0.0033433600328862667	0.5450299978256226	0.17929799854755402	0.8363900184631348
-165263503	chr18_80055308_G_GA	ENSG00000101546	0.0016471799463033676	0.6159440279006958	0.18799400329589844	0.9377899765968323
-165263768	chr18_80119413_CA_C	ENSG00000101546	2.673410108400276e-06	0.7768129706382751	0.15182499587535858	0.9588199853897095
-165263864	chr18_80140436_T_TA	ENSG00000101546	0.0016014300053939223	-0.8639370203018188	0.2629460096359253	0.83610999584198
-165263542	chr18_80062261_G_GT	ENSG00000101546	6.983349898348479e-09	0.9865990281105042	0.14946800470352173	0.9559500217437744
-189972132	chr18_79603296_T_G	ENSG00000101546	0.01336320023983717	0.8240600228309631	0.3245159983634949	0.4196000099182129
-165263592	chr18_80076146_A_G	ENSG00000101546	4.514749889494851e-05	-0.6753190159797668	0.1550469994544983	0.9636600017547607
-165263292	chr18_80009831_C_T	ENSG00000101546	2.8509200555859593e-10	1.0863800048828125	0.1474439948797226	0.9107099771499634
-88267669	chr18_79885575_C_T	ENSG00000101546	0.006604440044611692	1.2993799448013306	0.4638980031013489	0.5620399713516235
-189975330	chr18_80044562_A_G	ENSG00000101546	0.00030811000033281744	-0.5959500074386597	0.15681500732898712	0.9711300134658813
-165263794	chr18_80123995_G_T	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214
-189974476	chr18_79932475_A_AAAAG	ENSG00000101546	0.015355500392615795	-0.7255340218544006	0.2918809950351715	0.8104000091552734
-165264153	chr18_80229346_G_T	ENSG00000101546	7.59658007609687e-07	1.3685499429702759	0.25154799222946167	0.4359999895095825
-189968722	chr18_79121675_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189976216	chr18_80151832_T_TAA	ENSG00000101546	3.0354101454577176e-08	1.647570013999939	0.26389798521995544	0.4377500116825104
-189969117	chr18_79168362_T_TTTTG	ENSG00000101546	0.0321056991815567	0.5739529728889465	0.2623920142650604	0.9609699845314026
-165263801	chr18_80126005_T_G	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214
-165263544	chr18_80062552_A_C	ENSG00000101546	7.044500094366413e-09	0.9839209914207458	0.14911000430583954	0.9586499929428101
-189975304	chr18_80041735_CT_C	ENSG00000101546	0.00028746199677698314	-0.600579023361206	0.15717299282550812	0.9647600054740906
-189974160	chr18_79871198_A_G	ENSG00000101546	0.015499800443649292	0.4327490031719208	0.17434899508953094	0.9459900259971619
-165263136	chr18_79963435_T_C	ENSG00000101546	0.002108830027282238	-0.7193319797515869	0.22514000535011292	0.9371700286865234
-165263972	chr18_80166206_G_A	ENSG00000101546	3.7716699807788245e-07	0.8579139709472656	0.15271000564098358	0.984250009059906
-189968378	chr18_79074394_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165263039	chr18_79934439_C_A	ENSG00000101546	0.00417478010058403	-0.798354983329773	0.2694210112094879	0.860480010509491
-165263228	chr18_79992876_T_TAAA	ENSG00000101546	4.858270131080644e-06	0.8729450106620789	0.17599999904632568	0.7013300061225891
-189968600	chr18_79104905_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189976457	chr18_80177170_C_CACACAT	ENSG00000101546	0.04319680109620094	0.540369987487793	0.262347012758255	0.7683699727058411
-189974678	chr18_79961824_C_A	ENSG00000101546	0.0010577200446277857	0.6198980212211609	0.18129199743270874	0.8718400001525879
-88264325	chr18_79444397_T_C	ENSG00000101546	0.023963799700140953	-0.5087140202522278	0.2203499972820282	0.840179979801178
-165264096	chr18_80203464_C_T	ENSG00000101546	5.591099920820852e-07	0.9413319826126099	0.17057999968528748	0.8398100137710571
-189968594	chr18_79104243_G_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189975388	chr18_80050767_C_T	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189975006	chr18_80009477_C_T	ENSG00000101546	0.015355500392615795	-0.6192389726638794	0.24911800026893616	0.8964499831199646
-189968504	chr18_79090133_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165263628	chr18_80084914_C_T	ENSG00000101546	8.22564985014651e-08	0.9263049960136414	0.15443600714206696	0.9346399903297424
-165263522	chr18_80058866_G_A	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252
-189974680	chr18_79961832_C_T	ENSG00000101546	0.0010555300395935774	0.6199089884757996	0.18126000463962555	0.8678900003433228
-165263289	chr18_80009251_T_C	ENSG00000101546	2.1870800281931224e-08	0.9793440103530884	0.15487800538539886	0.8493599891662598
-88264169	chr18_79426301_GA_G	ENSG00000101546	0.04710569977760315	-0.4361859858036041	0.21577100455760956	0.8364800214767456
-165263788	chr18_80121321_A_G	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214
-88269563	chr18_80145080_G_A	ENSG00000101546	0.02580229938030243	0.6957359910011292	0.3053610026836395	0.9488199949264526
-165264160	chr18_80239256_GA_G	ENSG00000101546	2.102699909301009e-06	1.3618099689483643	0.2629530131816864	0.4129500091075897
-165263436	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238
-189968597	chr18_79104611_TTATAA_T	ENSG00000101546	0.027988800778985023	0.617796003818512	0.2752099931240082	0.9817100167274475
-88268444	chr18_80015355_A_AATT	ENSG00000101546	0.0017859699437394738	0.5766699910163879	0.17744199931621552	0.9408900141716003
-165263527	chr18_80059828_C_T	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252
-165263839	chr18_80132673_T_TC	ENSG00000101546	7.58461028453894e-05	-0.6865130066871643	0.1630920022726059	0.9509599804878235
-189974162	chr18_79871219_A_G	ENSG00000101546	0.0165862999856472	0.4269689917564392	0.17387300729751587	0.9480500221252441
-165263789	chr18_80121775_C_T	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214
-165263640	chr18_80087994_C_T	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445
-165263639	chr18_80087974_G_A	ENSG00000101546	0.00044552498729899526	-0.8210049867630005	0.22256900370121002	0.9761999845504761
-165263581	chr18_80073689_T_C	ENSG00000101546	4.612260090652853e-05	-0.6746699810028076	0.15511000156402588	0.9637799859046936
-165263610	chr18_80082134_C_T	ENSG00000101546	0.000819315027911216	-0.7047110199928284	0.20133599638938904	0.9649699926376343
-88264136	chr18_79424489_ATC_A	ENSG00000101546	0.035638801753520966	-0.40778300166130066	0.19028300046920776	0.7771000266075134
-165263638	chr18_80087736_G_A	ENSG00000101546	0.00044552498729899526	-0.8210049867630005	0.22256900370121002	0.9761999845504761
-165263608	chr18_80081300_A_ATTTTG	ENSG00000101546	0.0003881960001308471	-0.735040009021759	0.19702699780464172	0.9323999881744385
-88264125	chr18_79422877_A_G	ENSG00000101546	0.020511800423264503	-0.5033029913902283	0.21222899854183197	0.6115800142288208
-189968064	chr18_79039776_C_T	ENSG00000101546	0.041968200355768204	0.6170570254325867	0.2977519929409027	0.8722299933433533
-88269005	chr18_80077832_C_T	ENSG00000101546	0.005034840200096369	0.8004440069198608	0.27623799443244934	0.9668999910354614
-189968642	chr18_79110347_T_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968714	chr18_79119688_T_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189972200	chr18_79609793_T_C	ENSG00000101546	0.03648209944367409	0.5153999924659729	0.2416290044784546	0.734250009059906
-165263657	chr18_80091038_G_A	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-165262781	chr18_79856819_C_T	ENSG00000101546	0.0336374007165432	-0.5538960099220276	0.25552698969841003	0.9087200164794922
-88265719	chr18_79623341_G_T	ENSG00000101546	0.03791360184550285	0.37790000438690186	0.17855200171470642	0.9634199738502502
-88264253	chr18_79436515_T_C	ENSG00000101546	0.003389130113646388	0.6372069716453552	0.2099429965019226	0.5583400130271912
-88264255	chr18_79436516_A_G	ENSG00000101546	0.003389130113646388	0.6372069716453552	0.2099429965019226	0.5583400130271912
-88264257	chr18_79436520_C_G	ENSG00000101546	0.0034002400934696198	0.6367859840393066	0.209880992770195	0.5585799813270569
-165262457	chr18_79735193_G_A	ENSG00000101546	0.008846360258758068	-0.607571005821228	0.22548900544643402	0.472460001707077
-165262996	chr18_79916617_G_A	ENSG00000101546	0.004259330220520496	-0.7998499870300293	0.270563006401062	0.8580499887466431
-165263006	chr18_79918515_G_A	ENSG00000101546	0.0014601999428123236	-0.9419059753417969	0.284078985452652	0.8237299919128418
-165263029	chr18_79933268_G_A	ENSG00000101546	0.002767419908195734	-1.3343299627304077	0.4298650026321411	0.4537400007247925
-165263076	chr18_79949709_T_C	ENSG00000101546	0.004299520049244165	-0.7705410122871399	0.26093700528144836	0.8911499977111816
-189974606	chr18_79952832_G_A	ENSG00000101546	0.005470199976116419	-0.5226479768753052	0.18221299350261688	0.8816999793052673
-165263115	chr18_79958044_A_C	ENSG00000101546	0.009887199848890305	-0.4685969948768616	0.17661599814891815	0.9321200251579285
-165263131	chr18_79962454_T_C	ENSG00000101546	0.002212940016761422	-0.7662839889526367	0.24104300141334534	0.897570013999939
-165263139	chr18_79964288_C_T	ENSG00000101546	0.0015720200026407838	-0.7361720204353333	0.22364799678325653	0.9351099729537964
-88268157	chr18_79972269_C_T	ENSG00000101546	0.011475699953734875	0.9159129858016968	0.3526400029659271	0.9362900257110596
-88268193	chr18_79981709_G_C	ENSG00000101546	0.01121590007096529	0.921908974647522	0.35377201437950134	0.9163500070571899
-88269673	chr18_80156433_C_T	ENSG00000101546	0.04466180130839348	0.6362230181694031	0.31109800934791565	0.9156299829483032
-165263954	chr18_80159596_G_A	ENSG00000101546	0.005446889903396368	-0.6496639847755432	0.2263759970664978	0.9853699803352356
-165263970	chr18_80166075_T_C	ENSG00000101546	2.5096700483118184e-05	0.7037469744682312	0.15575499832630157	0.9442600011825562
-165263997	chr18_80173181_C_T	ENSG00000101546	1.9580600564950146e-05	0.7143980264663696	0.15577000379562378	0.9529100060462952
-165264012	chr18_80176788_G_A	ENSG00000101546	0.006324660032987595	-0.6553260087966919	0.23266999423503876	0.9824299812316895
-165264044	chr18_80182601_T_A	ENSG00000101546	0.014786999672651291	-0.6476200222969055	0.25901201367378235	0.8419100046157837
-165263456	chr18_80044987_G_A	ENSG00000101546	0.0006024069734849036	-1.2891499996185303	0.35848599672317505	0.5775399804115295
-88269065	chr18_80084281_T_C	ENSG00000101546	0.02202009968459606	0.9053729772567749	0.38642001152038574	0.9398699998855591
-88269069	chr18_80085391_C_T	ENSG00000101546	0.005079439841210842	0.8000400066375732	0.2763960063457489	0.9688500165939331
-88269391	chr18_80121805_T_G	ENSG00000101546	0.024224499240517616	0.6989679932594299	0.30333900451660156	0.9884600043296814
-165263799	chr18_80125440_G_C	ENSG00000101546	0.0010786299826577306	-0.7654820084571838	0.22427800297737122	0.9777299761772156
-88269641	chr18_80153262_A_G	ENSG00000101546	0.022971300408244133	0.7115330100059509	0.3059230148792267	0.843500018119812
-189974018	chr18_79861048_A_G	ENSG00000101546	0.021407900378108025	-0.405131995677948	0.17207899689674377	0.9432799816131592
-189974038	chr18_79863611_G_C	ENSG00000101546	0.02124899998307228	-0.40533900260925293	0.17194800078868866	0.9459999799728394
-189974060	chr18_79865652_A_G	ENSG00000101546	0.022696299478411674	-0.4093700051307678	0.17563900351524353	0.9261299967765808
-189974202	chr18_79875572_A_G	ENSG00000101546	0.03542789816856384	-0.4546479880809784	0.211899995803833	0.9528599977493286
-165262934	chr18_79887635_C_G	ENSG00000101546	0.04571409896016121	-0.7533379793167114	0.3702250123023987	0.6625900268554688
-165262940	chr18_79890637_G_A	ENSG00000101546	0.01577099971473217	-1.1103299856185913	0.4485589861869812	0.5202900171279907
-165262759	chr18_79835228_C_T	ENSG00000101546	0.02138659916818142	0.3833160102367401	0.16278499364852905	0.9941999912261963
-165263637	chr18_80087594_G_A	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445
-189968248	chr18_79061509_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165262741	chr18_79828847_C_T	ENSG00000101546	0.04667529836297035	-0.5667619705200195	0.2797999978065491	0.7946900129318237
-189968436	chr18_79082421_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968636	chr18_79109263_A_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968238	chr18_79060439_G_C	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968240	chr18_79060697_T_G	ENSG00000101546	0.032520901411771774	0.5555729866027832	0.2546209990978241	0.9988600015640259
-189968286	chr18_79068471_C_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968244	chr18_79060976_A_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-189968754	chr18_79125543_T_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-189968166	chr18_79053927_G_A	ENSG00000101546	0.026139799505472183	0.6242210268974304	0.2746169865131378	0.9758899807929993
-189968252	chr18_79062054_A_G	ENSG00000101546	0.032681599259376526	0.5641180276870728	0.2587839961051941	0.9772400259971619
-189968256	chr18_79062392_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968448	chr18_79083246_G_A	ENSG00000101546	0.02617580071091652	0.6233130097389221	0.2742860019207001	0.9903500080108643
-189968662	chr18_79113683_G_T	ENSG00000101546	0.027002299204468727	0.6210259795188904	0.27483001351356506	0.9549000263214111
-189968746	chr18_79125086_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-88264223	chr18_79432453_C_T	ENSG00000101546	0.024231500923633575	-0.4953480064868927	0.21498200297355652	0.9289799928665161
-88264277	chr18_79438540_C_T	ENSG00000101546	0.024143200367689133	-0.4953039884567261	0.21482500433921814	0.9282100200653076
-165261392	chr18_79476276_A_G	ENSG00000101546	0.038954898715019226	-0.429408997297287	0.20401600003242493	0.6355800032615662
-165263539	chr18_80062054_C_T	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768
-165263547	chr18_80063905_A_G	ENSG00000101546	0.0013559299986809492	0.6285849809646606	0.18821899592876434	0.9167699813842773
-165263550	chr18_80064850_C_G	ENSG00000101546	0.0012443000450730324	0.7275720238685608	0.21606799960136414	0.8892099857330322
-165263552	chr18_80064971_G_A	ENSG00000101546	0.0005819390062242746	0.7007129788398743	0.19427700340747833	0.886650025844574
-165263682	chr18_80096367_C_T	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.987529993057251
-165263683	chr18_80096368_A_G	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.987529993057251
-165263808	chr18_80127538_C_T	ENSG00000101546	0.0010717499535530806	-0.7658050060272217	0.22423900663852692	0.9778800010681152
-189976170	chr18_80144701_C_G	ENSG00000101546	0.004864959977567196	0.5091620087623596	0.17498500645160675	0.9397799968719482
-165263875	chr18_80144954_G_A	ENSG00000101546	5.636949936160818e-05	-0.6927289962768555	0.16135099530220032	0.9645299911499023
-189976362	chr18_80166015_C_T	ENSG00000101546	0.0459383986890316	0.5302850008010864	0.26088398694992065	0.837939977645874
-165264167	chr18_80246026_T_C	ENSG00000101546	0.03268430009484291	-0.8415319919586182	0.3860520124435425	0.4004400074481964
-165263672	chr18_80093640_A_G	ENSG00000101546	0.0007727540214546025	-0.6972600221633911	0.19816799461841583	0.9859099984169006
-189968620	chr18_79107061_G_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-165263601	chr18_80078362_C_T	ENSG00000101546	0.0008133020019158721	-0.7048460245132446	0.20124199986457825	0.9651399850845337
-189975314	chr18_80042297_C_T	ENSG00000101546	0.00031457399018108845	-0.5965999960899353	0.1572439968585968	0.9707499742507935
-189974208	chr18_79876176_C_T	ENSG00000101546	0.03181619942188263	-0.5941200256347656	0.2711380124092102	0.961329996585846
-189968650	chr18_79111477_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-88265706	chr18_79621378_GA_G	ENSG00000101546	0.048143498599529266	-0.4898659884929657	0.24349099397659302	0.9225599765777588
-88268495	chr18_80021254_G_C	ENSG00000101546	0.003772800089791417	0.5350610017776489	0.17845599353313446	0.9571999907493591
-189974210	chr18_79876303_G_C	ENSG00000101546	0.031777698546648026	-0.5941569805145264	0.2710919976234436	0.9615300297737122
-189968460	chr18_79084785_A_C	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-165263831	chr18_80131567_TTC_T	ENSG00000101546	0.0011604100000113249	-0.8025019764900208	0.23674499988555908	0.9274700284004211
-189969638	chr18_79245603_G_A	ENSG00000101546	0.03742780163884163	0.40794000029563904	0.19224099814891815	0.9494199752807617
-189968618	chr18_79106707_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-88270175	chr18_80257347_C_T	ENSG00000101546	0.047728899866342545	0.4663519859313965	0.2313610017299652	0.9160799980163574
-189974226	chr18_79878079_G_A	ENSG00000101546	0.022338099777698517	-0.638001024723053	0.2729789912700653	0.9185000061988831
-189969632	chr18_79245587_G_A	ENSG00000101546	0.03683289885520935	0.4116010069847107	0.19333800673484802	0.931659996509552
-189974300	chr18_79889662_G_T	ENSG00000101546	0.018403200432658195	-0.6812130212783813	0.2821100056171417	0.9209100008010864
-165261353	chr18_79464709_TA_T	ENSG00000101546	0.029605800285935402	-0.8919659852981567	0.4015290141105652	0.46327999234199524
-189968728	chr18_79123122_G_A	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183
-189968524	chr18_79094299_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189968512	chr18_79091898_T_C	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183
-189968188	chr18_79057520_G_A	ENSG00000101546	0.03240789845585823	0.5613129734992981	0.25707900524139404	0.9760100245475769
-189968390	chr18_79076757_C_T	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654
-189968472	chr18_79086013_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-88265783	chr18_79631156_CGTGT_C	ENSG00000101546	0.03570700064301491	-0.5140640139579773	0.23996800184249878	0.9148200154304504
-165263101	chr18_79954740_T_TTTTA	ENSG00000101546	0.015940500423312187	-0.4315820038318634	0.1746480017900467	0.9331099987030029
-88268493	chr18_80021182_CT_C	ENSG00000101546	0.009622779674828053	0.4900150001049042	0.18398800492286682	0.8669300079345703
-165263777	chr18_80120334_C_CT	ENSG00000101546	0.002584619913250208	-0.6125310063362122	0.1958789974451065	0.9440299868583679
-165263903	chr18_80152678_CTT_C	ENSG00000101546	0.006232670042663813	-0.5736100077629089	0.20327800512313843	0.9239500164985657
-165264172	chr18_80250390_CA_C	ENSG00000101546	0.02927589975297451	0.565858006477356	0.2541919946670532	0.4573499858379364
-165263513	chr18_80057487_A_ATTTCT	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853
-165262739	chr18_79827927_C_CTT	ENSG00000101546	0.011989600025117397	0.513247013092041	0.19887800514698029	0.6629599928855896
-165263132	chr18_79963052_AGCGTGCGTCAGC_A	ENSG00000101546	0.0020915500354021788	-0.8126299977302551	0.2541239857673645	0.8120999932289124
-165263343	chr18_80021993_C_CT	ENSG00000101546	3.1328301064448283e-10	1.086210012435913	0.1478710025548935	0.909089982509613
-165263673	chr18_80093675_C_CA	ENSG00000101546	0.0024812701158225536	0.6648129820823669	0.21166999638080597	0.6452299952507019
-165263984	chr18_80168912_T_TACAAATAAC	ENSG00000101546	0.008557089604437351	-0.6222079992294312	0.22987599670886993	0.9822800159454346
-165263666	chr18_80092310_T_C	ENSG00000101546	0.0007892749854363501	-0.7069770097732544	0.2013089954853058	0.9639000296592712
-189974598	chr18_79951964_T_C	ENSG00000101546	0.03788580000400543	-0.5122870206832886	0.24201099574565887	0.861240029335022
-165263914	chr18_80153258_A_G	ENSG00000101546	1.573410060018432e-07	0.9416090250015259	0.16131700575351715	0.9215499758720398
-189975262	chr18_80038449_TTGTC_T	ENSG00000101546	0.01789800077676773	-0.5947930216789246	0.24520400166511536	0.9567499756813049
-165263388	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023
-165263066	chr18_79946239_CAAAGAA_C	ENSG00000101546	0.018309399485588074	-0.41694799065589905	0.17252600193023682	0.8902300000190735
-189968596	chr18_79104611_TTATAA_T	ENSG00000101546	0.027988800778985023	0.617796003818512	0.2752099931240082	0.9817100167274475
-165263557	chr18_80066306_G_A	ENSG00000101546	1.681100002315361e-05	0.7509670257568359	0.16227400302886963	0.9999300241470337
-165263614	chr18_80083062_C_T	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934
-165263555	chr18_80065934_C_T	ENSG00000101546	2.165240039175842e-05	0.7394279837608337	0.162199005484581	0.9045000076293945
-165262764	chr18_79843283_T_G	ENSG00000101546	0.03241319954395294	-0.5894320011138916	0.2699649930000305	0.823419988155365
-165263046	chr18_79938967_C_T	ENSG00000101546	0.018794499337673187	-0.4103040099143982	0.1705079972743988	0.8488699793815613
-165263554	chr18_80065898_A_G	ENSG00000101546	0.0002628210058901459	0.780784010887146	0.20291300117969513	0.8837800025939941
-165263406	chr18_80035985_A_G	ENSG00000101546	0.0012013299856334925	0.7136030197143555	0.21121099591255188	0.9030900001525879
-165264054	chr18_80186452_C_T	ENSG00000101546	0.01209730003029108	-0.625154972076416	0.2425599992275238	0.9347000122070312
-88264567	chr18_79471307_C_T	ENSG00000101546	0.029840899631381035	-0.5340780019760132	0.24077999591827393	0.953029990196228
-165263186	chr18_79978025_C_T	ENSG00000101546	0.0026978300884366035	0.7515640258789062	0.24145400524139404	0.8339999914169312
-165263484	chr18_80051802_T_C	ENSG00000101546	2.150739965145476e-05	0.7579020261764526	0.16618500649929047	0.9473599791526794
-88267655	chr18_79882837_A_G	ENSG00000101546	0.04517349973320961	-0.6598359942436218	0.32343798875808716	0.7531599998474121
-189976654	chr18_80211932_G_T	ENSG00000101546	0.0024270599242299795	0.5798739790916443	0.1841920018196106	0.8251199722290039
-189969102	chr18_79167394_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-88264273	chr18_79438331_G_A	ENSG00000101546	0.02213910035789013	-0.5102289915084839	0.21797199547290802	0.8894799947738647
-189969106	chr18_79167714_G_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-165263041	chr18_79935384_T_A	ENSG00000101546	0.019308900460600853	-0.4078029990196228	0.17022700607776642	0.8508399724960327
-165263575	chr18_80070199_A_T	ENSG00000101546	7.044500094366413e-09	0.9839209914207458	0.14911000430583954	0.9588099718093872
-88264199	chr18_79429387_A_G	ENSG00000101546	0.022308100014925003	-0.5007789731025696	0.21421700716018677	0.9215999841690063
-165263760	chr18_80118197_G_A	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844
-88265769	chr18_79630317_G_A	ENSG00000101546	0.03580540046095848	-0.5124980211257935	0.2393690049648285	0.944350004196167
-189973898	chr18_79827644_G_C	ENSG00000101546	0.008066940121352673	-0.8298360109329224	0.3041520118713379	0.49950000643730164
-189969104	chr18_79167659_C_T	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969108	chr18_79167720_C_T	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304
-189969570	chr18_79233596_T_A	ENSG00000101546	0.003896069945767522	0.5369679927825928	0.1797579973936081	0.959089994430542
-189974620	chr18_79953983_C_A	ENSG00000101546	0.002398180076852441	-0.5623080134391785	0.17838600277900696	0.9387099742889404
-88265797	chr18_79632379_G_A	ENSG00000101546	0.03737270087003708	-0.4866830110549927	0.22927899658679962	0.9959099888801575
-88265711	chr18_79621710_A_G	ENSG00000101546	0.019354799762368202	-0.44100600481033325	0.1841599941253662	0.8976200222969055
-189976652	chr18_80211843_T_C	ENSG00000101546	0.0023437999188899994	0.5805349946022034	0.18372100591659546	0.8259299993515015
-165264097	chr18_80203646_A_G	ENSG00000101546	0.009295180439949036	-0.6584839820861816	0.24605600535869598	0.9172000288963318
-165264098	chr18_80203650_A_G	ENSG00000101546	0.009295180439949036	-0.6584839820861816	0.24605600535869598	0.9172000288963318
-165263206	chr18_79987542_T_C	ENSG00000101546	0.0025112999137490988	0.6745319962501526	0.21504099667072296	0.9982399940490723
-165264005	chr18_80174701_T_A	ENSG00000101546	4.0879299945117964e-07	0.875190019607544	0.1563500016927719	0.9762899875640869
-189970146	chr18_79351383_G_A	ENSG00000101546	0.042623601853847504	0.4559510052204132	0.22073499858379364	0.9135299921035767
-88264269	chr18_79438217_T_C	ENSG00000101546	0.023621300235390663	-0.4976469874382019	0.21501000225543976	0.9130399823188782
-165263134	chr18_79963052_AGCGTGCGTCAGC_A	ENSG00000101546	0.0020915500354021788	-0.8126299977302551	0.2541239857673645	0.8120999932289124
-165264143	chr18_80219369_A_C	ENSG00000101546	0.03919349983334541	-0.4473710060119629	0.2128179967403412	0.8657600283622742
-189973974	chr18_79851617_AGTGT_A	ENSG00000101546	0.025087300688028336	0.3987250030040741	0.1741199940443039	0.9344800114631653
-165263587	chr18_80074824_G_A	ENSG00000101546	3.7309499020921066e-05	-0.7325019836425781	0.16614800691604614	0.9672099947929382
-165263448	chr18_80043307_A_G	ENSG00000101546	2.20331003442098e-10	1.0803500413894653	0.14541299641132355	0.9572799801826477
-165263944	chr18_80158531_G_C	ENSG00000101546	0.005793530028313398	-0.6423699855804443	0.22555799782276154	0.9906899929046631
-165263067	chr18_79946294_A_G	ENSG00000101546	0.01889999955892563	-0.4143739938735962	0.17235800623893738	0.8961300253868103
-165263975	chr18_80167181_G_A	ENSG00000101546	3.898709906025033e-07	0.8648849725723267	0.15418000519275665	0.9767900109291077
-165263411	chr18_80037884_A_G	ENSG00000101546	0.001214809948578477	0.7135249972343445	0.2114119976758957	0.9020400047302246
-88264427	chr18_79457030_A_C	ENSG00000101546	0.03691809996962547	-0.5180060267448425	0.24343299865722656	0.9432100057601929
-165263486	chr18_80052364_A_G	ENSG00000101546	0.0016547499690204859	0.6155650019645691	0.18796400725841522	0.9381800293922424
-165261358	chr18_79465912_C_T	ENSG00000101546	0.02870820090174675	-0.5849969983100891	0.26183000206947327	0.8852999806404114
-189969604	chr18_79238146_T_C	ENSG00000101546	0.004182090051472187	0.5143020153045654	0.1735980063676834	0.9996399879455566
-165263838	chr18_80131943_G_C	ENSG00000101546	1.9416999919030786e-07	0.8951709866523743	0.15475299954414368	0.9697099924087524
-189975526	chr18_80064887_G_A	ENSG00000101546	0.009675689972937107	-0.7751269936561584	0.29126301407814026	0.7470200061798096
-88264215	chr18_79431849_T_C	ENSG00000101546	0.041228998452425	-0.3853529989719391	0.18525399267673492	0.8892800211906433
-165263665	chr18_80092087_A_G	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-165263994	chr18_80171165_C_T	ENSG00000101546	1.2719800679406035e-07	0.9270600080490112	0.15739800035953522	0.8776699900627136
-88264365	chr18_79449568_G_C	ENSG00000101546	0.020163800567388535	-0.444242000579834	0.1867849975824356	0.8618299961090088
-165262763	chr18_79843270_A_T	ENSG00000101546	0.03241319954395294	-0.5894320011138916	0.2699649930000305	0.823419988155365
-165263663	chr18_80091967_G_A	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-165263946	chr18_80158682_T_C	ENSG00000101546	0.0020898899529129267	-0.727869987487793	0.22759899497032166	0.9733700156211853
-88267653	chr18_79882807_A_G	ENSG00000101546	0.022010400891304016	-0.7396429777145386	0.3156619966030121	0.7248200178146362
-189974814	chr18_79982916_G_A	ENSG00000101546	0.030908800661563873	-0.5448430180549622	0.24727599322795868	0.805429995059967
-88269095	chr18_80088115_T_A	ENSG00000101546	0.01055390015244484	0.8436859846115112	0.32093799114227295	0.968999981880188
-165263912	chr18_80153217_T_A	ENSG00000101546	0.0004090899892617017	0.6742309927940369	0.18150100111961365	0.901669979095459
-165263543	chr18_80062285_A_G	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768
-189975378	chr18_80048971_T_C	ENSG00000101546	0.018202299252152443	-0.5972369909286499	0.24688899517059326	0.9101099967956543
-189974846	chr18_79988972_C_T	ENSG00000101546	0.019115999341011047	-0.5966410040855408	0.24863900244235992	0.8116300106048584
-189974938	chr18_80003613_T_C	ENSG00000101546	0.016826199367642403	-0.6356809735298157	0.259460985660553	0.8081899881362915
-165263268	chr18_80005392_T_C	ENSG00000101546	2.779080077175422e-08	0.9950469732284546	0.15883100032806396	0.850350022315979
-165263297	chr18_80011351_G_A	ENSG00000101546	9.517710175543925e-09	0.9896969795227051	0.1516599953174591	0.9080299735069275
-189975100	chr18_80020580_T_C	ENSG00000101546	0.01519010029733181	-0.6198329925537109	0.2489359974861145	0.9007200002670288
-88268491	chr18_80021174_G_A	ENSG00000101546	0.003772800089791417	0.5350610017776489	0.17845599353313446	0.9571999907493591
-165263360	chr18_80026810_G_A	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414
-165263385	chr18_80033240_C_A	ENSG00000101546	2.1558900498153122e-10	1.0828800201416016	0.14565299451351166	0.9521600008010864
-165263425	chr18_80039913_T_C	ENSG00000101546	7.270180013563277e-09	0.9866189956665039	0.14969100058078766	0.951770007610321
-189975322	chr18_80043710_A_G	ENSG00000101546	0.012630400247871876	-0.575357973575592	0.22466899454593658	0.9760000109672546
-165263465	chr18_80047137_T_G	ENSG00000101546	7.452690020670616e-09	0.9856410026550293	0.1496790051460266	0.9543899893760681
-165263466	chr18_80047211_C_T	ENSG00000101546	2.5229899620171636e-05	0.7453060150146484	0.16500599682331085	0.9468700289726257
-165263467	chr18_80047228_C_A	ENSG00000101546	7.452690020670616e-09	0.9856410026550293	0.1496790051460266	0.9543899893760681
-165263505	chr18_80055624_C_A	ENSG00000101546	7.168019955372529e-09	0.9857140183448792	0.1494770050048828	0.9486100077629089
-189975446	chr18_80057172_T_C	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189975488	chr18_80060400_G_A	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189975568	chr18_80069030_G_A	ENSG00000101546	0.02678219974040985	-0.5403760075569153	0.23878200352191925	0.9691299796104431
-165263573	chr18_80069379_T_C	ENSG00000101546	7.280910097051674e-09	0.9854159951210022	0.1495169997215271	0.9567599892616272
-189975584	chr18_80070744_G_C	ENSG00000101546	0.01796709932386875	-0.5397830009460449	0.2226649969816208	0.9735100269317627
-189975600	chr18_80074856_A_G	ENSG00000101546	0.03164549916982651	0.5214740037918091	0.23773899674415588	0.8784000277519226
-189975606	chr18_80076073_A_G	ENSG00000101546	0.020625999197363853	0.5374929904937744	0.22685900330543518	0.876550018787384
-189975628	chr18_80078454_T_G	ENSG00000101546	0.03117999993264675	0.5333920121192932	0.2424830049276352	0.8693699836730957
-165263630	chr18_80085528_G_T	ENSG00000101546	8.22564985014651e-08	0.9263049960136414	0.15443600714206696	0.9346399903297424
-165263633	chr18_80086500_C_T	ENSG00000101546	8.22564985014651e-08	0.9263049960136414	0.15443600714206696	0.9346399903297424
-165263664	chr18_80091978_G_A	ENSG00000101546	8.013550001351177e-08	0.929377019405365	0.1547819972038269	0.9317299723625183
-165263712	chr18_80104201_C_G	ENSG00000101546	4.17866985458204e-08	0.9344689846038818	0.15158000588417053	0.9470599889755249
-165263735	chr18_80111862_T_C	ENSG00000101546	1.3600100601252052e-07	0.8892989754676819	0.15141400694847107	0.9823700189590454
-165263750	chr18_80116331_A_G	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844
-165263804	chr18_80126368_G_A	ENSG00000101546	1.299259935194641e-07	0.8888170123100281	0.1510400027036667	0.9825599789619446
-165263845	chr18_80134056_A_C	ENSG00000101546	1.196400063463443e-07	0.8913260102272034	0.15094099938869476	0.9764299988746643
-165263866	chr18_80141590_A_G	ENSG00000101546	1.0253800297732596e-07	0.8969330191612244	0.15091200172901154	0.9724199771881104
-165263877	chr18_80145205_C_T	ENSG00000101546	1.030799978707364e-07	0.8969759941101074	0.1509529948234558	0.9716799855232239
-165263880	chr18_80146580_A_C	ENSG00000101546	1.2113800096358318e-07	0.8967229723930359	0.15193399786949158	0.9718499779701233
-165263888	chr18_80147982_C_T	ENSG00000101546	1.6655999957038148e-07	0.8971120119094849	0.15406900644302368	0.9694300293922424
-165263927	chr18_80153729_G_T	ENSG00000101546	1.578760020493064e-07	0.8853369951248169	0.1516990065574646	0.9564899802207947
-165263985	chr18_80168979_G_A	ENSG00000101546	3.8265400803538796e-07	0.8572790026664734	0.15269599854946136	0.984279990196228
-189974154	chr18_79870170_G_T	ENSG00000101546	0.01646539941430092	0.4279389977455139	0.1740649938583374	0.9452700018882751
-189974166	chr18_79871679_A_C	ENSG00000101546	0.016604699194431305	0.4271480143070221	0.17397700250148773	0.9468200206756592
-189974170	chr18_79872194_G_A	ENSG00000101546	0.016499700024724007	0.4275279939174652	0.17395499348640442	0.9465799927711487
-165264103	chr18_80208742_A_T	ENSG00000101546	5.064509878138779e-07	0.9348869919776917	0.16864599287509918	0.8584799766540527
-165264106	chr18_80209128_A_C	ENSG00000101546	4.939919904245471e-07	0.9450749754905701	0.1702899932861328	0.8296399712562561
-165264150	chr18_80223941_C_T	ENSG00000101546	3.5571400047729185e-08	1.532920002937317	0.2470719963312149	0.4260900020599365
-165264176	chr18_80254580_G_A	ENSG00000101546	8.53054018534749e-07	1.389780044555664	0.25684499740600586	0.4189999997615814
-189974426	chr18_79918240_C_T	ENSG00000101546	0.01804959960281849	-0.7147060036659241	0.2950429916381836	0.799589991569519
-189974480	chr18_79932917_T_C	ENSG00000101546	0.017002400010824203	-0.7211369872093201	0.2948319911956787	0.8111900091171265
-189974536	chr18_79942991_G_A	ENSG00000101546	0.02251330018043518	-0.6474800109863281	0.27741000056266785	0.8582000136375427
-189974550	chr18_79945632_G_C	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203
-189974552	chr18_79946197_C_G	ENSG00000101546	0.03594899922609329	-0.5206760168075562	0.2433830052614212	0.8616300225257874
-189974584	chr18_79950618_C_T	ENSG00000101546	0.02531309984624386	-0.626285970211029	0.273934006690979	0.8651599884033203
-189974622	chr18_79954138_G_A	ENSG00000101546	0.022005900740623474	-0.6418160200119019	0.2739019989967346	0.8555899858474731
-88268057	chr18_79960926_T_C	ENSG00000101546	0.03060219995677471	-0.7474160194396973	0.3385699987411499	0.7858700156211853
-165263171	chr18_79971952_C_T	ENSG00000101546	2.642840081534814e-05	0.7713630199432373	0.17125900089740753	0.9087100028991699
-189968862	chr18_79138984_C_T	ENSG00000101546	0.026828600093722343	0.6198970079421997	0.27400699257850647	0.9918100237846375
-189968956	chr18_79151138_C_G	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-189968958	chr18_79151359_T_C	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-189969022	chr18_79157788_G_A	ENSG00000101546	0.03309540078043938	0.5585179924964905	0.2568430006504059	0.9835399985313416
-189969032	chr18_79159493_C_T	ENSG00000101546	0.026304300874471664	0.6227669715881348	0.27428901195526123	0.9825800061225891
-189969048	chr18_79161065_C_T	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847000241279602
-189969052	chr18_79161323_C_G	ENSG00000101546	0.026357999071478844	0.6221020221710205	0.2740980088710785	0.987559974193573
-189969068	chr18_79163528_G_A	ENSG00000101546	0.026211999356746674	0.6285030245780945	0.27663901448249817	0.970990002155304
-189969078	chr18_79164189_A_T	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969084	chr18_79164957_T_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969086	chr18_79165604_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969088	chr18_79165660_G_A	ENSG00000101546	0.03397589921951294	0.5615339875221252	0.2595599889755249	0.9642500281333923
-189969090	chr18_79166226_G_C	ENSG00000101546	0.02625720016658306	0.6304360032081604	0.2775759994983673	0.9618899822235107
-189969092	chr18_79166811_C_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969094	chr18_79166834_A_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969124	chr18_79168884_C_T	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969130	chr18_79169274_A_G	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304
-189969166	chr18_79173300_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969182	chr18_79174122_A_G	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969184	chr18_79174379_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943
-189969198	chr18_79175825_C_T	ENSG00000101546	0.02602200023829937	0.6326929926872253	0.27811700105667114	0.9521499872207642
-189969200	chr18_79175828_A_C	ENSG00000101546	0.033622100949287415	0.5630710124969482	0.25973600149154663	0.9513099789619446
-189969226	chr18_79181087_G_T	ENSG00000101546	0.025193700566887856	0.6350740194320679	0.27754199504852295	0.957319974899292
-189969252	chr18_79183371_A_C	ENSG00000101546	0.025193700566887856	0.6350740194320679	0.27754199504852295	0.957319974899292
-189969354	chr18_79190903_T_A	ENSG00000101546	0.02895589917898178	0.6377649903297424	0.28590500354766846	0.9197400212287903
-189968328	chr18_79071087_G_C	ENSG00000101546	0.02618280053138733	0.6232709884643555	0.27428001165390015	0.9907600283622742
-189968528	chr18_79095236_G_A	ENSG00000101546	0.03627309948205948	0.6376929879188538	0.29861700534820557	0.9447000026702881
-189969552	chr18_79227492_A_G	ENSG00000101546	0.04375910013914108	0.4694570004940033	0.22854900360107422	0.9157000184059143
-165261260	chr18_79445023_G_A	ENSG00000101546	0.014688899740576744	1.1767200231552124	0.4701380133628845	0.6274099946022034
-165261287	chr18_79452989_G_T	ENSG00000101546	0.011877600103616714	1.1912399530410767	0.46095898747444153	0.6495299935340881
-189968774	chr18_79129448_G_T	ENSG00000101546	0.03430910035967827	-0.8093069791793823	0.37480801343917847	0.9810799956321716
-88269083	chr18_80087134_A_G	ENSG00000101546	0.01055390015244484	0.8436859846115112	0.32093799114227295	0.9689499735832214
-189974346	chr18_79900015_T_C	ENSG00000101546	0.03645030036568642	-0.6774500012397766	0.31754499673843384	0.736270010471344
-189974508	chr18_79936389_T_C	ENSG00000101546	0.017986800521612167	-0.7101179957389832	0.2929820120334625	0.8177199959754944
-189974510	chr18_79936394_T_C	ENSG00000101546	0.017986800521612167	-0.7101179957389832	0.2929820120334625	0.8177199959754944
-88269257	chr18_80109111_C_T	ENSG00000101546	0.024308200925588608	0.6991260051727295	0.3035930097103119	0.9881500005722046
-189969640	chr18_79245626_G_C	ENSG00000101546	0.036264099180698395	0.4151270091533661	0.19438500702381134	0.9500399827957153
-165263892	chr18_80150025_T_C	ENSG00000101546	9.766570292413235e-05	-0.6717050075531006	0.16235899925231934	0.973580002784729
-165263868	chr18_80142946_A_G	ENSG00000101546	0.0010755800176411867	-0.7504820227622986	0.21982499957084656	0.9998999834060669
-165263795	chr18_80124152_G_A	ENSG00000101546	0.0010703200241550803	-0.7656580209732056	0.22416700422763824	0.9782299995422363
-165263796	chr18_80124184_T_C	ENSG00000101546	0.0010569100268185139	-0.7661370038986206	0.22404399514198303	0.9767400026321411
-165261405	chr18_79478226_T_C	ENSG00000101546	0.005422110203653574	-0.592818021774292	0.20645199716091156	0.620389997959137
-165261393	chr18_79476279_G_A	ENSG00000101546	0.0281125009059906	-0.49430298805236816	0.22037699818611145	0.6396200060844421
-165261394	chr18_79476299_G_A	ENSG00000101546	0.02704709954559803	-0.4985499978065491	0.22069600224494934	0.638189971446991
-165263906	chr18_80152678_CTTTT_C	ENSG00000101546	1.8839300253148394e-07	0.8988940119743347	0.1551939994096756	0.9596899747848511
-165262241	chr18_79682538_G_A	ENSG00000101546	0.02608090080320835	1.0410100221633911	0.45778998732566833	0.5468000173568726
-189975504	chr18_80062213_TG_T	ENSG00000101546	0.012708200141787529	-0.5767030119895935	0.22540099918842316	0.9361000061035156
-88264573	chr18_79472698_C_T	ENSG00000101546	0.029933199286460876	-0.5349820256233215	0.24132800102233887	0.9493299722671509
-165263678	chr18_80094146_CACAG_C	ENSG00000101546	9.348160290301166e-08	0.9973589777946472	0.16716499626636505	0.8185300230979919
-189969158	chr18_79172193_C_G	ENSG00000101546	0.04756399989128113	0.6673650145530701	0.33083298802375793	0.6532800197601318
-165263905	chr18_80152678_CTTTT_C	ENSG00000101546	1.8839300253148394e-07	0.8988940119743347	0.1551939994096756	0.9596899747848511
-189968342	chr18_79071897_T_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-189968819	chr18_79133508_A_AAC	ENSG00000101546	0.04565830156207085	0.559283971786499	0.27478501200675964	0.7888799905776978
-165263387	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023
-189969424	chr18_79202586_T_C	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646
-189974172	chr18_79872229_C_CAAA	ENSG00000101546	0.0453278012573719	0.3888939917087555	0.1907690018415451	0.863610029220581
-189968346	chr18_79071906_TG_T	ENSG00000101546	0.027973199263215065	0.6197720170021057	0.27606201171875	0.9166300296783447
-165263410	chr18_80037321_C_T	ENSG00000101546	0.0012013299856334925	0.7136030197143555	0.21121099591255188	0.9030900001525879
-88267565	chr18_79872891_C_G	ENSG00000101546	0.03573310002684593	-0.9392750263214111	0.43852201104164124	0.6782500147819519
-88264553	chr18_79469409_C_G	ENSG00000101546	0.030011000111699104	-0.5333290100097656	0.24070000648498535	0.956309974193573
-88264329	chr18_79444477_T_C	ENSG00000101546	0.044089701026678085	-0.5171549916267395	0.25217700004577637	0.887440025806427
-165263162	chr18_79969549_T_C	ENSG00000101546	0.0035614699590951204	0.6765509843826294	0.2241619974374771	0.8575199842453003
-165264175	chr18_80254366_G_A	ENSG00000101546	7.737850182820694e-07	1.3849200010299683	0.2547749876976013	0.41881000995635986
-189969433	chr18_79206623_C_CATAA	ENSG00000101546	0.02459779940545559	0.5034890174865723	0.21909800171852112	0.6862199902534485
-189968700	chr18_79118383_C_T	ENSG00000101546	0.006744119804352522	0.7905949950218201	0.28301799297332764	0.8611500263214111
-189969992	chr18_79326649_G_A	ENSG00000101546	0.026566000655293465	-0.9029719829559326	0.39841699600219727	0.8937199711799622
-165263348	chr18_80024187_T_TA	ENSG00000101546	9.365420439166883e-09	0.9901210069656372	0.15163399279117584	0.9103400111198425
-189974760	chr18_79970600_A_G	ENSG00000101546	0.020918600261211395	-0.6234570145606995	0.2637709975242615	0.7880399823188782
-88264018	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267
-189969620	chr18_79243516_A_G	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940800070762634
-189968904	chr18_79145077_C_CGGG	ENSG00000101546	0.019698500633239746	0.9430649876594543	0.3949719965457916	0.7448899745941162
-189969648	chr18_79247755_A_G	ENSG00000101546	0.03011780045926571	-0.8174859881401062	0.3691929876804352	0.9952499866485596
-165263814	chr18_80129105_G_GT	ENSG00000101546	0.0003587440005503595	-0.8434470295906067	0.22464700043201447	0.935259997844696
-189974704	chr18_79964637_C_A	ENSG00000101546	0.03462810069322586	-0.5157999992370605	0.239315003156662	0.7733299732208252
-165261427	chr18_79487117_C_T	ENSG00000101546	0.001169090042822063	1.1296800374984741	0.3334999978542328	0.5028600096702576
-189969902	chr18_79304041_C_T	ENSG00000101546	0.035376500338315964	-0.8260939717292786	0.3849110007286072	0.9374399781227112
-88264157	chr18_79425287_T_G	ENSG00000101546	0.04636019840836525	-0.3968670070171356	0.19563600420951843	0.7454599738121033
-165261240	chr18_79439322_C_T	ENSG00000101546	0.025505399331450462	1.1031999588012695	0.48319000005722046	0.6258299946784973
-165264078	chr18_80196890_TAA_T	ENSG00000101546	0.03214230015873909	-0.4360960125923157	0.199412003159523	0.7321599721908569
-165263219	chr18_79991107_CAA_C	ENSG00000101546	4.226340024615638e-05	0.8044869899749756	0.18392400443553925	0.7601000070571899
-189969528	chr18_79221928_TAA_T	ENSG00000101546	0.03211839869618416	-0.8195649981498718	0.3747060000896454	0.9770600199699402
-165263776	chr18_80120334_C_CT	ENSG00000101546	0.002584619913250208	-0.6125310063362122	0.1958789974451065	0.9440299868583679
-189969740	chr18_79264960_T_C	ENSG00000101546	0.02921850048005581	-0.8332149982452393	0.37415599822998047	0.9723899960517883
-189976215	chr18_80151832_T_TAA	ENSG00000101546	3.0354101454577176e-08	1.647570013999939	0.26389798521995544	0.4377500116825104
-189970532	chr18_79385700_C_T	ENSG00000101546	0.029550699517130852	-0.9878489971160889	0.4445360004901886	0.7541800141334534
-189968347	chr18_79071906_TG_T	ENSG00000101546	0.027973199263215065	0.6197720170021057	0.27606201171875	0.9166300296783447
-189975305	chr18_80041735_CT_C	ENSG00000101546	0.00028746199677698314	-0.600579023361206	0.15717299282550812	0.9647600054740906
-189969910	chr18_79306147_T_C	ENSG00000101546	0.035376500338315964	-0.8260939717292786	0.3849110007286072	0.9374399781227112
-88263701	chr18_79369532_CAA_C	ENSG00000101546	0.04803730174899101	-1.0487899780273438	0.5210549831390381	0.6834999918937683
-189974596	chr18_79951388_G_A	ENSG00000101546	0.02521420083940029	-0.6268860101699829	0.2740040123462677	0.8650599718093872
-165263438	chr18_80041720_CTTT_C	ENSG00000101546	0.0012789099710062146	0.713791012763977	0.21253199875354767	0.9042900204658508
-165260696	chr18_79282195_C_T	ENSG00000101546	0.03759080171585083	-1.0327500104904175	0.4871099889278412	0.6486499905586243
-189969300	chr18_79187171_T_C	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646
-189969706	chr18_79260195_C_T	ENSG00000101546	0.04540269821882248	-0.8871849775314331	0.4353579878807068	0.9621999859809875
-165264034	chr18_80179223_A_AT	ENSG00000101546	5.437000254460145e-07	0.8975480198860168	0.16243700683116913	0.9192799925804138
-165263151	chr18_79967147_CA_C	ENSG00000101546	0.004885829985141754	0.6611229777336121	0.22732800245285034	0.7614399790763855
-189969527	chr18_79221928_TA_T	ENSG00000101546	0.004411329980939627	0.5199660062789917	0.17661799490451813	0.94691002368927
-88264591	chr18_79476006_T_C	ENSG00000101546	0.030385300517082214	-0.5334050059318542	0.24130000174045563	0.941540002822876
-88264505	chr18_79464429_G_A	ENSG00000101546	0.03677560016512871	-0.5191329717636108	0.2437720000743866	0.9442300200462341
-189974676	chr18_79961494_CT_C	ENSG00000101546	0.0010634800419211388	0.6191359758377075	0.18116100132465363	0.8721699714660645
-165263435	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238
-189969026	chr18_79158134_C_T	ENSG00000101546	0.030845800414681435	-0.8117179870605469	0.3682529926300049	0.9889600276947021
-189969341	chr18_79190511_T_TACACAC	ENSG00000101546	0.008170249871909618	0.7961120009422302	0.29229000210762024	0.6411299705505371
-189974487	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834
-189969982	chr18_79323998_G_C	ENSG00000101546	0.03304329887032509	-0.8546680212020874	0.39291200041770935	0.9000399708747864
-189969798	chr18_79278582_G_A	ENSG00000101546	0.029738599434494972	-0.8309569954872131	0.37438100576400757	0.9692699909210205
-189974740	chr18_79968715_C_T	ENSG00000101546	0.021641800180077553	-0.6214669942855835	0.2644580006599426	0.7712399959564209
-88264192	chr18_79429220_CAA_C	ENSG00000101546	0.04382459819316864	-0.45905399322509766	0.22355599701404572	0.846310019493103
-189969684	chr18_79256318_C_T	ENSG00000101546	0.03011780045926571	-0.8174859881401062	0.3691929876804352	0.9952499866485596
-189970182	chr18_79354912_G_A	ENSG00000101546	0.04338959977030754	0.4545440077781677	0.22088900208473206	0.9137099981307983
-189969340	chr18_79190511_T_TACACAC	ENSG00000101546	0.008170249871909618	0.7961120009422302	0.29229000210762024	0.6411299705505371
-165263835	chr18_80131569_CTT_C	ENSG00000101546	1.2384700198708742e-07	0.8924009799957275	0.15134300291538239	0.9730899930000305
-189969580	chr18_79234782_G_A	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940699934959412
-189968344	chr18_79071901_T_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261
-189974366	chr18_79907334_G_GTT	ENSG00000101546	0.0016344500472769141	0.683821976184845	0.20854899287223816	0.7303400039672852
-189974774	chr18_79973296_A_AC	ENSG00000101546	0.01814259961247444	-0.6509069800376892	0.26893100142478943	0.7876999974250793
-189974042	chr18_79864450_G_T	ENSG00000101546	0.04978540167212486	-0.3477100133895874	0.174126997590065	0.9513499736785889
-189968215	chr18_79058693_CAA_C	ENSG00000101546	0.026237700134515762	0.6261829733848572	0.2756670117378235	0.9628499746322632
-189969572	chr18_79234363_T_C	ENSG00000101546	0.030060099437832832	-0.8153769969940186	0.36810699105262756	0.9937400221824646
-165261213	chr18_79434497_C_T	ENSG00000101546	0.027447599917650223	-0.7925699949264526	0.35179901123046875	0.7452399730682373
-189970080	chr18_79343488_A_G	ENSG00000101546	0.025313900783658028	-0.9277070164680481	0.4057759940624237	0.8686699867248535
-189969896	chr18_79301876_A_G	ENSG00000101546	0.028195800259709358	-0.8757619857788086	0.39065900444984436	0.9383000135421753
-189969147	chr18_79171878_G_GTT	ENSG00000101546	0.028650900349020958	-0.8239669799804688	0.36864998936653137	0.926010012626648
-189969950	chr18_79314942_A_G	ENSG00000101546	0.03304329887032509	-0.8546680212020874	0.39291200041770935	0.9000399708747864
-189974052	chr18_79864972_G_GGTGCTGAGAGGTCTGT	ENSG00000101546	0.01172959990799427	0.46544700860977173	0.17977699637413025	0.8596000075340271
-165262320	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449
-189969558	chr18_79229675_T_G	ENSG00000101546	0.030060099437832832	-0.8153769969940186	0.36810699105262756	0.9937400221824646
-189969345	chr18_79190543_CACATAT_C	ENSG00000101546	0.032207898795604706	-0.8075429797172546	0.3694080114364624	0.8842599987983704
-88264421	chr18_79456756_G_A	ENSG00000101546	0.03703920170664787	-0.5177099704742432	0.2434539943933487	0.9455299973487854
-189974475	chr18_79932475_A_AAAAG	ENSG00000101546	0.015355500392615795	-0.7255340218544006	0.2918809950351715	0.8104000091552734
-88269434	chr18_80129095_CTTTTTTTTTGT_C	ENSG00000101546	0.024507999420166016	0.7027459740638733	0.30560898780822754	0.9831100106239319
-165263902	chr18_80152678_CTT_C	ENSG00000101546	0.006232670042663813	-0.5736100077629089	0.20327800512313843	0.9239500164985657
-165263424	chr18_80039768_T_C	ENSG00000101546	7.270180013563277e-09	0.9866189956665039	0.14969100058078766	0.951770007610321
-189975472	chr18_80059315_G_A	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976
-189968674	chr18_79116922_TA_T	ENSG00000101546	0.04038659855723381	-0.7535989880561829	0.3607249855995178	0.575980007648468
-88268595	chr18_80033957_ACCTCGCGCCAGTCTTCGCCCCGCCCATTCACCGCCCG_A	ENSG00000101546	0.003214519936591387	0.5541219711303711	0.18148699402809143	0.9526399970054626
-88264565	chr18_79470822_G_A	ENSG00000101546	0.029840899631381035	-0.5340780019760132	0.24077999591827393	0.953029990196228
-189969372	chr18_79194476_T_A	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646
-189975280	chr18_80040697_T_A	ENSG00000101546	0.012147700414061546	-0.5820279717445374	0.2259649932384491	0.9689300060272217
-189970280	chr18_79366193_G_A	ENSG00000101546	0.024874800816178322	-0.9352800250053406	0.4078100025653839	0.8464999794960022
-88264557	chr18_79469738_G_A	ENSG00000101546	0.02866319939494133	-0.5374559760093689	0.24048100411891937	0.9534800052642822
-88264489	chr18_79463322_G_A	ENSG00000101546	0.039069898426532745	-0.5131530165672302	0.24395200610160828	0.9422299861907959
-189974854	chr18_79989942_G_A	ENSG00000101546	0.01678840070962906	-0.6368399858474731	0.2598400115966797	0.8073300123214722
-189968466	chr18_79085432_G_C	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9400799870491028
-189974604	chr18_79952148_G_C	ENSG00000101546	0.04254880174994469	-0.5400630235671997	0.26135799288749695	0.8537600040435791
-189969140	chr18_79171046_C_G	ENSG00000101546	0.03221280127763748	-0.8171060085296631	0.37379398941993713	0.9908400177955627
-88267717	chr18_79896625_G_A	ENSG00000101546	0.0034671800676733255	1.4117100238800049	0.4663209915161133	0.5471199750900269
-189969574	chr18_79234556_G_A	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940699934959412
-189970530	chr18_79385563_G_A	ENSG00000101546	0.02903839945793152	-0.9858199954032898	0.44217100739479065	0.7318599820137024
-189970134	chr18_79350645_T_C	ENSG00000101546	0.024216100573539734	-0.9169840216636658	0.39792901277542114	0.8608899712562561
-189974234	chr18_79879482_AC_A	ENSG00000101546	0.029288699850440025	-0.6117449998855591	0.2748279869556427	0.9521300196647644
-189968853	chr18_79138774_TA_T	ENSG00000101546	0.031318701803684235	-0.8162350058555603	0.3713800013065338	0.9262400269508362
-88265705	chr18_79621378_GA_G	ENSG00000101546	0.048143498599529266	-0.4898659884929657	0.24349099397659302	0.9225599765777588
-165263104	chr18_79955231_TA_T	ENSG00000101546	0.01798349991440773	-0.413085013628006	0.17042699456214905	0.9349200129508972
-165263983	chr18_80168573_TTG_T	ENSG00000101546	1.3762099797531846e-06	0.863614022731781	0.16330400109291077	0.8400200009346008
-88264607	chr18_79477142_G_A	ENSG00000101546	0.03042300045490265	-0.5328919887542725	0.24112500250339508	0.9447100162506104
-165262757	chr18_79833034_CT_C	ENSG00000101546	0.022035999223589897	0.3914470076560974	0.16709299385547638	0.952210009098053
-189968216	chr18_79058693_CAA_C	ENSG00000101546	0.026237700134515762	0.6261829733848572	0.2756670117378235	0.9628499746322632
-165263536	chr18_80061354_GT_G	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768
-189974489	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834
-189974261	chr18_79882394_GA_G	ENSG00000101546	0.028648799285292625	0.3878380060195923	0.17351900041103363	0.9393600225448608
-165262658	chr18_79782606_AC_A	ENSG00000101546	0.044745299965143204	-0.3916890025138855	0.19160400331020355	0.5842300057411194
-88268278	chr18_79993320_TA_T	ENSG00000101546	0.0006915549747645855	0.5959029793739319	0.16770799458026886	0.8548300266265869
-88269316	chr18_80116512_TC_T	ENSG00000101546	0.024279000237584114	0.6988750100135803	0.30341899394989014	0.9890599846839905
-189970096	chr18_79347957_G_A	ENSG00000101546	0.02423040010035038	-0.9164440035820007	0.3977360129356384	0.8612099885940552
-165263181	chr18_79976966_AT_A	ENSG00000101546	0.0034992999862879515	0.6780070066452026	0.22419500350952148	0.8539800047874451
-165263263	chr18_80004129_TA_T	ENSG00000101546	0.00520892022177577	0.6606469750404358	0.22894099354743958	0.8338599801063538
-165263959	chr18_80163448_CAG_C	ENSG00000101546	0.00013008899986743927	-0.6530699729919434	0.1610729992389679	0.951449990272522
-88269476	chr18_80131569_CT_C	ENSG00000101546	0.026396099478006363	0.6945620179176331	0.30610400438308716	0.9568700194358826
-165263470	chr18_80047699_GA_G	ENSG00000101546	0.0013542500091716647	0.7053020000457764	0.21116599440574646	0.9127600193023682
-165263152	chr18_79967147_CA_C	ENSG00000101546	0.004885829985141754	0.6611229777336121	0.22732800245285034	0.7614399790763855
-165264161	chr18_80239256_GA_G	ENSG00000101546	2.102699909301009e-06	1.3618099689483643	0.2629530131816864	0.4129500091075897
-88264170	chr18_79426301_GA_G	ENSG00000101546	0.04710569977760315	-0.4361859858036041	0.21577100455760956	0.8364800214767456
-165262769	chr18_79846478_CAT_C	ENSG00000101546	0.02139969915151596	0.3941349983215332	0.16739700734615326	0.9439200162887573
-88264241	chr18_79435355_T_TGTTG	ENSG00000101546	0.024304399266839027	-0.49570098519325256	0.21525000035762787	0.9309700131416321
-189975306	chr18_80041735_CT_C	ENSG00000101546	0.00028746199677698314	-0.600579023361206	0.15717299282550812	0.9647600054740906
-165263770	chr18_80119413_CA_C	ENSG00000101546	2.673410108400276e-06	0.7768129706382751	0.15182499587535858	0.9588199853897095
-189968571	chr18_79101946_AT_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779
-189970040	chr18_79335323_T_A	ENSG00000101546	0.024308599531650543	-0.9125999808311462	0.3962939977645874	0.8648800253868103
-189969886	chr18_79295598_T_C	ENSG00000101546	0.027284400537610054	-0.8622180223464966	0.38229501247406006	0.936680018901825
-189970276	chr18_79365978_G_A	ENSG00000101546	0.024874800816178322	-0.9352800250053406	0.4078100025653839	0.8464999794960022
-165261149	chr18_79421003_G_A	ENSG00000101546	0.018156299367547035	-0.8786090016365051	0.3630540072917938	0.6575899720191956
-165263194	chr18_79982214_AAGC_A	ENSG00000101546	0.001902349991723895	-0.7687190175056458	0.23805800080299377	0.9539700150489807
-165262983	chr18_79911740_G_A	ENSG00000101546	0.010322700254619122	-0.7123119831085205	0.27011099457740784	0.8618500232696533
-189976272	chr18_80153474_T_C	ENSG00000101546	0.008158969692885876	0.48144999146461487	0.17673000693321228	0.9126899838447571
-189974610	chr18_79953260_G_C	ENSG00000101546	0.02645450085401535	-0.6147410273551941	0.27103400230407715	0.8877500295639038
-165263238	chr18_79995819_A_C	ENSG00000101546	0.0031936101149767637	0.6837649941444397	0.22378499805927277	0.847599983215332
-165264164	chr18_80244172_G_A	ENSG00000101546	4.921540153191017e-07	1.3903599977493286	0.2504830062389374	0.42671000957489014
-189976560	chr18_80192660_T_C	ENSG00000101546	0.009941689670085907	0.492125004529953	0.18562699854373932	0.8522099852561951
-165263120	chr18_79960079_A_G	ENSG00000101546	0.009551970288157463	-0.4505850076675415	0.1690090000629425	0.9965800046920776
-165263129	chr18_79962378_G_A	ENSG00000101546	0.008336080238223076	-0.48478201031684875	0.1784690022468567	0.8995699882507324
-189969358	chr18_79191569_C_G	ENSG00000101546	0.02559800073504448	0.6338080167770386	0.27778199315071106	0.9552800059318542
-165263121	chr18_79960299_A_G	ENSG00000101546	0.009744100272655487	-0.4710739850997925	0.1771859973669052	0.9189599752426147
-189974612	chr18_79953289_A_G	ENSG00000101546	0.022304899990558624	-0.6391260027885437	0.273389995098114	0.8772600293159485
-88264493	chr18_79463654_T_G	ENSG00000101546	0.049512799829244614	-0.38020700216293335	0.19016799330711365	0.9182800054550171
-88264495	chr18_79463783_T_C	ENSG00000101546	0.049356698989868164	-0.380374014377594	0.1901170015335083	0.9187800288200378
-165263239	chr18_79996289_G_A	ENSG00000101546	0.006708129774779081	0.6383129954338074	0.22834600508213043	0.8453400135040283
-165263204	chr18_79986623_T_C	ENSG00000101546	0.00319199007935822	0.6836150288581848	0.22372299432754517	0.8479400277137756
-165263537	chr18_80061444_C_T	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768
-189969678	chr18_79255717_G_A	ENSG00000101546	0.03957419842481613	0.47379499673843384	0.22583800554275513	0.9398599863052368
-165263538	chr18_80061737_A_G	ENSG00000101546	7.044500094366413e-09	0.9839209914207458	0.14911000430583954	0.9586499929428101
-189969680	chr18_79255814_G_A	ENSG00000101546	0.038816601037979126	0.4644469916820526	0.22050200402736664	0.9406999945640564
-165261369	chr18_79468659_C_T	ENSG00000101546	0.028084900230169296	-0.5873289704322815	0.2618040144443512	0.9168000221252441
-189974668	chr18_79960332_T_A	ENSG00000101546	0.0010418799938634038	-0.6201750040054321	0.18111799657344818	0.8810399770736694
-165263583	chr18_80073851_G_A	ENSG00000101546	0.00043113200808875263	-0.8576350212097168	0.23186999559402466	0.962689995765686
-165264168	chr18_80248871_A_G	ENSG00000101546	0.011193100363016129	-1.032979965209961	0.3962779939174652	0.40608999133110046
-88264497	chr18_79463827_T_A	ENSG00000101546	0.049908798187971115	-0.37958601117134094	0.1901959925889969	0.9175000190734863
-88269217	chr18_80099250_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342
-165263376	chr18_80031289_T_C	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231
-189975178	chr18_80031319_T_C	ENSG00000101546	0.0004358440055511892	-0.6040440201759338	0.16345499455928802	0.9303299784660339
-189968966	chr18_79152226_G_A	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488
-88264245	chr18_79435553_C_T	ENSG00000101546	0.02433530054986477	-0.4936879873275757	0.2144239991903305	0.9369300007820129
-165264062	chr18_80190452_T_C	ENSG00000101546	3.6959698945793207e-07	0.9414259791374207	0.16742299497127533	0.8532299995422363
-189974174	chr18_79872565_G_A	ENSG00000101546	0.016356199979782104	0.42819198966026306	0.17398400604724884	0.9500899910926819
-165261452	chr18_79490717_C_T	ENSG00000101546	0.001237459946423769	1.1226099729537964	0.33320799469947815	0.505299985408783
-165263278	chr18_80006438_G_A	ENSG00000101546	0.0031031400430947542	0.6861979961395264	0.22386400401592255	0.8466399908065796
-88269345	chr18_80119020_G_A	ENSG00000101546	0.024178799241781235	0.6992549896240234	0.30336201190948486	0.9884600043296814
-189975162	chr18_80029118_G_A	ENSG00000101546	0.00036453999928198755	-0.6130009889602661	0.1634799987077713	0.925320029258728
-165263989	chr18_80169725_T_C	ENSG00000101546	1.5484200048376806e-05	0.705053985118866	0.1516219973564148	0.953540027141571
-189976404	chr18_80169983_A_G	ENSG00000101546	0.04586619883775711	0.5302829742431641	0.2607940137386322	0.8389999866485596
-165263279	chr18_80006478_A_G	ENSG00000101546	0.0031472300179302692	0.6852880120277405	0.22391800582408905	0.8443700075149536
-88268951	chr18_80068600_G_A	ENSG00000101546	2.652140028658323e-05	0.6841779947280884	0.15193499624729156	0.9614800214767456
-189968554	chr18_79098693_C_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275
-165263999	chr18_80173368_T_C	ENSG00000101546	0.0062687997706234455	-0.655655026435852	0.23252399265766144	0.9851700067520142
-88268953	chr18_80068684_C_G	ENSG00000101546	0.009712659753859043	0.8444820046424866	0.3174940049648285	0.9571300148963928
-165263214	chr18_79989211_G_T	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528
-189974214	chr18_79876519_A_G	ENSG00000101546	0.031777698546648026	-0.5941569805145264	0.2710919976234436	0.9615300297737122
-88264345	chr18_79445536_G_C	ENSG00000101546	0.021521400660276413	-0.4996800124645233	0.21243000030517578	0.8766700029373169
-165264064	chr18_80191205_T_C	ENSG00000101546	0.009882640093564987	-0.6603999733924866	0.2488899976015091	0.8497800230979919
-88264203	chr18_79430142_T_C	ENSG00000101546	0.02072330005466938	-0.5077760219573975	0.2144870012998581	0.9177600145339966
-165264145	chr18_80220228_G_C	ENSG00000101546	0.012287000194191933	-0.6442480087280273	0.2505429983139038	0.8767099976539612
-165263141	chr18_79964726_A_C	ENSG00000101546	0.0033067800104618073	-0.6612259745597839	0.21725399792194366	0.9032700061798096
-88269643	chr18_80153265_A_G	ENSG00000101546	0.0003054149856325239	-0.6451789736747742	0.16965100169181824	0.9172800183296204
-165263920	chr18_80153331_A_G	ENSG00000101546	0.0016397900180891156	-0.755744993686676	0.23055900633335114	0.9422399997711182
-165263922	chr18_80153341_A_G	ENSG00000101546	0.0016073000151664019	-0.7542809844017029	0.22965499758720398	0.953499972820282
-165263553	chr18_80065055_C_T	ENSG00000101546	4.11217006330844e-05	0.6887189745903015	0.1571819931268692	0.9298400282859802
-88264335	chr18_79445408_A_G	ENSG00000101546	0.037631601095199585	-0.41114500164985657	0.19396500289440155	0.7963399887084961
-88264229	chr18_79432983_C_A	ENSG00000101546	0.04125019907951355	-0.3656949996948242	0.17582200467586517	0.9875800013542175
-88264233	chr18_79433246_C_T	ENSG00000101546	0.0415676012635231	-0.38412100076675415	0.18497799336910248	0.8949699997901917
-165263372	chr18_80029522_T_C	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231
-165263569	chr18_80068160_T_C	ENSG00000101546	0.00041363100172020495	0.7137899994850159	0.19232399761676788	0.9294599890708923
-189974564	chr18_79947690_C_G	ENSG00000101546	0.023983800783753395	-0.647346019744873	0.28044000267982483	0.8314599990844727
-165263949	chr18_80159179_A_G	ENSG00000101546	0.00016111700097098947	-0.6376240253448486	0.15971499681472778	0.981410026550293
-165263468	chr18_80047610_T_C	ENSG00000101546	0.001360769965685904	0.7057350277900696	0.21139399707317352	0.9108700156211853
-165263921	chr18_80153334_T_A	ENSG00000101546	0.0016001700423657894	-0.756335973739624	0.23017899692058563	0.9468799829483032
-165264079	chr18_80196890_TAA_T	ENSG00000101546	0.03214230015873909	-0.4360960125923157	0.199412003159523	0.7321599721908569
-165262319	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449
-189975418	chr18_80054690_CTATATTAAAA_C	ENSG00000101546	0.012759200297296047	-0.5740739703178406	0.22450700402259827	0.9652900099754333
-165264042	chr18_80181018_G_A	ENSG00000101546	0.012398400343954563	-0.5916939973831177	0.23041200637817383	0.9978600144386292
-189968900	chr18_79145048_C_G	ENSG00000101546	0.019496500492095947	0.8502600193023682	0.3554919958114624	0.8464099764823914
-189974460	chr18_79926407_T_C	ENSG00000101546	0.026291299611330032	0.6431620121002197	0.2832460105419159	0.6420300006866455
-165263361	chr18_80027419_A_C	ENSG00000101546	0.002106579951941967	0.6693220138549805	0.20946399867534637	0.9998300075531006
-165261395	chr18_79476511_G_A	ENSG00000101546	0.02611990086734295	-0.502918004989624	0.22122099995613098	0.6410899758338928
-165261396	chr18_79476571_A_G	ENSG00000101546	0.026773499324917793	-0.4989500045776367	0.22046299278736115	0.6403499841690063
-165263256	chr18_80002824_C_T	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8476799726486206
-165263563	chr18_80067314_T_C	ENSG00000101546	0.0007583670085296035	0.6864370107650757	0.19476599991321564	0.9122999906539917
-88269233	chr18_80103778_A_G	ENSG00000101546	0.01050500012934208	0.6951419711112976	0.26425701379776	0.9999499917030334
-165263603	chr18_80079841_G_A	ENSG00000101546	8.284870034458436e-08	0.9240869879722595	0.15411199629306793	0.9350699782371521
-88269701	chr18_80158602_T_C	ENSG00000101546	0.03843799978494644	0.8538249731063843	0.4045509994029999	0.7732599973678589
-165263330	chr18_80017499_T_G	ENSG00000101546	4.44870007498821e-09	1.0125999450683594	0.1509149968624115	0.9108099937438965
-88268959	chr18_80069398_A_G	ENSG00000101546	0.010636200197041035	0.8416950106620789	0.32053500413894653	0.9647300243377686
-189970550	chr18_79387640_G_A	ENSG00000101546	0.020820200443267822	0.5047739744186401	0.21338799595832825	0.8117700219154358
-189975544	chr18_80067196_G_A	ENSG00000101546	0.01796709932386875	-0.5397830009460449	0.2226649969816208	0.9735100269317627
-165263288	chr18_80008880_C_T	ENSG00000101546	0.013017799705266953	0.5714100003242493	0.22413699328899384	0.8380799889564514
-189975118	chr18_80022684_A_G	ENSG00000101546	0.016550099477171898	-0.5827370285987854	0.23722299933433533	0.9039400219917297
-88269253	chr18_80106922_C_G	ENSG00000101546	0.007234159857034683	0.4775159955024719	0.17250800132751465	0.9840400218963623
-165263648	chr18_80089167_C_G	ENSG00000101546	0.0008080929983407259	-0.7047550082206726	0.20110000669956207	0.9645699858665466
-165263649	chr18_80089292_T_G	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-189976590	chr18_80198172_A_C	ENSG00000101546	0.009564920328557491	0.49497199058532715	0.18569299578666687	0.8510500192642212
-88264337	chr18_79445416_T_C	ENSG00000101546	0.021770600229501724	-0.4989970028400421	0.21255899965763092	0.8761000037193298
-165263650	chr18_80089293_T_C	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329
-165263130	chr18_79962401_G_A	ENSG00000101546	0.00885738991200924	-0.48104798793792725	0.17856299877166748	0.8973299860954285
-165263226	chr18_79992801_C_T	ENSG00000101546	0.006698139943182468	0.6384109854698181	0.22833700478076935	0.8453800082206726
-165263375	chr18_80030723_T_C	ENSG00000101546	2.851660019231872e-10	1.0856800079345703	0.1473499983549118	0.9138000011444092
-189969544	chr18_79225255_C_T	ENSG00000101546	0.040497101843357086	0.4814000129699707	0.2305620014667511	0.9017400145530701
-165263231	chr18_79993037_G_A	ENSG00000101546	0.006709849927574396	0.6383140087127686	0.22835400700569153	0.8453400135040283
-165263049	chr18_79940038_C_T	ENSG00000101546	0.0033925101161003113	0.8075529932975769	0.2660970091819763	0.7323099970817566
-165263232	chr18_79993043_C_T	ENSG00000101546	0.006709849927574396	0.6383140087127686	0.22835400700569153	0.8453400135040283
-165263565	chr18_80067475_A_G	ENSG00000101546	2.112299989676103e-05	0.7578619718551636	0.1659960001707077	0.9542499780654907
-165263496	chr18_80054332_T_A	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193
-165263398	chr18_80034297_C_T	ENSG00000101546	2.1434200248027224e-10	1.0816199779510498	0.145456001162529	0.9542099833488464
-165263401	chr18_80034410_C_T	ENSG00000101546	2.1306000019816196e-10	1.0814900398254395	0.14541099965572357	0.9556499719619751
-165263561	chr18_80067216_T_C	ENSG00000101546	2.1410800400190055e-05	0.7573570013046265	0.16602100431919098	0.9542999863624573
-165263370	chr18_80029323_C_T	ENSG00000101546	2.851660019231872e-10	1.0856800079345703	0.1473499983549118	0.9138000011444092
-189970236	chr18_79362597_C_G	ENSG00000101546	0.03911609947681427	0.4700779914855957	0.22352799773216248	0.9036800265312195
-189974662	chr18_79959208_C_T	ENSG00000101546	0.02777549996972084	-0.6085529923439026	0.2707110047340393	0.888729989528656
-189974580	chr18_79950501_A_T	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203
-165263923	chr18_80153446_A_G	ENSG00000101546	0.04956590011715889	-0.3937479853630066	0.19698800146579742	0.9437599778175354
-189974514	chr18_79938568_A_G	ENSG00000101546	0.019015999510884285	-0.7022410035133362	0.29239198565483093	0.8251000046730042
-165264110	chr18_80210509_C_T	ENSG00000101546	0.0045760199427604675	-0.7339209914207458	0.2503809928894043	0.8940100073814392
-165264070	chr18_80194756_A_C	ENSG00000101546	0.009459789842367172	-0.6460620164871216	0.24200299382209778	0.931190013885498
-165263379	chr18_80032097_A_G	ENSG00000101546	2.4389498753940586e-10	1.0866700410842896	0.14674200117588043	0.9175199866294861
-165263189	chr18_79980544_T_C	ENSG00000101546	0.00319429999217391	0.6854429841041565	0.22434000670909882	0.8422799706459045
-165263237	chr18_79995660_C_T	ENSG00000101546	0.006708129774779081	0.6383129954338074	0.22834600508213043	0.8453400135040283
-165263516	chr18_80057744_A_G	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853
-88264499	chr18_79464192_C_T	ENSG00000101546	0.04975920170545578	-0.3794960081577301	0.1900230050086975	0.9188899993896484
-189969794	chr18_79276035_G_A	ENSG00000101546	0.040891699492931366	0.46993300318717957	0.22552600502967834	0.9511899948120117
-165263353	chr18_80024607_G_A	ENSG00000101546	2.8381999528370727e-10	1.086359977722168	0.1474200040102005	0.9133099913597107
-165263319	chr18_80015414_A_G	ENSG00000101546	0.0024664499796926975	0.6797459721565247	0.21628700196743011	0.8863599896430969
-189975548	chr18_80067299_G_T	ENSG00000101546	0.04763510078191757	-0.4191969931125641	0.2078769952058792	0.9619200229644775
-165263585	chr18_80074355_T_C	ENSG00000101546	0.00042486301390454173	-0.8566830158233643	0.23133300244808197	0.9675800204277039
-165263566	chr18_80067563_G_A	ENSG00000101546	1.5357799476589662e-09	1.0456600189208984	0.15011900663375854	0.939300000667572
-165263148	chr18_79966944_G_C	ENSG00000101546	0.003407210111618042	0.6812019944190979	0.22457300126552582	0.8618299961090088
-165263500	chr18_80054939_C_T	ENSG00000101546	0.0016599999507889152	0.6154130101203918	0.18797700107097626	0.9383599758148193
-189969622	chr18_79244104_A_G	ENSG00000101546	0.003821440041065216	0.5378050208091736	0.17963600158691406	0.9557499885559082
-88269637	chr18_80153242_G_A	ENSG00000101546	0.04311149939894676	0.4946820139884949	0.24006499350070953	0.8200200200080872
-165263489	chr18_80052603_A_G	ENSG00000101546	0.0016483699437230825	0.615805983543396	0.1879650056362152	0.9378799796104431
-189974578	chr18_79949831_C_T	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203
-189974582	chr18_79950516_C_T	ENSG00000101546	0.02531309984624386	-0.626285970211029	0.273934006690979	0.8651599884033203
-165263613	chr18_80083000_T_C	ENSG00000101546	0.0007988249999471009	-0.7053970098495483	0.2010750025510788	0.9670500159263611
-165263521	chr18_80058865_T_C	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853
-165263523	chr18_80058987_T_G	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853
-165263620	chr18_80083688_T_C	ENSG00000101546	0.0004472960135899484	-0.8209519982337952	0.22262699902057648	0.9754400253295898
-165263371	chr18_80029356_T_C	ENSG00000101546	2.851660019231872e-10	1.0856800079345703	0.1473499983549118	0.9138000011444092
-189968288	chr18_79068771_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261
-189968296	chr18_79069075_G_T	ENSG00000101546	0.03258020058274269	0.5606759786605835	0.2570509910583496	0.9886400103569031
-165261376	chr18_79470409_T_C	ENSG00000101546	0.041590798646211624	-0.5826259851455688	0.2806040048599243	0.7188900113105774
-88264561	chr18_79470355_G_C	ENSG00000101546	0.0443493016064167	-0.407245010137558	0.19883200526237488	0.8575999736785889
-189970523	chr18_79385438_G_GGGC	ENSG00000101546	0.026308899745345116	-1.0514899492263794	0.463128000497818	0.7798100113868713
+88269117	chr18_80089655_C_G	ENSG00000101546	0.005060859955847263	0.7998219728469849	0.27619698643684387	0.9690999984741211	QTD000021
+165263272	chr18_80006298_C_T	ENSG00000101546	0.006537919864058495	0.6408849954605103	0.22850899398326874	0.8438900113105774	QTD000021
+189974970	chr18_80006322_T_G	ENSG00000101546	0.011794700287282467	-0.5716080069541931	0.22096000611782074	0.843529999256134	QTD000021
+189969216	chr18_79178881_T_G	ENSG00000101546	0.02522590011358261	0.635079026222229	0.2776080071926117	0.9558600187301636	QTD000021
+165263198	chr18_79985640_A_G	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528	QTD000021
+189976676	chr18_80214310_C_A	ENSG00000101546	0.04717560112476349	0.544579029083252	0.2694779932498932	0.6489700078964233	QTD000021
+165263686	chr18_80096776_T_C	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.9875199794769287	QTD000021
+165263890	chr18_80149200_G_C	ENSG00000101546	4.389380137581611e-06	0.7606329917907715	0.15253299474716187	0.9581500291824341	QTD000021
+165263199	chr18_79986042_CT_C	ENSG00000101546	6.413459777832031e-05	0.7103880047798157	0.16687899827957153	0.8760600090026855	QTD000021
+88268227	chr18_79988659_G_A	ENSG00000101546	0.006915390025824308	0.5245959758758545	0.18840600550174713	0.9341999888420105	QTD000021
+165263207	chr18_79988525_A_C	ENSG00000101546	0.0031936299055814743	0.6835629940032959	0.22371900081634521	0.8479499816894531	QTD000021
+189970452	chr18_79381096_T_C	ENSG00000101546	0.005841409787535667	-0.5551300048828125	0.1951259970664978	0.7927500009536743	QTD000021
+189974568	chr18_79948532_T_A	ENSG00000101546	0.02531309984624386	-0.626285970211029	0.273934006690979	0.8651599884033203	QTD000021
+189974572	chr18_79948781_G_A	ENSG00000101546	0.0036047999747097492	-0.5253739953041077	0.1743129938840866	0.9980499744415283	QTD000021
+189974574	chr18_79948992_A_G	ENSG00000101546	0.03834199905395508	-0.5101780295372009	0.2416040003299713	0.8685399889945984	QTD000021
+88268435	chr18_80015173_T_C	ENSG00000101546	0.0003370509948581457	0.5943009853363037	0.1574999988079071	0.9223799705505371	QTD000021
+88268441	chr18_80015318_T_C	ENSG00000101546	0.0003370520134922117	0.5942829847335815	0.15749500691890717	0.9225199818611145	QTD000021
+165263473	chr18_80048712_T_A	ENSG00000101546	0.001699079992249608	0.6150810122489929	0.18831400573253632	0.9347699880599976	QTD000021
+165263474	chr18_80048745_A_G	ENSG00000101546	0.0017098799580708146	0.6147590279579163	0.18833500146865845	0.9346699714660645	QTD000021
+189969758	chr18_79267258_A_G	ENSG00000101546	0.030641300603747368	-0.3394399881362915	0.15379899740219116	0.9347699880599976	QTD000021
+189974336	chr18_79897319_C_A	ENSG00000101546	0.02697809971868992	-0.7050880193710327	0.3119800090789795	0.8267999887466431	QTD000021
+189974520	chr18_79939893_C_T	ENSG00000101546	0.002230909885838628	0.6795340180397034	0.2139360010623932	0.8003100156784058	QTD000021
+189974562	chr18_79947427_C_T	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203	QTD000021
+165263183	chr18_79977397_C_T	ENSG00000101546	0.004117169883102179	0.6725360155105591	0.22659200429916382	0.8432499766349792	QTD000021
+189974850	chr18_79989181_C_T	ENSG00000101546	0.016787299886345863	-0.6368229985237122	0.2598299980163574	0.807129979133606	QTD000021
+165263286	chr18_80007935_A_G	ENSG00000101546	0.00274211005307734	0.6948300004005432	0.22362199425697327	0.7960799932479858	QTD000021
+165263290	chr18_80009368_T_C	ENSG00000101546	0.005383189767599106	0.6336519718170166	0.22047600150108337	0.8845999836921692	QTD000021
+165263382	chr18_80032826_A_C	ENSG00000101546	0.002464570105075836	0.6766359806060791	0.2152789980173111	0.9028099775314331	QTD000021
+88268647	chr18_80038033_C_T	ENSG00000101546	0.002321799984201789	0.6017940044403076	0.19025899469852448	0.7152799963951111	QTD000021
+165263432	chr18_80041700_G_A	ENSG00000101546	0.001348600024357438	0.7056990265846252	0.21119900047779083	0.911329984664917	QTD000021
+165263480	chr18_80049381_T_C	ENSG00000101546	0.0016119900392368436	0.6201500296592712	0.18887099623680115	0.9311699867248535	QTD000021
+88269453	chr18_80130127_G_A	ENSG00000101546	0.024224499240517616	0.6989679932594299	0.30333900451660156	0.9883300065994263	QTD000021
+165264086	chr18_80200981_G_A	ENSG00000101546	5.232629973761505e-07	0.9415439963340759	0.17010100185871124	0.8468199968338013	QTD000021
+165264113	chr18_80211420_G_T	ENSG00000101546	4.844760042033158e-07	0.9379090070724487	0.16884900629520416	0.856909990310669	QTD000021
+165263979	chr18_80168455_T_G	ENSG00000101546	0.008551299571990967	-0.6225879788398743	0.229994997382164	0.9817900061607361	QTD000021
+189974648	chr18_79957256_T_C	ENSG00000101546	0.026315899565815926	-0.6152210235595703	0.27098700404167175	0.8858199715614319	QTD000021
+165264015	chr18_80177025_G_GCACA	ENSG00000101546	1.5764900496151313e-08	1.0693299770355225	0.16700099408626556	0.7436299920082092	QTD000021
+189970536	chr18_79386003_T_C	ENSG00000101546	0.029892899096012115	-1.0388000011444092	0.46848100423812866	0.5593400001525879	QTD000021
+165263100	chr18_79954740_T_TTTTA	ENSG00000101546	0.015940500423312187	-0.4315820038318634	0.1746480017900467	0.9331099987030029	QTD000021
+165264074	chr18_80195609_G_C	ENSG00000101546	5.187960141483927e-07	0.9366790056228638	0.1691560000181198	0.8519600033760071	QTD000021
+189976530	chr18_80186371_C_CCT	ENSG00000101546	0.04832129925489426	0.5391690135002136	0.268216997385025	0.6838600039482117	QTD000021
+165263593	chr18_80076295_T_A	ENSG00000101546	7.731499884755522e-09	0.986873984336853	0.150068998336792	0.9564999938011169	QTD000021
+165264073	chr18_80195568_TATATAC_T	ENSG00000101546	0.00558339012786746	-0.7545740008354187	0.2637389898300171	0.8303099870681763	QTD000021
+189969054	chr18_79161566_G_A	ENSG00000101546	0.033481400460004807	0.561834990978241	0.2589539885520935	0.9670199751853943	QTD000021
+189974326	chr18_79895807_C_A	ENSG00000101546	0.026583099737763405	-0.7069860100746155	0.3119789958000183	0.8252599835395813	QTD000021
+189968432	chr18_79082227_T_C	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+88264593	chr18_79476259_G_A	ENSG00000101546	0.031721800565719604	-0.5312759876251221	0.2423200011253357	0.9400200247764587	QTD000021
+165264067	chr18_80192432_C_T	ENSG00000101546	4.886369993073458e-07	0.9410269856452942	0.16947700083255768	0.853190004825592	QTD000021
+165263391	chr18_80033734_T_C	ENSG00000101546	2.1368899705276334e-10	1.0814100503921509	0.14541399478912354	0.9551200270652771	QTD000021
+189974924	chr18_79999306_C_T	ENSG00000101546	0.016028599813580513	-0.6412019729614258	0.2597000002861023	0.7981100082397461	QTD000021
+189974274	chr18_79884045_G_A	ENSG00000101546	0.03408399969339371	-0.620281994342804	0.2868939936161041	0.9244400262832642	QTD000021
+88269193	chr18_80097610_CA_C	ENSG00000101546	0.010821700096130371	0.6994050145149231	0.2670089900493622	0.98853999376297	QTD000021
+165263190	chr18_79981409_C_T	ENSG00000101546	2.8930999818044256e-08	0.993582010269165	0.15884700417518616	0.8503199815750122	QTD000021
+165263802	chr18_80126255_CTGT_C	ENSG00000101546	0.0013861899496987462	-0.7513729929924011	0.2254679948091507	0.9777500033378601	QTD000021
+165261080	chr18_79397432_CCAGCTCT_C	ENSG00000101546	0.027723999693989754	-0.41871899366378784	0.18619999289512634	0.7035599946975708	QTD000021
+165263884	chr18_80147460_G_GCTGTGGTGC	ENSG00000101546	0.00011425300181144848	-0.6719560027122498	0.16421100497245789	0.9685099720954895	QTD000021
+165263885	chr18_80147460_G_GCTGTGGTGC	ENSG00000101546	0.00011425300181144848	-0.6719560027122498	0.16421100497245789	0.9685099720954895	QTD000021
+189976542	chr18_80190271_CA_C	ENSG00000101546	0.0494145005941391	0.540340006351471	0.27014100551605225	0.6949599981307983	QTD000021
+189969626	chr18_79245424_CA_C	ENSG00000101546	0.03679890185594559	0.5042889714241028	0.23683199286460876	0.8968600034713745	QTD000021
+189974566	chr18_79947827_TG_T	ENSG00000101546	0.02533089928328991	-0.6261579990386963	0.2739120125770569	0.8652700185775757	QTD000021
+165263469	chr18_80047699_GA_G	ENSG00000101546	0.0013542500091716647	0.7053020000457764	0.21116599440574646	0.9127600193023682	QTD000021
+165263725	chr18_80109435_G_T	ENSG00000101546	1.2129700621699158e-07	0.892195999622345	0.15117600560188293	0.9795399904251099	QTD000021
+189970000	chr18_79327597_C_T	ENSG00000101546	0.024081099778413773	-0.9562659859657288	0.41456499695777893	0.7628700137138367	QTD000021
+189969056	chr18_79161589_T_C	ENSG00000101546	0.033481400460004807	0.561834990978241	0.2589539885520935	0.9670199751853943	QTD000021
+165263261	chr18_80004129_TA_T	ENSG00000101546	0.00520892022177577	0.6606469750404358	0.22894099354743958	0.8338599801063538	QTD000021
+189969526	chr18_79221928_TA_T	ENSG00000101546	0.004411329980939627	0.5199660062789917	0.17661799490451813	0.94691002368927	QTD000021
+165263301	chr18_80011878_C_T	ENSG00000101546	2.8614999258991247e-10	1.0858500003814697	0.1473889946937561	0.9119499921798706	QTD000021
+88268453	chr18_80015887_T_C	ENSG00000101546	0.0005235049757175148	0.6151949763298035	0.16903799772262573	0.8602700233459473	QTD000021
+189974594	chr18_79951357_T_G	ENSG00000101546	0.038259100168943405	-0.5104730129241943	0.24163700640201569	0.8684399724006653	QTD000021
+165263937	chr18_80157500_C_T	ENSG00000101546	0.005877189803868532	-0.633247971534729	0.22275499999523163	0.9998800158500671	QTD000021
+165263487	chr18_80052545_C_T	ENSG00000101546	7.230669840652126e-09	0.9848809838294983	0.14939799904823303	0.9470199942588806	QTD000021
+165263179	chr18_79976966_AT_A	ENSG00000101546	0.0034992999862879515	0.6780070066452026	0.22419500350952148	0.8539800047874451	QTD000021
+165264000	chr18_80173623_TA_T	ENSG00000101546	0.006267809774726629	-0.6556059718132019	0.23250199854373932	0.9845700263977051	QTD000021
+189968988	chr18_79154049_C_T	ENSG00000101546	0.026356900110840797	0.6221839785575867	0.27413201332092285	0.987559974193573	QTD000021
+165263103	chr18_79955231_TA_T	ENSG00000101546	0.01798349991440773	-0.413085013628006	0.17042699456214905	0.9349200129508972	QTD000021
+88268149	chr18_79970807_C_A	ENSG00000101546	0.00901023019105196	0.4909360110759735	0.1826609969139099	0.9951300024986267	QTD000021
+165263836	chr18_80131623_G_T	ENSG00000101546	1.1903100016752433e-07	0.891057014465332	0.15086300671100616	0.9770200252532959	QTD000021
+189974634	chr18_79955687_T_C	ENSG00000101546	0.026685500517487526	-0.6141179800033569	0.27118799090385437	0.8807200193405151	QTD000021
+189968338	chr18_79071888_TG_T	ENSG00000101546	0.027317199856042862	0.6245059967041016	0.27695798873901367	0.8624100089073181	QTD000021
+189973980	chr18_79854682_C_G	ENSG00000101546	0.023015199229121208	0.4193579852581024	0.18036200106143951	0.8848699927330017	QTD000021
+165263252	chr18_79999802_G_C	ENSG00000101546	1.4111000368188797e-08	1.0174100399017334	0.15822599828243256	0.8517900109291077	QTD000021
+189970340	chr18_79371392_A_C	ENSG00000101546	0.03572259843349457	0.4821909964084625	0.22510899603366852	0.8771399855613708	QTD000021
+165263488	chr18_80052571_C_T	ENSG00000101546	7.160169790410009e-09	0.98505699634552	0.14937099814414978	0.9501199722290039	QTD000021
+189973910	chr18_79829199_T_G	ENSG00000101546	0.004635340068489313	0.6134790182113647	0.20961399376392365	0.7643700242042542	QTD000021
+165263651	chr18_80089468_C_T	ENSG00000101546	8.101719828346177e-08	0.9278609752655029	0.15459899604320526	0.9344099760055542	QTD000021
+189968455	chr18_79084159_G_GT	ENSG00000101546	0.026145299896597862	0.6233959794044495	0.27426400780677795	0.990559995174408	QTD000021
+189976140	chr18_80138816_C_CA	ENSG00000101546	0.04852209985256195	0.5525559782981873	0.2751289904117584	0.6626099944114685	QTD000021
+165263197	chr18_79984401_C_CT	ENSG00000101546	0.003161210101097822	0.6846809983253479	0.22382999956607819	0.8464900255203247	QTD000021
+88268465	chr18_80016428_G_A	ENSG00000101546	0.0003410860081203282	0.5949400067329407	0.157819002866745	0.9217699766159058	QTD000021
+88268463	chr18_80016386_T_A	ENSG00000101546	0.00033757698838599026	0.5943300127983093	0.15752699971199036	0.9221699833869934	QTD000021
+189974008	chr18_79860620_C_T	ENSG00000101546	0.021427400410175323	-0.4055219888687134	0.1722709983587265	0.942330002784729	QTD000021
+189974530	chr18_79941917_C_T	ENSG00000101546	0.018415000289678574	-0.7021380066871643	0.29080599546432495	0.8183500170707703	QTD000021
+189968360	chr18_79072683_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165263904	chr18_80152678_CTTTT_C	ENSG00000101546	1.8839300253148394e-07	0.8988940119743347	0.1551939994096756	0.9596899747848511	QTD000021
+165263594	chr18_80077162_A_AAT	ENSG00000101546	0.00010088000271935016	-0.6831870079040527	0.1655060052871704	0.972540020942688	QTD000021
+165263282	chr18_80007204_A_G	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8471400141716003	QTD000021
+88264535	chr18_79466973_C_T	ENSG00000101546	0.030743399634957314	-0.5306249856948853	0.24057699739933014	0.9541299939155579	QTD000021
+165262655	chr18_79782225_A_G	ENSG00000101546	0.04506170004606247	-0.39171698689460754	0.19190900027751923	0.5810999870300293	QTD000021
+165264154	chr18_80230333_G_C	ENSG00000101546	7.558409720331838e-07	1.3686699867248535	0.25151100754737854	0.4362500011920929	QTD000021
+88264545	chr18_79467950_G_T	ENSG00000101546	0.030585499480366707	-0.5315729975700378	0.24077099561691284	0.955489993095398	QTD000021
+165264026	chr18_80178331_G_A	ENSG00000101546	5.078319986751012e-07	0.9027500152587891	0.16286900639533997	0.8690699934959412	QTD000021
+165263478	chr18_80049003_A_G	ENSG00000101546	0.00093129399465397	0.6501619815826416	0.18792100250720978	0.9037500023841858	QTD000021
+165261302	chr18_79455999_G_A	ENSG00000101546	0.03341389819979668	-0.9631909728050232	0.4437670111656189	0.6566900014877319	QTD000021
+165264124	chr18_80214056_T_C	ENSG00000101546	4.836339826397307e-07	0.9379900097846985	0.16885100305080414	0.8568400144577026	QTD000021
+165263196	chr18_79983996_A_G	ENSG00000101546	0.0031252100598067045	0.6856480240821838	0.2238609939813614	0.8450300097465515	QTD000021
+189975318	chr18_80042683_A_G	ENSG00000101546	0.00030811000033281744	-0.5959500074386597	0.15681500732898712	0.9711300134658813	QTD000021
+189974158	chr18_79870600_G_C	ENSG00000101546	0.016574300825595856	0.42703700065612793	0.17387999594211578	0.9479399919509888	QTD000021
+165264001	chr18_80173715_C_T	ENSG00000101546	6.341139737742196e-07	0.8533120155334473	0.15553000569343567	0.9968100190162659	QTD000021
+189974394	chr18_79912473_A_C	ENSG00000101546	0.0037128899712115526	0.545753002166748	0.18168799579143524	0.8391000032424927	QTD000021
+189974396	chr18_79912533_A_G	ENSG00000101546	0.009505489841103554	0.4873799979686737	0.1826860010623932	0.810949981212616	QTD000021
+165263336	chr18_80019532_T_C	ENSG00000101546	9.29609011990351e-09	0.9903740286827087	0.15163099765777588	0.9100900292396545	QTD000021
+165263308	chr18_80013284_A_G	ENSG00000101546	0.0024590399116277695	0.6799489855766296	0.21628199517726898	0.8852300047874451	QTD000021
+165263450	chr18_80043716_A_G	ENSG00000101546	0.001348600024357438	0.7056990265846252	0.21119900047779083	0.911329984664917	QTD000021
+165263188	chr18_79979098_T_C	ENSG00000101546	0.0031906599178910255	0.6855279803276062	0.22433899343013763	0.8428199887275696	QTD000021
+165263254	chr18_80001717_C_T	ENSG00000101546	2.8912999994190614e-08	0.9936370253562927	0.1588519960641861	0.8511199951171875	QTD000021
+165263294	chr18_80010278_A_C	ENSG00000101546	4.501179873273031e-09	1.0125700235366821	0.15097500383853912	0.9097700119018555	QTD000021
+88269647	chr18_80153280_A_T	ENSG00000101546	0.026515599340200424	0.43570300936698914	0.19217799603939056	0.8357800245285034	QTD000021
+189973992	chr18_79858869_C_T	ENSG00000101546	0.034122198820114136	0.3691610097885132	0.17078299820423126	0.9214199781417847	QTD000021
+189973994	chr18_79859009_C_T	ENSG00000101546	0.010832199826836586	0.4584600031375885	0.17504900693893433	0.934469997882843	QTD000021
+189974256	chr18_79881902_C_G	ENSG00000101546	0.028648799285292625	0.3878380060195923	0.17351900041103363	0.9393600225448608	QTD000021
+189975328	chr18_80043839_A_C	ENSG00000101546	0.00030836599762551486	-0.595770001411438	0.1567779928445816	0.9712799787521362	QTD000021
+165263727	chr18_80110152_A_G	ENSG00000101546	5.758960105595179e-05	-0.6803119778633118	0.15868200361728668	0.9999499917030334	QTD000021
+165263853	chr18_80134846_A_G	ENSG00000101546	1.1987299330940004e-07	0.8911299705505371	0.15092000365257263	0.9764900207519531	QTD000021
+165263258	chr18_80003701_T_C	ENSG00000101546	2.8912999994190614e-08	0.9936370253562927	0.1588519960641861	0.8511199951171875	QTD000021
+165263929	chr18_80155950_G_A	ENSG00000101546	1.484340009483276e-05	0.7235910296440125	0.15522600710391998	0.9126399755477905	QTD000021
+165263259	chr18_80003721_T_C	ENSG00000101546	2.8912999994190614e-08	0.9936370253562927	0.1588519960641861	0.8511199951171875	QTD000021
+165263097	chr18_79953591_G_A	ENSG00000101546	0.018157700076699257	-0.4125800132751465	0.17048600316047668	0.9350399971008301	QTD000021
+165263096	chr18_79953494_C_T	ENSG00000101546	0.018177499994635582	-0.4124450087547302	0.1704609990119934	0.9351199865341187	QTD000021
+165264125	chr18_80214183_C_T	ENSG00000101546	3.407639894703607e-07	1.5600299835205078	0.2764289975166321	0.4388200044631958	QTD000021
+165263963	chr18_80164499_T_C	ENSG00000101546	2.1902700098053174e-07	0.8857880234718323	0.15393200516700745	0.9749500155448914	QTD000021
+165263533	chr18_80060910_C_T	ENSG00000101546	7.034130167227204e-09	0.9838669896125793	0.14909300208091736	0.9586499929428101	QTD000021
+165263454	chr18_80044678_T_G	ENSG00000101546	0.001348600024357438	0.7056990265846252	0.21119900047779083	0.911329984664917	QTD000021
+165263200	chr18_79986403_T_A	ENSG00000101546	1.6620999758742983e-06	0.8167529702186584	0.15587599575519562	0.849049985408783	QTD000021
+88264265	chr18_79437571_T_C	ENSG00000101546	0.043609898537397385	-0.44555801153182983	0.21675600111484528	0.8732500076293945	QTD000021
+88268703	chr18_80042638_G_A	ENSG00000101546	0.003612630069255829	0.5335400104522705	0.17706599831581116	0.9787099957466125	QTD000021
+165263479	chr18_80049229_C_T	ENSG00000101546	2.2965099560678937e-05	0.7533029913902283	0.16582900285720825	0.9481800198554993	QTD000021
+165263320	chr18_80015810_T_C	ENSG00000101546	0.0023489799350500107	0.6838210225105286	0.21645799279212952	0.883109986782074	QTD000021
+165263383	chr18_80032946_T_A	ENSG00000101546	4.7634500510707056e-11	1.145259976387024	0.1469459980726242	0.9411900043487549	QTD000021
+189975326	chr18_80043750_G_A	ENSG00000101546	0.00030836599762551486	-0.595770001411438	0.1567779928445816	0.9712799787521362	QTD000021
+165263548	chr18_80064423_A_C	ENSG00000101546	0.0011940599652007222	0.7402759790420532	0.21897999942302704	0.9021700024604797	QTD000021
+88264217	chr18_79432116_A_G	ENSG00000101546	0.02420409955084324	-0.49648699164390564	0.2154339998960495	0.9023799896240234	QTD000021
+189975102	chr18_80020683_C_T	ENSG00000101546	0.0003653719904832542	-0.6127560138702393	0.16344499588012695	0.9256200194358826	QTD000021
+165263293	chr18_80009836_G_A	ENSG00000101546	4.4834198575927076e-09	1.0126399993896484	0.15096400678157806	0.9098799824714661	QTD000021
+165263295	chr18_80010322_G_A	ENSG00000101546	4.485749993676791e-09	1.012619972229004	0.15096400678157806	0.9099199771881104	QTD000021
+165263170	chr18_79970825_A_G	ENSG00000101546	0.003493859898298979	0.6786320209503174	0.22436299920082092	0.8561000227928162	QTD000021
+189974034	chr18_79862996_T_C	ENSG00000101546	0.0238575991243124	-0.3865709900856018	0.16731199622154236	0.9996100068092346	QTD000021
+88269645	chr18_80153273_C_G	ENSG00000101546	0.02143239974975586	0.44191399216651917	0.18773899972438812	0.8216400146484375	QTD000021
+165263919	chr18_80153302_C_T	ENSG00000101546	0.0337240993976593	-0.5685020089149475	0.26239800453186035	0.748989999294281	QTD000021
+189975310	chr18_80041795_T_C	ENSG00000101546	0.00030811000033281744	-0.5959500074386597	0.15681500732898712	0.9711300134658813	QTD000021
+165263622	chr18_80083867_C_G	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934	QTD000021
+165263623	chr18_80083957_C_T	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445	QTD000021
+165263455	chr18_80044809_G_A	ENSG00000101546	7.453770045628971e-09	0.9854879975318909	0.1496569961309433	0.9538000226020813	QTD000021
+165264037	chr18_80179378_T_C	ENSG00000101546	0.0015318799996748567	0.5973799824714661	0.18102000653743744	0.9066900014877319	QTD000021
+165263483	chr18_80051495_C_A	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252	QTD000021
+189968632	chr18_79108000_T_A	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967	QTD000021
+165263227	chr18_79992876_T_TAAA	ENSG00000101546	4.858270131080644e-06	0.8729450106620789	0.17599999904632568	0.7013300061225891	QTD000021
+189968640	chr18_79110162_T_C	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967	QTD000021
+189969888	chr18_79296049_T_C	ENSG00000101546	0.02867319993674755	-0.8735740184783936	0.39090099930763245	0.9350699782371521	QTD000021
+189969898	chr18_79303255_G_A	ENSG00000101546	0.03531689941883087	-0.8263319730758667	0.384893000125885	0.9322500228881836	QTD000021
+189968628	chr18_79107637_G_A	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967	QTD000021
+189969428	chr18_79204525_C_A	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646	QTD000021
+189969128	chr18_79169242_T_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189970456	chr18_79381111_T_C	ENSG00000101546	0.026278700679540634	-0.9570159912109375	0.42142999172210693	0.8164399862289429	QTD000021
+189968698	chr18_79118330_C_G	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967	QTD000021
+189970060	chr18_79339743_G_A	ENSG00000101546	0.024308599531650543	-0.9125999808311462	0.3962939977645874	0.8648800253868103	QTD000021
+88267149	chr18_79783475_C_CAAAAAAAAAA	ENSG00000101546	0.007150080054998398	-1.1952500343322754	0.4311380088329315	0.4055199921131134	QTD000021
+189968204	chr18_79058217_T_C	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9401000142097473	QTD000021
+189968590	chr18_79103691_G_A	ENSG00000101546	0.04781489819288254	-0.7181119918823242	0.3564029932022095	0.9768800139427185	QTD000021
+189969598	chr18_79237692_G_T	ENSG00000101546	0.04433250054717064	0.4997889995574951	0.24399599432945251	0.8938999772071838	QTD000021
+189968726	chr18_79122298_G_A	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967	QTD000021
+189969296	chr18_79186660_A_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189969098	chr18_79167154_C_A	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189969812	chr18_79281913_G_C	ENSG00000101546	0.029738599434494972	-0.8309569954872131	0.37438100576400757	0.9692699909210205	QTD000021
+88264153	chr18_79425179_C_CTCTGTCTCTGTCTCTCTGTCTGTCTCTGTGTCTG	ENSG00000101546	0.03348499909043312	-0.5042049884796143	0.23239700496196747	0.6798400282859802	QTD000021
+189968828	chr18_79134116_T_C	ENSG00000101546	0.030845800414681435	-0.8117179870605469	0.3682529926300049	0.9889600276947021	QTD000021
+189970538	chr18_79386295_C_G	ENSG00000101546	0.0355570986866951	-0.9875860214233398	0.46062400937080383	0.8064200282096863	QTD000021
+189968428	chr18_79080425_A_C	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+189970446	chr18_79379494_C_A	ENSG00000101546	0.006771930027753115	0.8088930249214172	0.2897219955921173	0.546970009803772	QTD000021
+88261925	chr18_79097672_G_C	ENSG00000101546	0.029620099812746048	-0.540611982345581	0.24338500201702118	0.9357600212097168	QTD000021
+88269135	chr18_80091891_C_T	ENSG00000101546	0.010521300137043	0.8432310223579407	0.3206230103969574	0.9692599773406982	QTD000021
+165263044	chr18_79937110_T_C	ENSG00000101546	0.004301569890230894	-0.7993729710578918	0.27071601152420044	0.8554199934005737	QTD000021
+165264135	chr18_80217899_A_G	ENSG00000101546	0.005211949814110994	-0.6893119812011719	0.23889200389385223	0.805109977722168	QTD000021
+88269507	chr18_80134386_A_AGT	ENSG00000101546	0.047348301857709885	0.6571260094642639	0.3254309892654419	0.7366799712181091	QTD000021
+88262155	chr18_79128052_C_CT	ENSG00000101546	0.013145900331437588	-0.7608969807624817	0.2989029884338379	0.7035099864006042	QTD000021
+165263146	chr18_79966121_T_C	ENSG00000101546	0.002355509903281927	-0.5645080208778381	0.17874300479888916	0.8751500248908997	QTD000021
+189974242	chr18_79880316_C_CA	ENSG00000101546	0.01609550043940544	-0.7063339948654175	0.2862679958343506	0.7907099723815918	QTD000021
+165263427	chr18_80040239_AT_A	ENSG00000101546	0.0006344889989122748	-1.2856199741363525	0.3591110110282898	0.569130003452301	QTD000021
+189970338	chr18_79371370_TAA_T	ENSG00000101546	0.026458900421857834	-1.0992599725723267	0.4846689999103546	0.6761000156402588	QTD000021
+189969996	chr18_79327536_AGC_A	ENSG00000101546	0.034864600747823715	-0.9216139912605286	0.42817699909210205	0.7690600156784058	QTD000021
+189969660	chr18_79249079_TA_T	ENSG00000101546	0.02948799915611744	-0.8166509866714478	0.3673500120639801	0.9844300150871277	QTD000021
+189975024	chr18_80011677_G_C	ENSG00000101546	0.015259799547493458	-0.6196200251579285	0.2490289956331253	0.8984299898147583	QTD000021
+189975134	chr18_80025983_A_G	ENSG00000101546	0.016570299863815308	-0.5826950073242188	0.23725199699401855	0.9036200046539307	QTD000021
+165264151	chr18_80226462_C_T	ENSG00000101546	5.715129987038381e-07	1.369979977607727	0.24850699305534363	0.43606001138687134	QTD000021
+165263604	chr18_80080362_C_T	ENSG00000101546	0.0007970309816300869	-0.7052819728851318	0.20100200176239014	0.9670400023460388	QTD000021
+189975844	chr18_80103247_A_G	ENSG00000101546	0.003959029912948608	0.5524510145187378	0.18528500199317932	0.9293599724769592	QTD000021
+189975842	chr18_80103219_T_C	ENSG00000101546	0.003961219917982817	0.5524060130119324	0.18528200685977936	0.9293599724769592	QTD000021
+88265749	chr18_79628431_T_C	ENSG00000101546	0.04770689830183983	0.3341499865055084	0.16575799882411957	0.9682999849319458	QTD000021
+189976466	chr18_80177445_C_T	ENSG00000101546	0.04747119918465614	0.5311939716339111	0.26321500539779663	0.7918800115585327	QTD000021
+189974410	chr18_79914634_C_T	ENSG00000101546	0.004485940095037222	0.5156059861183167	0.17548500001430511	0.8685500025749207	QTD000021
+88268923	chr18_80065981_A_G	ENSG00000101546	0.001693099969998002	0.6461420059204102	0.19775299727916718	0.9551100134849548	QTD000021
+165263283	chr18_80007566_T_C	ENSG00000101546	0.003112219972535968	0.6858699917793274	0.22382999956607819	0.8428599834442139	QTD000021
+88268963	chr18_80070388_G_C	ENSG00000101546	0.02360139973461628	0.8853600025177002	0.38246700167655945	0.9613699913024902	QTD000021
+165263002	chr18_79918327_A_G	ENSG00000101546	0.04121759906411171	0.37589898705482483	0.18069800734519958	0.830269992351532	QTD000021
+189974288	chr18_79887234_G_C	ENSG00000101546	0.0339869000017643	-0.6203529834747314	0.286765992641449	0.9263399839401245	QTD000021
+88268535	chr18_80028215_G_C	ENSG00000101546	0.007812350057065487	0.5490819811820984	0.20038799941539764	0.8706700205802917	QTD000021
+88268537	chr18_80028302_C_G	ENSG00000101546	0.003849250031635165	0.5351849794387817	0.1789100021123886	0.9419999718666077	QTD000021
+189975286	chr18_80041227_G_A	ENSG00000101546	0.0003089960082434118	-0.5979019999504089	0.15736399590969086	0.9656100273132324	QTD000021
+189974310	chr18_79891511_A_G	ENSG00000101546	0.033448200672864914	-0.6237900257110596	0.2874540090560913	0.9214500188827515	QTD000021
+88268163	chr18_79976111_C_T	ENSG00000101546	0.008952969685196877	0.49998798966407776	0.18586699664592743	0.9432399868965149	QTD000021
+189969808	chr18_79281852_T_G	ENSG00000101546	0.03782210126519203	0.48354700207710266	0.2283560037612915	0.9390599727630615	QTD000021
+189974472	chr18_79928830_G_C	ENSG00000101546	0.008587850257754326	0.4717639982700348	0.17437900602817535	0.9334400296211243	QTD000021
+88265751	chr18_79628519_G_A	ENSG00000101546	0.047676701098680496	0.3341909945011139	0.1657550036907196	0.9682899713516235	QTD000021
+88269187	chr18_80097461_G_T	ENSG00000101546	0.025620199739933014	0.6260730028152466	0.27443501353263855	0.9892699718475342	QTD000021
+88269191	chr18_80097554_G_A	ENSG00000101546	0.010862300172448158	0.6994370222091675	0.2671639919281006	0.9884799718856812	QTD000021
+88269733	chr18_80164071_A_C	ENSG00000101546	0.03801070153713226	0.6622840166091919	0.3130820095539093	0.870930016040802	QTD000021
+189975172	chr18_80030689_G_T	ENSG00000101546	0.00036481101415120065	-0.6129689812660217	0.16348199546337128	0.9254599809646606	QTD000021
+189974628	chr18_79955231_T_C	ENSG00000101546	0.0031202901154756546	0.5538470149040222	0.18079699575901031	0.9220600128173828	QTD000021
+189974420	chr18_79917315_C_G	ENSG00000101546	0.0030392499174922705	0.5548359751701355	0.18059200048446655	0.8702099919319153	QTD000021
+189969456	chr18_79208210_A_G	ENSG00000101546	0.003539720084518194	0.5443410277366638	0.1802310049533844	0.9538499712944031	QTD000021
+165263246	chr18_79997882_T_A	ENSG00000101546	0.00667465990409255	0.6408960223197937	0.22912199795246124	0.8406500220298767	QTD000021
+88269457	chr18_80130552_A_G	ENSG00000101546	0.02465049922466278	0.6977249979972839	0.303737998008728	0.9815000295639038	QTD000021
+88268929	chr18_80067192_G_A	ENSG00000101546	0.010367799550294876	0.8489490151405334	0.3221229910850525	0.9592400193214417	QTD000021
+88268939	chr18_80067404_G_T	ENSG00000101546	0.010668500326573849	0.8413940072059631	0.3205600082874298	0.9634799957275391	QTD000021
+88269301	chr18_80115526_C_G	ENSG00000101546	0.024279000237584114	0.6988750100135803	0.30341899394989014	0.988860011100769	QTD000021
+189970012	chr18_79330730_G_A	ENSG00000101546	0.04692310094833374	0.45115798711776733	0.22298599779605865	0.9156000018119812	QTD000021
+88263091	chr18_79260146_G_A	ENSG00000101546	0.03113340027630329	0.668129026889801	0.3036479949951172	0.7333499789237976	QTD000021
+189974534	chr18_79942976_C_T	ENSG00000101546	0.00617578998208046	0.5417900085449219	0.1917780041694641	0.6976400017738342	QTD000021
+88269189	chr18_80097486_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342	QTD000021
+88266771	chr18_79742141_TGAGGTGGAGGCCTGGGGGCAGCAGAG_T	ENSG00000101546	0.03260349854826927	-0.9425650238990784	0.43219301104545593	0.42250001430511475	QTD000021
+189975476	chr18_80059643_T_C	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189975484	chr18_80060018_A_T	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189974788	chr18_79977240_T_G	ENSG00000101546	0.01845810003578663	-0.6320319771766663	0.26187101006507874	0.8072999715805054	QTD000021
+165263529	chr18_80060000_T_C	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853	QTD000021
+189975516	chr18_80062951_G_A	ENSG00000101546	0.012708200141787529	-0.5767030119895935	0.22540099918842316	0.9361000061035156	QTD000021
+189974956	chr18_80005220_C_T	ENSG00000101546	0.015002500265836716	-0.6167280077934265	0.24721099436283112	0.8146399855613708	QTD000021
+189974866	chr18_79991380_A_G	ENSG00000101546	0.016766300424933434	-0.6369699835777283	0.2598380148410797	0.807200014591217	QTD000021
+165263304	chr18_80012151_T_C	ENSG00000101546	0.0024645200464874506	0.6798909902572632	0.21631500124931335	0.8861700296401978	QTD000021
+189975426	chr18_80055138_T_C	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189975480	chr18_80059915_G_A	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571	QTD000021
+189975486	chr18_80060172_G_A	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189975234	chr18_80035323_C_G	ENSG00000101546	0.017634199932217598	-0.5941640138626099	0.2443539947271347	0.9664999842643738	QTD000021
+189974258	chr18_79881916_C_T	ENSG00000101546	0.035509899258613586	-0.6130660176277161	0.28586700558662415	0.9263100028038025	QTD000021
+165263491	chr18_80053395_G_T	ENSG00000101546	0.0014024500269442797	0.6116849780082703	0.18375900387763977	0.9997699856758118	QTD000021
+189975560	chr18_80067838_T_C	ENSG00000101546	0.027172299101948738	-0.5348979830741882	0.23698699474334717	0.9732599854469299	QTD000021
+189975404	chr18_80052890_C_T	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571	QTD000021
+189974338	chr18_79897865_A_C	ENSG00000101546	0.027356300503015518	-0.6986830234527588	0.309935986995697	0.8177499771118164	QTD000021
+88264183	chr18_79428406_C_T	ENSG00000101546	0.0035831599961966276	0.5916919708251953	0.1961819976568222	0.5903199911117554	QTD000021
+165264179	chr18_80256437_C_T	ENSG00000101546	1.0022899914474692e-06	1.3872699737548828	0.2583479881286621	0.4155200123786926	QTD000021
+189974874	chr18_79992459_A_G	ENSG00000101546	0.01678840070962906	-0.6368399858474731	0.2598400115966797	0.8073300123214722	QTD000021
+189974378	chr18_79908190_C_T	ENSG00000101546	0.02625890076160431	-0.7442160248756409	0.32767701148986816	0.865369975566864	QTD000021
+165263545	chr18_80062556_T_C	ENSG00000101546	0.0013587300200015306	0.6284509897232056	0.18821699917316437	0.9168499708175659	QTD000021
+189974944	chr18_80004073_T_C	ENSG00000101546	0.01681469939649105	-0.6360729932785034	0.2595919966697693	0.8078600168228149	QTD000021
+189975592	chr18_80074222_A_G	ENSG00000101546	0.021228300407528877	0.5256810188293457	0.22296099364757538	0.8827199935913086	QTD000021
+189975030	chr18_80012053_C_T	ENSG00000101546	0.015259799547493458	-0.6196200251579285	0.2490289956331253	0.8984299898147583	QTD000021
+189974798	chr18_79978994_G_A	ENSG00000101546	0.016826199367642403	-0.6356809735298157	0.259460985660553	0.8081899881362915	QTD000021
+189975558	chr18_80067644_G_A	ENSG00000101546	0.018936200067400932	-0.5249940156936646	0.2184389978647232	0.9997000098228455	QTD000021
+189974750	chr18_79969568_T_G	ENSG00000101546	0.024881400167942047	-0.6028140187263489	0.26285699009895325	0.8036199808120728	QTD000021
+165262766	chr18_79845212_A_G	ENSG00000101546	0.03241319954395294	-0.5894320011138916	0.2699649930000305	0.823419988155365	QTD000021
+189975422	chr18_80054855_C_T	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189974768	chr18_79972180_C_T	ENSG00000101546	0.019525699317455292	-0.6385509967803955	0.26704299449920654	0.7862200140953064	QTD000021
+189974958	chr18_80005310_T_C	ENSG00000101546	0.0203901007771492	-0.6135429739952087	0.2584550082683563	0.8163400292396545	QTD000021
+88264299	chr18_79439638_T_C	ENSG00000101546	0.04078270122408867	-0.3897930085659027	0.18696199357509613	0.855459988117218	QTD000021
+189968676	chr18_79116940_T_TA	ENSG00000101546	0.027863100171089172	0.6207360029220581	0.27628999948501587	0.9672899842262268	QTD000021
+165264163	chr18_80242558_C_G	ENSG00000101546	0.032818298786878586	-0.831233024597168	0.3816309869289398	0.40481001138687134	QTD000021
+189974744	chr18_79969306_GA_G	ENSG00000101546	0.00014140500570647418	1.3737800121307373	0.3408629894256592	0.40935999155044556	QTD000021
+165263669	chr18_80092346_TATAGAGAGAGAGAGAGAGAG_T	ENSG00000101546	0.00607470003888011	-0.8651469945907593	0.3055979907512665	0.6850600242614746	QTD000021
+189975887	chr18_80111566_AT_A	ENSG00000101546	0.005242549814283848	0.5107319951057434	0.17712900042533875	0.9149500131607056	QTD000021
+165263595	chr18_80077316_C_CAA	ENSG00000101546	0.0005801990046165884	-0.917589008808136	0.2543419897556305	0.8556399941444397	QTD000021
+165263834	chr18_80131569_CTT_C	ENSG00000101546	1.2384700198708742e-07	0.8924009799957275	0.15134300291538239	0.9730899930000305	QTD000021
+189968852	chr18_79138774_T_TA	ENSG00000101546	0.034833598881959915	0.5915639996528625	0.2747890055179596	0.9073699712753296	QTD000021
+88269041	chr18_80083194_CA_C	ENSG00000101546	0.0026245699264109135	-0.7046819925308228	0.22572000324726105	0.7047299742698669	QTD000021
+189974358	chr18_79903863_A_G	ENSG00000101546	0.027788599953055382	0.43759599328041077	0.19467799365520477	0.7608399987220764	QTD000021
+165264041	chr18_80180322_C_T	ENSG00000101546	0.008212540298700333	-0.6301609873771667	0.23152300715446472	0.9437400102615356	QTD000021
+165263619	chr18_80083687_G_A	ENSG00000101546	0.000790458987466991	-0.7059760093688965	0.2010509967803955	0.9594500064849854	QTD000021
+165263109	chr18_79956624_G_A	ENSG00000101546	0.016277799382805824	-0.4408339858055115	0.17898400127887726	0.9308300018310547	QTD000021
+189974122	chr18_79867877_A_G	ENSG00000101546	0.024202600121498108	-0.4021959900856018	0.17451700568199158	0.9387999773025513	QTD000021
+165264149	chr18_80223381_T_A	ENSG00000101546	0.027060700580477715	-0.8133559823036194	0.36008700728416443	0.41071999073028564	QTD000021
+165263779	chr18_80120574_C_T	ENSG00000101546	5.779879938927479e-05	-0.6903769969940186	0.16106800734996796	0.972790002822876	QTD000021
+88268473	chr18_80017636_T_G	ENSG00000101546	0.00033769800211302936	0.5948230028152466	0.15766200423240662	0.9208700060844421	QTD000021
+189974450	chr18_79923131_G_T	ENSG00000101546	0.0018138400046154857	-0.7967979907989502	0.24556100368499756	0.7055799961090088	QTD000021
+88268097	chr18_79965655_A_G	ENSG00000101546	0.020526399835944176	0.5358060002326965	0.22596199810504913	0.8470799922943115	QTD000021
+165263407	chr18_80036239_G_T	ENSG00000101546	0.0012013299856334925	0.7136030197143555	0.21121099591255188	0.9030900001525879	QTD000021
+189974644	chr18_79956889_G_A	ENSG00000101546	0.0014028799487277865	-0.611066997051239	0.1835789978504181	0.9300900101661682	QTD000021
+165263886	chr18_80147638_A_G	ENSG00000101546	0.03544029965996742	-0.43302100896835327	0.2018350064754486	0.8271600008010864	QTD000021
+189975242	chr18_80036574_C_T	ENSG00000101546	0.0003092499973718077	-0.5977219939231873	0.15732699632644653	0.9657700061798096	QTD000021
+165263108	chr18_79956540_T_C	ENSG00000101546	0.029979800805449486	-0.389710009098053	0.17584800720214844	0.9292200207710266	QTD000021
+189974136	chr18_79868996_A_G	ENSG00000101546	0.024199599400162697	-0.40219399333000183	0.17451299726963043	0.9389399886131287	QTD000021
+165261322	chr18_79459475_C_T	ENSG00000101546	0.031688299030065536	-0.5803430080413818	0.2646459937095642	0.8968300223350525	QTD000021
+165263874	chr18_80144824_A_G	ENSG00000101546	0.00041173299541696906	-0.9514430165290833	0.2562609910964966	0.8420799970626831	QTD000021
+88270173	chr18_80257297_C_T	ENSG00000101546	0.047908999025821686	0.46539101004600525	0.23107700049877167	0.9243299961090088	QTD000021
+88265709	chr18_79621649_C_T	ENSG00000101546	0.04461599886417389	-0.49900299310684204	0.24394699931144714	0.9291499853134155	QTD000021
+189975098	chr18_80019652_C_A	ENSG00000101546	0.013960200361907482	-0.6017209887504578	0.23853500187397003	0.8804900050163269	QTD000021
+165264166	chr18_80245424_G_A	ENSG00000101546	0.030152199789881706	-0.8601790070533752	0.38855698704719543	0.40099000930786133	QTD000021
+189974132	chr18_79868832_T_C	ENSG00000101546	0.024199599400162697	-0.40219399333000183	0.17451299726963043	0.9389399886131287	QTD000021
+165264045	chr18_80182722_G_T	ENSG00000101546	0.00996697973459959	-0.6216570138931274	0.2345689982175827	0.9793599843978882	QTD000021
+165263111	chr18_79957182_T_C	ENSG00000101546	0.00988140981644392	-0.4686099886894226	0.17660599946975708	0.9330800175666809	QTD000021
+189975228	chr18_80034810_G_A	ENSG00000101546	0.00044641000567935407	-0.5888959765434265	0.15967200696468353	0.999779999256134	QTD000021
+165264169	chr18_80248901_T_G	ENSG00000101546	0.03456300124526024	0.5418429970741272	0.2513050138950348	0.46849000453948975	QTD000021
+189975044	chr18_80013596_G_A	ENSG00000101546	0.00036805300624109805	-0.6124699711799622	0.1634649932384491	0.9235000014305115	QTD000021
+165263481	chr18_80050485_C_T	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193	QTD000021
+165262767	chr18_79846001_G_A	ENSG00000101546	0.020738299936056137	0.3971950113773346	0.1677979975938797	0.9456400275230408	QTD000021
+88265721	chr18_79624103_C_G	ENSG00000101546	0.043914999812841415	-0.4948810040950775	0.24110999703407288	0.9356099963188171	QTD000021
+165263464	chr18_80047043_G_C	ENSG00000101546	0.003139219945296645	0.6661379933357239	0.21759900450706482	0.9107499718666077	QTD000021
+88264251	chr18_79436509_G_A	ENSG00000101546	0.003377229906618595	0.6379070281982422	0.21008999645709991	0.558210015296936	QTD000021
+165263977	chr18_80167710_G_A	ENSG00000101546	0.0016949500422924757	-0.9104419946670532	0.27867400646209717	0.8137000203132629	QTD000021
+189974458	chr18_79925520_A_G	ENSG00000101546	0.008464010432362556	0.4737200140953064	0.1747570037841797	0.9314900040626526	QTD000021
+88268475	chr18_80017757_C_T	ENSG00000101546	0.00033673999132588506	0.594323992729187	0.15749399363994598	0.9223799705505371	QTD000021
+165264171	chr18_80249901_T_C	ENSG00000101546	0.01624150015413761	0.6362590193748474	0.25823700428009033	0.45124000310897827	QTD000021
+165263621	chr18_80083748_G_C	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934	QTD000021
+165263780	chr18_80120603_G_C	ENSG00000101546	5.779879938927479e-05	-0.6903769969940186	0.16106800734996796	0.972790002822876	QTD000021
+165263463	chr18_80046509_A_G	ENSG00000101546	0.0015298300422728062	0.7141900062561035	0.21638800203800201	0.9067999720573425	QTD000021
+165263718	chr18_80106536_C_CGTG	ENSG00000101546	0.0009647249826230109	-0.9014440178871155	0.26139500737190247	0.693589985370636	QTD000021
+165263677	chr18_80094116_TAC_T	ENSG00000101546	0.001179030048660934	-0.7517610192298889	0.22211000323295593	0.838670015335083	QTD000021
+189975886	chr18_80111566_AT_A	ENSG00000101546	0.005242549814283848	0.5107319951057434	0.17712900042533875	0.9149500131607056	QTD000021
+189970168	chr18_79354568_CAAA_C	ENSG00000101546	0.008687240071594715	0.9145209789276123	0.33856698870658875	0.6008700132369995	QTD000021
+165263659	chr18_80091490_CTT_C	ENSG00000101546	0.00044414299190975726	-0.8210899829864502	0.22253400087356567	0.976170003414154	QTD000021
+165263676	chr18_80094116_TAC_T	ENSG00000101546	0.001179030048660934	-0.7517610192298889	0.22211000323295593	0.838670015335083	QTD000021
+165262968	chr18_79903896_A_G	ENSG00000101546	0.007458209991455078	0.7488849759101868	0.27163100242614746	0.7172300219535828	QTD000021
+165263645	chr18_80088881_G_GTT	ENSG00000101546	0.0008126859902404249	-0.7047669887542725	0.2012059986591339	0.9644399881362915	QTD000021
+165261301	chr18_79455760_TCCCACGGCCGCCCCATCCCAC_T	ENSG00000101546	0.026114100590348244	0.5667369961738586	0.24928300082683563	0.43731001019477844	QTD000021
+189969028	chr18_79158230_CT_C	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+165263541	chr18_80062261_G_GT	ENSG00000101546	6.983349898348479e-09	0.9865990281105042	0.14946800470352173	0.9559500217437744	QTD000021
+165262966	chr18_79903409_C_G	ENSG00000101546	0.010445400141179562	-0.7067210078239441	0.26844099164009094	0.8590099811553955	QTD000021
+189968684	chr18_79117040_A_ACT	ENSG00000101546	0.0408950001001358	0.527961015701294	0.2533789873123169	0.9663900136947632	QTD000021
+189969452	chr18_79208081_T_G	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646	QTD000021
+189968300	chr18_79069127_C_CT	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165263968	chr18_80165736_G_GA	ENSG00000101546	2.1741000466590776e-07	0.8853939771652222	0.15381400287151337	0.9742799997329712	QTD000021
+189968716	chr18_79120359_TAAAA_T	ENSG00000101546	0.031156500801444054	-0.8116329908370972	0.3689199984073639	0.9836699962615967	QTD000021
+88264019	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267	QTD000021
+88264191	chr18_79429220_CAA_C	ENSG00000101546	0.04382459819316864	-0.45905399322509766	0.22355599701404572	0.846310019493103	QTD000021
+189975578	chr18_80070469_A_G	ENSG00000101546	0.01796709932386875	-0.5397830009460449	0.2226649969816208	0.9735100269317627	QTD000021
+189974276	chr18_79884547_TCTGGGC_T	ENSG00000101546	0.03304240107536316	-0.6261109709739685	0.2878369987010956	0.9235900044441223	QTD000021
+165263351	chr18_80024474_TTGTG_T	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414	QTD000021
+189969584	chr18_79236473_CT_C	ENSG00000101546	0.030060099437832832	-0.8153769969940186	0.36810699105262756	0.9937400221824646	QTD000021
+165261386	chr18_79474048_G_A	ENSG00000101546	0.02458750084042549	-0.7795990109443665	0.33922499418258667	0.6962199807167053	QTD000021
+189969062	chr18_79162674_CAG_C	ENSG00000101546	0.033481400460004807	0.561834990978241	0.2589539885520935	0.9670199751853943	QTD000021
+189968278	chr18_79064966_C_T	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9400799870491028	QTD000021
+165261351	chr18_79464648_T_TTCTGTGTGTG	ENSG00000101546	0.025898899883031845	-0.7204480171203613	0.3164199888706207	0.7374500036239624	QTD000021
+189969168	chr18_79173346_A_AT	ENSG00000101546	0.03304319828748703	0.5645449757575989	0.259535014629364	0.9645799994468689	QTD000021
+165263596	chr18_80077316_CA_C	ENSG00000101546	2.383680026696311e-07	0.8571000099182129	0.14949700236320496	0.9176099896430969	QTD000021
+165263005	chr18_79918420_C_CGGG	ENSG00000101546	0.010068999603390694	0.6765609979629517	0.2556520104408264	0.5720400214195251	QTD000021
+189968654	chr18_79112039_TAGAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189969156	chr18_79172036_A_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+88264507	chr18_79464494_T_TA	ENSG00000101546	0.03658439964056015	-0.5196570158004761	0.24376200139522552	0.9464499950408936	QTD000021
+189974454	chr18_79924036_C_CA	ENSG00000101546	0.013886700384318829	-0.7454249858856201	0.29526498913764954	0.7831699848175049	QTD000021
+189975218	chr18_80034088_CG_C	ENSG00000101546	0.017705900594592094	-0.5938979983329773	0.24440599977970123	0.9673900008201599	QTD000021
+189970442	chr18_79379096_CCTGAGTTTCCGGACGGGCCCGGCCCTGCGAGGGCGCG_C	ENSG00000101546	0.028271500021219254	-0.9858899712562561	0.44000399112701416	0.8375300168991089	QTD000021
+189969116	chr18_79168362_T_TTTTG	ENSG00000101546	0.0321056991815567	0.5739529728889465	0.2623920142650604	0.9609699845314026	QTD000021
+165263646	chr18_80089156_CTTTTTT_C	ENSG00000101546	0.0007952200248837471	-0.7048580050468445	0.20083999633789062	0.9687299728393555	QTD000021
+189969324	chr18_79189288_A_G	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189969080	chr18_79164533_G_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+165263755	chr18_80116545_C_CT	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844	QTD000021
+189968902	chr18_79145066_A_G	ENSG00000101546	0.021456299349665642	0.8250390291213989	0.3505690097808838	0.8266100287437439	QTD000021
+189968411	chr18_79078663_GT_G	ENSG00000101546	0.03195120021700859	-0.8200979828834534	0.3745729923248291	0.9371100068092346	QTD000021
+88269042	chr18_80083194_CAA_C	ENSG00000101546	0.03877180069684982	0.6794390082359314	0.3224959969520569	0.7369199991226196	QTD000021
+165263133	chr18_79963052_AGCGTGCGTCAGC_A	ENSG00000101546	0.0020915500354021788	-0.8126299977302551	0.2541239857673645	0.8120999932289124	QTD000021
+189968298	chr18_79069113_G_GCC	ENSG00000101546	0.026198700070381165	0.6238790154457092	0.2745780050754547	0.991349995136261	QTD000021
+165263719	chr18_80106536_C_CGTG	ENSG00000101546	0.0009647249826230109	-0.9014440178871155	0.26139500737190247	0.693589985370636	QTD000021
+88267659	chr18_79882883_C_T	ENSG00000101546	0.009121229872107506	1.5579899549484253	0.5806570053100586	0.5323799848556519	QTD000021
+165263145	chr18_79965699_A_G	ENSG00000101546	0.0012596900342032313	-0.7240279912948608	0.21526800096035004	0.9650300145149231	QTD000021
+165263142	chr18_79965625_G_C	ENSG00000101546	0.0013199399691075087	-0.7183049917221069	0.2145259976387024	0.9714699983596802	QTD000021
+165263618	chr18_80083488_C_CTT	ENSG00000101546	0.0014832599554210901	-0.6493579745292664	0.19614699482917786	0.9565899968147278	QTD000021
+189968938	chr18_79149476_GAA_G	ENSG00000101546	0.030845800414681435	-0.8117179870605469	0.3682529926300049	0.9889600276947021	QTD000021
+165263065	chr18_79946239_CAAAGAA_C	ENSG00000101546	0.018309399485588074	-0.41694799065589905	0.17252600193023682	0.8902300000190735	QTD000021
+88269145	chr18_80092342_TATATATAGAGAGAGAGAGAGAG_T	ENSG00000101546	0.021002300083637238	1.3039599657058716	0.552049994468689	0.5843200087547302	QTD000021
+189976456	chr18_80177170_C_CACACAT	ENSG00000101546	0.04319680109620094	0.540369987487793	0.262347012758255	0.7683699727058411	QTD000021
+189968986	chr18_79153989_C_T	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+189968090	chr18_79044595_TA_T	ENSG00000101546	0.03289920091629028	-0.8263850212097168	0.37958601117134094	0.8961600065231323	QTD000021
+165263901	chr18_80152678_CTT_C	ENSG00000101546	0.006232670042663813	-0.5736100077629089	0.20327800512313843	0.9239500164985657	QTD000021
+189968096	chr18_79045092_GCTTT_G	ENSG00000101546	0.03276880085468292	-0.8266410231590271	0.3794110119342804	0.9081100225448608	QTD000021
+165263193	chr18_79982214_AAGC_A	ENSG00000101546	0.001902349991723895	-0.7687190175056458	0.23805800080299377	0.9539700150489807	QTD000021
+165264134	chr18_80217851_G_GA	ENSG00000101546	4.7355800347759214e-07	0.9590169787406921	0.17247000336647034	0.8252400159835815	QTD000021
+189969160	chr18_79172256_T_TG	ENSG00000101546	0.02102700062096119	1.0501899719238281	0.4447050094604492	0.49046000838279724	QTD000021
+189969146	chr18_79171878_G_GTT	ENSG00000101546	0.028650900349020958	-0.8239669799804688	0.36864998936653137	0.926010012626648	QTD000021
+189969560	chr18_79229978_TA_T	ENSG00000101546	0.03398840129375458	-0.7986850142478943	0.3692060112953186	0.9703500270843506	QTD000021
+88268429	chr18_80013393_T_C	ENSG00000101546	0.006624099798500538	0.9265140295028687	0.3309069871902466	0.9486500024795532	QTD000021
+189968397	chr18_79076904_G_GT	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165263704	chr18_80099359_C_T	ENSG00000101546	0.0010180700337514281	-1.4965399503707886	0.4361189901828766	0.4753200113773346	QTD000021
+88264587	chr18_79474712_G_A	ENSG00000101546	0.02989250048995018	-0.5387089848518372	0.24294699728488922	0.8973900079727173	QTD000021
+165263242	chr18_79997395_C_CA	ENSG00000101546	2.8814399755106024e-08	0.9946050047874451	0.15898500382900238	0.8493000268936157	QTD000021
+88264589	chr18_79475415_CGTT_C	ENSG00000101546	0.030645400285720825	-0.5480639934539795	0.24833300709724426	0.8634999990463257	QTD000021
+189968469	chr18_79085883_G_GT	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.9910200238227844	QTD000021
+165263647	chr18_80089161_TTTTTTC_T	ENSG00000101546	0.0002696430019568652	0.6738640069961548	0.17547400295734406	0.9258900284767151	QTD000021
+189968518	chr18_79092640_C_CTTT	ENSG00000101546	0.026963699609041214	0.6564019918441772	0.29041001200675964	0.8723999857902527	QTD000021
+165263395	chr18_80034081_G_GC	ENSG00000101546	2.1349699785844223e-10	1.0824600458145142	0.14554999768733978	0.9538999795913696	QTD000021
+189976320	chr18_80158991_AT_A	ENSG00000101546	0.0029946300201117992	0.5591099858283997	0.18168599903583527	0.8935700058937073	QTD000021
+165264173	chr18_80250995_ATTGT_A	ENSG00000101546	8.147729886331945e-07	1.3974100351333618	0.2576969861984253	0.417959988117218	QTD000021
+165261384	chr18_79473733_A_G	ENSG00000101546	0.01849539950489998	-0.7254490256309509	0.30067598819732666	0.8794199824333191	QTD000021
+189969194	chr18_79175282_C_CTG	ENSG00000101546	0.03348590061068535	0.5636100172996521	0.2597790062427521	0.9584500193595886	QTD000021
+189970171	chr18_79354568_CAAAAAAA_C	ENSG00000101546	0.02525389939546585	-0.9186720252037048	0.401652991771698	0.8540899753570557	QTD000021
+189969231	chr18_79181600_C_CT	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+88268179	chr18_79977810_TTTTTG_T	ENSG00000101546	0.0090065598487854	0.5001299977302551	0.18607200682163239	0.9585400223731995	QTD000021
+88269551	chr18_80144307_TACA_T	ENSG00000101546	0.025891300290822983	0.6965559720993042	0.30591100454330444	0.9466000199317932	QTD000021
+189968310	chr18_79069549_C_CG	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654	QTD000021
+189974442	chr18_79922282_GA_G	ENSG00000101546	0.0020336799789220095	0.563323974609375	0.17565099895000458	0.8583499789237976	QTD000021
+189969450	chr18_79207979_C_T	ENSG00000101546	0.03009819984436035	-0.8121849894523621	0.3667539954185486	0.9940800070762634	QTD000021
+189969326	chr18_79189296_G_A	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189969432	chr18_79206623_C_CATAA	ENSG00000101546	0.02459779940545559	0.5034890174865723	0.21909800171852112	0.6862199902534485	QTD000021
+165263607	chr18_80081300_A_ATTTTG	ENSG00000101546	0.0003881960001308471	-0.735040009021759	0.19702699780464172	0.9323999881744385	QTD000021
+189968366	chr18_79072965_C_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968134	chr18_79050340_T_TAATAAATAAATA	ENSG00000101546	0.03670889884233475	0.6114330291748047	0.28700900077819824	0.9308199882507324	QTD000021
+189969998	chr18_79327540_TGCTCTCCGTGGTTAGC_T	ENSG00000101546	0.034864600747823715	-0.9216139912605286	0.42817699909210205	0.7690600156784058	QTD000021
+189969590	chr18_79237248_G_A	ENSG00000101546	0.037329401820898056	0.507407009601593	0.23898600041866302	0.8235099911689758	QTD000021
+189974608	chr18_79952896_GGCCCCCT_G	ENSG00000101546	0.014420700259506702	-0.675724983215332	0.2692070007324219	0.8406599760055542	QTD000021
+88264503	chr18_79464361_CT_C	ENSG00000101546	0.0354854017496109	-0.5205100178718567	0.24267500638961792	0.9361699819564819	QTD000021
+189968434	chr18_79082248_T_A	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9400799870491028	QTD000021
+189975248	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798	QTD000021
+189968364	chr18_79072845_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165263218	chr18_79991107_CAA_C	ENSG00000101546	4.226340024615638e-05	0.8044869899749756	0.18392400443553925	0.7601000070571899	QTD000021
+88268469	chr18_80017227_T_C	ENSG00000101546	0.0003371330094523728	0.5942819714546204	0.15749800205230713	0.9224299788475037	QTD000021
+165261352	chr18_79464677_T_TATATACACAC	ENSG00000101546	0.026624400168657303	-0.8889089822769165	0.39236900210380554	0.497189998626709	QTD000021
+165263307	chr18_80013122_A_AT	ENSG00000101546	7.343759733657862e-08	0.9926689863204956	0.1647309958934784	0.8404200077056885	QTD000021
+189969435	chr18_79206623_CATAA_C	ENSG00000101546	0.036491598933935165	-0.7889209985733032	0.36987999081611633	0.737820029258728	QTD000021
+189969756	chr18_79266758_T_C	ENSG00000101546	0.029738599434494972	-0.8309569954872131	0.37438100576400757	0.9692699909210205	QTD000021
+189969058	chr18_79161735_A_G	ENSG00000101546	0.026211999356746674	0.6285030245780945	0.27663901448249817	0.970990002155304	QTD000021
+88269433	chr18_80129095_CTTTTTTTTTGT_C	ENSG00000101546	0.024507999420166016	0.7027459740638733	0.30560898780822754	0.9831100106239319	QTD000021
+189969926	chr18_79309669_A_G	ENSG00000101546	0.027699900791049004	-0.9351099729537964	0.41576799750328064	0.7708799839019775	QTD000021
+165261435	chr18_79488298_TTGTGTGTGTGTGTG_T	ENSG00000101546	0.0348701998591423	-0.39046499133110046	0.18141299486160278	0.7831100225448608	QTD000021
+165263243	chr18_79997448_A_AAAT	ENSG00000101546	0.006668020039796829	0.6410819888114929	0.22915899753570557	0.8404399752616882	QTD000021
+88264017	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267	QTD000021
+165264089	chr18_80202126_AAAC_A	ENSG00000101546	0.012753100134432316	-0.6267529726028442	0.2450910061597824	0.9089199900627136	QTD000021
+189969072	chr18_79163645_A_G	ENSG00000101546	0.031346000730991364	-0.8081910014152527	0.36778199672698975	0.9937400221824646	QTD000021
+165264142	chr18_80219205_T_TTTGC	ENSG00000101546	0.04346669837832451	-0.43810200691223145	0.2129790037870407	0.8742899894714355	QTD000021
+165263333	chr18_80018583_T_C	ENSG00000101546	9.473540174553818e-09	0.98955899477005	0.1516129970550537	0.9089099764823914	QTD000021
+189976380	chr18_80168314_C_A	ENSG00000101546	0.046848900616168976	0.5284479856491089	0.2610970139503479	0.8314899802207947	QTD000021
+88264185	chr18_79428486_A_C	ENSG00000101546	0.04352179914712906	-0.3734950125217438	0.18162000179290771	0.8747100234031677	QTD000021
+88264575	chr18_79472709_A_G	ENSG00000101546	0.0498369000852108	-0.3575980067253113	0.1791210025548935	0.9945300221443176	QTD000021
+165263643	chr18_80088353_A_G	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445	QTD000021
+189968592	chr18_79103710_A_G	ENSG00000101546	0.028219299390912056	0.6170700192451477	0.27530500292778015	0.9819499850273132	QTD000021
+189968648	chr18_79110876_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968276	chr18_79064762_C_T	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165263247	chr18_79997949_T_G	ENSG00000101546	0.00667465990409255	0.6408960223197937	0.22912199795246124	0.8406500220298767	QTD000021
+165261459	chr18_79491848_A_G	ENSG00000101546	0.02016489952802658	-0.41565200686454773	0.17476600408554077	0.8600299954414368	QTD000021
+165261457	chr18_79491559_C_G	ENSG00000101546	0.01997949928045273	-0.4160810112953186	0.17467600107192993	0.8610299825668335	QTD000021
+165261456	chr18_79491254_C_G	ENSG00000101546	0.020042700693011284	-0.4207099974155426	0.1767120063304901	0.8355699777603149	QTD000021
+165261430	chr18_79488213_G_A	ENSG00000101546	0.022015299648046494	-0.40702399611473083	0.1737149953842163	0.8542100191116333	QTD000021
+165261455	chr18_79491061_T_C	ENSG00000101546	0.01999030075967312	-0.416032999753952	0.1746709942817688	0.8610799908638	QTD000021
+88264727	chr18_79491622_G_A	ENSG00000101546	0.04307619854807854	0.3810189962387085	0.18487299978733063	0.8528599739074707	QTD000021
+165261460	chr18_79491941_T_C	ENSG00000101546	0.020231500267982483	-0.4155910015106201	0.17483699321746826	0.8591399788856506	QTD000021
+165261461	chr18_79492044_G_C	ENSG00000101546	0.02181529998779297	-0.41130200028419495	0.17526499927043915	0.859499990940094	QTD000021
+165263654	chr18_80090098_C_T	ENSG00000101546	0.00042329999268986285	-0.8076810240745544	0.2180349975824356	0.9999200105667114	QTD000021
+189968150	chr18_79051231_T_G	ENSG00000101546	0.02619119919836521	0.6239150166511536	0.2745800018310547	0.9768900275230408	QTD000021
+189968516	chr18_79092507_A_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968246	chr18_79061076_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968418	chr18_79079688_G_T	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654	QTD000021
+189968690	chr18_79117126_T_C	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189968324	chr18_79070812_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+189968610	chr18_79106106_A_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165263655	chr18_80090300_T_C	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+189968420	chr18_79079728_G_A	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654	QTD000021
+189968694	chr18_79117339_T_A	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183	QTD000021
+189968558	chr18_79099291_A_G	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183	QTD000021
+189975156	chr18_80028551_T_C	ENSG00000101546	0.0003614209999796003	-0.61388099193573	0.16360199451446533	0.9251300096511841	QTD000021
+165263356	chr18_80026210_G_A	ENSG00000101546	0.0024157098960131407	0.6816679835319519	0.21641899645328522	0.8848900198936462	QTD000021
+165263269	chr18_80005618_G_A	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8476799726486206	QTD000021
+165263270	chr18_80005839_C_G	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8476799726486206	QTD000021
+165263054	chr18_79942025_T_C	ENSG00000101546	0.00342423003166914	0.8067060112953186	0.2660979926586151	0.7327200174331665	QTD000021
+165262356	chr18_79710683_G_A	ENSG00000101546	0.027877699583768845	1.0290100574493408	0.45805901288986206	0.5303099751472473	QTD000021
+189974294	chr18_79888218_C_T	ENSG00000101546	0.03377470001578331	-0.6218339800834656	0.2870970070362091	0.921500027179718	QTD000021
+165263212	chr18_79988975_G_A	ENSG00000101546	0.007797140162438154	0.677515983581543	0.2471960037946701	0.8099700212478638	QTD000021
+165263210	chr18_79988859_G_C	ENSG00000101546	1.6504300219821744e-06	0.8164809942245483	0.15577000379562378	0.8511199951171875	QTD000021
+189976396	chr18_80169145_A_G	ENSG00000101546	0.04821709915995598	0.527944028377533	0.26250699162483215	0.8372700214385986	QTD000021
+165264157	chr18_80237823_T_C	ENSG00000101546	0.03238749876618385	-0.8387230038642883	0.38408398628234863	0.4003700017929077	QTD000021
+165263737	chr18_80112081_G_A	ENSG00000101546	0.001039269962348044	-0.7610329985618591	0.22220300137996674	0.9879800081253052	QTD000021
+165263738	chr18_80112093_G_C	ENSG00000101546	0.001042929943650961	-0.7607399821281433	0.2221899926662445	0.9881700277328491	QTD000021
+189969332	chr18_79189668_T_A	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189968208	chr18_79058307_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.9712700247764587	QTD000021
+189968756	chr18_79126701_C_T	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183	QTD000021
+88269197	chr18_80097897_C_T	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342	QTD000021
+88269195	chr18_80097877_G_A	ENSG00000101546	0.024271700531244278	0.6988790035247803	0.3034049868583679	0.9890199899673462	QTD000021
+189974966	chr18_80005859_G_A	ENSG00000101546	0.014974099583923817	-0.6198790073394775	0.2484000027179718	0.8089500069618225	QTD000021
+88268259	chr18_79992430_A_G	ENSG00000101546	0.011227499693632126	0.9215899705886841	0.35370200872421265	0.9165700078010559	QTD000021
+165263352	chr18_80024474_TTGTG_T	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414	QTD000021
+189968422	chr18_79079751_GT_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165262318	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449	QTD000021
+88268541	chr18_80028464_T_C	ENSG00000101546	0.003772800089791417	0.5350610017776489	0.17845599353313446	0.9571999907493591	QTD000021
+189975420	chr18_80054701_GGAC_G	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+88268455	chr18_80015967_C_T	ENSG00000101546	0.00567656010389328	1.0066499710083008	0.3525719940662384	0.8747400045394897	QTD000021
+189974544	chr18_79944951_GC_G	ENSG00000101546	0.022499799728393555	-0.6802849769592285	0.29143500328063965	0.8177800178527832	QTD000021
+189975058	chr18_80015355_A_AATTATTATTATT	ENSG00000101546	0.01359890028834343	-0.6569129824638367	0.25937798619270325	0.8670600056648254	QTD000021
+189968946	chr18_79150079_C_CA	ENSG00000101546	0.026356900110840797	0.6221839785575867	0.27413201332092285	0.987559974193573	QTD000021
+88269207	chr18_80098620_CTT_C	ENSG00000101546	0.02666180022060871	0.6308789849281311	0.27854400873184204	0.979200005531311	QTD000021
+189974588	chr18_79950980_G_A	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203	QTD000021
+189974590	chr18_79951127_G_T	ENSG00000101546	0.00324757001362741	0.5525670051574707	0.18118500709533691	0.9183400273323059	QTD000021
+189974592	chr18_79951157_A_C	ENSG00000101546	0.025229500606656075	-0.6268119812011719	0.27400100231170654	0.8650100231170654	QTD000021
+165263364	chr18_80028456_T_C	ENSG00000101546	0.0024493299424648285	0.6803510189056396	0.2163189947605133	0.8861200213432312	QTD000021
+165261385	chr18_79473902_G_A	ENSG00000101546	0.026818400248885155	-0.6829119920730591	0.30184000730514526	0.8665099740028381	QTD000021
+189969230	chr18_79181600_C_CT	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+88268421	chr18_80013111_GA_G	ENSG00000101546	0.00623522000387311	0.94343101978302	0.3343529999256134	0.9108899831771851	QTD000021
+189974490	chr18_79934128_TAA_T	ENSG00000101546	0.018797900527715683	-0.7050750255584717	0.2930130064487457	0.8239700198173523	QTD000021
+88267299	chr18_79829229_G_A	ENSG00000101546	0.006904010195285082	1.3521699905395508	0.48552000522613525	0.5361999869346619	QTD000021
+189976484	chr18_80178889_A_G	ENSG00000101546	0.04774029925465584	0.5347390174865723	0.26530200242996216	0.7473999857902527	QTD000021
+189968142	chr18_79050764_C_T	ENSG00000101546	0.02619119919836521	0.6239150166511536	0.2745800018310547	0.9768900275230408	QTD000021
+88264319	chr18_79442949_A_G	ENSG00000101546	0.024087799713015556	-0.4948180019855499	0.21452699601650238	0.9288899898529053	QTD000021
+165263222	chr18_79991786_C_A	ENSG00000101546	2.8773799343184692e-08	0.994189977645874	0.15891000628471375	0.8507500290870667	QTD000021
+165263966	chr18_80165030_A_G	ENSG00000101546	1.0223699973721523e-05	0.7187389731407166	0.1509310007095337	0.9588299989700317	QTD000021
+189975184	chr18_80032450_C_G	ENSG00000101546	0.00041126098949462175	-0.6060730218887329	0.163223996758461	0.9515500068664551	QTD000021
+165263381	chr18_80032676_T_C	ENSG00000101546	0.002472139894962311	0.6762980222702026	0.21524199843406677	0.9030900001525879	QTD000021
+165263050	chr18_79941007_C_G	ENSG00000101546	0.004313630051910877	-0.7956420183181763	0.26954200863838196	0.8611299991607666	QTD000021
+189974252	chr18_79880942_G_T	ENSG00000101546	0.02927199937403202	-0.6120150089263916	0.2749199867248535	0.9426599740982056	QTD000021
+165264109	chr18_80210089_T_C	ENSG00000101546	0.01109089981764555	-0.6423850059509277	0.2461089938879013	0.9005600214004517	QTD000021
+165263681	chr18_80095624_C_T	ENSG00000101546	8.493950008414686e-05	-0.8327509760856628	0.19936099648475647	0.9533500075340271	QTD000021
+88269223	chr18_80101627_G_A	ENSG00000101546	0.010835600085556507	0.6991339921951294	0.2669549882411957	0.989139974117279	QTD000021
+165263746	chr18_80115768_G_C	ENSG00000101546	0.0003516149881761521	-0.8289920091629028	0.220441997051239	0.9840099811553955	QTD000021
+88269225	chr18_80101974_C_T	ENSG00000101546	0.01050500012934208	0.6951419711112976	0.26425701379776	0.9999899864196777	QTD000021
+189974538	chr18_79943476_A_G	ENSG00000101546	0.0024323000106960535	-0.633467972278595	0.20126299560070038	0.8774700164794922	QTD000021
+189974500	chr18_79934294_C_A	ENSG00000101546	0.008568979799747467	0.4717499911785126	0.1743219941854477	0.934499979019165	QTD000021
+189974498	chr18_79934168_T_G	ENSG00000101546	0.00886933971196413	0.4530409872531891	0.16819800436496735	0.9988300204277039	QTD000021
+88267735	chr18_79901170_A_G	ENSG00000101546	0.043753400444984436	0.626662015914917	0.305074006319046	0.638979971408844	QTD000021
+88264359	chr18_79449015_A_G	ENSG00000101546	0.020402999594807625	-0.44371500611305237	0.1869339942932129	0.8567000031471252	QTD000021
+88269721	chr18_80160338_C_T	ENSG00000101546	0.04165950044989586	0.9882199764251709	0.4761109948158264	0.6051499843597412	QTD000021
+88264375	chr18_79451175_T_C	ENSG00000101546	0.010953900404274464	-0.4541740119457245	0.1736910045146942	0.9836699962615967	QTD000021
+165263154	chr18_79968045_C_T	ENSG00000101546	0.0033152198884636164	0.5490509867668152	0.1804489940404892	0.8358500003814697	QTD000021
+165263155	chr18_79968135_G_T	ENSG00000101546	0.0025249600876122713	0.6742879748344421	0.21508799493312836	0.9993699789047241	QTD000021
+88265723	chr18_79624561_C_T	ENSG00000101546	0.04361329972743988	0.3741999864578247	0.18204499781131744	0.9674999713897705	QTD000021
+88265771	chr18_79630343_G_A	ENSG00000101546	0.04653380066156387	0.3270370066165924	0.1613450050354004	0.9975500106811523	QTD000021
+88268371	chr18_80006801_T_C	ENSG00000101546	0.01107420027256012	0.9228410124778748	0.3534800112247467	0.9176999926567078	QTD000021
+165263281	chr18_80006936_G_A	ENSG00000101546	0.0031031400430947542	0.6861979961395264	0.22386400401592255	0.8466399908065796	QTD000021
+189975124	chr18_80024198_A_C	ENSG00000101546	0.00036481101415120065	-0.6129689812660217	0.16348199546337128	0.9254599809646606	QTD000021
+189976680	chr18_80214570_C_T	ENSG00000101546	0.04749640077352524	0.5439770221710205	0.26958099007606506	0.6470199823379517	QTD000021
+165264132	chr18_80215819_G_T	ENSG00000101546	0.010726099833846092	-0.6411049962043762	0.2444400042295456	0.9078199863433838	QTD000021
+165261463	chr18_79492234_A_G	ENSG00000101546	0.020214799791574478	-0.4156700074672699	0.17484599351882935	0.8594800233840942	QTD000021
+88264735	chr18_79492158_A_G	ENSG00000101546	0.044126201421022415	0.37968501448631287	0.18517599999904633	0.8499900102615356	QTD000021
+165263408	chr18_80036386_A_C	ENSG00000101546	0.0012144800275564194	0.7148810029029846	0.2118079960346222	0.9005299806594849	QTD000021
+189974232	chr18_79878968_G_A	ENSG00000101546	0.02235650084912777	-0.6372110247612	0.27268001437187195	0.9195500016212463	QTD000021
+88269185	chr18_80097175_T_C	ENSG00000101546	0.010834700427949429	0.6996859908103943	0.2671619951725006	0.9884700179100037	QTD000021
+88269215	chr18_80099154_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342	QTD000021
+165263287	chr18_80008141_T_A	ENSG00000101546	5.821710146847181e-05	0.7035840153694153	0.16422699391841888	0.8942199945449829	QTD000021
+88264267	chr18_79437795_A_G	ENSG00000101546	0.019953899085521698	-0.5127109885215759	0.21519500017166138	0.9152200222015381	QTD000021
+88269213	chr18_80099142_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342	QTD000021
+189968536	chr18_79097489_T_A	ENSG00000101546	0.026249200105667114	0.6333479881286621	0.2788429856300354	0.9636600017547607	QTD000021
+189969944	chr18_79312902_A_T	ENSG00000101546	0.04649680107831955	0.46311700344085693	0.2284409999847412	0.8740900158882141	QTD000021
+189974560	chr18_79946425_T_C	ENSG00000101546	0.026411300525069237	-0.6212390065193176	0.2738179862499237	0.8618000149726868	QTD000021
+165264108	chr18_80209970_C_T	ENSG00000101546	5.121460162627045e-07	0.9372400045394897	0.1691569983959198	0.8549500107765198	QTD000021
+165263926	chr18_80153654_A_G	ENSG00000101546	0.004891959950327873	-0.6616219878196716	0.2275339961051941	0.9807999730110168	QTD000021
+165263661	chr18_80091874_G_T	ENSG00000101546	8.101719828346177e-08	0.9278609752655029	0.15459899604320526	0.9344099760055542	QTD000021
+189970126	chr18_79350161_C_T	ENSG00000101546	0.04271410033106804	0.45565399527549744	0.22068999707698822	0.9141299724578857	QTD000021
+189970194	chr18_79356116_C_T	ENSG00000101546	0.03198229894042015	0.4816110134124756	0.22001299262046814	0.9361000061035156	QTD000021
+189969588	chr18_79236894_C_T	ENSG00000101546	0.010057100094854832	1.083940029144287	0.4095189869403839	0.6497600078582764	QTD000021
+165262777	chr18_79852254_C_T	ENSG00000101546	0.029356699436903	-0.5751489996910095	0.25849899649620056	0.9031199812889099	QTD000021
+189968894	chr18_79144511_C_T	ENSG00000101546	0.028131699189543724	0.6180059909820557	0.2755639851093292	0.9607999920845032	QTD000021
+189969586	chr18_79236752_G_T	ENSG00000101546	0.04136829823255539	0.49744999408721924	0.23931199312210083	0.8937900066375732	QTD000021
+88264323	chr18_79444231_G_T	ENSG00000101546	0.021645499393343925	-0.5013729929924011	0.213359996676445	0.8994799852371216	QTD000021
+189974032	chr18_79862879_A_G	ENSG00000101546	0.010590399615466595	0.45870301127433777	0.174576997756958	0.9356399774551392	QTD000021
+165263296	chr18_80011050_C_T	ENSG00000101546	4.485749993676791e-09	1.012619972229004	0.15096400678157806	0.9098799824714661	QTD000021
+189976588	chr18_80197495_C_T	ENSG00000101546	0.009564920328557491	0.49497199058532715	0.18569299578666687	0.8510500192642212	QTD000021
+88268461	chr18_80016061_G_T	ENSG00000101546	0.0032865500543266535	0.5493680238723755	0.18037700653076172	0.9368000030517578	QTD000021
+189976626	chr18_80208181_A_G	ENSG00000101546	0.047510500997304916	0.5501949787139893	0.27268001437187195	0.6280400156974792	QTD000021
+189974016	chr18_79860911_A_G	ENSG00000101546	0.010555099695920944	0.4590950012207031	0.17464199662208557	0.934499979019165	QTD000021
+165263253	chr18_80001335_T_C	ENSG00000101546	1.4020399952130447e-08	1.0173399448394775	0.15817700326442719	0.8520799875259399	QTD000021
+189968532	chr18_79097112_C_T	ENSG00000101546	0.026814399287104607	0.622094988822937	0.2749519944190979	0.9851300120353699	QTD000021
+189968482	chr18_79086261_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165264022	chr18_80177972_T_TACACAC	ENSG00000101546	0.0028105799574404955	-0.8103110194206238	0.26148900389671326	0.6188700199127197	QTD000021
+189970552	chr18_79387642_G_C	ENSG00000101546	0.022433200851082802	-0.49226298928260803	0.21077799797058105	0.7585099935531616	QTD000021
+88264041	chr18_79412078_A_G	ENSG00000101546	0.04878789931535721	-0.411734014749527	0.2052599936723709	0.4424299895763397	QTD000021
+88269773	chr18_80168573_T_TTGTG	ENSG00000101546	0.01679369993507862	0.7516739964485168	0.30671000480651855	0.6649600267410278	QTD000021
+88264321	chr18_79443592_A_G	ENSG00000101546	0.0010349299991503358	-0.7124919891357422	0.20794999599456787	0.6106699705123901	QTD000021
+88265039	chr18_79530109_T_C	ENSG00000101546	0.008827930316329002	-0.7055609822273254	0.2617810070514679	0.41578999161720276	QTD000021
+165263958	chr18_80163448_CAG_C	ENSG00000101546	0.00013008899986743927	-0.6530699729919434	0.1610729992389679	0.951449990272522	QTD000021
+189968880	chr18_79141527_A_T	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806	QTD000021
+165263386	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023	QTD000021
+189968354	chr18_79072485_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968848	chr18_79137391_T_C	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806	QTD000021
+88269475	chr18_80131569_CT_C	ENSG00000101546	0.026396099478006363	0.6945620179176331	0.30610400438308716	0.9568700194358826	QTD000021
+189968766	chr18_79128050_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165261387	chr18_79474655_G_A	ENSG00000101546	0.023498600348830223	-0.6998289823532104	0.3020879924297333	0.8451499938964844	QTD000021
+165263878	chr18_80146131_C_G	ENSG00000101546	0.0026378000620752573	-0.7031970024108887	0.2253659963607788	0.9875400066375732	QTD000021
+189974406	chr18_79914567_A_ACAC	ENSG00000101546	0.005766630172729492	0.5081620216369629	0.1783290058374405	0.8534200191497803	QTD000021
+189974474	chr18_79932475_A_AAAAG	ENSG00000101546	0.015355500392615795	-0.7255340218544006	0.2918809950351715	0.8104000091552734	QTD000021
+165264065	chr18_80191353_C_A	ENSG00000101546	0.005423389840871096	-0.7459239959716797	0.2597790062427521	0.8539900183677673	QTD000021
+165264116	chr18_80211946_CA_C	ENSG00000101546	0.010767700150609016	-0.6441410183906555	0.24573400616645813	0.901229977607727	QTD000021
+189974318	chr18_79892129_A_AC	ENSG00000101546	0.013907000422477722	-0.6947519779205322	0.2752549946308136	0.871399998664856	QTD000021
+189975888	chr18_80111566_AT_A	ENSG00000101546	0.005242549814283848	0.5107319951057434	0.17712900042533875	0.9149500131607056	QTD000021
+165263962	chr18_80164361_C_T	ENSG00000101546	0.004420159850269556	-0.6688129901885986	0.2272299975156784	0.9820899963378906	QTD000021
+165263475	chr18_80048941_C_CGTCT	ENSG00000101546	3.2930998713709414e-05	0.7449690103530884	0.1676589995622635	0.9231600165367126	QTD000021
+165263589	chr18_80074960_G_A	ENSG00000101546	0.0004214690125081688	-0.854718029499054	0.23064999282360077	0.9711199998855591	QTD000021
+189968396	chr18_79076904_G_GT	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968940	chr18_79149725_A_AT	ENSG00000101546	0.032887399196624756	0.5622609853744507	0.2582469880580902	0.9640300273895264	QTD000021
+88268244	chr18_79991107_CA_C	ENSG00000101546	0.020448200404644012	0.46891599893569946	0.19762499630451202	0.8222200274467468	QTD000021
+189970542	chr18_79387207_CA_C	ENSG00000101546	0.008634510450065136	0.6610770225524902	0.24453599750995636	0.6520299911499023	QTD000021
+165263930	chr18_80156079_C_T	ENSG00000101546	0.005804670043289661	-0.6445559859275818	0.22638000547885895	0.9838200211524963	QTD000021
+165263471	chr18_80047702_A_G	ENSG00000101546	0.0013542500091716647	0.7053020000457764	0.21116599440574646	0.9127600193023682	QTD000021
+165263274	chr18_80006383_CA_C	ENSG00000101546	0.0021724801044911146	0.6917529702186584	0.21717999875545502	0.8327900171279907	QTD000021
+165263349	chr18_80024187_T_TA	ENSG00000101546	9.365420439166883e-09	0.9901210069656372	0.15163399279117584	0.9103400111198425	QTD000021
+189968730	chr18_79124164_CAG_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165263549	chr18_80064603_G_A	ENSG00000101546	2.311870048288256e-05	0.7587190270423889	0.16708900034427643	0.9409099817276001	QTD000021
+189974528	chr18_79941908_T_A	ENSG00000101546	0.016617100685834885	-0.653846025466919	0.26634201407432556	0.8183199763298035	QTD000021
+165263803	chr18_80126255_CTGT_C	ENSG00000101546	0.0013861899496987462	-0.7513729929924011	0.2254679948091507	0.9777500033378601	QTD000021
+189974456	chr18_79924117_C_T	ENSG00000101546	0.018136899918317795	-0.7141460180282593	0.2950440049171448	0.8180800080299377	QTD000021
+189968808	chr18_79132112_C_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165263244	chr18_79997448_A_AAAT	ENSG00000101546	0.006668020039796829	0.6410819888114929	0.22915899753570557	0.8404399752616882	QTD000021
+189968864	chr18_79139469_T_G	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806	QTD000021
+189968796	chr18_79130596_C_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189968454	chr18_79084159_G_GT	ENSG00000101546	0.026145299896597862	0.6233959794044495	0.27426400780677795	0.990559995174408	QTD000021
+165262768	chr18_79846478_CAT_C	ENSG00000101546	0.02139969915151596	0.3941349983215332	0.16739700734615326	0.9439200162887573	QTD000021
+189968468	chr18_79085883_G_GT	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.9910200238227844	QTD000021
+189969652	chr18_79248225_TG_T	ENSG00000101546	0.03012160025537014	-0.8133220076560974	0.3673210144042969	0.9957000017166138	QTD000021
+88268567	chr18_80031647_T_C	ENSG00000101546	0.0037468199152499437	0.5355499982833862	0.17847700417041779	0.9565500020980835	QTD000021
+88265791	chr18_79631418_CGT_C	ENSG00000101546	0.04891889914870262	0.33583900332450867	0.16752399504184723	0.9341700077056885	QTD000021
+165263047	chr18_79939763_AC_A	ENSG00000101546	0.01909800060093403	-0.4082370102405548	0.17009800672531128	0.8504300117492676	QTD000021
+189968410	chr18_79078663_G_GT	ENSG00000101546	0.02647639997303486	0.6239200234413147	0.2751219868659973	0.9853699803352356	QTD000021
+165264052	chr18_80186148_G_A	ENSG00000101546	0.011839100159704685	-0.6416829824447632	0.24818499386310577	0.9166600108146667	QTD000021
+189968876	chr18_79140729_G_A	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806	QTD000021
+165263506	chr18_80056237_G_GT	ENSG00000101546	0.00015261500084307045	0.6454190015792847	0.16102899610996246	0.9305899739265442	QTD000021
+165264046	chr18_80184151_G_A	ENSG00000101546	0.01181969977915287	-0.6072559952735901	0.23481300473213196	0.9821400046348572	QTD000021
+165263157	chr18_79968594_A_G	ENSG00000101546	0.003704539965838194	0.7053970098495483	0.23477399349212646	0.8464400172233582	QTD000021
+165263167	chr18_79970585_CT_C	ENSG00000101546	0.009232349693775177	0.5941150188446045	0.221794992685318	0.8132200241088867	QTD000021
+189968638	chr18_79109564_CT_C	ENSG00000101546	0.02801240049302578	0.6179019808769226	0.2753010094165802	0.9795299768447876	QTD000021
+165263995	chr18_80172670_C_T	ENSG00000101546	0.006621839944273233	-0.6514000296592712	0.23263899981975555	0.9870399832725525	QTD000021
+165264076	chr18_80195893_C_CT	ENSG00000101546	9.202360160998069e-06	0.7922729849815369	0.16539299488067627	0.86558997631073	QTD000021
+165263458	chr18_80045228_C_CT	ENSG00000101546	0.0012360200053080916	0.7123919725418091	0.21142500638961792	0.905239999294281	QTD000021
+165263457	chr18_80045228_C_CT	ENSG00000101546	0.0012360200053080916	0.7123919725418091	0.21142500638961792	0.905239999294281	QTD000021
+189968996	chr18_79155086_G_A	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847699999809265	QTD000021
+189968786	chr18_79130419_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189974128	chr18_79868719_T_C	ENSG00000101546	0.024199599400162697	-0.40219399333000183	0.17451299726963043	0.9389399886131287	QTD000021
+189968994	chr18_79155083_A_G	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+189968706	chr18_79119108_CTG_C	ENSG00000101546	0.027767999097704887	0.6189860105514526	0.27533799409866333	0.9764800071716309	QTD000021
+189968192	chr18_79057721_T_TA	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293	QTD000021
+165263192	chr18_79981952_CG_C	ENSG00000101546	2.677890006452799e-05	0.7691310048103333	0.17090100049972534	0.8939599990844727	QTD000021
+165263255	chr18_80002141_C_T	ENSG00000101546	0.006564840208739042	0.6404359936714172	0.22846999764442444	0.8449299931526184	QTD000021
+165264033	chr18_80179223_A_AT	ENSG00000101546	5.437000254460145e-07	0.8975480198860168	0.16243700683116913	0.9192799925804138	QTD000021
+165263202	chr18_79986442_C_CA	ENSG00000101546	0.00017432900494895875	0.6640830039978027	0.1673090010881424	0.8925899863243103	QTD000021
+165263869	chr18_80144063_AT_A	ENSG00000101546	0.0011340300552546978	-0.7654100060462952	0.2253129929304123	0.9729599952697754	QTD000021
+189968874	chr18_79140712_G_A	ENSG00000101546	0.026807500049471855	0.6195229887962341	0.2738029956817627	0.9921900033950806	QTD000021
+189968140	chr18_79050620_A_G	ENSG00000101546	0.02619119919836521	0.6239150166511536	0.2745800018310547	0.9768900275230408	QTD000021
+189968566	chr18_79101639_TAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189976036	chr18_80127339_G_GT	ENSG00000101546	4.4629800868278835e-06	0.8070570230484009	0.16198499500751495	0.9078199863433838	QTD000021
+189968384	chr18_79075081_G_GTT	ENSG00000101546	0.03524570167064667	0.6415330171585083	0.29869601130485535	0.9439799785614014	QTD000021
+165264056	chr18_80186948_A_T	ENSG00000101546	0.004830219782888889	-0.7145410180091858	0.24535700678825378	0.9209499955177307	QTD000021
+165264071	chr18_80194850_A_C	ENSG00000101546	0.01119260024279356	-0.6294440031051636	0.24146899580955505	0.9396399855613708	QTD000021
+189974106	chr18_79867490_TG_T	ENSG00000101546	0.026217199862003326	-0.4064269959926605	0.17889800667762756	0.9064000248908997	QTD000021
+189975142	chr18_80026740_CAT_C	ENSG00000101546	0.0003653719904832542	-0.6127560138702393	0.16344499588012695	0.9256200194358826	QTD000021
+165264158	chr18_80237893_T_C	ENSG00000101546	0.029706399887800217	-0.849481999874115	0.3826490044593811	0.40230000019073486	QTD000021
+165264072	chr18_80195252_G_A	ENSG00000101546	0.013934800401329994	-0.6261630058288574	0.24815599620342255	0.9025999903678894	QTD000021
+189968670	chr18_79114946_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165263367	chr18_80028595_A_AG	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231	QTD000021
+189968910	chr18_79146549_A_G	ENSG00000101546	0.03590390086174011	0.559315025806427	0.2613779902458191	0.9762099981307983	QTD000021
+189975232	chr18_80035261_TAA_T	ENSG00000101546	0.0003092499973718077	-0.5977219939231873	0.15732699632644653	0.9657700061798096	QTD000021
+88264135	chr18_79424489_ATC_A	ENSG00000101546	0.035638801753520966	-0.40778300166130066	0.19028300046920776	0.7771000266075134	QTD000021
+165263517	chr18_80057775_G_A	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252	QTD000021
+189968386	chr18_79076578_AT_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165263492	chr18_80053957_ACT_A	ENSG00000101546	2.131220026058145e-05	0.7576010227203369	0.1660279929637909	0.9484999775886536	QTD000021
+165262745	chr18_79829596_C_G	ENSG00000101546	0.039578501135110855	-0.5699710249900818	0.27168700098991394	0.8153600096702576	QTD000021
+165262657	chr18_79782606_AC_A	ENSG00000101546	0.044745299965143204	-0.3916890025138855	0.19160400331020355	0.5842300057411194	QTD000021
+189968707	chr18_79119108_CTG_C	ENSG00000101546	0.027767999097704887	0.6189860105514526	0.27533799409866333	0.9764800071716309	QTD000021
+189968908	chr18_79146328_T_C	ENSG00000101546	0.028304100036621094	0.8882920145988464	0.39653098583221436	0.5303099751472473	QTD000021
+189968655	chr18_79112039_TAGAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165261442	chr18_79489705_A_G	ENSG00000101546	0.020162399858236313	-0.4175409972667694	0.1755570024251938	0.8545600175857544	QTD000021
+189968423	chr18_79079751_GT_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+88269552	chr18_80144307_TACA_T	ENSG00000101546	0.025891300290822983	0.6965559720993042	0.30591100454330444	0.9466000199317932	QTD000021
+165264090	chr18_80202126_AAAC_A	ENSG00000101546	0.012753100134432316	-0.6267529726028442	0.2450910061597824	0.9089199900627136	QTD000021
+88262207	chr18_79133508_AAC_A	ENSG00000101546	0.01566080003976822	0.7371839880943298	0.29748401045799255	0.8217899799346924	QTD000021
+165261429	chr18_79487686_C_G	ENSG00000101546	0.04398379847407341	-0.3603760004043579	0.17563700675964355	0.8575000166893005	QTD000021
+189968062	chr18_79039214_G_A	ENSG00000101546	0.020527100190520287	-1.050920009613037	0.44319799542427063	0.7403299808502197	QTD000021
+189969018	chr18_79157419_A_C	ENSG00000101546	0.03309350088238716	0.560634970664978	0.2578139901161194	0.972029983997345	QTD000021
+189970444	chr18_79379138_C_G	ENSG00000101546	0.028271500021219254	-0.9858899712562561	0.44000399112701416	0.8375300168991089	QTD000021
+189969434	chr18_79206623_CATAA_C	ENSG00000101546	0.036491598933935165	-0.7889209985733032	0.36987999081611633	0.737820029258728	QTD000021
+165263437	chr18_80041720_CTTT_C	ENSG00000101546	0.0012789099710062146	0.713791012763977	0.21253199875354767	0.9042900204658508	QTD000021
+189968731	chr18_79124164_CAG_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189970076	chr18_79342612_T_A	ENSG00000101546	0.025955799967050552	-0.9063199758529663	0.3982129991054535	0.7273899912834167	QTD000021
+88262208	chr18_79133508_AAC_A	ENSG00000101546	0.01566080003976822	0.7371839880943298	0.29748401045799255	0.8217899799346924	QTD000021
+189974546	chr18_79944954_G_A	ENSG00000101546	0.022499799728393555	-0.6802849769592285	0.29143500328063965	0.8177800178527832	QTD000021
+189974650	chr18_79957497_C_CT	ENSG00000101546	0.0225272998213768	-0.6381809711456299	0.2734549939632416	0.876259982585907	QTD000021
+165261437	chr18_79489040_G_A	ENSG00000101546	0.019716599956154823	-0.4143350124359131	0.17355699837207794	0.8567299842834473	QTD000021
+189970164	chr18_79354288_C_A	ENSG00000101546	0.04056549817323685	0.46553799510002136	0.2230439931154251	0.902209997177124	QTD000021
+189975266	chr18_80038461_C_A	ENSG00000101546	0.0003188450064044446	-0.5966470241546631	0.15742400288581848	0.9603400230407715	QTD000021
+189975342	chr18_80045715_G_A	ENSG00000101546	0.01263049989938736	-0.5753780007362366	0.22467699646949768	0.9758899807929993	QTD000021
+88268731	chr18_80045856_A_C	ENSG00000101546	0.0035814300645142794	0.5257490277290344	0.17430800199508667	0.9998300075531006	QTD000021
+165263461	chr18_80045949_A_C	ENSG00000101546	2.2688599610187765e-10	1.0516300201416016	0.1416810005903244	0.9998499751091003	QTD000021
+165263462	chr18_80046478_C_T	ENSG00000101546	7.452690020670616e-09	0.9856410026550293	0.1496790051460266	0.9543899893760681	QTD000021
+189976134	chr18_80136961_G_A	ENSG00000101546	2.643429979798384e-05	0.6996489763259888	0.15533900260925293	0.9907500147819519	QTD000021
+189974438	chr18_79919006_G_C	ENSG00000101546	0.0066312397830188274	0.48878198862075806	0.1745939999818802	0.9206200242042542	QTD000021
+165262960	chr18_79899561_G_T	ENSG00000101546	0.03711000084877014	-0.6233670115470886	0.29325300455093384	0.8791999816894531	QTD000021
+189968387	chr18_79076578_AT_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968818	chr18_79133508_A_AAC	ENSG00000101546	0.04565830156207085	0.559283971786499	0.27478501200675964	0.7888799905776978	QTD000021
+88263055	chr18_79252797_C_CT	ENSG00000101546	0.021775100380182266	0.6891270279884338	0.2935599982738495	0.6720799803733826	QTD000021
+189968362	chr18_79072701_G_GC	ENSG00000101546	0.03247750177979469	0.5609250068664551	0.25700798630714417	0.9900100231170654	QTD000021
+88268579	chr18_80032972_GTTTTTCCTCTGCCCGTTTGTTTGTGAAAACTCTGCTTCTCAATACTCCGCCC_G	ENSG00000101546	0.0012752000475302339	0.6026189923286438	0.17938099801540375	0.9282699823379517	QTD000021
+189968567	chr18_79101639_TAC_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+88268180	chr18_79977810_TTTTTG_T	ENSG00000101546	0.0090065598487854	0.5001299977302551	0.18607200682163239	0.9585400223731995	QTD000021
+189968678	chr18_79116940_TAA_T	ENSG00000101546	0.04045280069112778	-0.7494009733200073	0.3588379919528961	0.88441002368927	QTD000021
+88264235	chr18_79434097_A_G	ENSG00000101546	0.024301599711179733	-0.49390000104904175	0.2144639939069748	0.9359099864959717	QTD000021
+88264249	chr18_79435885_A_C	ENSG00000101546	0.023322200402617455	-0.48093900084495544	0.20732800662517548	0.9973800182342529	QTD000021
+88264289	chr18_79439023_A_G	ENSG00000101546	0.02402999997138977	-0.49540600180625916	0.21468999981880188	0.9272099733352661	QTD000021
+88264303	chr18_79441610_G_C	ENSG00000101546	0.04085079953074455	-0.38913899660110474	0.18671299517154694	0.8569999933242798	QTD000021
+88264307	chr18_79441837_T_C	ENSG00000101546	0.022944100201129913	-0.5003949999809265	0.2151000052690506	0.8924000263214111	QTD000021
+88264309	chr18_79442052_C_T	ENSG00000101546	0.022940700873732567	-0.500465989112854	0.21512499451637268	0.8923299908638	QTD000021
+88264311	chr18_79442394_T_C	ENSG00000101546	0.02406729944050312	-0.4954099953174591	0.2147510051727295	0.8962200284004211	QTD000021
+165261333	chr18_79462613_C_T	ENSG00000101546	0.0271208006888628	-0.5959150195121765	0.26392900943756104	0.9055899977684021	QTD000021
+88264571	chr18_79472204_A_G	ENSG00000101546	0.042507100850343704	-0.4067719876766205	0.1968120038509369	0.921779990196228	QTD000021
+165261406	chr18_79479253_G_A	ENSG00000101546	0.02256079949438572	-0.4961729943752289	0.2126609981060028	0.6370400190353394	QTD000021
+165261409	chr18_79481207_C_G	ENSG00000101546	0.008506080135703087	-0.497734010219574	0.18374000489711761	0.8274000287055969	QTD000021
+165261410	chr18_79481357_G_A	ENSG00000101546	0.009778819978237152	-0.5023890137672424	0.18905900418758392	0.7541499733924866	QTD000021
+165261411	chr18_79481374_A_G	ENSG00000101546	0.012608599849045277	-0.47899800539016724	0.18699400126934052	0.8098099827766418	QTD000021
+165263862	chr18_80139595_C_G	ENSG00000101546	1.559189968247665e-07	0.8953660130500793	0.15333600342273712	0.9739500284194946	QTD000021
+189974192	chr18_79874234_C_G	ENSG00000101546	0.03234120085835457	-0.5900099873542786	0.270114004611969	0.964709997177124	QTD000021
+189974196	chr18_79874361_C_T	ENSG00000101546	0.04905340075492859	0.4443570077419281	0.22179199755191803	0.9974499940872192	QTD000021
+189974540	chr18_79944512_C_G	ENSG00000101546	0.025339100509881973	-0.6260780096054077	0.27389299869537354	0.866159975528717	QTD000021
+189974542	chr18_79944919_C_T	ENSG00000101546	0.023991400375962257	-0.6715369820594788	0.2909359931945801	0.7998999953269958	QTD000021
+189974548	chr18_79945362_A_G	ENSG00000101546	0.038335900753736496	-0.5102840065956116	0.24164600670337677	0.8674499988555908	QTD000021
+165261412	chr18_79481665_A_G	ENSG00000101546	0.015734700486063957	-0.4688830077648163	0.18935400247573853	0.7924399971961975	QTD000021
+165263722	chr18_80108244_C_A	ENSG00000101546	0.00029792700661346316	-0.8340280055999756	0.21888099610805511	0.9868599772453308	QTD000021
+189974190	chr18_79873976_G_A	ENSG00000101546	0.036646001040935516	0.3692980110645294	0.17328999936580658	0.9490000009536743	QTD000021
+88269525	chr18_80138359_C_T	ENSG00000101546	0.024976499378681183	0.6974279880523682	0.3043209910392761	0.9661700129508972	QTD000021
+189975263	chr18_80038449_TTGTC_T	ENSG00000101546	0.01789800077676773	-0.5947930216789246	0.24520400166511536	0.9567499756813049	QTD000021
+189974486	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834	QTD000021
+88268415	chr18_80011983_C_A	ENSG00000101546	0.006631609983742237	0.9260450005531311	0.3307879865169525	0.9488700032234192	QTD000021
+165263235	chr18_79995179_T_C	ENSG00000101546	0.0034303099382668734	0.7194989919662476	0.23737899959087372	0.8192200064659119	QTD000021
+88264687	chr18_79489122_C_T	ENSG00000101546	0.044888198375701904	0.3766619861125946	0.18437999486923218	0.8487499952316284	QTD000021
+165261446	chr18_79490107_C_G	ENSG00000101546	0.02172970026731491	-0.4120570123195648	0.17546799778938293	0.8585799932479858	QTD000021
+165263138	chr18_79963843_G_A	ENSG00000101546	0.0026279999874532223	-0.7095100283622742	0.22729800641536713	0.9226999878883362	QTD000021
+165263137	chr18_79963832_G_A	ENSG00000101546	0.0026249599177390337	-0.7097190022468567	0.22733700275421143	0.9225900173187256	QTD000021
+189969540	chr18_79224569_C_T	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940299987792969	QTD000021
+165261448	chr18_79490638_G_A	ENSG00000101546	0.01955379918217659	-0.3910149931907654	0.16356199979782104	0.996720016002655	QTD000021
+165263507	chr18_80056237_G_GT	ENSG00000101546	0.00015261500084307045	0.6454190015792847	0.16102899610996246	0.9305899739265442	QTD000021
+189976141	chr18_80138816_C_CA	ENSG00000101546	0.04852209985256195	0.5525559782981873	0.2751289904117584	0.6626099944114685	QTD000021
+189976544	chr18_80190271_CA_C	ENSG00000101546	0.0494145005941391	0.540340006351471	0.27014100551605225	0.6949599981307983	QTD000021
+165263314	chr18_80015201_T_TG	ENSG00000101546	4.449080215351842e-09	1.0125999450683594	0.1509159952402115	0.9107800126075745	QTD000021
+165262740	chr18_79827927_C_CTT	ENSG00000101546	0.011989600025117397	0.513247013092041	0.19887800514698029	0.6629599928855896	QTD000021
+165263368	chr18_80028595_A_AG	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231	QTD000021
+88268243	chr18_79991107_CA_C	ENSG00000101546	0.020448200404644012	0.46891599893569946	0.19762499630451202	0.8222200274467468	QTD000021
+165263245	chr18_79997448_A_AAAT	ENSG00000101546	0.006668020039796829	0.6410819888114929	0.22915899753570557	0.8404399752616882	QTD000021
+165263939	chr18_80157550_A_AACTT	ENSG00000101546	9.776449587661773e-06	0.7181739807128906	0.1504340022802353	0.9609799981117249	QTD000021
+165263020	chr18_79926660_C_CT	ENSG00000101546	0.019240999594330788	-0.4084230065345764	0.17038699984550476	0.8445600271224976	QTD000021
+88268408	chr18_80011523_A_AAG	ENSG00000101546	0.0003354639920871705	0.5944780111312866	0.15748700499534607	0.9214900135993958	QTD000021
+165263433	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238	QTD000021
+165263389	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023	QTD000021
+165264117	chr18_80211946_CA_C	ENSG00000101546	0.010767700150609016	-0.6441410183906555	0.24573400616645813	0.901229977607727	QTD000021
+165263275	chr18_80006383_CA_C	ENSG00000101546	0.0021724801044911146	0.6917529702186584	0.21717999875545502	0.8327900171279907	QTD000021
+165263769	chr18_80119413_CA_C	ENSG00000101546	2.673410108400276e-06	0.7768129706382751	0.15182499587535858	0.9588199853897095	QTD000021
+165263434	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238	QTD000021
+189974407	chr18_79914567_A_ACAC	ENSG00000101546	0.005766630172729492	0.5081620216369629	0.1783290058374405	0.8534200191497803	QTD000021
+88269601	chr18_80151832_T_TA	ENSG00000101546	0.011504399590194225	1.0405399799346924	0.4007680118083954	0.5421500205993652	QTD000021
+189975251	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798	QTD000021
+189976684	chr18_80215026_TA_T	ENSG00000101546	0.049762699753046036	0.541579008102417	0.2711859941482544	0.6305999755859375	QTD000021
+88268640	chr18_80037888_CAAAAAA_C	ENSG00000101546	0.04219590127468109	0.4156379997730255	0.20078900456428528	0.7036399841308594	QTD000021
+189969627	chr18_79245424_CA_C	ENSG00000101546	0.03679890185594559	0.5042889714241028	0.23683199286460876	0.8968600034713745	QTD000021
+165263180	chr18_79976966_AT_A	ENSG00000101546	0.0034992999862879515	0.6780070066452026	0.22419500350952148	0.8539800047874451	QTD000021
+189976543	chr18_80190271_CA_C	ENSG00000101546	0.0494145005941391	0.540340006351471	0.27014100551605225	0.6949599981307983	QTD000021
+165263276	chr18_80006383_CA_C	ENSG00000101546	0.0021724801044911146	0.6917529702186584	0.21717999875545502	0.8327900171279907	QTD000021
+189968685	chr18_79117040_A_ACT	ENSG00000101546	0.0408950001001358	0.527961015701294	0.2533789873123169	0.9663900136947632	QTD000021
+189969169	chr18_79173346_A_AT	ENSG00000101546	0.03304319828748703	0.5645449757575989	0.259535014629364	0.9645799994468689	QTD000021
+165263203	chr18_79986442_C_CA	ENSG00000101546	0.00017432900494895875	0.6640830039978027	0.1673090010881424	0.8925899863243103	QTD000021
+165263756	chr18_80116545_C_CT	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844	QTD000021
+88268307	chr18_79998683_C_G	ENSG00000101546	0.014356800355017185	0.4843209981918335	0.19282099604606628	0.8916100263595581	QTD000021
+165263249	chr18_79998837_T_C	ENSG00000101546	0.0031788500491529703	0.6856939792633057	0.22430099546909332	0.8440399765968323	QTD000021
+189974674	chr18_79961149_C_T	ENSG00000101546	0.022092100232839584	-0.6302440166473389	0.26914501190185547	0.8257899880409241	QTD000021
+165263124	chr18_79961125_A_G	ENSG00000101546	0.009977339766919613	-0.4703580141067505	0.1775050014257431	0.9077799916267395	QTD000021
+88264717	chr18_79490878_C_T	ENSG00000101546	0.04308350011706352	0.38102400302886963	0.1848820000886917	0.8528000116348267	QTD000021
+165261439	chr18_79489212_A_G	ENSG00000101546	0.023302199319005013	-0.4020810127258301	0.17330700159072876	0.8553400039672852	QTD000021
+165261444	chr18_79489902_C_T	ENSG00000101546	0.023647800087928772	-0.4086270034313202	0.17658400535583496	0.8522899746894836	QTD000021
+165261443	chr18_79489831_T_C	ENSG00000101546	0.02305220067501068	-0.40998101234436035	0.17637899518013	0.8530799746513367	QTD000021
+165263938	chr18_80157550_A_AACTT	ENSG00000101546	9.776449587661773e-06	0.7181739807128906	0.1504340022802353	0.9609799981117249	QTD000021
+165261440	chr18_79489311_A_G	ENSG00000101546	0.019971000030636787	-0.413908988237381	0.17375099658966064	0.8541899919509888	QTD000021
+189974254	chr18_79881226_A_G	ENSG00000101546	0.04038320109248161	-0.3620240092277527	0.17328700423240662	0.9162499904632568	QTD000021
+88269203	chr18_80098513_T_C	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9887599945068359	QTD000021
+189976398	chr18_80169229_G_A	ENSG00000101546	0.04581720009446144	0.5306689739227295	0.26092299818992615	0.8379899859428406	QTD000021
+165263251	chr18_79999582_A_G	ENSG00000101546	0.003123970003798604	0.6857290267944336	0.22387699782848358	0.8470399975776672	QTD000021
+189968312	chr18_79069599_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968316	chr18_79069952_T_C	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654	QTD000021
+189975782	chr18_80094527_T_G	ENSG00000101546	0.04555770009756088	-0.42556801438331604	0.2089879959821701	0.9381099939346313	QTD000021
+189968330	chr18_79071142_T_C	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654	QTD000021
+189968304	chr18_79069232_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189975442	chr18_80056645_G_T	ENSG00000101546	0.017709199339151382	-0.5895990133285522	0.24264399707317352	0.965149998664856	QTD000021
+189975444	chr18_80056991_G_A	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571	QTD000021
+165263220	chr18_79991151_A_G	ENSG00000101546	0.006708129774779081	0.6383129954338074	0.22834600508213043	0.8453400135040283	QTD000021
+189975432	chr18_80055505_A_G	ENSG00000101546	0.017726300284266472	-0.5896520018577576	0.24270400404930115	0.9648100137710571	QTD000021
+165262780	chr18_79855988_C_T	ENSG00000101546	0.03361830115318298	-0.5539600253105164	0.2555280029773712	0.9125800132751465	QTD000021
+165263558	chr18_80066399_C_G	ENSG00000101546	0.0005949999904260039	0.8107140064239502	0.2252040058374405	0.8926600217819214	QTD000021
+165261441	chr18_79489693_C_T	ENSG00000101546	0.02021780051290989	-0.41695699095726013	0.1753920018672943	0.8563799858093262	QTD000021
+189975834	chr18_80099463_C_A	ENSG00000101546	0.00355039001442492	0.5585179924964905	0.18498900532722473	0.923829972743988	QTD000021
+165263493	chr18_80053972_T_C	ENSG00000101546	2.131220026058145e-05	0.7576010227203369	0.1660279929637909	0.9484999775886536	QTD000021
+165263694	chr18_80097984_G_C	ENSG00000101546	3.9682898744786144e-08	0.9398599863052368	0.1521420031785965	0.9430299997329712	QTD000021
+88268591	chr18_80033710_A_G	ENSG00000101546	0.0025717299431562424	0.5703060030937195	0.18227800726890564	0.9211300015449524	QTD000021
+189968306	chr18_79069377_A_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+88269421	chr18_80127256_T_C	ENSG00000101546	0.024045800790190697	0.6929889917373657	0.30035001039505005	0.9993500113487244	QTD000021
+88269661	chr18_80153647_T_C	ENSG00000101546	0.026196099817752838	0.7009819746017456	0.3085069954395294	0.8868100047111511	QTD000021
+189969164	chr18_79172718_A_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+165263519	chr18_80058414_A_G	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193	QTD000021
+189968332	chr18_79071213_A_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+88264627	chr18_79479863_G_A	ENSG00000101546	0.024715399369597435	0.5066459774971008	0.220660001039505	0.6346499919891357	QTD000021
+165263495	chr18_80054070_C_T	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193	QTD000021
+165263680	chr18_80094597_C_T	ENSG00000101546	0.00017910900351125747	0.6984239816665649	0.17631299793720245	0.8826500177383423	QTD000021
+189975840	chr18_80103152_A_G	ENSG00000101546	0.003961219917982817	0.5524060130119324	0.18528200685977936	0.9293599724769592	QTD000021
+189975230	chr18_80035232_A_T	ENSG00000101546	0.0003092499973718077	-0.5977219939231873	0.15732699632644653	0.9657700061798096	QTD000021
+189968624	chr18_79107353_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165263660	chr18_80091557_G_T	ENSG00000101546	0.00044414299190975726	-0.8210899829864502	0.22253400087356567	0.976170003414154	QTD000021
+189968190	chr18_79057565_C_G	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293	QTD000021
+189968186	chr18_79057485_T_C	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293	QTD000021
+189968622	chr18_79107095_A_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968130	chr18_79050030_A_G	ENSG00000101546	0.03523319959640503	0.597881019115448	0.2783519923686981	0.9544699788093567	QTD000021
+189968720	chr18_79120803_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189974134	chr18_79868953_G_C	ENSG00000101546	0.016444800421595573	0.42762601375579834	0.17390300333499908	0.9478399753570557	QTD000021
+189974146	chr18_79869373_G_A	ENSG00000101546	0.016442500054836273	0.427619993686676	0.17389599978923798	0.9478999972343445	QTD000021
+88268159	chr18_79973273_C_T	ENSG00000101546	0.009821070358157158	0.4935680031776428	0.18585200607776642	0.9221799969673157	QTD000021
+165263685	chr18_80096657_A_G	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.987529993057251	QTD000021
+88269209	chr18_80098907_T_G	ENSG00000101546	0.010833400301635265	0.6991909742355347	0.2669680118560791	0.9890099763870239	QTD000021
+88269211	chr18_80098936_T_C	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342	QTD000021
+165263765	chr18_80118775_G_A	ENSG00000101546	5.522430001292378e-05	-0.6893159747123718	0.16033999621868134	0.9832900166511536	QTD000021
+165263815	chr18_80129276_G_A	ENSG00000101546	0.00037060098838992417	-0.8321589827537537	0.22222299873828888	0.9770799875259399	QTD000021
+88269445	chr18_80129301_A_G	ENSG00000101546	0.024224499240517616	0.6989679932594299	0.30333900451660156	0.9883300065994263	QTD000021
+189976592	chr18_80198202_T_C	ENSG00000101546	0.009564920328557491	0.49497199058532715	0.18569299578666687	0.8510500192642212	QTD000021
+165264099	chr18_80206083_G_C	ENSG00000101546	0.010746500454843044	-0.640330970287323	0.24421200156211853	0.9113199710845947	QTD000021
+189976648	chr18_80211402_G_C	ENSG00000101546	0.04830950126051903	0.5429670214653015	0.2700920104980469	0.6302700042724609	QTD000021
+165261082	chr18_79398019_A_G	ENSG00000101546	0.042753901332616806	-0.5647420287132263	0.2735790014266968	0.5271099805831909	QTD000021
+88264121	chr18_79422003_T_G	ENSG00000101546	0.019655099138617516	0.5088779926300049	0.21304799616336823	0.46035999059677124	QTD000021
+88264453	chr18_79459389_G_C	ENSG00000101546	0.006419629789888859	0.6041060090065002	0.21489299833774567	0.5322099924087524	QTD000021
+165262653	chr18_79782065_G_A	ENSG00000101546	0.045755401253700256	-0.39195701479911804	0.1926639974117279	0.577750027179718	QTD000021
+165262771	chr18_79848203_C_G	ENSG00000101546	0.02034120075404644	0.396014004945755	0.16675299406051636	0.9521999955177307	QTD000021
+189974248	chr18_79880340_C_T	ENSG00000101546	0.021694200113415718	-0.6418460011482239	0.2732439935207367	0.911109983921051	QTD000021
+189974388	chr18_79911112_G_A	ENSG00000101546	0.004530809819698334	0.5153930187225342	0.17562100291252136	0.8685700297355652	QTD000021
+189974392	chr18_79911830_A_C	ENSG00000101546	0.002845499897375703	0.5605630278587341	0.1811390072107315	0.8322299718856812	QTD000021
+165262995	chr18_79915188_A_T	ENSG00000101546	0.00795970018953085	-0.7358710169792175	0.2692280113697052	0.8645700216293335	QTD000021
+189974418	chr18_79917155_A_G	ENSG00000101546	0.0026061199605464935	-0.8074439764022827	0.25843900442123413	0.7077400088310242	QTD000021
+165263149	chr18_79967126_T_C	ENSG00000101546	0.003251390065997839	0.5506470203399658	0.1805800050497055	0.835070013999939	QTD000021
+165263166	chr18_79970197_A_G	ENSG00000101546	0.0034312200732529163	0.6782429814338684	0.2237749993801117	0.8579000234603882	QTD000021
+165263177	chr18_79976365_T_A	ENSG00000101546	0.002789250109344721	0.7504439949989319	0.2419690042734146	0.8117499947547913	QTD000021
+165263178	chr18_79976735_T_C	ENSG00000101546	0.0034454900305718184	0.6796560287475586	0.22434599697589874	0.853659987449646	QTD000021
+165263240	chr18_79996604_G_A	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528	QTD000021
+165263241	chr18_79996664_A_C	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528	QTD000021
+88268339	chr18_80004232_C_G	ENSG00000101546	0.006844629999250174	0.5252249836921692	0.18838000297546387	0.9337999820709229	QTD000021
+165263265	chr18_80004353_T_C	ENSG00000101546	0.0031801799777895212	0.6846820116043091	0.22397999465465546	0.8461099863052368	QTD000021
+189975046	chr18_80014886_A_C	ENSG00000101546	0.0003680720110423863	-0.6124129891395569	0.16345100104808807	0.9237099885940552	QTD000021
+165263334	chr18_80018816_T_C	ENSG00000101546	0.002536430023610592	0.6788970232009888	0.21666400134563446	0.8821399807929993	QTD000021
+88268481	chr18_80019156_C_T	ENSG00000101546	0.0004446200036909431	0.5852479934692383	0.15862999856472015	0.8768100142478943	QTD000021
+165263422	chr18_80039495_T_C	ENSG00000101546	0.0011908699525520205	0.7143269777297974	0.21125000715255737	0.9028900265693665	QTD000021
+88268657	chr18_80039707_C_T	ENSG00000101546	0.003636860055848956	0.5357609987258911	0.17793899774551392	0.9728599786758423	QTD000021
+88269073	chr18_80086171_T_C	ENSG00000101546	0.013327600434422493	0.7274990081787109	0.2863749861717224	0.9688100218772888	QTD000021
+165263684	chr18_80096499_G_T	ENSG00000101546	0.0007837309967726469	-0.6893439888954163	0.19616499543190002	0.9999600052833557	QTD000021
+165263695	chr18_80098501_T_C	ENSG00000101546	0.000130853004520759	-0.8881670236587524	0.21914899349212646	0.989300012588501	QTD000021
+88269205	chr18_80098597_T_C	ENSG00000101546	0.010849700309336185	0.6992549896240234	0.26705101132392883	0.9889299869537354	QTD000021
+165263766	chr18_80118818_C_T	ENSG00000101546	1.83099000423681e-05	-0.7252659797668457	0.15751099586486816	0.9831600189208984	QTD000021
+165263797	chr18_80124685_G_A	ENSG00000101546	0.0010703200241550803	-0.7656580209732056	0.22416700422763824	0.9782299995422363	QTD000021
+165263816	chr18_80129292_T_C	ENSG00000101546	5.776300167781301e-05	-0.6904259920120239	0.1610720008611679	0.9726399779319763	QTD000021
+88269711	chr18_80159189_C_A	ENSG00000101546	0.04252230003476143	0.6393460035324097	0.30936399102211	0.9185400009155273	QTD000021
+189976540	chr18_80187442_T_C	ENSG00000101546	0.009092560037970543	0.4767880141735077	0.17761999368667603	0.9968900084495544	QTD000021
+189968494	chr18_79088401_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968102	chr18_79046843_A_G	ENSG00000101546	0.04790379852056503	0.5542430281639099	0.2751869857311249	0.9925900101661682	QTD000021
+165263635	chr18_80086851_G_A	ENSG00000101546	0.0007837309967726469	-0.6893439888954163	0.19616499543190002	0.9999600052833557	QTD000021
+189968748	chr18_79125187_C_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968644	chr18_79110397_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968750	chr18_79125298_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189968752	chr18_79125300_C_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189968126	chr18_79049535_C_T	ENSG00000101546	0.03523319959640503	0.597881019115448	0.2783519923686981	0.9544699788093567	QTD000021
+189968576	chr18_79102423_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189968158	chr18_79052962_C_T	ENSG00000101546	0.032968200743198395	0.5597910284996033	0.25723499059677124	0.9755499958992004	QTD000021
+165262746	chr18_79829655_G_A	ENSG00000101546	0.02116600051522255	0.3977780044078827	0.1686280071735382	0.9473000168800354	QTD000021
+165262747	chr18_79829689_G_A	ENSG00000101546	0.02116600051522255	0.3977780044078827	0.1686280071735382	0.947350025177002	QTD000021
+165262748	chr18_79829759_C_T	ENSG00000101546	0.021174399182200432	0.3977130055427551	0.16861200332641602	0.9474999904632568	QTD000021
+189968182	chr18_79057189_G_A	ENSG00000101546	0.020477300509810448	0.6620489954948425	0.2790890038013458	0.9433299899101257	QTD000021
+189975428	chr18_80055299_T_A	ENSG00000101546	0.017705900594592094	-0.5901219844818115	0.24285200238227844	0.9646999835968018	QTD000021
+189968616	chr18_79106549_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826099872589111	QTD000021
+189968160	chr18_79053245_G_A	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293	QTD000021
+189968724	chr18_79121798_C_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968120	chr18_79048210_G_A	ENSG00000101546	0.0428554005920887	0.538437008857727	0.26096799969673157	0.9537400007247925	QTD000021
+189968652	chr18_79111939_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968520	chr18_79093118_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968508	chr18_79091094_A_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968474	chr18_79086014_A_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165264120	chr18_80212884_C_CA	ENSG00000101546	8.715030048733752e-07	0.9057700037956238	0.1675650030374527	0.8506500124931335	QTD000021
+189968058	chr18_79038700_C_G	ENSG00000101546	0.03980499878525734	-0.885125994682312	0.4224100112915039	0.8608800172805786	QTD000021
+165262321	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449	QTD000021
+189974488	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834	QTD000021
+165262735	chr18_79826290_A_G	ENSG00000101546	0.00378870009444654	0.627170979976654	0.20927800238132477	0.5979099869728088	QTD000021
+165262733	chr18_79826223_C_T	ENSG00000101546	0.00366286002099514	0.6300830245018005	0.20943599939346313	0.5947099924087524	QTD000021
+165264159	chr18_80238491_C_CA	ENSG00000101546	9.123349968831462e-07	1.388550043106079	0.25743499398231506	0.4219000041484833	QTD000021
+165262754	chr18_79832660_C_G	ENSG00000101546	0.022002199664711952	0.3916130065917969	0.16711999475955963	0.9518700242042542	QTD000021
+88265792	chr18_79631418_CGT_C	ENSG00000101546	0.04891889914870262	0.33583900332450867	0.16752399504184723	0.9341700077056885	QTD000021
+189973888	chr18_79825900_C_T	ENSG00000101546	0.02994289994239807	0.520455002784729	0.23478899896144867	0.5083400011062622	QTD000021
+189968226	chr18_79059225_T_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.9712700247764587	QTD000021
+88269600	chr18_80151832_T_TA	ENSG00000101546	0.011504399590194225	1.0405399799346924	0.4007680118083954	0.5421500205993652	QTD000021
+189968380	chr18_79074681_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165261445	chr18_79490090_C_CCCCCCG	ENSG00000101546	0.0011022200342267752	1.1362600326538086	0.3335860073566437	0.5041300058364868	QTD000021
+189968382	chr18_79074733_C_T	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+88264020	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267	QTD000021
+189968178	chr18_79055173_C_T	ENSG00000101546	0.02617580071091652	0.62323397397995	0.2742510139942169	0.9769700169563293	QTD000021
+189976683	chr18_80215026_TA_T	ENSG00000101546	0.049762699753046036	0.541579008102417	0.2711859941482544	0.6305999755859375	QTD000021
+189968146	chr18_79051037_C_CAA	ENSG00000101546	0.026054900139570236	0.6269279718399048	0.275644987821579	0.969980001449585	QTD000021
+165263439	chr18_80041720_CTTT_C	ENSG00000101546	0.0012789099710062146	0.713791012763977	0.21253199875354767	0.9042900204658508	QTD000021
+189968258	chr18_79063088_C_T	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165263671	chr18_80093639_C_T	ENSG00000101546	0.0007727540214546025	-0.6972600221633911	0.19816799461841583	0.9859099984169006	QTD000021
+165263426	chr18_80040239_A_ATTTTTT	ENSG00000101546	2.4490100614116272e-08	1.058609962463379	0.1681469976902008	0.7731599807739258	QTD000021
+189968604	chr18_79105141_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165263605	chr18_80081068_G_C	ENSG00000101546	0.00044452500878833234	-0.8213809728622437	0.22262899577617645	0.9748499989509583	QTD000021
+165263606	chr18_80081190_T_C	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934	QTD000021
+189973946	chr18_79835748_G_A	ENSG00000101546	0.02287450060248375	0.41680800914764404	0.1790740042924881	0.9065899848937988	QTD000021
+189968128	chr18_79050002_A_G	ENSG00000101546	0.03523319959640503	0.597881019115448	0.2783519923686981	0.9544699788093567	QTD000021
+165263641	chr18_80088041_C_T	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445	QTD000021
+189969145	chr18_79171878_G_GTT	ENSG00000101546	0.028650900349020958	-0.8239669799804688	0.36864998936653137	0.926010012626648	QTD000021
+189974468	chr18_79928124_C_T	ENSG00000101546	0.004080949816852808	0.5253480076789856	0.17681799829006195	0.9315299987792969	QTD000021
+189969192	chr18_79175062_A_G	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304	QTD000021
+165264023	chr18_80177972_T_TACACAC	ENSG00000101546	0.0028105799574404955	-0.8103110194206238	0.26148900389671326	0.6188700199127197	QTD000021
+88264485	chr18_79463270_T_C	ENSG00000101546	0.026027800515294075	-0.42829498648643494	0.1882759928703308	0.914359986782074	QTD000021
+165263476	chr18_80048941_C_CGTCT	ENSG00000101546	3.2930998713709414e-05	0.7449690103530884	0.1676589995622635	0.9231600165367126	QTD000021
+165263161	chr18_79969449_C_T	ENSG00000101546	0.0007966730045154691	0.6422420144081116	0.18302899599075317	0.8087000250816345	QTD000021
+88268599	chr18_80034026_C_T	ENSG00000101546	0.0036171600222587585	0.5427029728889465	0.18013300001621246	0.9630100131034851	QTD000021
+88268596	chr18_80033957_ACCTCGCGCCAGTCTTCGCCCCGCCCATTCACCGCCCG_A	ENSG00000101546	0.003214519936591387	0.5541219711303711	0.18148699402809143	0.9526399970054626	QTD000021
+189969190	chr18_79174976_G_T	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304	QTD000021
+189968086	chr18_79044372_C_T	ENSG00000101546	0.029401499778032303	0.6184489727020264	0.27803999185562134	0.953249990940094	QTD000021
+88264487	chr18_79463302_T_C	ENSG00000101546	0.02601430006325245	-0.42830199003219604	0.1882610023021698	0.9144099950790405	QTD000021
+165263658	chr18_80091064_A_G	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+88264521	chr18_79464840_G_A	ENSG00000101546	0.04578449949622154	-0.37894299626350403	0.18629199266433716	0.92535001039505	QTD000021
+165261285	chr18_79451956_C_T	ENSG00000101546	0.011720200069248676	1.1646599769592285	0.4497910141944885	0.5813500285148621	QTD000021
+165262738	chr18_79827758_C_G	ENSG00000101546	0.008222740143537521	0.9172099828720093	0.3370420038700104	0.4500100016593933	QTD000021
+165263429	chr18_80040888_G_A	ENSG00000101546	2.1306000019816196e-10	1.0814900398254395	0.14541099965572357	0.9556499719619751	QTD000021
+88261539	chr18_79051830_A_G	ENSG00000101546	0.03224790096282959	-0.4322510063648224	0.19777999818325043	0.9691200256347656	QTD000021
+88268277	chr18_79993320_TA_T	ENSG00000101546	0.0006915549747645855	0.5959029793739319	0.16770799458026886	0.8548300266265869	QTD000021
+189969376	chr18_79194643_G_A	ENSG00000101546	0.03558110073208809	0.6024720072746277	0.2810389995574951	0.976140022277832	QTD000021
+165262758	chr18_79834109_G_C	ENSG00000101546	0.03796989843249321	-0.5710309743881226	0.26988500356674194	0.8181999921798706	QTD000021
+189974322	chr18_79893508_C_T	ENSG00000101546	0.031037800014019012	0.38543900847435	0.17507000267505646	0.9323999881744385	QTD000021
+165263135	chr18_79963434_C_T	ENSG00000101546	0.002108830027282238	-0.7193319797515869	0.22514000535011292	0.9371700286865234	QTD000021
+189969006	chr18_79156593_T_C	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+165263284	chr18_80007575_T_G	ENSG00000101546	1.3900599782346035e-08	1.017490029335022	0.15814900398254395	0.8522599935531616	QTD000021
+165263354	chr18_80025761_G_A	ENSG00000101546	2.903239870732932e-10	1.0852899551391602	0.1473820060491562	0.9137799739837646	QTD000021
+165261284	chr18_79451908_G_A	ENSG00000101546	0.012045400217175484	1.185439944267273	0.4596579968929291	0.6571699976921082	QTD000021
+189972258	chr18_79614110_G_A	ENSG00000101546	0.04099920019507408	-0.49995800852775574	0.2400670051574707	0.7966200113296509	QTD000021
+88264519	chr18_79464810_G_A	ENSG00000101546	0.04581430181860924	-0.3789820075035095	0.18633800745010376	0.9251099824905396	QTD000021
+189973975	chr18_79851617_AGTGT_A	ENSG00000101546	0.025087300688028336	0.3987250030040741	0.1741199940443039	0.9344800114631653	QTD000021
+165263960	chr18_80164008_G_C	ENSG00000101546	1.6429399352091423e-07	0.906453013420105	0.155581995844841	0.9467300176620483	QTD000021
+189974290	chr18_79887406_G_A	ENSG00000101546	0.028696300461888313	0.38781601190567017	0.17356300354003906	0.9388300180435181	QTD000021
+88264239	chr18_79435347_T_TTTG	ENSG00000101546	0.01670759916305542	-0.531885027885437	0.21684999763965607	0.8868200182914734	QTD000021
+88268527	chr18_80026225_G_T	ENSG00000101546	0.0037550099659711123	0.5361679792404175	0.17872799932956696	0.9558600187301636	QTD000021
+165262756	chr18_79833034_CT_C	ENSG00000101546	0.022035999223589897	0.3914470076560974	0.16709299385547638	0.952210009098053	QTD000021
+165263262	chr18_80004129_TA_T	ENSG00000101546	0.00520892022177577	0.6606469750404358	0.22894099354743958	0.8338599801063538	QTD000021
+165263201	chr18_79986442_C_CA	ENSG00000101546	0.00017432900494895875	0.6640830039978027	0.1673090010881424	0.8925899863243103	QTD000021
+165263943	chr18_80158499_T_C	ENSG00000101546	2.1639000635786942e-07	0.8859949707984924	0.15388700366020203	0.9753900170326233	QTD000021
+165263346	chr18_80022390_C_T	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414	QTD000021
+189974186	chr18_79873629_G_A	ENSG00000101546	0.03373640030622482	0.3741300106048584	0.17269599437713623	0.9526299834251404	QTD000021
+189974204	chr18_79876077_C_T	ENSG00000101546	0.033759698271751404	0.3732829988002777	0.17232799530029297	0.9575600028038025	QTD000021
+88269315	chr18_80116512_TC_T	ENSG00000101546	0.024279000237584114	0.6988750100135803	0.30341899394989014	0.9890599846839905	QTD000021
+165263535	chr18_80061354_GT_G	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768	QTD000021
+165261216	chr18_79435381_C_T	ENSG00000101546	0.028486300259828568	-0.5824120044708252	0.2602970004081726	0.8003100156784058	QTD000021
+189975249	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798	QTD000021
+165263444	chr18_80042008_G_A	ENSG00000101546	2.1362399349467154e-10	1.0832899808883667	0.1456650048494339	0.9544500112533569	QTD000021
+189974206	chr18_79876101_C_T	ENSG00000101546	0.033759698271751404	0.3732829988002777	0.17232799530029297	0.9575600028038025	QTD000021
+88268525	chr18_80026224_G_T	ENSG00000101546	0.0037550099659711123	0.5361679792404175	0.17872799932956696	0.9558600187301636	QTD000021
+165263430	chr18_80040980_G_C	ENSG00000101546	7.270180013563277e-09	0.9866189956665039	0.14969100058078766	0.951770007610321	QTD000021
+165264009	chr18_80175614_G_A	ENSG00000101546	5.855069957760861e-07	0.8658900260925293	0.15724200010299683	0.9783099889755249	QTD000021
+165263277	chr18_80006426_G_C	ENSG00000101546	2.907809992791499e-08	0.9940099716186523	0.15894700586795807	0.8502799868583679	QTD000021
+189969002	chr18_79156413_C_T	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+165263328	chr18_80017135_G_C	ENSG00000101546	0.0015251500299200416	-0.8334389925003052	0.25244200229644775	0.8865100145339966	QTD000021
+165262773	chr18_79849462_C_T	ENSG00000101546	0.02033980004489422	0.39604198932647705	0.16676299273967743	0.9520099759101868	QTD000021
+189974444	chr18_79922662_T_C	ENSG00000101546	0.008993959985673428	0.6875429749488831	0.255748987197876	0.6315299868583679	QTD000021
+88268407	chr18_80011523_A_AAG	ENSG00000101546	0.0003354639920871705	0.5944780111312866	0.15748700499534607	0.9214900135993958	QTD000021
+165263754	chr18_80116545_C_CT	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844	QTD000021
+189968280	chr18_79065411_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165263313	chr18_80015201_T_TG	ENSG00000101546	4.449080215351842e-09	1.0125999450683594	0.1509159952402115	0.9107800126075745	QTD000021
+189968250	chr18_79061767_T_C	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189975222	chr18_80034310_CTCGCCCCGCCCTGCATCA_C	ENSG00000101546	0.01939390040934086	-0.5574700236320496	0.23287199437618256	0.9631800055503845	QTD000021
+165263396	chr18_80034081_G_GC	ENSG00000101546	2.1349699785844223e-10	1.0824600458145142	0.14554999768733978	0.9538999795913696	QTD000021
+88268639	chr18_80037888_CAAAAAA_C	ENSG00000101546	0.04219590127468109	0.4156379997730255	0.20078900456428528	0.7036399841308594	QTD000021
+165264155	chr18_80230443_G_T	ENSG00000101546	0.009560249745845795	-1.0725799798965454	0.4023590087890625	0.4146899878978729	QTD000021
+165263582	chr18_80073792_G_A	ENSG00000101546	7.0585102207587624e-09	0.9839000105857849	0.14911699295043945	0.9587699770927429	QTD000021
+189974491	chr18_79934128_TAA_T	ENSG00000101546	0.018797900527715683	-0.7050750255584717	0.2930130064487457	0.8239700198173523	QTD000021
+189975223	chr18_80034310_CTCGCCCCGCCCTGCATCA_C	ENSG00000101546	0.01939390040934086	-0.5574700236320496	0.23287199437618256	0.9631800055503845	QTD000021
+189970402	chr18_79376186_C_T	ENSG00000101546	0.0025194899644702673	1.4823399782180786	0.4727360010147095	0.40827998518943787	QTD000021
+189968236	chr18_79060196_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+165263514	chr18_80057487_A_ATTTCT	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853	QTD000021
+165263579	chr18_80070707_C_T	ENSG00000101546	5.149839853402227e-05	0.6767920255661011	0.15671099722385406	0.9416499733924866	QTD000021
+189974260	chr18_79882394_GA_G	ENSG00000101546	0.028648799285292625	0.3878380060195923	0.17351900041103363	0.9393600225448608	QTD000021
+189976478	chr18_80178830_AC_A	ENSG00000101546	2.380720070505049e-05	0.7269030213356018	0.1603659987449646	0.9226999878883362	QTD000021
+189968734	chr18_79124185_C_T	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165264077	chr18_80196890_TAA_T	ENSG00000101546	0.03214230015873909	-0.4360960125923157	0.199412003159523	0.7321599721908569	QTD000021
+189968738	chr18_79124310_A_T	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183	QTD000021
+189975250	chr18_80037888_C_CA	ENSG00000101546	0.012088700197637081	-0.5827230215072632	0.2260729968547821	0.9680799841880798	QTD000021
+189969661	chr18_79249079_TA_T	ENSG00000101546	0.02948799915611744	-0.8166509866714478	0.3673500120639801	0.9844300150871277	QTD000021
+88266772	chr18_79742141_TGAGGTGGAGGCCTGGGGGCAGCAGAG_T	ENSG00000101546	0.03260349854826927	-0.9425650238990784	0.43219301104545593	0.42250001430511475	QTD000021
+165264075	chr18_80195893_C_CT	ENSG00000101546	9.202360160998069e-06	0.7922729849815369	0.16539299488067627	0.86558997631073	QTD000021
+88266775	chr18_79742176_AAGCAT_A	ENSG00000101546	0.026386499404907227	-1.1123900413513184	0.490215003490448	0.4789699912071228	QTD000021
+189968742	chr18_79124480_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165263634	chr18_80086614_A_G	ENSG00000101546	0.0007937669870443642	-0.7054010033607483	0.20096200704574585	0.9684799909591675	QTD000021
+189968570	chr18_79101946_AT_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189976682	chr18_80215026_TA_T	ENSG00000101546	0.049762699753046036	0.541579008102417	0.2711859941482544	0.6305999755859375	QTD000021
+189975170	chr18_80030402_C_T	ENSG00000101546	0.016570299863815308	-0.5826950073242188	0.23725199699401855	0.9036200046539307	QTD000021
+189968272	chr18_79064045_A_G	ENSG00000101546	0.026272600516676903	0.6248220205307007	0.27513399720191956	0.9890199899673462	QTD000021
+88264129	chr18_79424016_G_A	ENSG00000101546	0.03583399951457977	-0.40857699513435364	0.19086100161075592	0.7759900093078613	QTD000021
+189968630	chr18_79107717_C_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165264051	chr18_80185774_CCT_C	ENSG00000101546	4.3216800804657396e-07	0.9511610269546509	0.17034900188446045	0.8398699760437012	QTD000021
+189968214	chr18_79058693_CAA_C	ENSG00000101546	0.026237700134515762	0.6261829733848572	0.2756670117378235	0.9628499746322632	QTD000021
+189968583	chr18_79103285_T_TTTA	ENSG00000101546	0.026482699438929558	0.6243190169334412	0.2753100097179413	0.9829199910163879	QTD000021
+165263019	chr18_79926660_C_CT	ENSG00000101546	0.019240999594330788	-0.4084230065345764	0.17038699984550476	0.8445600271224976	QTD000021
+165263150	chr18_79967147_CA_C	ENSG00000101546	0.004885829985141754	0.6611229777336121	0.22732800245285034	0.7614399790763855	QTD000021
+165263164	chr18_79969751_CCTTG_C	ENSG00000101546	0.0033433600328862667	0.5450299978256226	0.17929799854755402	0.8363900184631348	QTD000021
+165263165	chr18_79969751_CCTTG_C	ENSG00000101546	0.0033433600328862667	0.5450299978256226	0.17929799854755402	0.8363900184631348	QTD000021
+165263503	chr18_80055308_G_GA	ENSG00000101546	0.0016471799463033676	0.6159440279006958	0.18799400329589844	0.9377899765968323	QTD000021
+165263768	chr18_80119413_CA_C	ENSG00000101546	2.673410108400276e-06	0.7768129706382751	0.15182499587535858	0.9588199853897095	QTD000021
+165263864	chr18_80140436_T_TA	ENSG00000101546	0.0016014300053939223	-0.8639370203018188	0.2629460096359253	0.83610999584198	QTD000021
+165263542	chr18_80062261_G_GT	ENSG00000101546	6.983349898348479e-09	0.9865990281105042	0.14946800470352173	0.9559500217437744	QTD000021
+189972132	chr18_79603296_T_G	ENSG00000101546	0.01336320023983717	0.8240600228309631	0.3245159983634949	0.4196000099182129	QTD000021
+165263592	chr18_80076146_A_G	ENSG00000101546	4.514749889494851e-05	-0.6753190159797668	0.1550469994544983	0.9636600017547607	QTD000021
+165263292	chr18_80009831_C_T	ENSG00000101546	2.8509200555859593e-10	1.0863800048828125	0.1474439948797226	0.9107099771499634	QTD000021
+88267669	chr18_79885575_C_T	ENSG00000101546	0.006604440044611692	1.2993799448013306	0.4638980031013489	0.5620399713516235	QTD000021
+189975330	chr18_80044562_A_G	ENSG00000101546	0.00030811000033281744	-0.5959500074386597	0.15681500732898712	0.9711300134658813	QTD000021
+165263794	chr18_80123995_G_T	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214	QTD000021
+189974476	chr18_79932475_A_AAAAG	ENSG00000101546	0.015355500392615795	-0.7255340218544006	0.2918809950351715	0.8104000091552734	QTD000021
+165264153	chr18_80229346_G_T	ENSG00000101546	7.59658007609687e-07	1.3685499429702759	0.25154799222946167	0.4359999895095825	QTD000021
+189968722	chr18_79121675_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189976216	chr18_80151832_T_TAA	ENSG00000101546	3.0354101454577176e-08	1.647570013999939	0.26389798521995544	0.4377500116825104	QTD000021
+189969117	chr18_79168362_T_TTTTG	ENSG00000101546	0.0321056991815567	0.5739529728889465	0.2623920142650604	0.9609699845314026	QTD000021
+165263801	chr18_80126005_T_G	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214	QTD000021
+165263544	chr18_80062552_A_C	ENSG00000101546	7.044500094366413e-09	0.9839209914207458	0.14911000430583954	0.9586499929428101	QTD000021
+189975304	chr18_80041735_CT_C	ENSG00000101546	0.00028746199677698314	-0.600579023361206	0.15717299282550812	0.9647600054740906	QTD000021
+189974160	chr18_79871198_A_G	ENSG00000101546	0.015499800443649292	0.4327490031719208	0.17434899508953094	0.9459900259971619	QTD000021
+165263136	chr18_79963435_T_C	ENSG00000101546	0.002108830027282238	-0.7193319797515869	0.22514000535011292	0.9371700286865234	QTD000021
+165263972	chr18_80166206_G_A	ENSG00000101546	3.7716699807788245e-07	0.8579139709472656	0.15271000564098358	0.984250009059906	QTD000021
+189968378	chr18_79074394_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165263039	chr18_79934439_C_A	ENSG00000101546	0.00417478010058403	-0.798354983329773	0.2694210112094879	0.860480010509491	QTD000021
+165263228	chr18_79992876_T_TAAA	ENSG00000101546	4.858270131080644e-06	0.8729450106620789	0.17599999904632568	0.7013300061225891	QTD000021
+189968600	chr18_79104905_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189976457	chr18_80177170_C_CACACAT	ENSG00000101546	0.04319680109620094	0.540369987487793	0.262347012758255	0.7683699727058411	QTD000021
+189974678	chr18_79961824_C_A	ENSG00000101546	0.0010577200446277857	0.6198980212211609	0.18129199743270874	0.8718400001525879	QTD000021
+88264325	chr18_79444397_T_C	ENSG00000101546	0.023963799700140953	-0.5087140202522278	0.2203499972820282	0.840179979801178	QTD000021
+165264096	chr18_80203464_C_T	ENSG00000101546	5.591099920820852e-07	0.9413319826126099	0.17057999968528748	0.8398100137710571	QTD000021
+189968594	chr18_79104243_G_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189975388	chr18_80050767_C_T	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189975006	chr18_80009477_C_T	ENSG00000101546	0.015355500392615795	-0.6192389726638794	0.24911800026893616	0.8964499831199646	QTD000021
+189968504	chr18_79090133_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165263628	chr18_80084914_C_T	ENSG00000101546	8.22564985014651e-08	0.9263049960136414	0.15443600714206696	0.9346399903297424	QTD000021
+165263522	chr18_80058866_G_A	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252	QTD000021
+189974680	chr18_79961832_C_T	ENSG00000101546	0.0010555300395935774	0.6199089884757996	0.18126000463962555	0.8678900003433228	QTD000021
+165263289	chr18_80009251_T_C	ENSG00000101546	2.1870800281931224e-08	0.9793440103530884	0.15487800538539886	0.8493599891662598	QTD000021
+88264169	chr18_79426301_GA_G	ENSG00000101546	0.04710569977760315	-0.4361859858036041	0.21577100455760956	0.8364800214767456	QTD000021
+165263788	chr18_80121321_A_G	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214	QTD000021
+88269563	chr18_80145080_G_A	ENSG00000101546	0.02580229938030243	0.6957359910011292	0.3053610026836395	0.9488199949264526	QTD000021
+165264160	chr18_80239256_GA_G	ENSG00000101546	2.102699909301009e-06	1.3618099689483643	0.2629530131816864	0.4129500091075897	QTD000021
+165263436	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238	QTD000021
+189968597	chr18_79104611_TTATAA_T	ENSG00000101546	0.027988800778985023	0.617796003818512	0.2752099931240082	0.9817100167274475	QTD000021
+88268444	chr18_80015355_A_AATT	ENSG00000101546	0.0017859699437394738	0.5766699910163879	0.17744199931621552	0.9408900141716003	QTD000021
+165263527	chr18_80059828_C_T	ENSG00000101546	7.093630127741335e-09	0.9849389791488647	0.14930200576782227	0.9504500031471252	QTD000021
+165263839	chr18_80132673_T_TC	ENSG00000101546	7.58461028453894e-05	-0.6865130066871643	0.1630920022726059	0.9509599804878235	QTD000021
+189974162	chr18_79871219_A_G	ENSG00000101546	0.0165862999856472	0.4269689917564392	0.17387300729751587	0.9480500221252441	QTD000021
+165263789	chr18_80121775_C_T	ENSG00000101546	1.292879971970251e-07	0.8889529705047607	0.1510320007801056	0.9828699827194214	QTD000021
+165263640	chr18_80087994_C_T	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445	QTD000021
+165263639	chr18_80087974_G_A	ENSG00000101546	0.00044552498729899526	-0.8210049867630005	0.22256900370121002	0.9761999845504761	QTD000021
+165263581	chr18_80073689_T_C	ENSG00000101546	4.612260090652853e-05	-0.6746699810028076	0.15511000156402588	0.9637799859046936	QTD000021
+165263610	chr18_80082134_C_T	ENSG00000101546	0.000819315027911216	-0.7047110199928284	0.20133599638938904	0.9649699926376343	QTD000021
+88264136	chr18_79424489_ATC_A	ENSG00000101546	0.035638801753520966	-0.40778300166130066	0.19028300046920776	0.7771000266075134	QTD000021
+165263638	chr18_80087736_G_A	ENSG00000101546	0.00044552498729899526	-0.8210049867630005	0.22256900370121002	0.9761999845504761	QTD000021
+165263608	chr18_80081300_A_ATTTTG	ENSG00000101546	0.0003881960001308471	-0.735040009021759	0.19702699780464172	0.9323999881744385	QTD000021
+88264125	chr18_79422877_A_G	ENSG00000101546	0.020511800423264503	-0.5033029913902283	0.21222899854183197	0.6115800142288208	QTD000021
+189968064	chr18_79039776_C_T	ENSG00000101546	0.041968200355768204	0.6170570254325867	0.2977519929409027	0.8722299933433533	QTD000021
+88269005	chr18_80077832_C_T	ENSG00000101546	0.005034840200096369	0.8004440069198608	0.27623799443244934	0.9668999910354614	QTD000021
+189968642	chr18_79110347_T_G	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968714	chr18_79119688_T_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189972200	chr18_79609793_T_C	ENSG00000101546	0.03648209944367409	0.5153999924659729	0.2416290044784546	0.734250009059906	QTD000021
+165263657	chr18_80091038_G_A	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+165262781	chr18_79856819_C_T	ENSG00000101546	0.0336374007165432	-0.5538960099220276	0.25552698969841003	0.9087200164794922	QTD000021
+88265719	chr18_79623341_G_T	ENSG00000101546	0.03791360184550285	0.37790000438690186	0.17855200171470642	0.9634199738502502	QTD000021
+88264253	chr18_79436515_T_C	ENSG00000101546	0.003389130113646388	0.6372069716453552	0.2099429965019226	0.5583400130271912	QTD000021
+88264255	chr18_79436516_A_G	ENSG00000101546	0.003389130113646388	0.6372069716453552	0.2099429965019226	0.5583400130271912	QTD000021
+88264257	chr18_79436520_C_G	ENSG00000101546	0.0034002400934696198	0.6367859840393066	0.209880992770195	0.5585799813270569	QTD000021
+165262457	chr18_79735193_G_A	ENSG00000101546	0.008846360258758068	-0.607571005821228	0.22548900544643402	0.472460001707077	QTD000021
+165262996	chr18_79916617_G_A	ENSG00000101546	0.004259330220520496	-0.7998499870300293	0.270563006401062	0.8580499887466431	QTD000021
+165263006	chr18_79918515_G_A	ENSG00000101546	0.0014601999428123236	-0.9419059753417969	0.284078985452652	0.8237299919128418	QTD000021
+165263029	chr18_79933268_G_A	ENSG00000101546	0.002767419908195734	-1.3343299627304077	0.4298650026321411	0.4537400007247925	QTD000021
+165263076	chr18_79949709_T_C	ENSG00000101546	0.004299520049244165	-0.7705410122871399	0.26093700528144836	0.8911499977111816	QTD000021
+189974606	chr18_79952832_G_A	ENSG00000101546	0.005470199976116419	-0.5226479768753052	0.18221299350261688	0.8816999793052673	QTD000021
+165263115	chr18_79958044_A_C	ENSG00000101546	0.009887199848890305	-0.4685969948768616	0.17661599814891815	0.9321200251579285	QTD000021
+165263131	chr18_79962454_T_C	ENSG00000101546	0.002212940016761422	-0.7662839889526367	0.24104300141334534	0.897570013999939	QTD000021
+165263139	chr18_79964288_C_T	ENSG00000101546	0.0015720200026407838	-0.7361720204353333	0.22364799678325653	0.9351099729537964	QTD000021
+88268157	chr18_79972269_C_T	ENSG00000101546	0.011475699953734875	0.9159129858016968	0.3526400029659271	0.9362900257110596	QTD000021
+88268193	chr18_79981709_G_C	ENSG00000101546	0.01121590007096529	0.921908974647522	0.35377201437950134	0.9163500070571899	QTD000021
+88269673	chr18_80156433_C_T	ENSG00000101546	0.04466180130839348	0.6362230181694031	0.31109800934791565	0.9156299829483032	QTD000021
+165263954	chr18_80159596_G_A	ENSG00000101546	0.005446889903396368	-0.6496639847755432	0.2263759970664978	0.9853699803352356	QTD000021
+165263970	chr18_80166075_T_C	ENSG00000101546	2.5096700483118184e-05	0.7037469744682312	0.15575499832630157	0.9442600011825562	QTD000021
+165263997	chr18_80173181_C_T	ENSG00000101546	1.9580600564950146e-05	0.7143980264663696	0.15577000379562378	0.9529100060462952	QTD000021
+165264012	chr18_80176788_G_A	ENSG00000101546	0.006324660032987595	-0.6553260087966919	0.23266999423503876	0.9824299812316895	QTD000021
+165264044	chr18_80182601_T_A	ENSG00000101546	0.014786999672651291	-0.6476200222969055	0.25901201367378235	0.8419100046157837	QTD000021
+165263456	chr18_80044987_G_A	ENSG00000101546	0.0006024069734849036	-1.2891499996185303	0.35848599672317505	0.5775399804115295	QTD000021
+88269065	chr18_80084281_T_C	ENSG00000101546	0.02202009968459606	0.9053729772567749	0.38642001152038574	0.9398699998855591	QTD000021
+88269069	chr18_80085391_C_T	ENSG00000101546	0.005079439841210842	0.8000400066375732	0.2763960063457489	0.9688500165939331	QTD000021
+88269391	chr18_80121805_T_G	ENSG00000101546	0.024224499240517616	0.6989679932594299	0.30333900451660156	0.9884600043296814	QTD000021
+165263799	chr18_80125440_G_C	ENSG00000101546	0.0010786299826577306	-0.7654820084571838	0.22427800297737122	0.9777299761772156	QTD000021
+88269641	chr18_80153262_A_G	ENSG00000101546	0.022971300408244133	0.7115330100059509	0.3059230148792267	0.843500018119812	QTD000021
+189974018	chr18_79861048_A_G	ENSG00000101546	0.021407900378108025	-0.405131995677948	0.17207899689674377	0.9432799816131592	QTD000021
+189974038	chr18_79863611_G_C	ENSG00000101546	0.02124899998307228	-0.40533900260925293	0.17194800078868866	0.9459999799728394	QTD000021
+189974060	chr18_79865652_A_G	ENSG00000101546	0.022696299478411674	-0.4093700051307678	0.17563900351524353	0.9261299967765808	QTD000021
+189974202	chr18_79875572_A_G	ENSG00000101546	0.03542789816856384	-0.4546479880809784	0.211899995803833	0.9528599977493286	QTD000021
+165262934	chr18_79887635_C_G	ENSG00000101546	0.04571409896016121	-0.7533379793167114	0.3702250123023987	0.6625900268554688	QTD000021
+165262940	chr18_79890637_G_A	ENSG00000101546	0.01577099971473217	-1.1103299856185913	0.4485589861869812	0.5202900171279907	QTD000021
+165262759	chr18_79835228_C_T	ENSG00000101546	0.02138659916818142	0.3833160102367401	0.16278499364852905	0.9941999912261963	QTD000021
+165263637	chr18_80087594_G_A	ENSG00000101546	0.000793222978245467	-0.7051990032196045	0.20089200139045715	0.9687700271606445	QTD000021
+189968248	chr18_79061509_G_A	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165262741	chr18_79828847_C_T	ENSG00000101546	0.04667529836297035	-0.5667619705200195	0.2797999978065491	0.7946900129318237	QTD000021
+189968436	chr18_79082421_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968636	chr18_79109263_A_C	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968238	chr18_79060439_G_C	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968240	chr18_79060697_T_G	ENSG00000101546	0.032520901411771774	0.5555729866027832	0.2546209990978241	0.9988600015640259	QTD000021
+189968286	chr18_79068471_C_G	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968244	chr18_79060976_A_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+189968754	chr18_79125543_T_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+189968166	chr18_79053927_G_A	ENSG00000101546	0.026139799505472183	0.6242210268974304	0.2746169865131378	0.9758899807929993	QTD000021
+189968252	chr18_79062054_A_G	ENSG00000101546	0.032681599259376526	0.5641180276870728	0.2587839961051941	0.9772400259971619	QTD000021
+189968256	chr18_79062392_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968448	chr18_79083246_G_A	ENSG00000101546	0.02617580071091652	0.6233130097389221	0.2742860019207001	0.9903500080108643	QTD000021
+189968662	chr18_79113683_G_T	ENSG00000101546	0.027002299204468727	0.6210259795188904	0.27483001351356506	0.9549000263214111	QTD000021
+189968746	chr18_79125086_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+88264223	chr18_79432453_C_T	ENSG00000101546	0.024231500923633575	-0.4953480064868927	0.21498200297355652	0.9289799928665161	QTD000021
+88264277	chr18_79438540_C_T	ENSG00000101546	0.024143200367689133	-0.4953039884567261	0.21482500433921814	0.9282100200653076	QTD000021
+165261392	chr18_79476276_A_G	ENSG00000101546	0.038954898715019226	-0.429408997297287	0.20401600003242493	0.6355800032615662	QTD000021
+165263539	chr18_80062054_C_T	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768	QTD000021
+165263547	chr18_80063905_A_G	ENSG00000101546	0.0013559299986809492	0.6285849809646606	0.18821899592876434	0.9167699813842773	QTD000021
+165263550	chr18_80064850_C_G	ENSG00000101546	0.0012443000450730324	0.7275720238685608	0.21606799960136414	0.8892099857330322	QTD000021
+165263552	chr18_80064971_G_A	ENSG00000101546	0.0005819390062242746	0.7007129788398743	0.19427700340747833	0.886650025844574	QTD000021
+165263682	chr18_80096367_C_T	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.987529993057251	QTD000021
+165263683	chr18_80096368_A_G	ENSG00000101546	0.0007818900048732758	-0.6961449980735779	0.19805799424648285	0.987529993057251	QTD000021
+165263808	chr18_80127538_C_T	ENSG00000101546	0.0010717499535530806	-0.7658050060272217	0.22423900663852692	0.9778800010681152	QTD000021
+189976170	chr18_80144701_C_G	ENSG00000101546	0.004864959977567196	0.5091620087623596	0.17498500645160675	0.9397799968719482	QTD000021
+165263875	chr18_80144954_G_A	ENSG00000101546	5.636949936160818e-05	-0.6927289962768555	0.16135099530220032	0.9645299911499023	QTD000021
+189976362	chr18_80166015_C_T	ENSG00000101546	0.0459383986890316	0.5302850008010864	0.26088398694992065	0.837939977645874	QTD000021
+165264167	chr18_80246026_T_C	ENSG00000101546	0.03268430009484291	-0.8415319919586182	0.3860520124435425	0.4004400074481964	QTD000021
+165263672	chr18_80093640_A_G	ENSG00000101546	0.0007727540214546025	-0.6972600221633911	0.19816799461841583	0.9859099984169006	QTD000021
+189968620	chr18_79107061_G_T	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+165263601	chr18_80078362_C_T	ENSG00000101546	0.0008133020019158721	-0.7048460245132446	0.20124199986457825	0.9651399850845337	QTD000021
+189975314	chr18_80042297_C_T	ENSG00000101546	0.00031457399018108845	-0.5965999960899353	0.1572439968585968	0.9707499742507935	QTD000021
+189974208	chr18_79876176_C_T	ENSG00000101546	0.03181619942188263	-0.5941200256347656	0.2711380124092102	0.961329996585846	QTD000021
+189968650	chr18_79111477_G_A	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+88265706	chr18_79621378_GA_G	ENSG00000101546	0.048143498599529266	-0.4898659884929657	0.24349099397659302	0.9225599765777588	QTD000021
+88268495	chr18_80021254_G_C	ENSG00000101546	0.003772800089791417	0.5350610017776489	0.17845599353313446	0.9571999907493591	QTD000021
+189974210	chr18_79876303_G_C	ENSG00000101546	0.031777698546648026	-0.5941569805145264	0.2710919976234436	0.9615300297737122	QTD000021
+189968460	chr18_79084785_A_C	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+165263831	chr18_80131567_TTC_T	ENSG00000101546	0.0011604100000113249	-0.8025019764900208	0.23674499988555908	0.9274700284004211	QTD000021
+189969638	chr18_79245603_G_A	ENSG00000101546	0.03742780163884163	0.40794000029563904	0.19224099814891815	0.9494199752807617	QTD000021
+189968618	chr18_79106707_A_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+88270175	chr18_80257347_C_T	ENSG00000101546	0.047728899866342545	0.4663519859313965	0.2313610017299652	0.9160799980163574	QTD000021
+189974226	chr18_79878079_G_A	ENSG00000101546	0.022338099777698517	-0.638001024723053	0.2729789912700653	0.9185000061988831	QTD000021
+189969632	chr18_79245587_G_A	ENSG00000101546	0.03683289885520935	0.4116010069847107	0.19333800673484802	0.931659996509552	QTD000021
+189974300	chr18_79889662_G_T	ENSG00000101546	0.018403200432658195	-0.6812130212783813	0.2821100056171417	0.9209100008010864	QTD000021
+165261353	chr18_79464709_TA_T	ENSG00000101546	0.029605800285935402	-0.8919659852981567	0.4015290141105652	0.46327999234199524	QTD000021
+189968728	chr18_79123122_G_A	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183	QTD000021
+189968524	chr18_79094299_G_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189968512	chr18_79091898_T_C	ENSG00000101546	0.03428110107779503	0.5569609999656677	0.2578999996185303	0.9804400205612183	QTD000021
+189968188	chr18_79057520_G_A	ENSG00000101546	0.03240789845585823	0.5613129734992981	0.25707900524139404	0.9760100245475769	QTD000021
+189968390	chr18_79076757_C_T	ENSG00000101546	0.03247600048780441	0.5609179735183716	0.25700199604034424	0.9900100231170654	QTD000021
+189968472	chr18_79086013_C_T	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+88265783	chr18_79631156_CGTGT_C	ENSG00000101546	0.03570700064301491	-0.5140640139579773	0.23996800184249878	0.9148200154304504	QTD000021
+165263101	chr18_79954740_T_TTTTA	ENSG00000101546	0.015940500423312187	-0.4315820038318634	0.1746480017900467	0.9331099987030029	QTD000021
+88268493	chr18_80021182_CT_C	ENSG00000101546	0.009622779674828053	0.4900150001049042	0.18398800492286682	0.8669300079345703	QTD000021
+165263777	chr18_80120334_C_CT	ENSG00000101546	0.002584619913250208	-0.6125310063362122	0.1958789974451065	0.9440299868583679	QTD000021
+165263903	chr18_80152678_CTT_C	ENSG00000101546	0.006232670042663813	-0.5736100077629089	0.20327800512313843	0.9239500164985657	QTD000021
+165264172	chr18_80250390_CA_C	ENSG00000101546	0.02927589975297451	0.565858006477356	0.2541919946670532	0.4573499858379364	QTD000021
+165263513	chr18_80057487_A_ATTTCT	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853	QTD000021
+165262739	chr18_79827927_C_CTT	ENSG00000101546	0.011989600025117397	0.513247013092041	0.19887800514698029	0.6629599928855896	QTD000021
+165263132	chr18_79963052_AGCGTGCGTCAGC_A	ENSG00000101546	0.0020915500354021788	-0.8126299977302551	0.2541239857673645	0.8120999932289124	QTD000021
+165263343	chr18_80021993_C_CT	ENSG00000101546	3.1328301064448283e-10	1.086210012435913	0.1478710025548935	0.909089982509613	QTD000021
+165263673	chr18_80093675_C_CA	ENSG00000101546	0.0024812701158225536	0.6648129820823669	0.21166999638080597	0.6452299952507019	QTD000021
+165263984	chr18_80168912_T_TACAAATAAC	ENSG00000101546	0.008557089604437351	-0.6222079992294312	0.22987599670886993	0.9822800159454346	QTD000021
+165263666	chr18_80092310_T_C	ENSG00000101546	0.0007892749854363501	-0.7069770097732544	0.2013089954853058	0.9639000296592712	QTD000021
+189974598	chr18_79951964_T_C	ENSG00000101546	0.03788580000400543	-0.5122870206832886	0.24201099574565887	0.861240029335022	QTD000021
+165263914	chr18_80153258_A_G	ENSG00000101546	1.573410060018432e-07	0.9416090250015259	0.16131700575351715	0.9215499758720398	QTD000021
+189975262	chr18_80038449_TTGTC_T	ENSG00000101546	0.01789800077676773	-0.5947930216789246	0.24520400166511536	0.9567499756813049	QTD000021
+165263388	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023	QTD000021
+165263066	chr18_79946239_CAAAGAA_C	ENSG00000101546	0.018309399485588074	-0.41694799065589905	0.17252600193023682	0.8902300000190735	QTD000021
+189968596	chr18_79104611_TTATAA_T	ENSG00000101546	0.027988800778985023	0.617796003818512	0.2752099931240082	0.9817100167274475	QTD000021
+165263557	chr18_80066306_G_A	ENSG00000101546	1.681100002315361e-05	0.7509670257568359	0.16227400302886963	0.9999300241470337	QTD000021
+165263614	chr18_80083062_C_T	ENSG00000101546	0.0007982939714565873	-0.7051159739494324	0.20098300278186798	0.9673399925231934	QTD000021
+165263555	chr18_80065934_C_T	ENSG00000101546	2.165240039175842e-05	0.7394279837608337	0.162199005484581	0.9045000076293945	QTD000021
+165262764	chr18_79843283_T_G	ENSG00000101546	0.03241319954395294	-0.5894320011138916	0.2699649930000305	0.823419988155365	QTD000021
+165263046	chr18_79938967_C_T	ENSG00000101546	0.018794499337673187	-0.4103040099143982	0.1705079972743988	0.8488699793815613	QTD000021
+165263554	chr18_80065898_A_G	ENSG00000101546	0.0002628210058901459	0.780784010887146	0.20291300117969513	0.8837800025939941	QTD000021
+165263406	chr18_80035985_A_G	ENSG00000101546	0.0012013299856334925	0.7136030197143555	0.21121099591255188	0.9030900001525879	QTD000021
+165264054	chr18_80186452_C_T	ENSG00000101546	0.01209730003029108	-0.625154972076416	0.2425599992275238	0.9347000122070312	QTD000021
+88264567	chr18_79471307_C_T	ENSG00000101546	0.029840899631381035	-0.5340780019760132	0.24077999591827393	0.953029990196228	QTD000021
+165263186	chr18_79978025_C_T	ENSG00000101546	0.0026978300884366035	0.7515640258789062	0.24145400524139404	0.8339999914169312	QTD000021
+165263484	chr18_80051802_T_C	ENSG00000101546	2.150739965145476e-05	0.7579020261764526	0.16618500649929047	0.9473599791526794	QTD000021
+88267655	chr18_79882837_A_G	ENSG00000101546	0.04517349973320961	-0.6598359942436218	0.32343798875808716	0.7531599998474121	QTD000021
+189976654	chr18_80211932_G_T	ENSG00000101546	0.0024270599242299795	0.5798739790916443	0.1841920018196106	0.8251199722290039	QTD000021
+189969102	chr18_79167394_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+88264273	chr18_79438331_G_A	ENSG00000101546	0.02213910035789013	-0.5102289915084839	0.21797199547290802	0.8894799947738647	QTD000021
+189969106	chr18_79167714_G_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+165263041	chr18_79935384_T_A	ENSG00000101546	0.019308900460600853	-0.4078029990196228	0.17022700607776642	0.8508399724960327	QTD000021
+165263575	chr18_80070199_A_T	ENSG00000101546	7.044500094366413e-09	0.9839209914207458	0.14911000430583954	0.9588099718093872	QTD000021
+88264199	chr18_79429387_A_G	ENSG00000101546	0.022308100014925003	-0.5007789731025696	0.21421700716018677	0.9215999841690063	QTD000021
+165263760	chr18_80118197_G_A	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844	QTD000021
+88265769	chr18_79630317_G_A	ENSG00000101546	0.03580540046095848	-0.5124980211257935	0.2393690049648285	0.944350004196167	QTD000021
+189973898	chr18_79827644_G_C	ENSG00000101546	0.008066940121352673	-0.8298360109329224	0.3041520118713379	0.49950000643730164	QTD000021
+189969104	chr18_79167659_C_T	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969108	chr18_79167720_C_T	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304	QTD000021
+189969570	chr18_79233596_T_A	ENSG00000101546	0.003896069945767522	0.5369679927825928	0.1797579973936081	0.959089994430542	QTD000021
+189974620	chr18_79953983_C_A	ENSG00000101546	0.002398180076852441	-0.5623080134391785	0.17838600277900696	0.9387099742889404	QTD000021
+88265797	chr18_79632379_G_A	ENSG00000101546	0.03737270087003708	-0.4866830110549927	0.22927899658679962	0.9959099888801575	QTD000021
+88265711	chr18_79621710_A_G	ENSG00000101546	0.019354799762368202	-0.44100600481033325	0.1841599941253662	0.8976200222969055	QTD000021
+189976652	chr18_80211843_T_C	ENSG00000101546	0.0023437999188899994	0.5805349946022034	0.18372100591659546	0.8259299993515015	QTD000021
+165264097	chr18_80203646_A_G	ENSG00000101546	0.009295180439949036	-0.6584839820861816	0.24605600535869598	0.9172000288963318	QTD000021
+165264098	chr18_80203650_A_G	ENSG00000101546	0.009295180439949036	-0.6584839820861816	0.24605600535869598	0.9172000288963318	QTD000021
+165263206	chr18_79987542_T_C	ENSG00000101546	0.0025112999137490988	0.6745319962501526	0.21504099667072296	0.9982399940490723	QTD000021
+165264005	chr18_80174701_T_A	ENSG00000101546	4.0879299945117964e-07	0.875190019607544	0.1563500016927719	0.9762899875640869	QTD000021
+189970146	chr18_79351383_G_A	ENSG00000101546	0.042623601853847504	0.4559510052204132	0.22073499858379364	0.9135299921035767	QTD000021
+88264269	chr18_79438217_T_C	ENSG00000101546	0.023621300235390663	-0.4976469874382019	0.21501000225543976	0.9130399823188782	QTD000021
+165263134	chr18_79963052_AGCGTGCGTCAGC_A	ENSG00000101546	0.0020915500354021788	-0.8126299977302551	0.2541239857673645	0.8120999932289124	QTD000021
+165264143	chr18_80219369_A_C	ENSG00000101546	0.03919349983334541	-0.4473710060119629	0.2128179967403412	0.8657600283622742	QTD000021
+189973974	chr18_79851617_AGTGT_A	ENSG00000101546	0.025087300688028336	0.3987250030040741	0.1741199940443039	0.9344800114631653	QTD000021
+165263587	chr18_80074824_G_A	ENSG00000101546	3.7309499020921066e-05	-0.7325019836425781	0.16614800691604614	0.9672099947929382	QTD000021
+165263448	chr18_80043307_A_G	ENSG00000101546	2.20331003442098e-10	1.0803500413894653	0.14541299641132355	0.9572799801826477	QTD000021
+165263944	chr18_80158531_G_C	ENSG00000101546	0.005793530028313398	-0.6423699855804443	0.22555799782276154	0.9906899929046631	QTD000021
+165263067	chr18_79946294_A_G	ENSG00000101546	0.01889999955892563	-0.4143739938735962	0.17235800623893738	0.8961300253868103	QTD000021
+165263975	chr18_80167181_G_A	ENSG00000101546	3.898709906025033e-07	0.8648849725723267	0.15418000519275665	0.9767900109291077	QTD000021
+165263411	chr18_80037884_A_G	ENSG00000101546	0.001214809948578477	0.7135249972343445	0.2114119976758957	0.9020400047302246	QTD000021
+88264427	chr18_79457030_A_C	ENSG00000101546	0.03691809996962547	-0.5180060267448425	0.24343299865722656	0.9432100057601929	QTD000021
+165263486	chr18_80052364_A_G	ENSG00000101546	0.0016547499690204859	0.6155650019645691	0.18796400725841522	0.9381800293922424	QTD000021
+165261358	chr18_79465912_C_T	ENSG00000101546	0.02870820090174675	-0.5849969983100891	0.26183000206947327	0.8852999806404114	QTD000021
+189969604	chr18_79238146_T_C	ENSG00000101546	0.004182090051472187	0.5143020153045654	0.1735980063676834	0.9996399879455566	QTD000021
+165263838	chr18_80131943_G_C	ENSG00000101546	1.9416999919030786e-07	0.8951709866523743	0.15475299954414368	0.9697099924087524	QTD000021
+189975526	chr18_80064887_G_A	ENSG00000101546	0.009675689972937107	-0.7751269936561584	0.29126301407814026	0.7470200061798096	QTD000021
+88264215	chr18_79431849_T_C	ENSG00000101546	0.041228998452425	-0.3853529989719391	0.18525399267673492	0.8892800211906433	QTD000021
+165263665	chr18_80092087_A_G	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+165263994	chr18_80171165_C_T	ENSG00000101546	1.2719800679406035e-07	0.9270600080490112	0.15739800035953522	0.8776699900627136	QTD000021
+88264365	chr18_79449568_G_C	ENSG00000101546	0.020163800567388535	-0.444242000579834	0.1867849975824356	0.8618299961090088	QTD000021
+165262763	chr18_79843270_A_T	ENSG00000101546	0.03241319954395294	-0.5894320011138916	0.2699649930000305	0.823419988155365	QTD000021
+165263663	chr18_80091967_G_A	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+165263946	chr18_80158682_T_C	ENSG00000101546	0.0020898899529129267	-0.727869987487793	0.22759899497032166	0.9733700156211853	QTD000021
+88267653	chr18_79882807_A_G	ENSG00000101546	0.022010400891304016	-0.7396429777145386	0.3156619966030121	0.7248200178146362	QTD000021
+189974814	chr18_79982916_G_A	ENSG00000101546	0.030908800661563873	-0.5448430180549622	0.24727599322795868	0.805429995059967	QTD000021
+88269095	chr18_80088115_T_A	ENSG00000101546	0.01055390015244484	0.8436859846115112	0.32093799114227295	0.968999981880188	QTD000021
+165263912	chr18_80153217_T_A	ENSG00000101546	0.0004090899892617017	0.6742309927940369	0.18150100111961365	0.901669979095459	QTD000021
+165263543	chr18_80062285_A_G	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768	QTD000021
+189975378	chr18_80048971_T_C	ENSG00000101546	0.018202299252152443	-0.5972369909286499	0.24688899517059326	0.9101099967956543	QTD000021
+189974846	chr18_79988972_C_T	ENSG00000101546	0.019115999341011047	-0.5966410040855408	0.24863900244235992	0.8116300106048584	QTD000021
+189974938	chr18_80003613_T_C	ENSG00000101546	0.016826199367642403	-0.6356809735298157	0.259460985660553	0.8081899881362915	QTD000021
+165263268	chr18_80005392_T_C	ENSG00000101546	2.779080077175422e-08	0.9950469732284546	0.15883100032806396	0.850350022315979	QTD000021
+165263297	chr18_80011351_G_A	ENSG00000101546	9.517710175543925e-09	0.9896969795227051	0.1516599953174591	0.9080299735069275	QTD000021
+189975100	chr18_80020580_T_C	ENSG00000101546	0.01519010029733181	-0.6198329925537109	0.2489359974861145	0.9007200002670288	QTD000021
+88268491	chr18_80021174_G_A	ENSG00000101546	0.003772800089791417	0.5350610017776489	0.17845599353313446	0.9571999907493591	QTD000021
+165263360	chr18_80026810_G_A	ENSG00000101546	9.416109669757589e-09	0.989503026008606	0.15157000720500946	0.9106799960136414	QTD000021
+165263385	chr18_80033240_C_A	ENSG00000101546	2.1558900498153122e-10	1.0828800201416016	0.14565299451351166	0.9521600008010864	QTD000021
+165263425	chr18_80039913_T_C	ENSG00000101546	7.270180013563277e-09	0.9866189956665039	0.14969100058078766	0.951770007610321	QTD000021
+189975322	chr18_80043710_A_G	ENSG00000101546	0.012630400247871876	-0.575357973575592	0.22466899454593658	0.9760000109672546	QTD000021
+165263465	chr18_80047137_T_G	ENSG00000101546	7.452690020670616e-09	0.9856410026550293	0.1496790051460266	0.9543899893760681	QTD000021
+165263466	chr18_80047211_C_T	ENSG00000101546	2.5229899620171636e-05	0.7453060150146484	0.16500599682331085	0.9468700289726257	QTD000021
+165263467	chr18_80047228_C_A	ENSG00000101546	7.452690020670616e-09	0.9856410026550293	0.1496790051460266	0.9543899893760681	QTD000021
+165263505	chr18_80055624_C_A	ENSG00000101546	7.168019955372529e-09	0.9857140183448792	0.1494770050048828	0.9486100077629089	QTD000021
+189975446	chr18_80057172_T_C	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189975488	chr18_80060400_G_A	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189975568	chr18_80069030_G_A	ENSG00000101546	0.02678219974040985	-0.5403760075569153	0.23878200352191925	0.9691299796104431	QTD000021
+165263573	chr18_80069379_T_C	ENSG00000101546	7.280910097051674e-09	0.9854159951210022	0.1495169997215271	0.9567599892616272	QTD000021
+189975584	chr18_80070744_G_C	ENSG00000101546	0.01796709932386875	-0.5397830009460449	0.2226649969816208	0.9735100269317627	QTD000021
+189975600	chr18_80074856_A_G	ENSG00000101546	0.03164549916982651	0.5214740037918091	0.23773899674415588	0.8784000277519226	QTD000021
+189975606	chr18_80076073_A_G	ENSG00000101546	0.020625999197363853	0.5374929904937744	0.22685900330543518	0.876550018787384	QTD000021
+189975628	chr18_80078454_T_G	ENSG00000101546	0.03117999993264675	0.5333920121192932	0.2424830049276352	0.8693699836730957	QTD000021
+165263630	chr18_80085528_G_T	ENSG00000101546	8.22564985014651e-08	0.9263049960136414	0.15443600714206696	0.9346399903297424	QTD000021
+165263633	chr18_80086500_C_T	ENSG00000101546	8.22564985014651e-08	0.9263049960136414	0.15443600714206696	0.9346399903297424	QTD000021
+165263664	chr18_80091978_G_A	ENSG00000101546	8.013550001351177e-08	0.929377019405365	0.1547819972038269	0.9317299723625183	QTD000021
+165263712	chr18_80104201_C_G	ENSG00000101546	4.17866985458204e-08	0.9344689846038818	0.15158000588417053	0.9470599889755249	QTD000021
+165263735	chr18_80111862_T_C	ENSG00000101546	1.3600100601252052e-07	0.8892989754676819	0.15141400694847107	0.9823700189590454	QTD000021
+165263750	chr18_80116331_A_G	ENSG00000101546	1.3628699946366396e-07	0.8891400098800659	0.15140099823474884	0.982729971408844	QTD000021
+165263804	chr18_80126368_G_A	ENSG00000101546	1.299259935194641e-07	0.8888170123100281	0.1510400027036667	0.9825599789619446	QTD000021
+165263845	chr18_80134056_A_C	ENSG00000101546	1.196400063463443e-07	0.8913260102272034	0.15094099938869476	0.9764299988746643	QTD000021
+165263866	chr18_80141590_A_G	ENSG00000101546	1.0253800297732596e-07	0.8969330191612244	0.15091200172901154	0.9724199771881104	QTD000021
+165263877	chr18_80145205_C_T	ENSG00000101546	1.030799978707364e-07	0.8969759941101074	0.1509529948234558	0.9716799855232239	QTD000021
+165263880	chr18_80146580_A_C	ENSG00000101546	1.2113800096358318e-07	0.8967229723930359	0.15193399786949158	0.9718499779701233	QTD000021
+165263888	chr18_80147982_C_T	ENSG00000101546	1.6655999957038148e-07	0.8971120119094849	0.15406900644302368	0.9694300293922424	QTD000021
+165263927	chr18_80153729_G_T	ENSG00000101546	1.578760020493064e-07	0.8853369951248169	0.1516990065574646	0.9564899802207947	QTD000021
+165263985	chr18_80168979_G_A	ENSG00000101546	3.8265400803538796e-07	0.8572790026664734	0.15269599854946136	0.984279990196228	QTD000021
+189974154	chr18_79870170_G_T	ENSG00000101546	0.01646539941430092	0.4279389977455139	0.1740649938583374	0.9452700018882751	QTD000021
+189974166	chr18_79871679_A_C	ENSG00000101546	0.016604699194431305	0.4271480143070221	0.17397700250148773	0.9468200206756592	QTD000021
+189974170	chr18_79872194_G_A	ENSG00000101546	0.016499700024724007	0.4275279939174652	0.17395499348640442	0.9465799927711487	QTD000021
+165264103	chr18_80208742_A_T	ENSG00000101546	5.064509878138779e-07	0.9348869919776917	0.16864599287509918	0.8584799766540527	QTD000021
+165264106	chr18_80209128_A_C	ENSG00000101546	4.939919904245471e-07	0.9450749754905701	0.1702899932861328	0.8296399712562561	QTD000021
+165264150	chr18_80223941_C_T	ENSG00000101546	3.5571400047729185e-08	1.532920002937317	0.2470719963312149	0.4260900020599365	QTD000021
+165264176	chr18_80254580_G_A	ENSG00000101546	8.53054018534749e-07	1.389780044555664	0.25684499740600586	0.4189999997615814	QTD000021
+189974426	chr18_79918240_C_T	ENSG00000101546	0.01804959960281849	-0.7147060036659241	0.2950429916381836	0.799589991569519	QTD000021
+189974480	chr18_79932917_T_C	ENSG00000101546	0.017002400010824203	-0.7211369872093201	0.2948319911956787	0.8111900091171265	QTD000021
+189974536	chr18_79942991_G_A	ENSG00000101546	0.02251330018043518	-0.6474800109863281	0.27741000056266785	0.8582000136375427	QTD000021
+189974550	chr18_79945632_G_C	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203	QTD000021
+189974552	chr18_79946197_C_G	ENSG00000101546	0.03594899922609329	-0.5206760168075562	0.2433830052614212	0.8616300225257874	QTD000021
+189974584	chr18_79950618_C_T	ENSG00000101546	0.02531309984624386	-0.626285970211029	0.273934006690979	0.8651599884033203	QTD000021
+189974622	chr18_79954138_G_A	ENSG00000101546	0.022005900740623474	-0.6418160200119019	0.2739019989967346	0.8555899858474731	QTD000021
+88268057	chr18_79960926_T_C	ENSG00000101546	0.03060219995677471	-0.7474160194396973	0.3385699987411499	0.7858700156211853	QTD000021
+165263171	chr18_79971952_C_T	ENSG00000101546	2.642840081534814e-05	0.7713630199432373	0.17125900089740753	0.9087100028991699	QTD000021
+189968862	chr18_79138984_C_T	ENSG00000101546	0.026828600093722343	0.6198970079421997	0.27400699257850647	0.9918100237846375	QTD000021
+189968956	chr18_79151138_C_G	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+189968958	chr18_79151359_T_C	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+189969022	chr18_79157788_G_A	ENSG00000101546	0.03309540078043938	0.5585179924964905	0.2568430006504059	0.9835399985313416	QTD000021
+189969032	chr18_79159493_C_T	ENSG00000101546	0.026304300874471664	0.6227669715881348	0.27428901195526123	0.9825800061225891	QTD000021
+189969048	chr18_79161065_C_T	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847000241279602	QTD000021
+189969052	chr18_79161323_C_G	ENSG00000101546	0.026357999071478844	0.6221020221710205	0.2740980088710785	0.987559974193573	QTD000021
+189969068	chr18_79163528_G_A	ENSG00000101546	0.026211999356746674	0.6285030245780945	0.27663901448249817	0.970990002155304	QTD000021
+189969078	chr18_79164189_A_T	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969084	chr18_79164957_T_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969086	chr18_79165604_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969088	chr18_79165660_G_A	ENSG00000101546	0.03397589921951294	0.5615339875221252	0.2595599889755249	0.9642500281333923	QTD000021
+189969090	chr18_79166226_G_C	ENSG00000101546	0.02625720016658306	0.6304360032081604	0.2775759994983673	0.9618899822235107	QTD000021
+189969092	chr18_79166811_C_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969094	chr18_79166834_A_C	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969124	chr18_79168884_C_T	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969130	chr18_79169274_A_G	ENSG00000101546	0.026107799261808395	0.6302070021629333	0.2771889865398407	0.970990002155304	QTD000021
+189969166	chr18_79173300_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969182	chr18_79174122_A_G	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969184	chr18_79174379_G_A	ENSG00000101546	0.03355500102043152	0.5624650120735168	0.25935500860214233	0.9670199751853943	QTD000021
+189969198	chr18_79175825_C_T	ENSG00000101546	0.02602200023829937	0.6326929926872253	0.27811700105667114	0.9521499872207642	QTD000021
+189969200	chr18_79175828_A_C	ENSG00000101546	0.033622100949287415	0.5630710124969482	0.25973600149154663	0.9513099789619446	QTD000021
+189969226	chr18_79181087_G_T	ENSG00000101546	0.025193700566887856	0.6350740194320679	0.27754199504852295	0.957319974899292	QTD000021
+189969252	chr18_79183371_A_C	ENSG00000101546	0.025193700566887856	0.6350740194320679	0.27754199504852295	0.957319974899292	QTD000021
+189969354	chr18_79190903_T_A	ENSG00000101546	0.02895589917898178	0.6377649903297424	0.28590500354766846	0.9197400212287903	QTD000021
+189968328	chr18_79071087_G_C	ENSG00000101546	0.02618280053138733	0.6232709884643555	0.27428001165390015	0.9907600283622742	QTD000021
+189968528	chr18_79095236_G_A	ENSG00000101546	0.03627309948205948	0.6376929879188538	0.29861700534820557	0.9447000026702881	QTD000021
+189969552	chr18_79227492_A_G	ENSG00000101546	0.04375910013914108	0.4694570004940033	0.22854900360107422	0.9157000184059143	QTD000021
+165261260	chr18_79445023_G_A	ENSG00000101546	0.014688899740576744	1.1767200231552124	0.4701380133628845	0.6274099946022034	QTD000021
+165261287	chr18_79452989_G_T	ENSG00000101546	0.011877600103616714	1.1912399530410767	0.46095898747444153	0.6495299935340881	QTD000021
+189968774	chr18_79129448_G_T	ENSG00000101546	0.03430910035967827	-0.8093069791793823	0.37480801343917847	0.9810799956321716	QTD000021
+88269083	chr18_80087134_A_G	ENSG00000101546	0.01055390015244484	0.8436859846115112	0.32093799114227295	0.9689499735832214	QTD000021
+189974346	chr18_79900015_T_C	ENSG00000101546	0.03645030036568642	-0.6774500012397766	0.31754499673843384	0.736270010471344	QTD000021
+189974508	chr18_79936389_T_C	ENSG00000101546	0.017986800521612167	-0.7101179957389832	0.2929820120334625	0.8177199959754944	QTD000021
+189974510	chr18_79936394_T_C	ENSG00000101546	0.017986800521612167	-0.7101179957389832	0.2929820120334625	0.8177199959754944	QTD000021
+88269257	chr18_80109111_C_T	ENSG00000101546	0.024308200925588608	0.6991260051727295	0.3035930097103119	0.9881500005722046	QTD000021
+189969640	chr18_79245626_G_C	ENSG00000101546	0.036264099180698395	0.4151270091533661	0.19438500702381134	0.9500399827957153	QTD000021
+165263892	chr18_80150025_T_C	ENSG00000101546	9.766570292413235e-05	-0.6717050075531006	0.16235899925231934	0.973580002784729	QTD000021
+165263868	chr18_80142946_A_G	ENSG00000101546	0.0010755800176411867	-0.7504820227622986	0.21982499957084656	0.9998999834060669	QTD000021
+165263795	chr18_80124152_G_A	ENSG00000101546	0.0010703200241550803	-0.7656580209732056	0.22416700422763824	0.9782299995422363	QTD000021
+165263796	chr18_80124184_T_C	ENSG00000101546	0.0010569100268185139	-0.7661370038986206	0.22404399514198303	0.9767400026321411	QTD000021
+165261405	chr18_79478226_T_C	ENSG00000101546	0.005422110203653574	-0.592818021774292	0.20645199716091156	0.620389997959137	QTD000021
+165261393	chr18_79476279_G_A	ENSG00000101546	0.0281125009059906	-0.49430298805236816	0.22037699818611145	0.6396200060844421	QTD000021
+165261394	chr18_79476299_G_A	ENSG00000101546	0.02704709954559803	-0.4985499978065491	0.22069600224494934	0.638189971446991	QTD000021
+165263906	chr18_80152678_CTTTT_C	ENSG00000101546	1.8839300253148394e-07	0.8988940119743347	0.1551939994096756	0.9596899747848511	QTD000021
+165262241	chr18_79682538_G_A	ENSG00000101546	0.02608090080320835	1.0410100221633911	0.45778998732566833	0.5468000173568726	QTD000021
+189975504	chr18_80062213_TG_T	ENSG00000101546	0.012708200141787529	-0.5767030119895935	0.22540099918842316	0.9361000061035156	QTD000021
+88264573	chr18_79472698_C_T	ENSG00000101546	0.029933199286460876	-0.5349820256233215	0.24132800102233887	0.9493299722671509	QTD000021
+165263678	chr18_80094146_CACAG_C	ENSG00000101546	9.348160290301166e-08	0.9973589777946472	0.16716499626636505	0.8185300230979919	QTD000021
+189969158	chr18_79172193_C_G	ENSG00000101546	0.04756399989128113	0.6673650145530701	0.33083298802375793	0.6532800197601318	QTD000021
+165263905	chr18_80152678_CTTTT_C	ENSG00000101546	1.8839300253148394e-07	0.8988940119743347	0.1551939994096756	0.9596899747848511	QTD000021
+189968342	chr18_79071897_T_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+189968819	chr18_79133508_A_AAC	ENSG00000101546	0.04565830156207085	0.559283971786499	0.27478501200675964	0.7888799905776978	QTD000021
+165263387	chr18_80033293_CCA_C	ENSG00000101546	0.006935810204595327	0.6283720135688782	0.2257629930973053	0.8395299911499023	QTD000021
+189969424	chr18_79202586_T_C	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646	QTD000021
+189974172	chr18_79872229_C_CAAA	ENSG00000101546	0.0453278012573719	0.3888939917087555	0.1907690018415451	0.863610029220581	QTD000021
+189968346	chr18_79071906_TG_T	ENSG00000101546	0.027973199263215065	0.6197720170021057	0.27606201171875	0.9166300296783447	QTD000021
+165263410	chr18_80037321_C_T	ENSG00000101546	0.0012013299856334925	0.7136030197143555	0.21121099591255188	0.9030900001525879	QTD000021
+88267565	chr18_79872891_C_G	ENSG00000101546	0.03573310002684593	-0.9392750263214111	0.43852201104164124	0.6782500147819519	QTD000021
+88264553	chr18_79469409_C_G	ENSG00000101546	0.030011000111699104	-0.5333290100097656	0.24070000648498535	0.956309974193573	QTD000021
+88264329	chr18_79444477_T_C	ENSG00000101546	0.044089701026678085	-0.5171549916267395	0.25217700004577637	0.887440025806427	QTD000021
+165263162	chr18_79969549_T_C	ENSG00000101546	0.0035614699590951204	0.6765509843826294	0.2241619974374771	0.8575199842453003	QTD000021
+165264175	chr18_80254366_G_A	ENSG00000101546	7.737850182820694e-07	1.3849200010299683	0.2547749876976013	0.41881000995635986	QTD000021
+189969433	chr18_79206623_C_CATAA	ENSG00000101546	0.02459779940545559	0.5034890174865723	0.21909800171852112	0.6862199902534485	QTD000021
+189968700	chr18_79118383_C_T	ENSG00000101546	0.006744119804352522	0.7905949950218201	0.28301799297332764	0.8611500263214111	QTD000021
+189969992	chr18_79326649_G_A	ENSG00000101546	0.026566000655293465	-0.9029719829559326	0.39841699600219727	0.8937199711799622	QTD000021
+165263348	chr18_80024187_T_TA	ENSG00000101546	9.365420439166883e-09	0.9901210069656372	0.15163399279117584	0.9103400111198425	QTD000021
+189974760	chr18_79970600_A_G	ENSG00000101546	0.020918600261211395	-0.6234570145606995	0.2637709975242615	0.7880399823188782	QTD000021
+88264018	chr18_79409332_TCATC_T	ENSG00000101546	0.04907580092549324	0.41091299057006836	0.20511899888515472	0.42903000116348267	QTD000021
+189969620	chr18_79243516_A_G	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940800070762634	QTD000021
+189968904	chr18_79145077_C_CGGG	ENSG00000101546	0.019698500633239746	0.9430649876594543	0.3949719965457916	0.7448899745941162	QTD000021
+189969648	chr18_79247755_A_G	ENSG00000101546	0.03011780045926571	-0.8174859881401062	0.3691929876804352	0.9952499866485596	QTD000021
+165263814	chr18_80129105_G_GT	ENSG00000101546	0.0003587440005503595	-0.8434470295906067	0.22464700043201447	0.935259997844696	QTD000021
+189974704	chr18_79964637_C_A	ENSG00000101546	0.03462810069322586	-0.5157999992370605	0.239315003156662	0.7733299732208252	QTD000021
+165261427	chr18_79487117_C_T	ENSG00000101546	0.001169090042822063	1.1296800374984741	0.3334999978542328	0.5028600096702576	QTD000021
+189969902	chr18_79304041_C_T	ENSG00000101546	0.035376500338315964	-0.8260939717292786	0.3849110007286072	0.9374399781227112	QTD000021
+88264157	chr18_79425287_T_G	ENSG00000101546	0.04636019840836525	-0.3968670070171356	0.19563600420951843	0.7454599738121033	QTD000021
+165261240	chr18_79439322_C_T	ENSG00000101546	0.025505399331450462	1.1031999588012695	0.48319000005722046	0.6258299946784973	QTD000021
+165264078	chr18_80196890_TAA_T	ENSG00000101546	0.03214230015873909	-0.4360960125923157	0.199412003159523	0.7321599721908569	QTD000021
+165263219	chr18_79991107_CAA_C	ENSG00000101546	4.226340024615638e-05	0.8044869899749756	0.18392400443553925	0.7601000070571899	QTD000021
+189969528	chr18_79221928_TAA_T	ENSG00000101546	0.03211839869618416	-0.8195649981498718	0.3747060000896454	0.9770600199699402	QTD000021
+165263776	chr18_80120334_C_CT	ENSG00000101546	0.002584619913250208	-0.6125310063362122	0.1958789974451065	0.9440299868583679	QTD000021
+189969740	chr18_79264960_T_C	ENSG00000101546	0.02921850048005581	-0.8332149982452393	0.37415599822998047	0.9723899960517883	QTD000021
+189976215	chr18_80151832_T_TAA	ENSG00000101546	3.0354101454577176e-08	1.647570013999939	0.26389798521995544	0.4377500116825104	QTD000021
+189970532	chr18_79385700_C_T	ENSG00000101546	0.029550699517130852	-0.9878489971160889	0.4445360004901886	0.7541800141334534	QTD000021
+189968347	chr18_79071906_TG_T	ENSG00000101546	0.027973199263215065	0.6197720170021057	0.27606201171875	0.9166300296783447	QTD000021
+189975305	chr18_80041735_CT_C	ENSG00000101546	0.00028746199677698314	-0.600579023361206	0.15717299282550812	0.9647600054740906	QTD000021
+189969910	chr18_79306147_T_C	ENSG00000101546	0.035376500338315964	-0.8260939717292786	0.3849110007286072	0.9374399781227112	QTD000021
+88263701	chr18_79369532_CAA_C	ENSG00000101546	0.04803730174899101	-1.0487899780273438	0.5210549831390381	0.6834999918937683	QTD000021
+189974596	chr18_79951388_G_A	ENSG00000101546	0.02521420083940029	-0.6268860101699829	0.2740040123462677	0.8650599718093872	QTD000021
+165263438	chr18_80041720_CTTT_C	ENSG00000101546	0.0012789099710062146	0.713791012763977	0.21253199875354767	0.9042900204658508	QTD000021
+165260696	chr18_79282195_C_T	ENSG00000101546	0.03759080171585083	-1.0327500104904175	0.4871099889278412	0.6486499905586243	QTD000021
+189969300	chr18_79187171_T_C	ENSG00000101546	0.030806099995970726	-0.8092349767684937	0.36703699827194214	0.9937400221824646	QTD000021
+189969706	chr18_79260195_C_T	ENSG00000101546	0.04540269821882248	-0.8871849775314331	0.4353579878807068	0.9621999859809875	QTD000021
+165264034	chr18_80179223_A_AT	ENSG00000101546	5.437000254460145e-07	0.8975480198860168	0.16243700683116913	0.9192799925804138	QTD000021
+165263151	chr18_79967147_CA_C	ENSG00000101546	0.004885829985141754	0.6611229777336121	0.22732800245285034	0.7614399790763855	QTD000021
+189969527	chr18_79221928_TA_T	ENSG00000101546	0.004411329980939627	0.5199660062789917	0.17661799490451813	0.94691002368927	QTD000021
+88264591	chr18_79476006_T_C	ENSG00000101546	0.030385300517082214	-0.5334050059318542	0.24130000174045563	0.941540002822876	QTD000021
+88264505	chr18_79464429_G_A	ENSG00000101546	0.03677560016512871	-0.5191329717636108	0.2437720000743866	0.9442300200462341	QTD000021
+189974676	chr18_79961494_CT_C	ENSG00000101546	0.0010634800419211388	0.6191359758377075	0.18116100132465363	0.8721699714660645	QTD000021
+165263435	chr18_80041720_CT_C	ENSG00000101546	0.0011709299869835377	-0.7383360266685486	0.21800099313259125	0.925599992275238	QTD000021
+189969026	chr18_79158134_C_T	ENSG00000101546	0.030845800414681435	-0.8117179870605469	0.3682529926300049	0.9889600276947021	QTD000021
+189969341	chr18_79190511_T_TACACAC	ENSG00000101546	0.008170249871909618	0.7961120009422302	0.29229000210762024	0.6411299705505371	QTD000021
+189974487	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834	QTD000021
+189969982	chr18_79323998_G_C	ENSG00000101546	0.03304329887032509	-0.8546680212020874	0.39291200041770935	0.9000399708747864	QTD000021
+189969798	chr18_79278582_G_A	ENSG00000101546	0.029738599434494972	-0.8309569954872131	0.37438100576400757	0.9692699909210205	QTD000021
+189974740	chr18_79968715_C_T	ENSG00000101546	0.021641800180077553	-0.6214669942855835	0.2644580006599426	0.7712399959564209	QTD000021
+88264192	chr18_79429220_CAA_C	ENSG00000101546	0.04382459819316864	-0.45905399322509766	0.22355599701404572	0.846310019493103	QTD000021
+189969684	chr18_79256318_C_T	ENSG00000101546	0.03011780045926571	-0.8174859881401062	0.3691929876804352	0.9952499866485596	QTD000021
+189970182	chr18_79354912_G_A	ENSG00000101546	0.04338959977030754	0.4545440077781677	0.22088900208473206	0.9137099981307983	QTD000021
+189969340	chr18_79190511_T_TACACAC	ENSG00000101546	0.008170249871909618	0.7961120009422302	0.29229000210762024	0.6411299705505371	QTD000021
+165263835	chr18_80131569_CTT_C	ENSG00000101546	1.2384700198708742e-07	0.8924009799957275	0.15134300291538239	0.9730899930000305	QTD000021
+189969580	chr18_79234782_G_A	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940699934959412	QTD000021
+189968344	chr18_79071901_T_G	ENSG00000101546	0.02619899995625019	0.623894989490509	0.2745859920978546	0.991349995136261	QTD000021
+189974366	chr18_79907334_G_GTT	ENSG00000101546	0.0016344500472769141	0.683821976184845	0.20854899287223816	0.7303400039672852	QTD000021
+189974774	chr18_79973296_A_AC	ENSG00000101546	0.01814259961247444	-0.6509069800376892	0.26893100142478943	0.7876999974250793	QTD000021
+189974042	chr18_79864450_G_T	ENSG00000101546	0.04978540167212486	-0.3477100133895874	0.174126997590065	0.9513499736785889	QTD000021
+189968215	chr18_79058693_CAA_C	ENSG00000101546	0.026237700134515762	0.6261829733848572	0.2756670117378235	0.9628499746322632	QTD000021
+189969572	chr18_79234363_T_C	ENSG00000101546	0.030060099437832832	-0.8153769969940186	0.36810699105262756	0.9937400221824646	QTD000021
+165261213	chr18_79434497_C_T	ENSG00000101546	0.027447599917650223	-0.7925699949264526	0.35179901123046875	0.7452399730682373	QTD000021
+189970080	chr18_79343488_A_G	ENSG00000101546	0.025313900783658028	-0.9277070164680481	0.4057759940624237	0.8686699867248535	QTD000021
+189969896	chr18_79301876_A_G	ENSG00000101546	0.028195800259709358	-0.8757619857788086	0.39065900444984436	0.9383000135421753	QTD000021
+189969147	chr18_79171878_G_GTT	ENSG00000101546	0.028650900349020958	-0.8239669799804688	0.36864998936653137	0.926010012626648	QTD000021
+189969950	chr18_79314942_A_G	ENSG00000101546	0.03304329887032509	-0.8546680212020874	0.39291200041770935	0.9000399708747864	QTD000021
+189974052	chr18_79864972_G_GGTGCTGAGAGGTCTGT	ENSG00000101546	0.01172959990799427	0.46544700860977173	0.17977699637413025	0.8596000075340271	QTD000021
+165262320	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449	QTD000021
+189969558	chr18_79229675_T_G	ENSG00000101546	0.030060099437832832	-0.8153769969940186	0.36810699105262756	0.9937400221824646	QTD000021
+189969345	chr18_79190543_CACATAT_C	ENSG00000101546	0.032207898795604706	-0.8075429797172546	0.3694080114364624	0.8842599987983704	QTD000021
+88264421	chr18_79456756_G_A	ENSG00000101546	0.03703920170664787	-0.5177099704742432	0.2434539943933487	0.9455299973487854	QTD000021
+189974475	chr18_79932475_A_AAAAG	ENSG00000101546	0.015355500392615795	-0.7255340218544006	0.2918809950351715	0.8104000091552734	QTD000021
+88269434	chr18_80129095_CTTTTTTTTTGT_C	ENSG00000101546	0.024507999420166016	0.7027459740638733	0.30560898780822754	0.9831100106239319	QTD000021
+165263902	chr18_80152678_CTT_C	ENSG00000101546	0.006232670042663813	-0.5736100077629089	0.20327800512313843	0.9239500164985657	QTD000021
+165263424	chr18_80039768_T_C	ENSG00000101546	7.270180013563277e-09	0.9866189956665039	0.14969100058078766	0.951770007610321	QTD000021
+189975472	chr18_80059315_G_A	ENSG00000101546	0.01277020014822483	-0.5738599896430969	0.22445200383663177	0.9660199880599976	QTD000021
+189968674	chr18_79116922_TA_T	ENSG00000101546	0.04038659855723381	-0.7535989880561829	0.3607249855995178	0.575980007648468	QTD000021
+88268595	chr18_80033957_ACCTCGCGCCAGTCTTCGCCCCGCCCATTCACCGCCCG_A	ENSG00000101546	0.003214519936591387	0.5541219711303711	0.18148699402809143	0.9526399970054626	QTD000021
+88264565	chr18_79470822_G_A	ENSG00000101546	0.029840899631381035	-0.5340780019760132	0.24077999591827393	0.953029990196228	QTD000021
+189969372	chr18_79194476_T_A	ENSG00000101546	0.030432799831032753	-0.8116919994354248	0.36729899048805237	0.9937400221824646	QTD000021
+189975280	chr18_80040697_T_A	ENSG00000101546	0.012147700414061546	-0.5820279717445374	0.2259649932384491	0.9689300060272217	QTD000021
+189970280	chr18_79366193_G_A	ENSG00000101546	0.024874800816178322	-0.9352800250053406	0.4078100025653839	0.8464999794960022	QTD000021
+88264557	chr18_79469738_G_A	ENSG00000101546	0.02866319939494133	-0.5374559760093689	0.24048100411891937	0.9534800052642822	QTD000021
+88264489	chr18_79463322_G_A	ENSG00000101546	0.039069898426532745	-0.5131530165672302	0.24395200610160828	0.9422299861907959	QTD000021
+189974854	chr18_79989942_G_A	ENSG00000101546	0.01678840070962906	-0.6368399858474731	0.2598400115966797	0.8073300123214722	QTD000021
+189968466	chr18_79085432_G_C	ENSG00000101546	0.03213199973106384	-0.8192809820175171	0.37460699677467346	0.9400799870491028	QTD000021
+189974604	chr18_79952148_G_C	ENSG00000101546	0.04254880174994469	-0.5400630235671997	0.26135799288749695	0.8537600040435791	QTD000021
+189969140	chr18_79171046_C_G	ENSG00000101546	0.03221280127763748	-0.8171060085296631	0.37379398941993713	0.9908400177955627	QTD000021
+88267717	chr18_79896625_G_A	ENSG00000101546	0.0034671800676733255	1.4117100238800049	0.4663209915161133	0.5471199750900269	QTD000021
+189969574	chr18_79234556_G_A	ENSG00000101546	0.02979159913957119	-0.8154709935188293	0.36752599477767944	0.9940699934959412	QTD000021
+189970530	chr18_79385563_G_A	ENSG00000101546	0.02903839945793152	-0.9858199954032898	0.44217100739479065	0.7318599820137024	QTD000021
+189970134	chr18_79350645_T_C	ENSG00000101546	0.024216100573539734	-0.9169840216636658	0.39792901277542114	0.8608899712562561	QTD000021
+189974234	chr18_79879482_AC_A	ENSG00000101546	0.029288699850440025	-0.6117449998855591	0.2748279869556427	0.9521300196647644	QTD000021
+189968853	chr18_79138774_TA_T	ENSG00000101546	0.031318701803684235	-0.8162350058555603	0.3713800013065338	0.9262400269508362	QTD000021
+88265705	chr18_79621378_GA_G	ENSG00000101546	0.048143498599529266	-0.4898659884929657	0.24349099397659302	0.9225599765777588	QTD000021
+165263104	chr18_79955231_TA_T	ENSG00000101546	0.01798349991440773	-0.413085013628006	0.17042699456214905	0.9349200129508972	QTD000021
+165263983	chr18_80168573_TTG_T	ENSG00000101546	1.3762099797531846e-06	0.863614022731781	0.16330400109291077	0.8400200009346008	QTD000021
+88264607	chr18_79477142_G_A	ENSG00000101546	0.03042300045490265	-0.5328919887542725	0.24112500250339508	0.9447100162506104	QTD000021
+165262757	chr18_79833034_CT_C	ENSG00000101546	0.022035999223589897	0.3914470076560974	0.16709299385547638	0.952210009098053	QTD000021
+189968216	chr18_79058693_CAA_C	ENSG00000101546	0.026237700134515762	0.6261829733848572	0.2756670117378235	0.9628499746322632	QTD000021
+165263536	chr18_80061354_GT_G	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768	QTD000021
+189974489	chr18_79934128_TA_T	ENSG00000101546	0.027777500450611115	0.6389870047569275	0.28425300121307373	0.6370999813079834	QTD000021
+189974261	chr18_79882394_GA_G	ENSG00000101546	0.028648799285292625	0.3878380060195923	0.17351900041103363	0.9393600225448608	QTD000021
+165262658	chr18_79782606_AC_A	ENSG00000101546	0.044745299965143204	-0.3916890025138855	0.19160400331020355	0.5842300057411194	QTD000021
+88268278	chr18_79993320_TA_T	ENSG00000101546	0.0006915549747645855	0.5959029793739319	0.16770799458026886	0.8548300266265869	QTD000021
+88269316	chr18_80116512_TC_T	ENSG00000101546	0.024279000237584114	0.6988750100135803	0.30341899394989014	0.9890599846839905	QTD000021
+189970096	chr18_79347957_G_A	ENSG00000101546	0.02423040010035038	-0.9164440035820007	0.3977360129356384	0.8612099885940552	QTD000021
+165263181	chr18_79976966_AT_A	ENSG00000101546	0.0034992999862879515	0.6780070066452026	0.22419500350952148	0.8539800047874451	QTD000021
+165263263	chr18_80004129_TA_T	ENSG00000101546	0.00520892022177577	0.6606469750404358	0.22894099354743958	0.8338599801063538	QTD000021
+165263959	chr18_80163448_CAG_C	ENSG00000101546	0.00013008899986743927	-0.6530699729919434	0.1610729992389679	0.951449990272522	QTD000021
+88269476	chr18_80131569_CT_C	ENSG00000101546	0.026396099478006363	0.6945620179176331	0.30610400438308716	0.9568700194358826	QTD000021
+165263470	chr18_80047699_GA_G	ENSG00000101546	0.0013542500091716647	0.7053020000457764	0.21116599440574646	0.9127600193023682	QTD000021
+165263152	chr18_79967147_CA_C	ENSG00000101546	0.004885829985141754	0.6611229777336121	0.22732800245285034	0.7614399790763855	QTD000021
+165264161	chr18_80239256_GA_G	ENSG00000101546	2.102699909301009e-06	1.3618099689483643	0.2629530131816864	0.4129500091075897	QTD000021
+88264170	chr18_79426301_GA_G	ENSG00000101546	0.04710569977760315	-0.4361859858036041	0.21577100455760956	0.8364800214767456	QTD000021
+165262769	chr18_79846478_CAT_C	ENSG00000101546	0.02139969915151596	0.3941349983215332	0.16739700734615326	0.9439200162887573	QTD000021
+88264241	chr18_79435355_T_TGTTG	ENSG00000101546	0.024304399266839027	-0.49570098519325256	0.21525000035762787	0.9309700131416321	QTD000021
+189975306	chr18_80041735_CT_C	ENSG00000101546	0.00028746199677698314	-0.600579023361206	0.15717299282550812	0.9647600054740906	QTD000021
+165263770	chr18_80119413_CA_C	ENSG00000101546	2.673410108400276e-06	0.7768129706382751	0.15182499587535858	0.9588199853897095	QTD000021
+189968571	chr18_79101946_AT_A	ENSG00000101546	0.027814200147986412	0.6184110045433044	0.27516600489616394	0.9826400279998779	QTD000021
+189970040	chr18_79335323_T_A	ENSG00000101546	0.024308599531650543	-0.9125999808311462	0.3962939977645874	0.8648800253868103	QTD000021
+189969886	chr18_79295598_T_C	ENSG00000101546	0.027284400537610054	-0.8622180223464966	0.38229501247406006	0.936680018901825	QTD000021
+189970276	chr18_79365978_G_A	ENSG00000101546	0.024874800816178322	-0.9352800250053406	0.4078100025653839	0.8464999794960022	QTD000021
+165261149	chr18_79421003_G_A	ENSG00000101546	0.018156299367547035	-0.8786090016365051	0.3630540072917938	0.6575899720191956	QTD000021
+165263194	chr18_79982214_AAGC_A	ENSG00000101546	0.001902349991723895	-0.7687190175056458	0.23805800080299377	0.9539700150489807	QTD000021
+165262983	chr18_79911740_G_A	ENSG00000101546	0.010322700254619122	-0.7123119831085205	0.27011099457740784	0.8618500232696533	QTD000021
+189976272	chr18_80153474_T_C	ENSG00000101546	0.008158969692885876	0.48144999146461487	0.17673000693321228	0.9126899838447571	QTD000021
+189974610	chr18_79953260_G_C	ENSG00000101546	0.02645450085401535	-0.6147410273551941	0.27103400230407715	0.8877500295639038	QTD000021
+165263238	chr18_79995819_A_C	ENSG00000101546	0.0031936101149767637	0.6837649941444397	0.22378499805927277	0.847599983215332	QTD000021
+165264164	chr18_80244172_G_A	ENSG00000101546	4.921540153191017e-07	1.3903599977493286	0.2504830062389374	0.42671000957489014	QTD000021
+189976560	chr18_80192660_T_C	ENSG00000101546	0.009941689670085907	0.492125004529953	0.18562699854373932	0.8522099852561951	QTD000021
+165263120	chr18_79960079_A_G	ENSG00000101546	0.009551970288157463	-0.4505850076675415	0.1690090000629425	0.9965800046920776	QTD000021
+165263129	chr18_79962378_G_A	ENSG00000101546	0.008336080238223076	-0.48478201031684875	0.1784690022468567	0.8995699882507324	QTD000021
+189969358	chr18_79191569_C_G	ENSG00000101546	0.02559800073504448	0.6338080167770386	0.27778199315071106	0.9552800059318542	QTD000021
+165263121	chr18_79960299_A_G	ENSG00000101546	0.009744100272655487	-0.4710739850997925	0.1771859973669052	0.9189599752426147	QTD000021
+189974612	chr18_79953289_A_G	ENSG00000101546	0.022304899990558624	-0.6391260027885437	0.273389995098114	0.8772600293159485	QTD000021
+88264493	chr18_79463654_T_G	ENSG00000101546	0.049512799829244614	-0.38020700216293335	0.19016799330711365	0.9182800054550171	QTD000021
+88264495	chr18_79463783_T_C	ENSG00000101546	0.049356698989868164	-0.380374014377594	0.1901170015335083	0.9187800288200378	QTD000021
+165263239	chr18_79996289_G_A	ENSG00000101546	0.006708129774779081	0.6383129954338074	0.22834600508213043	0.8453400135040283	QTD000021
+165263204	chr18_79986623_T_C	ENSG00000101546	0.00319199007935822	0.6836150288581848	0.22372299432754517	0.8479400277137756	QTD000021
+165263537	chr18_80061444_C_T	ENSG00000101546	0.0013590699527412653	0.6284019947052002	0.1882070004940033	0.9169399738311768	QTD000021
+189969678	chr18_79255717_G_A	ENSG00000101546	0.03957419842481613	0.47379499673843384	0.22583800554275513	0.9398599863052368	QTD000021
+165263538	chr18_80061737_A_G	ENSG00000101546	7.044500094366413e-09	0.9839209914207458	0.14911000430583954	0.9586499929428101	QTD000021
+189969680	chr18_79255814_G_A	ENSG00000101546	0.038816601037979126	0.4644469916820526	0.22050200402736664	0.9406999945640564	QTD000021
+165261369	chr18_79468659_C_T	ENSG00000101546	0.028084900230169296	-0.5873289704322815	0.2618040144443512	0.9168000221252441	QTD000021
+189974668	chr18_79960332_T_A	ENSG00000101546	0.0010418799938634038	-0.6201750040054321	0.18111799657344818	0.8810399770736694	QTD000021
+165263583	chr18_80073851_G_A	ENSG00000101546	0.00043113200808875263	-0.8576350212097168	0.23186999559402466	0.962689995765686	QTD000021
+165264168	chr18_80248871_A_G	ENSG00000101546	0.011193100363016129	-1.032979965209961	0.3962779939174652	0.40608999133110046	QTD000021
+88264497	chr18_79463827_T_A	ENSG00000101546	0.049908798187971115	-0.37958601117134094	0.1901959925889969	0.9175000190734863	QTD000021
+88269217	chr18_80099250_A_G	ENSG00000101546	0.010833200067281723	0.6991170048713684	0.2669390141963959	0.9892699718475342	QTD000021
+165263376	chr18_80031289_T_C	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231	QTD000021
+189975178	chr18_80031319_T_C	ENSG00000101546	0.0004358440055511892	-0.6040440201759338	0.16345499455928802	0.9303299784660339	QTD000021
+189968966	chr18_79152226_G_A	ENSG00000101546	0.03306629881262779	0.5587360262870789	0.25689899921417236	0.9847800135612488	QTD000021
+88264245	chr18_79435553_C_T	ENSG00000101546	0.02433530054986477	-0.4936879873275757	0.2144239991903305	0.9369300007820129	QTD000021
+165264062	chr18_80190452_T_C	ENSG00000101546	3.6959698945793207e-07	0.9414259791374207	0.16742299497127533	0.8532299995422363	QTD000021
+189974174	chr18_79872565_G_A	ENSG00000101546	0.016356199979782104	0.42819198966026306	0.17398400604724884	0.9500899910926819	QTD000021
+165261452	chr18_79490717_C_T	ENSG00000101546	0.001237459946423769	1.1226099729537964	0.33320799469947815	0.505299985408783	QTD000021
+165263278	chr18_80006438_G_A	ENSG00000101546	0.0031031400430947542	0.6861979961395264	0.22386400401592255	0.8466399908065796	QTD000021
+88269345	chr18_80119020_G_A	ENSG00000101546	0.024178799241781235	0.6992549896240234	0.30336201190948486	0.9884600043296814	QTD000021
+189975162	chr18_80029118_G_A	ENSG00000101546	0.00036453999928198755	-0.6130009889602661	0.1634799987077713	0.925320029258728	QTD000021
+165263989	chr18_80169725_T_C	ENSG00000101546	1.5484200048376806e-05	0.705053985118866	0.1516219973564148	0.953540027141571	QTD000021
+189976404	chr18_80169983_A_G	ENSG00000101546	0.04586619883775711	0.5302829742431641	0.2607940137386322	0.8389999866485596	QTD000021
+165263279	chr18_80006478_A_G	ENSG00000101546	0.0031472300179302692	0.6852880120277405	0.22391800582408905	0.8443700075149536	QTD000021
+88268951	chr18_80068600_G_A	ENSG00000101546	2.652140028658323e-05	0.6841779947280884	0.15193499624729156	0.9614800214767456	QTD000021
+189968554	chr18_79098693_C_G	ENSG00000101546	0.026747800409793854	0.6209210157394409	0.2743090093135834	0.9914000034332275	QTD000021
+165263999	chr18_80173368_T_C	ENSG00000101546	0.0062687997706234455	-0.655655026435852	0.23252399265766144	0.9851700067520142	QTD000021
+88268953	chr18_80068684_C_G	ENSG00000101546	0.009712659753859043	0.8444820046424866	0.3174940049648285	0.9571300148963928	QTD000021
+165263214	chr18_79989211_G_T	ENSG00000101546	0.003197189886122942	0.6834139823913574	0.22369800508022308	0.8481000065803528	QTD000021
+189974214	chr18_79876519_A_G	ENSG00000101546	0.031777698546648026	-0.5941569805145264	0.2710919976234436	0.9615300297737122	QTD000021
+88264345	chr18_79445536_G_C	ENSG00000101546	0.021521400660276413	-0.4996800124645233	0.21243000030517578	0.8766700029373169	QTD000021
+165264064	chr18_80191205_T_C	ENSG00000101546	0.009882640093564987	-0.6603999733924866	0.2488899976015091	0.8497800230979919	QTD000021
+88264203	chr18_79430142_T_C	ENSG00000101546	0.02072330005466938	-0.5077760219573975	0.2144870012998581	0.9177600145339966	QTD000021
+165264145	chr18_80220228_G_C	ENSG00000101546	0.012287000194191933	-0.6442480087280273	0.2505429983139038	0.8767099976539612	QTD000021
+165263141	chr18_79964726_A_C	ENSG00000101546	0.0033067800104618073	-0.6612259745597839	0.21725399792194366	0.9032700061798096	QTD000021
+88269643	chr18_80153265_A_G	ENSG00000101546	0.0003054149856325239	-0.6451789736747742	0.16965100169181824	0.9172800183296204	QTD000021
+165263920	chr18_80153331_A_G	ENSG00000101546	0.0016397900180891156	-0.755744993686676	0.23055900633335114	0.9422399997711182	QTD000021
+165263922	chr18_80153341_A_G	ENSG00000101546	0.0016073000151664019	-0.7542809844017029	0.22965499758720398	0.953499972820282	QTD000021
+165263553	chr18_80065055_C_T	ENSG00000101546	4.11217006330844e-05	0.6887189745903015	0.1571819931268692	0.9298400282859802	QTD000021
+88264335	chr18_79445408_A_G	ENSG00000101546	0.037631601095199585	-0.41114500164985657	0.19396500289440155	0.7963399887084961	QTD000021
+88264229	chr18_79432983_C_A	ENSG00000101546	0.04125019907951355	-0.3656949996948242	0.17582200467586517	0.9875800013542175	QTD000021
+88264233	chr18_79433246_C_T	ENSG00000101546	0.0415676012635231	-0.38412100076675415	0.18497799336910248	0.8949699997901917	QTD000021
+165263372	chr18_80029522_T_C	ENSG00000101546	0.002449670108035207	0.6802759766578674	0.21629799902439117	0.886139988899231	QTD000021
+165263569	chr18_80068160_T_C	ENSG00000101546	0.00041363100172020495	0.7137899994850159	0.19232399761676788	0.9294599890708923	QTD000021
+189974564	chr18_79947690_C_G	ENSG00000101546	0.023983800783753395	-0.647346019744873	0.28044000267982483	0.8314599990844727	QTD000021
+165263949	chr18_80159179_A_G	ENSG00000101546	0.00016111700097098947	-0.6376240253448486	0.15971499681472778	0.981410026550293	QTD000021
+165263468	chr18_80047610_T_C	ENSG00000101546	0.001360769965685904	0.7057350277900696	0.21139399707317352	0.9108700156211853	QTD000021
+165263921	chr18_80153334_T_A	ENSG00000101546	0.0016001700423657894	-0.756335973739624	0.23017899692058563	0.9468799829483032	QTD000021
+165264079	chr18_80196890_TAA_T	ENSG00000101546	0.03214230015873909	-0.4360960125923157	0.199412003159523	0.7321599721908569	QTD000021
+165262319	chr18_79701529_TTAAA_T	ENSG00000101546	0.04060700163245201	0.4292060136795044	0.2056809961795807	0.647849977016449	QTD000021
+189975418	chr18_80054690_CTATATTAAAA_C	ENSG00000101546	0.012759200297296047	-0.5740739703178406	0.22450700402259827	0.9652900099754333	QTD000021
+165264042	chr18_80181018_G_A	ENSG00000101546	0.012398400343954563	-0.5916939973831177	0.23041200637817383	0.9978600144386292	QTD000021
+189968900	chr18_79145048_C_G	ENSG00000101546	0.019496500492095947	0.8502600193023682	0.3554919958114624	0.8464099764823914	QTD000021
+189974460	chr18_79926407_T_C	ENSG00000101546	0.026291299611330032	0.6431620121002197	0.2832460105419159	0.6420300006866455	QTD000021
+165263361	chr18_80027419_A_C	ENSG00000101546	0.002106579951941967	0.6693220138549805	0.20946399867534637	0.9998300075531006	QTD000021
+165261395	chr18_79476511_G_A	ENSG00000101546	0.02611990086734295	-0.502918004989624	0.22122099995613098	0.6410899758338928	QTD000021
+165261396	chr18_79476571_A_G	ENSG00000101546	0.026773499324917793	-0.4989500045776367	0.22046299278736115	0.6403499841690063	QTD000021
+165263256	chr18_80002824_C_T	ENSG00000101546	0.00312149990350008	0.6855869889259338	0.22381100058555603	0.8476799726486206	QTD000021
+165263563	chr18_80067314_T_C	ENSG00000101546	0.0007583670085296035	0.6864370107650757	0.19476599991321564	0.9122999906539917	QTD000021
+88269233	chr18_80103778_A_G	ENSG00000101546	0.01050500012934208	0.6951419711112976	0.26425701379776	0.9999499917030334	QTD000021
+165263603	chr18_80079841_G_A	ENSG00000101546	8.284870034458436e-08	0.9240869879722595	0.15411199629306793	0.9350699782371521	QTD000021
+88269701	chr18_80158602_T_C	ENSG00000101546	0.03843799978494644	0.8538249731063843	0.4045509994029999	0.7732599973678589	QTD000021
+165263330	chr18_80017499_T_G	ENSG00000101546	4.44870007498821e-09	1.0125999450683594	0.1509149968624115	0.9108099937438965	QTD000021
+88268959	chr18_80069398_A_G	ENSG00000101546	0.010636200197041035	0.8416950106620789	0.32053500413894653	0.9647300243377686	QTD000021
+189970550	chr18_79387640_G_A	ENSG00000101546	0.020820200443267822	0.5047739744186401	0.21338799595832825	0.8117700219154358	QTD000021
+189975544	chr18_80067196_G_A	ENSG00000101546	0.01796709932386875	-0.5397830009460449	0.2226649969816208	0.9735100269317627	QTD000021
+165263288	chr18_80008880_C_T	ENSG00000101546	0.013017799705266953	0.5714100003242493	0.22413699328899384	0.8380799889564514	QTD000021
+189975118	chr18_80022684_A_G	ENSG00000101546	0.016550099477171898	-0.5827370285987854	0.23722299933433533	0.9039400219917297	QTD000021
+88269253	chr18_80106922_C_G	ENSG00000101546	0.007234159857034683	0.4775159955024719	0.17250800132751465	0.9840400218963623	QTD000021
+165263648	chr18_80089167_C_G	ENSG00000101546	0.0008080929983407259	-0.7047550082206726	0.20110000669956207	0.9645699858665466	QTD000021
+165263649	chr18_80089292_T_G	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+189976590	chr18_80198172_A_C	ENSG00000101546	0.009564920328557491	0.49497199058532715	0.18569299578666687	0.8510500192642212	QTD000021
+88264337	chr18_79445416_T_C	ENSG00000101546	0.021770600229501724	-0.4989970028400421	0.21255899965763092	0.8761000037193298	QTD000021
+165263650	chr18_80089293_T_C	ENSG00000101546	0.0007971100276336074	-0.7047070264816284	0.20083999633789062	0.9688699841499329	QTD000021
+165263130	chr18_79962401_G_A	ENSG00000101546	0.00885738991200924	-0.48104798793792725	0.17856299877166748	0.8973299860954285	QTD000021
+165263226	chr18_79992801_C_T	ENSG00000101546	0.006698139943182468	0.6384109854698181	0.22833700478076935	0.8453800082206726	QTD000021
+165263375	chr18_80030723_T_C	ENSG00000101546	2.851660019231872e-10	1.0856800079345703	0.1473499983549118	0.9138000011444092	QTD000021
+189969544	chr18_79225255_C_T	ENSG00000101546	0.040497101843357086	0.4814000129699707	0.2305620014667511	0.9017400145530701	QTD000021
+165263231	chr18_79993037_G_A	ENSG00000101546	0.006709849927574396	0.6383140087127686	0.22835400700569153	0.8453400135040283	QTD000021
+165263049	chr18_79940038_C_T	ENSG00000101546	0.0033925101161003113	0.8075529932975769	0.2660970091819763	0.7323099970817566	QTD000021
+165263232	chr18_79993043_C_T	ENSG00000101546	0.006709849927574396	0.6383140087127686	0.22835400700569153	0.8453400135040283	QTD000021
+165263565	chr18_80067475_A_G	ENSG00000101546	2.112299989676103e-05	0.7578619718551636	0.1659960001707077	0.9542499780654907	QTD000021
+165263496	chr18_80054332_T_A	ENSG00000101546	0.0016576099442318082	0.6154590249061584	0.18796400725841522	0.9383599758148193	QTD000021
+165263398	chr18_80034297_C_T	ENSG00000101546	2.1434200248027224e-10	1.0816199779510498	0.145456001162529	0.9542099833488464	QTD000021
+165263401	chr18_80034410_C_T	ENSG00000101546	2.1306000019816196e-10	1.0814900398254395	0.14541099965572357	0.9556499719619751	QTD000021
+165263561	chr18_80067216_T_C	ENSG00000101546	2.1410800400190055e-05	0.7573570013046265	0.16602100431919098	0.9542999863624573	QTD000021
+165263370	chr18_80029323_C_T	ENSG00000101546	2.851660019231872e-10	1.0856800079345703	0.1473499983549118	0.9138000011444092	QTD000021
+189970236	chr18_79362597_C_G	ENSG00000101546	0.03911609947681427	0.4700779914855957	0.22352799773216248	0.9036800265312195	QTD000021
+189974662	chr18_79959208_C_T	ENSG00000101546	0.02777549996972084	-0.6085529923439026	0.2707110047340393	0.888729989528656	QTD000021
+189974580	chr18_79950501_A_T	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203	QTD000021
+165263923	chr18_80153446_A_G	ENSG00000101546	0.04956590011715889	-0.3937479853630066	0.19698800146579742	0.9437599778175354	QTD000021
+189974514	chr18_79938568_A_G	ENSG00000101546	0.019015999510884285	-0.7022410035133362	0.29239198565483093	0.8251000046730042	QTD000021
+165264110	chr18_80210509_C_T	ENSG00000101546	0.0045760199427604675	-0.7339209914207458	0.2503809928894043	0.8940100073814392	QTD000021
+165264070	chr18_80194756_A_C	ENSG00000101546	0.009459789842367172	-0.6460620164871216	0.24200299382209778	0.931190013885498	QTD000021
+165263379	chr18_80032097_A_G	ENSG00000101546	2.4389498753940586e-10	1.0866700410842896	0.14674200117588043	0.9175199866294861	QTD000021
+165263189	chr18_79980544_T_C	ENSG00000101546	0.00319429999217391	0.6854429841041565	0.22434000670909882	0.8422799706459045	QTD000021
+165263237	chr18_79995660_C_T	ENSG00000101546	0.006708129774779081	0.6383129954338074	0.22834600508213043	0.8453400135040283	QTD000021
+165263516	chr18_80057744_A_G	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853	QTD000021
+88264499	chr18_79464192_C_T	ENSG00000101546	0.04975920170545578	-0.3794960081577301	0.1900230050086975	0.9188899993896484	QTD000021
+189969794	chr18_79276035_G_A	ENSG00000101546	0.040891699492931366	0.46993300318717957	0.22552600502967834	0.9511899948120117	QTD000021
+165263353	chr18_80024607_G_A	ENSG00000101546	2.8381999528370727e-10	1.086359977722168	0.1474200040102005	0.9133099913597107	QTD000021
+165263319	chr18_80015414_A_G	ENSG00000101546	0.0024664499796926975	0.6797459721565247	0.21628700196743011	0.8863599896430969	QTD000021
+189975548	chr18_80067299_G_T	ENSG00000101546	0.04763510078191757	-0.4191969931125641	0.2078769952058792	0.9619200229644775	QTD000021
+165263585	chr18_80074355_T_C	ENSG00000101546	0.00042486301390454173	-0.8566830158233643	0.23133300244808197	0.9675800204277039	QTD000021
+165263566	chr18_80067563_G_A	ENSG00000101546	1.5357799476589662e-09	1.0456600189208984	0.15011900663375854	0.939300000667572	QTD000021
+165263148	chr18_79966944_G_C	ENSG00000101546	0.003407210111618042	0.6812019944190979	0.22457300126552582	0.8618299961090088	QTD000021
+165263500	chr18_80054939_C_T	ENSG00000101546	0.0016599999507889152	0.6154130101203918	0.18797700107097626	0.9383599758148193	QTD000021
+189969622	chr18_79244104_A_G	ENSG00000101546	0.003821440041065216	0.5378050208091736	0.17963600158691406	0.9557499885559082	QTD000021
+88269637	chr18_80153242_G_A	ENSG00000101546	0.04311149939894676	0.4946820139884949	0.24006499350070953	0.8200200200080872	QTD000021
+165263489	chr18_80052603_A_G	ENSG00000101546	0.0016483699437230825	0.615805983543396	0.1879650056362152	0.9378799796104431	QTD000021
+189974578	chr18_79949831_C_T	ENSG00000101546	0.025274500250816345	-0.626459002494812	0.273934006690979	0.8651599884033203	QTD000021
+189974582	chr18_79950516_C_T	ENSG00000101546	0.02531309984624386	-0.626285970211029	0.273934006690979	0.8651599884033203	QTD000021
+165263613	chr18_80083000_T_C	ENSG00000101546	0.0007988249999471009	-0.7053970098495483	0.2010750025510788	0.9670500159263611	QTD000021
+165263521	chr18_80058865_T_C	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853	QTD000021
+165263523	chr18_80058987_T_G	ENSG00000101546	0.0016572499880567193	0.6155040264129639	0.1879740059375763	0.938289999961853	QTD000021
+165263620	chr18_80083688_T_C	ENSG00000101546	0.0004472960135899484	-0.8209519982337952	0.22262699902057648	0.9754400253295898	QTD000021
+165263371	chr18_80029356_T_C	ENSG00000101546	2.851660019231872e-10	1.0856800079345703	0.1473499983549118	0.9138000011444092	QTD000021
+189968288	chr18_79068771_G_A	ENSG00000101546	0.026196099817752838	0.6231859922409058	0.2742680013179779	0.991349995136261	QTD000021
+189968296	chr18_79069075_G_T	ENSG00000101546	0.03258020058274269	0.5606759786605835	0.2570509910583496	0.9886400103569031	QTD000021
+165261376	chr18_79470409_T_C	ENSG00000101546	0.041590798646211624	-0.5826259851455688	0.2806040048599243	0.7188900113105774	QTD000021
+88264561	chr18_79470355_G_C	ENSG00000101546	0.0443493016064167	-0.407245010137558	0.19883200526237488	0.8575999736785889	QTD000021
+189970523	chr18_79385438_G_GGGC	ENSG00000101546	0.026308899745345116	-1.0514899492263794	0.463128000497818	0.7798100113868713	QTD000021
@@ -33,7 +33,8 @@ CREATE TABLE public.association (
     pvalue double precision,
     beta double precision,
     se double precision,
-    r2 double precision
+    r2 double precision,
+    study_id character varying(30)
 );
 
 
@@ -73,6 +74,34 @@ CREATE TABLE public.variant (
 
 ALTER TABLE public.variant OWNER TO eqtl_user;
 
+--
+-- Name: data_version; Type: TABLE; Schema: public; Owner: eqtl_user
+--
+
+CREATE TABLE public.data_version (
+    id integer NOT NULL,
+    version bigint NOT NULL,
+    updated_at timestamp without time zone DEFAULT now()
+);
+
+
+ALTER TABLE public.data_version OWNER TO eqtl_user;
+
+--
+-- Data for Name: data_version; Type: TABLE DATA; Schema: public; Owner: eqtl_user
+--
+
+INSERT INTO public.data_version (id, version) VALUES (1, 1);
+
+
+--
+-- Name: data_version data_version_pkey; Type: CONSTRAINT; Schema: public; Owner: eqtl_user
+--
+
+ALTER TABLE ONLY public.data_version
+    ADD CONSTRAINT data_version_pkey PRIMARY KEY (id);
+
+
 --
 -- Name: association association_pkey; Type: CONSTRAINT; Schema: public; Owner: eqtl_user
 --
@@ -104,6 +133,13 @@ ALTER TABLE ONLY public.variant
 CREATE INDEX idx_association_gene ON public.association USING btree (gene_id);
 
 
+--
+-- Name: idx_association_gene_pvalue_id; Type: INDEX; Schema: public; Owner: eqtl_user
+--
+
+CREATE INDEX idx_association_gene_pvalue_id ON public.association USING btree (gene_id, pvalue, id);
+
+
 --
 -- Name: idx_association_pvalue; Type: INDEX; Schema: public; Owner: eqtl_user
 --
@@ -118,6 +154,20 @@ CREATE INDEX idx_association_pvalue ON public.association USING btree (pvalue);
 CREATE INDEX idx_association_variant ON public.association USING btree (variant_id);
 
 
+--
+-- Name: idx_association_study; Type: INDEX; Schema: public; Owner: eqtl_user
+--
+
+CREATE INDEX idx_association_study ON public.association USING btree (study_id);
+
+
+--
+-- Name: idx_variant_chromosome_position; Type: INDEX; Schema: public; Owner: eqtl_user
+--
+
+CREATE INDEX idx_variant_chromosome_position ON public.variant USING btree (chromosome, "position");
+
+
 --
 -- Name: idx_variant_rsid; Type: INDEX; Schema: public; Owner: eqtl_user
 --
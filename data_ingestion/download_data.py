@@ -1,112 +1,267 @@
 import ftplib
 import os
 import io
+import sys
 import csv
+import gzip
+import zlib
+import time
+import calendar
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ftplib import FTP
 from urllib.request import urlopen
 
+METADATA_URL = "https://raw.githubusercontent.com/eQTL-Catalogue/eQTL-Catalogue-resources/master/data_tables/dataset_metadata.tsv"
 
-def download_file(ftp_session, remote_path, local_path):
+
+class DownloadError(Exception):
+    """Raised when a file could not be downloaded intact after all retries."""
+
+
+class FTPConnectionPool:
+    """
+    Hands out one logged-in FTP connection per worker thread, so the number of
+    open connections is bounded by the size of the thread pool using it.
     """
-    Downloads a single file from the FTP server.
 
-    Args:
-        ftp_session (ftplib.FTP): The active FTP session.
-        remote_path (str): The path to the file on the remote server.
-        local_path (str): The local path to save the file.
+    def __init__(self, host, port=21, timeout=60):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        ftp = getattr(self._local, "ftp", None)
+        if ftp is None:
+            ftp = FTP()
+            ftp.connect(self.host, self.port, timeout=self.timeout)
+            ftp.login()
+            ftp.voidcmd("TYPE I")
+            self._local.ftp = ftp
+            with self._lock:
+                self._connections.append(ftp)
+        return ftp
+
+    def discard(self):
+        """Drops the current thread's connection, e.g. after it broke mid-transfer."""
+        ftp = getattr(self._local, "ftp", None)
+        self._local.ftp = None
+        if ftp is not None:
+            with self._lock:
+                self._connections.remove(ftp)
+            ftp.close()
+
+    def close(self):
+        with self._lock:
+            for ftp in self._connections:
+                try:
+                    ftp.quit()
+                except ftplib.all_errors:
+                    ftp.close()
+            self._connections.clear()
+
+
+def remote_stat(ftp_session, remote_path):
     """
+    Returns (size in bytes, modification time as a UNIX timestamp) of a remote file.
+    The mtime is None if the server does not support MDTM.
+    """
+    size = ftp_session.size(remote_path)
     try:
-        print(f"Downloading {remote_path} to {local_path}...")
-        with open(local_path, "wb") as local_file:
-            ftp_session.retrbinary("RETR " + remote_path, local_file.write)
-        print("Download successful.")
-    except ftplib.all_errors as e:
-        print(f"Error downloading file: {e}")
+        response = ftp_session.voidcmd("MDTM " + remote_path)
+        mtime = calendar.timegm(time.strptime(response.split()[-1][:14], "%Y%m%d%H%M%S"))
+    except ftplib.error_perm:
+        mtime = None
+    return size, mtime
+
 
+def is_up_to_date(local_path, size, mtime):
+    """Returns True if the local file has the remote file's size and mtime."""
+    if not os.path.exists(local_path):
+        return False
+    stat = os.stat(local_path)
+    return stat.st_size == size and (mtime is None or int(stat.st_mtime) == mtime)
 
-def main():
+
+def verify_gzip(path, block_size=1 << 20):
     """
-    Connects to the EBI FTP server and downloads all macrophage datasets.
+    Decompresses a gzip file end to end, which checks every member's CRC and
+    length trailer. Returns True if the stream is intact.
     """
-    # EBI FTP server details
-    host = "ftp.ebi.ac.uk"
+    try:
+        with gzip.open(path, "rb") as fh:
+            while fh.read(block_size):
+                pass
+    except (OSError, EOFError, zlib.error):
+        return False
+    return True
 
-    # Paths to the data directories
-    sumstats_dir = "/pub/databases/spot/eQTL/sumstats/"
 
-    # Local directory to save the files
-    local_dir = "data"
-    if not os.path.exists(local_dir):
-        os.makedirs(local_dir)
-        print(f"Created local directory: {local_dir}")
+def download_file(pool, remote_path, local_path, max_retries=5):
+    """
+    Downloads a single file from the FTP server, resuming where a previous
+    attempt stopped.
 
-    # Choose between downloading full summary statistics (.all.tsv.gz)
-    # or the filtered credible set files (.cc.tsv.gz).
-    # The .cc files are significantly smaller and recommended for local laptops.
-    file_suffix = ".cc.tsv.gz"
-    # To download all files, change the line above to:
-    # file_suffix = '.all.tsv.gz'
+    Data is written to local_path + ".part" and only renamed to local_path once
+    the gzip stream has been verified. Dropped connections are retried with a
+    REST offset so the bytes already on disk are not fetched again.
 
-    try:
-        print(f"Connecting to FTP server at {host}...")
-        with FTP(host) as ftp:
-            ftp.login()
-            print("Login successful.")
+    Args:
+        pool (FTPConnectionPool): Source of the calling thread's FTP connection.
+        remote_path (str): The path to the file on the remote server.
+        local_path (str): The local path to save the file.
+        max_retries (int): Number of attempts before giving up.
+
+    Returns:
+        str: "skipped" if the local copy was already up to date, else "downloaded".
+
+    Raises:
+        DownloadError: If the file could not be downloaded intact.
+    """
+    part_path = local_path + ".part"
+    for attempt in range(max_retries):
+        try:
+            ftp = pool.get()
+            size, mtime = remote_stat(ftp, remote_path)
+            if is_up_to_date(local_path, size, mtime):
+                return "skipped"
+
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            if offset > size:
+                offset = 0
+            if offset < size:
+                print(f"Downloading {remote_path} to {local_path}"
+                      + (f" (resuming at byte {offset})..." if offset else "..."))
+                with open(part_path, "ab" if offset else "wb") as local_file:
+                    ftp.retrbinary("RETR " + remote_path, local_file.write, rest=offset or None)
+
+            if os.path.getsize(part_path) != size or not verify_gzip(part_path):
+                os.remove(part_path)
+                raise DownloadError(f"{remote_path} failed the integrity check")
 
-            # Step 1: Download and parse the metadata file to find Macrophage datasets
-            metadata_url = "https://raw.githubusercontent.com/eQTL-Catalogue/eQTL-Catalogue-resources/master/data_tables/dataset_metadata.tsv"
-            print(f"Downloading metadata from {metadata_url}...")
+            os.replace(part_path, local_path)
+            if mtime is not None:
+                os.utime(local_path, (mtime, mtime))
+            print(f"Downloaded {remote_path}.")
+            return "downloaded"
+        except (DownloadError, *ftplib.all_errors) as e:
+            pool.discard()
+            if attempt == max_retries - 1:
+                raise DownloadError(f"Giving up on {remote_path} after {max_retries} attempts: {e}") from e
+            wait_time = 2**attempt
+            print(f"Error downloading {remote_path}: {e}. Retrying in {wait_time}s...", file=sys.stderr)
+            time.sleep(wait_time)
 
-            macrophage_datasets = []
-            with urlopen(metadata_url) as response:
-                # Decode the response and read it as a CSV
-                decoded_content = response.read().decode("utf-8")
-                reader = csv.reader(io.StringIO(decoded_content), delimiter='\t')
 
-                header = next(reader)  # Read header row
-                # Find the index of 'qtl_group', 'study_id', and 'dataset_id' columns
+def download_files(host, files, workers=4, port=21, max_retries=5):
+    """
+    Downloads (remote_path, local_path) pairs over at most `workers` parallel
+    FTP connections.
+
+    Returns:
+        dict: Counts of "downloaded", "skipped" and "failed" files.
+    """
+    counts = {"downloaded": 0, "skipped": 0, "failed": 0}
+    pool = FTPConnectionPool(host, port)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(download_file, pool, remote_path, local_path, max_retries): remote_path
+                for remote_path, local_path in files
+            }
+            for future in as_completed(futures):
                 try:
-                    qtl_group_idx = header.index("sample_group")
-                    study_id_idx = header.index("study_id")
-                    dataset_id_idx = header.index("dataset_id")
-                except ValueError as e:
-                    print(f"Error: Missing expected column in metadata file: {e}")
-                    return
+                    counts[future.result()] += 1
+                except DownloadError as e:
+                    print(e, file=sys.stderr)
+                    counts["failed"] += 1
+    finally:
+        pool.close()
+    return counts
 
-                for row in reader:
-                    if "macrophage" in row[qtl_group_idx].lower():
-                        macrophage_datasets.append({
-                            "study_id": row[study_id_idx],
-                            "dataset_id": row[dataset_id_idx]
-                        })
 
-            print("Metadata downloaded and parsed successfully.")
+def fetch_macrophage_datasets(metadata_url=METADATA_URL):
+    """
+    Downloads the eQTL Catalogue dataset metadata and returns the study_id and
+    dataset_id of every macrophage dataset.
+    """
+    print(f"Downloading metadata from {metadata_url}...")
+    macrophage_datasets = []
+    with urlopen(metadata_url) as response:
+        # Decode the response and read it as a CSV
+        decoded_content = response.read().decode("utf-8")
+        reader = csv.reader(io.StringIO(decoded_content), delimiter='\t')
 
-            if not macrophage_datasets:
-                print("No macrophage datasets found in the metadata.")
-                return
+        header = next(reader)  # Read header row
+        # Find the index of 'qtl_group', 'study_id', and 'dataset_id' columns
+        qtl_group_idx = header.index("sample_group")
+        study_id_idx = header.index("study_id")
+        dataset_id_idx = header.index("dataset_id")
 
-            print(f"Found {len(macrophage_datasets)} macrophage datasets.")
+        for row in reader:
+            if "macrophage" in row[qtl_group_idx].lower():
+                macrophage_datasets.append({
+                    "study_id": row[study_id_idx],
+                    "dataset_id": row[dataset_id_idx]
+                })
+    print("Metadata downloaded and parsed successfully.")
+    return macrophage_datasets
 
-            # Step 3: Download the corresponding summary statistics files
-            ftp.cwd(sumstats_dir)
-            print(f"Changed to directory: {sumstats_dir}")
 
-            for row in macrophage_datasets:
-                study_id = row["study_id"]
-                dataset_id = row["dataset_id"]
+def main(host="ftp.ebi.ac.uk", local_dir="data", file_suffix=".cc.tsv.gz", workers=4):
+    """
+    Connects to the EBI FTP server and downloads all macrophage datasets.
 
-                # The file structure is sumstats/<study_id>/<dataset_id>/<dataset_id>.<suffix>
-                remote_file_path = f"{study_id}/{dataset_id}/{dataset_id}{file_suffix}"
-                local_file_path = os.path.join(local_dir, f"{dataset_id}{file_suffix}")
+    The .cc files are significantly smaller and recommended for local laptops;
+    pass file_suffix=".all.tsv.gz" to download the full summary statistics.
 
-                download_file(ftp, remote_file_path, local_file_path)
+    Returns:
+        int: 0 if every file is present and intact, 1 otherwise.
+    """
+    # Paths to the data directories
+    sumstats_dir = "/pub/databases/spot/eQTL/sumstats/"
 
-    except ftplib.all_errors as e:
-        print(f"FTP error: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+    if not os.path.exists(local_dir):
+        os.makedirs(local_dir)
+        print(f"Created local directory: {local_dir}")
+
+    try:
+        macrophage_datasets = fetch_macrophage_datasets()
+    except ValueError as e:
+        print(f"Error: Missing expected column in metadata file: {e}", file=sys.stderr)
+        return 1
+
+    if not macrophage_datasets:
+        print("No macrophage datasets found in the metadata.")
+        return 0
+
+    print(f"Found {len(macrophage_datasets)} macrophage datasets.")
+
+    # The file structure is sumstats/<study_id>/<dataset_id>/<dataset_id>.<suffix>
+    files = [
+        (f"{sumstats_dir}{row['study_id']}/{row['dataset_id']}/{row['dataset_id']}{file_suffix}",
+         os.path.join(local_dir, f"{row['dataset_id']}{file_suffix}"))
+        for row in macrophage_datasets
+    ]
+    counts = download_files(host, files, workers=workers)
+    print(f"{counts['downloaded']} downloaded, {counts['skipped']} already up to date, {counts['failed']} failed.")
+    return 1 if counts["failed"] else 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Download macrophage datasets from the eQTL Catalogue FTP server.")
+    parser.add_argument("--host", default="ftp.ebi.ac.uk", help="FTP server to download from.")
+    parser.add_argument("--local-dir", default="data", help="Directory to save the files in.")
+    parser.add_argument(
+        "--suffix",
+        default=".cc.tsv.gz",
+        help="File suffix to download: '.cc.tsv.gz' (credible sets) or '.all.tsv.gz' (full sumstats).",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Number of parallel FTP connections.")
+    args = parser.parse_args()
+
+    sys.exit(main(args.host, args.local_dir, args.suffix, args.workers))
@@ -0,0 +1,99 @@
+import os
+import glob
+import shutil
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Columnar copy of the association table, denormalized with the variant
+# coordinates so that scans never need a join. The dataset is laid out as
+# <root>/study_id=<study>/chromosome=<chrom>/part-<chunk>.parquet.
+# Chromosomes are named as the backend's /scan/ filter names them ("1", "X",
+# "MT", without a "chr" prefix); rows without one go to the partition pyarrow
+# reads back as null.
+PARQUET_SCHEMA = pa.schema([
+    ("variant_id", pa.string()),
+    ("rsid", pa.string()),
+    ("position", pa.int64()),
+    ("ref", pa.string()),
+    ("alt", pa.string()),
+    ("maf", pa.float64()),
+    ("gene_id", pa.string()),
+    ("pvalue", pa.float64()),
+    ("beta", pa.float64()),
+    ("se", pa.float64()),
+    ("r2", pa.float64()),
+])
+PARTITION_SCHEMA = pa.schema([("study_id", pa.string()), ("chromosome", pa.string())])
+ROW_GROUP_SIZE = 16384  # rows per row group; smaller groups make the pvalue/position statistics more selective
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def study_dir(root, study_id):
+    return os.path.join(root, f"study_id={study_id}")
+
+
+def staging_dir(root, study_id, file_name):
+    """
+    Directory a file's chunks are written to while it is loaded, until
+    publish_study() moves it into place. Its dot-name keeps it out of dataset
+    discovery, so readers never see a partly written study.
+    """
+    return os.path.join(root, f".study_id={study_id}.{file_name}.load")
+
+
+def clear_study(root, study_id):
+    """Removes every Parquet file previously written for a study, published or not."""
+    shutil.rmtree(study_dir(root, study_id), ignore_errors=True)
+    for path in glob.glob(os.path.join(glob.escape(root), f".study_id={glob.escape(study_id)}.*")):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def publish_study(root, study_id, directory):
+    """
+    Replaces the study's published files with the staging directory. Two
+    renames, so readers see the old or the new files (or, in between, none).
+    """
+    target = study_dir(root, study_id)
+    old = os.path.join(root, f".study_id={study_id}.old")
+    shutil.rmtree(old, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    if os.path.exists(target):
+        os.rename(target, old)
+    os.rename(directory, target)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def write_chunk(directory, chunk_index, chunk_df):
+    """
+    Writes one sumstats chunk into a study's partitions, one file per chromosome.
+
+    Rows are sorted by position so each row group covers a narrow position range
+    and readers can skip groups by their min/max statistics. File names are
+    derived from the chunk index, so rewriting a chunk after an interrupted load
+    replaces the earlier file instead of duplicating its rows.
+
+    Args:
+        directory (str): Directory of the study, such as its study_dir() or
+            staging_dir().
+        chunk_index (int): Position of the chunk within its source file.
+        chunk_df (pd.DataFrame): Sumstats chunk as read from the source file.
+
+    Returns:
+        int: Number of rows written.
+    """
+    chunk_df = chunk_df.rename(columns={"variant": "variant_id"})
+    chromosomes = (chunk_df["chromosome"].astype("string").str.removeprefix("chr").str.upper()
+                   .replace({"M": "MT"}).fillna(NULL_PARTITION))
+    for chromosome, rows in chunk_df.groupby(chromosomes, sort=False):
+        table = pa.Table.from_pandas(
+            rows.sort_values("position").reindex(columns=PARQUET_SCHEMA.names),
+            schema=PARQUET_SCHEMA, preserve_index=False,
+        )
+        partition = os.path.join(directory, f"chromosome={chromosome}")
+        os.makedirs(partition, exist_ok=True)
+        file_name = f"part-{chunk_index:05d}.parquet"
+        # Write under a dot-name first (ignored by dataset discovery) so readers never see a half-written file
+        tmp_path = os.path.join(partition, "." + file_name)
+        pq.write_table(table, tmp_path, row_group_size=ROW_GROUP_SIZE, compression="zstd", write_statistics=True)
+        os.replace(tmp_path, os.path.join(partition, file_name))
+    return len(chunk_df)
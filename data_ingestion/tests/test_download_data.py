@@ -0,0 +1,99 @@
+import gzip
+import os
+import threading
+
+import pytest
+from pyftpdlib.authorizers import DummyAuthorizer
+from pyftpdlib.handlers import FTPHandler
+from pyftpdlib.servers import FTPServer
+
+from download_data import download_files, verify_gzip
+
+PAYLOAD = b"".join(f"gene_{i}\tchr1_{i}_A_G\t0.05\n".encode() for i in range(20000))
+
+
+@pytest.fixture(scope="module")
+def ftp_server(tmp_path_factory):
+    """
+    Serves a directory over anonymous FTP on a free local port, standing in for
+    the EBI FTP server.
+    """
+    root = tmp_path_factory.mktemp("ftp_root")
+    authorizer = DummyAuthorizer()
+    authorizer.add_anonymous(str(root))
+    handler = type("Handler", (FTPHandler,), {"authorizer": authorizer})
+    server = FTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"timeout": 0.1}, daemon=True)
+    thread.start()
+    yield root, server.address[1]
+    server.close_all()
+
+
+def write_remote(root, name, payload=PAYLOAD):
+    path = root / name
+    with gzip.open(path, "wb") as fh:
+        fh.write(payload)
+    return path
+
+
+def test_downloads_in_parallel(ftp_server, tmp_path):
+    """
+    Test that several files are downloaded intact over parallel connections.
+    """
+    root, port = ftp_server
+    names = [f"QTD00000{i}.cc.tsv.gz" for i in range(4)]
+    for name in names:
+        write_remote(root, name)
+
+    files = [(f"/{name}", str(tmp_path / name)) for name in names]
+    counts = download_files("127.0.0.1", files, workers=3, port=port)
+
+    assert counts == {"downloaded": 4, "skipped": 0, "failed": 0}
+    for name in names:
+        assert (tmp_path / name).read_bytes() == (root / name).read_bytes()
+        assert not os.path.exists(tmp_path / (name + ".part"))
+
+
+def test_skips_up_to_date_files(ftp_server, tmp_path):
+    """
+    Test that a file whose size and mtime match the server is not fetched again.
+    """
+    root, port = ftp_server
+    write_remote(root, "QTD000010.cc.tsv.gz")
+    files = [("/QTD000010.cc.tsv.gz", str(tmp_path / "QTD000010.cc.tsv.gz"))]
+
+    assert download_files("127.0.0.1", files, port=port)["downloaded"] == 1
+    assert download_files("127.0.0.1", files, port=port) == {"downloaded": 0, "skipped": 1, "failed": 0}
+
+
+def test_resumes_partial_download(ftp_server, tmp_path):
+    """
+    Test that an interrupted download continues from the bytes already on disk.
+    """
+    root, port = ftp_server
+    remote = write_remote(root, "QTD000020.cc.tsv.gz")
+    content = remote.read_bytes()
+    local = tmp_path / "QTD000020.cc.tsv.gz"
+    (tmp_path / "QTD000020.cc.tsv.gz.part").write_bytes(content[: len(content) // 2])
+
+    counts = download_files("127.0.0.1", [("/QTD000020.cc.tsv.gz", str(local))], port=port)
+
+    assert counts["downloaded"] == 1
+    assert local.read_bytes() == content
+
+
+def test_rejects_corrupt_gzip(ftp_server, tmp_path):
+    """
+    Test that a truncated gzip stream on the server is reported as a failure and
+    never handed over under the final file name.
+    """
+    root, port = ftp_server
+    content = write_remote(root, "QTD000030.cc.tsv.gz").read_bytes()
+    (root / "QTD000030.cc.tsv.gz").write_bytes(content[:-100])
+    local = tmp_path / "QTD000030.cc.tsv.gz"
+
+    counts = download_files("127.0.0.1", [("/QTD000030.cc.tsv.gz", str(local))], port=port, max_retries=1)
+
+    assert counts["failed"] == 1
+    assert not local.exists()
+    assert not verify_gzip(str(root / "QTD000030.cc.tsv.gz"))
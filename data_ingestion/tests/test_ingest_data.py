@@ -0,0 +1,273 @@
+import gzip
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+# ingest_data creates its engine at import; reading files never connects to it
+os.environ.setdefault("DATABASE_URL", "postgresql+psycopg2://localhost/eqtl_catalogue")
+import ingest_data
+
+# Scratch database for the tests that load files; its tables are dropped and re-created by every test
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+HEADER = ["molecular_trait_id", "chromosome", "position", "ref", "alt", "variant", "ma_samples", "maf", "pvalue",
+          "beta", "se", "type", "ac", "an", "r2", "molecular_trait_object_id", "gene_id", "median_tpm", "rsid"]
+
+
+def write_sumstats(path, rows):
+    lines = ["\t".join(HEADER)]
+    for i in range(rows):
+        position = 1000 + i
+        lines.append("\t".join([
+            "ENSG00000101546", "X" if i % 2 else "1", str(position), "A", "G", f"chr1_{position}_A_G",
+            "NA" if i == 3 else "12", "0.0123457", f"{10.0 ** -(i % 300):.17g}", "-0.25", "0.1", "SNP",
+            "15", "300", "NA", "ENSG00000101546", "ENSG00000101546", "3.5", "NA" if i == 5 else f"rs{position}",
+        ]))
+    with gzip.open(path, "wt") as fh:
+        fh.write("\n".join(lines) + "\n")
+
+
+def test_read_chunks_types_and_nulls(tmp_path):
+    path = str(tmp_path / "QTD000001.all.tsv.gz")
+    write_sumstats(path, 10)
+
+    (chunk_df, _), = ingest_data.read_chunks(path)
+
+    assert list(chunk_df.columns) == list(ingest_data.SUMSTATS_TYPES)
+    assert isinstance(chunk_df["chromosome"].dtype, pd.CategoricalDtype)
+    assert chunk_df["position"].dtype == "Int32"
+    assert chunk_df["ma_samples"].isna().tolist() == [i == 3 for i in range(10)]
+    assert chunk_df["rsid"].isna().tolist() == [i == 5 for i in range(10)]
+    assert chunk_df["r2"].isna().all()
+    assert chunk_df["pvalue"].tolist() == [10.0 ** -i for i in range(10)]
+    assert chunk_df["maf"].iloc[0] == 0.0123457
+
+
+def test_read_chunks_resumes_at_line_boundaries(tmp_path):
+    path = str(tmp_path / "QTD000001.all.tsv.gz")
+    write_sumstats(path, 1000)
+
+    chunks = list(ingest_data.read_chunks(path, chunk_bytes=4096))
+    resumed = list(ingest_data.read_chunks(path, chunks[2][1], chunk_bytes=4096))
+
+    assert len(chunks) > 10
+    assert sum(len(chunk_df) for chunk_df, _ in chunks) == 1000
+    assert pd.concat(chunk_df for chunk_df, _ in chunks)["position"].tolist() == list(range(1000, 2000))
+    with gzip.open(path, "rb") as fh:
+        assert chunks[-1][1] == len(fh.read())
+    assert [chunk_df["position"].tolist() for chunk_df, _ in resumed] == \
+           [chunk_df["position"].tolist() for chunk_df, _ in chunks[3:]]
+
+
+def test_split_chunk_maps_chromosome_names():
+    chunk_df = pd.DataFrame({"variant": ["chr1_1_A_G", "chrX_1_A_G", "chrMT_1_A_G", "chr9_1_A_G"],
+                             "chromosome": pd.Categorical(["1", "chrX", "MT", None]),
+                             "gene_id": "ENSG00000101546"})
+
+    variants, _, _, _, _ = ingest_data.split_chunk(chunk_df, 1, ingest_data.KeyMap(), ingest_data.KeyMap())
+
+    assert variants["chromosome"].tolist() == [1, 23, 25, pd.NA]
+
+
+def test_key_map_waits_for_pending_keys():
+    key_map = ingest_data.KeyMap()
+    key_map.load([("a", 1)])
+    keys, new_ids = key_map.assign(["a", "b"])
+    assert (keys, new_ids) == ([1, 2], ["b"])
+
+    # Another chunk asking for "b" gets its key only once the row is committed and published
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(key_map.assign(["b", "c"])))
+    waiter.start()
+    time.sleep(0.2)
+    assert results == []
+    assert key_map.assign(["a", "d"]) == ([1, 3], ["d"])
+    key_map.publish(["b"])
+    waiter.join(5)
+    assert results == [([2, 4], ["c"])]
+
+
+def test_key_map_release_hands_out_ids_again():
+    key_map = ingest_data.KeyMap()
+    _, new_ids = key_map.assign(["a"])
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(key_map.assign(["a"])))
+    waiter.start()
+    time.sleep(0.2)
+    key_map.release(new_ids)
+    waiter.join(5)
+
+    # The rolled back ID is new again, so the waiting chunk inserts it itself
+    assert results == [([2], ["a"])]
+    assert key_map.size() == 1
+
+
+def test_key_map_wait_gives_up_on_keys_never_settled(monkeypatch):
+    monkeypatch.setattr(ingest_data, "KEY_WAIT_TIMEOUT", 0.2)
+    key_map = ingest_data.KeyMap()
+    key_map.assign(["a"])
+
+    with pytest.raises(TimeoutError, match="1 IDs"):
+        key_map.assign(["a", "b"])
+    # Nothing was handed out by the failed call
+    assert key_map.assign(["b"]) == ([2], ["b"])
+
+
+def test_split_chunk_releases_keys_when_it_fails(monkeypatch):
+    monkeypatch.setattr(ingest_data, "KEY_WAIT_TIMEOUT", 0.2)
+    chunk_df = pd.DataFrame({"variant": ["chr1_1_A_G"], "chromosome": pd.Categorical(["1"]),
+                             "gene_id": "ENSG00000101546"})
+
+    class FailingKeyMap(ingest_data.KeyMap):
+        def assign(self, natural_ids):
+            super().assign(natural_ids)
+            raise RuntimeError("manager connection lost")
+
+    variant_keys = ingest_data.KeyMap()
+    with pytest.raises(RuntimeError):
+        ingest_data.split_chunk(chunk_df, 1, variant_keys, FailingKeyMap())
+
+    # The variant key is not left pending, so the next chunk gets it without waiting
+    assert variant_keys.assign(["chr1_1_A_G"]) == ([2], ["chr1_1_A_G"])
+
+
+READ_CHUNKS = ingest_data.read_chunks
+
+
+class Interrupted(Exception):
+    pass
+
+
+@pytest.fixture
+def database(monkeypatch):
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(TEST_DATABASE_URL)
+    monkeypatch.setattr(ingest_data, "engine", engine)
+    monkeypatch.setattr(ingest_data, "SessionLocal", sessionmaker(bind=engine))
+    ingest_data.drop_staging_tables()
+    ingest_data.Base.metadata.drop_all(bind=engine)
+    ingest_data.Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def read_small_chunks(monkeypatch, fail_after=None, crash=False):
+    """
+    Makes ingest_file() read 4 kB chunks, raising Interrupted after fail_after of
+    them, or with crash, killing the process there.
+    """
+    offsets = []
+
+    def read(file_path, byte_offset=0):
+        offsets.append(byte_offset)
+        for index, chunk in enumerate(READ_CHUNKS(file_path, byte_offset, chunk_bytes=4096)):
+            if index == fail_after:
+                if crash:
+                    os._exit(1)
+                raise Interrupted()
+            yield chunk
+
+    monkeypatch.setattr(ingest_data, "read_chunks", read)
+    return offsets
+
+
+def load(file_path):
+    variant_keys, gene_keys = ingest_data.KeyMap(), ingest_data.KeyMap()
+    ingest_data.seed_key_map(variant_keys, ingest_data.Variant.variant_id, ingest_data.Variant.id)
+    ingest_data.seed_key_map(gene_keys, ingest_data.Gene.gene_id, ingest_data.Gene.id)
+    _, rows, _, status = ingest_data.ingest_file(file_path, variant_keys, gene_keys)
+    return rows, status
+
+
+def association_counts(engine):
+    with engine.connect() as conn:
+        return tuple(conn.execute(text("SELECT count(*), count(DISTINCT variant_key) FROM association")).one())
+
+
+def manifest_row(path):
+    with ingest_data.SessionLocal() as db:
+        return db.get(ingest_data.IngestManifest, os.path.basename(path))
+
+
+def test_unchanged_file_is_skipped(database, tmp_path):
+    path = str(tmp_path / "QTD000001.all.tsv.gz")
+    write_sumstats(path, 200)
+
+    assert load(path) == (200, "loaded")
+    assert load(path) == (0, "skipped")
+    # A new mtime alone makes the checksum decide, and the content is the same
+    os.utime(path, (time.time() + 60, time.time() + 60))
+    assert load(path) == (0, "skipped")
+
+    assert association_counts(database) == (200, 200)
+    assert manifest_row(path).status == "complete"
+    assert manifest_row(path).file_mtime == os.stat(path).st_mtime
+
+
+def test_interrupted_load_resumes_after_last_committed_chunk(database, tmp_path, monkeypatch):
+    path = str(tmp_path / "QTD000001.all.tsv.gz")
+    write_sumstats(path, 1000)
+
+    read_small_chunks(monkeypatch, fail_after=3)
+    with pytest.raises(Interrupted):
+        load(path)
+    interrupted = manifest_row(path)
+    assert (interrupted.status, interrupted.last_chunk) == ("loading", 2)
+    assert 0 < interrupted.rows_loaded < 1000
+    # Nothing is visible before the whole file is in
+    assert association_counts(database) == (0, 0)
+
+    offsets = read_small_chunks(monkeypatch)
+    assert load(path) == (1000 - interrupted.rows_loaded, "resumed")
+    assert offsets == [interrupted.byte_offset]
+    assert association_counts(database) == (1000, 1000)
+    manifest = manifest_row(path)
+    assert (manifest.status, manifest.rows_loaded) == ("complete", 1000)
+    assert manifest.last_chunk > interrupted.last_chunk
+
+
+def test_changed_file_is_reloaded_from_the_start(database, tmp_path, monkeypatch):
+    path = str(tmp_path / "QTD000001.all.tsv.gz")
+    write_sumstats(path, 1000)
+    read_small_chunks(monkeypatch, fail_after=3)
+    with pytest.raises(Interrupted):
+        load(path)
+
+    # A different file under the same name does not resume the earlier one's load
+    write_sumstats(path, 300)
+    offsets = read_small_chunks(monkeypatch)
+    assert load(path) == (300, "loaded")
+    assert offsets == [0]
+    assert association_counts(database) == (300, 300)
+    assert manifest_row(path).checksum == ingest_data.file_checksum(path)
+
+    # Nor is a completed one skipped
+    write_sumstats(path, 500)
+    assert load(path) == (500, "loaded")
+    assert association_counts(database) == (500, 500)
+    assert manifest_row(path).rows_loaded == 500
+
+
+def test_dead_worker_marks_its_files_failed(database, tmp_path, monkeypatch):
+    path = str(tmp_path / "QTD000001.all.tsv.gz")
+    write_sumstats(path, 1000)
+
+    # The worker inherits the patched reader and dies after committing three chunks
+    read_small_chunks(monkeypatch, fail_after=3, crash=True)
+    ingest_data.ingest_files([path], workers=1)
+
+    failed = manifest_row(path)
+    assert (failed.status, failed.last_chunk) == ("failed", 2)
+    assert association_counts(database) == (0, 0)
+
+    offsets = read_small_chunks(monkeypatch)
+    assert load(path) == (1000 - failed.rows_loaded, "resumed")
+    assert offsets == [failed.byte_offset]
+    assert manifest_row(path).status == "complete"
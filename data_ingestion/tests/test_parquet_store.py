@@ -0,0 +1,106 @@
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+import parquet_store
+
+
+def make_chunk(start, rows, chromosomes=("1", "X")):
+    positions = range(start, start + rows)
+    return pd.DataFrame({
+        "molecular_trait_id": "ENSG00000101546",
+        "chromosome": [chromosomes[i % len(chromosomes)] for i in range(rows)],
+        "position": list(reversed(positions)),
+        "ref": "A",
+        "alt": "G",
+        "variant": [f"chr1_{p}_A_G" for p in reversed(positions)],
+        "maf": 0.1,
+        "pvalue": [10.0 ** -(i % 12) for i in range(rows)],
+        "beta": 0.5,
+        "se": 0.1,
+        "r2": None,
+        "gene_id": "ENSG00000101546",
+        "rsid": [f"rs{p}" for p in reversed(positions)],
+    })
+
+
+def open_dataset(root):
+    return ds.dataset(root, format="parquet", partitioning=ds.partitioning(parquet_store.PARTITION_SCHEMA,
+                                                                           flavor="hive"))
+
+
+def test_write_chunk_partitions_by_study_and_chromosome(tmp_path):
+    parquet_store.write_chunk(parquet_store.study_dir(str(tmp_path), "QTD000001"), 0, make_chunk(1000, 100))
+    parquet_store.write_chunk(parquet_store.study_dir(str(tmp_path), "QTD000002"), 0, make_chunk(1000, 50))
+
+    assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.parquet")) == [
+        "study_id=QTD000001/chromosome=1/part-00000.parquet",
+        "study_id=QTD000001/chromosome=X/part-00000.parquet",
+        "study_id=QTD000002/chromosome=1/part-00000.parquet",
+        "study_id=QTD000002/chromosome=X/part-00000.parquet",
+    ]
+    hits = open_dataset(tmp_path).to_table(
+        filter=(ds.field("study_id") == "QTD000001") & (ds.field("pvalue") <= 1e-8))
+    assert hits.num_rows == sum(1 for i in range(100) if i % 12 >= 8)
+    assert set(hits.column("chromosome").to_pylist()) == {"1", "X"}
+
+
+def test_write_chunk_sorts_by_position_and_keeps_statistics(tmp_path):
+    study = parquet_store.study_dir(str(tmp_path), "QTD000001")
+    parquet_store.write_chunk(study, 3, make_chunk(1000, 100, chromosomes=("1",)))
+
+    parquet_file = pq.ParquetFile(tmp_path / "study_id=QTD000001" / "chromosome=1" / "part-00003.parquet")
+    positions = parquet_file.read(columns=["position"]).column("position").to_pylist()
+    assert positions == sorted(positions)
+    statistics = parquet_file.metadata.row_group(0).column(parquet_file.schema_arrow.get_field_index("pvalue")).statistics
+    assert statistics.has_min_max
+
+
+def test_rewriting_a_chunk_replaces_it(tmp_path):
+    study = parquet_store.study_dir(str(tmp_path), "QTD000001")
+    parquet_store.write_chunk(study, 0, make_chunk(1000, 100))
+    parquet_store.write_chunk(study, 1, make_chunk(2000, 100))
+    parquet_store.write_chunk(study, 1, make_chunk(2000, 100))
+    assert open_dataset(tmp_path).count_rows() == 200
+
+    parquet_store.clear_study(str(tmp_path), "QTD000001")
+    assert not list(tmp_path.rglob("*.parquet"))
+
+
+def test_rows_without_chromosome_read_back_as_null(tmp_path):
+    chunk_df = make_chunk(1000, 10)
+    chunk_df["chromosome"] = pd.Categorical(["1", None] * 5)
+    parquet_store.write_chunk(parquet_store.study_dir(str(tmp_path), "QTD000001"), 0, chunk_df)
+
+    assert not (tmp_path / "study_id=QTD000001" / "chromosome=nan").exists()
+    chromosomes = open_dataset(tmp_path).to_table().column("chromosome").to_pylist()
+    assert sorted(chromosomes, key=str) == ["1"] * 5 + [None] * 5
+
+
+def test_chromosome_partitions_use_normalized_names(tmp_path):
+    chunk_df = make_chunk(1000, 9, chromosomes=("chr1", "x", "chrM"))
+    parquet_store.write_chunk(parquet_store.study_dir(str(tmp_path), "QTD000001"), 0, chunk_df)
+
+    assert sorted(p.name for p in (tmp_path / "study_id=QTD000001").iterdir()) == \
+        ["chromosome=1", "chromosome=MT", "chromosome=X"]
+
+
+def test_staged_files_replace_the_study_when_published(tmp_path):
+    root = str(tmp_path)
+    parquet_store.write_chunk(parquet_store.study_dir(root, "QTD000001"), 0, make_chunk(1000, 100))
+    staging = parquet_store.staging_dir(root, "QTD000001", "QTD000001.all.tsv.gz")
+    parquet_store.write_chunk(staging, 0, make_chunk(5000, 30))
+    parquet_store.write_chunk(staging, 1, make_chunk(6000, 30))
+
+    # Readers keep seeing the published files until the load is published
+    assert open_dataset(tmp_path).count_rows() == 100
+
+    parquet_store.publish_study(root, "QTD000001", staging)
+    table = open_dataset(tmp_path).to_table()
+    assert table.num_rows == 60
+    assert min(table.column("position").to_pylist()) == 5000
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["study_id=QTD000001"]
+
+    parquet_store.write_chunk(staging, 0, make_chunk(1000, 10))
+    parquet_store.clear_study(root, "QTD000001")
+    assert not list(tmp_path.iterdir())